@@ -0,0 +1,55 @@
+"""Benchmark of the persistent cache of parsed files.
+
+Loads every yml of the test files with `get_yaml` like a new run of the SDK would - with the in process cache cleared -
+without the disk cache, with an empty disk cache (parsing and writing the entries) and with the disk cache filled by
+the previous run.
+
+Usage:
+    python benchmarks/disk_parse_cache.py [--dir demisto_sdk/tests/test_files] [--rounds 5]
+"""
+import argparse
+import glob
+import os
+import tempfile
+import time
+
+from demisto_sdk.commands.common.disk_parse_cache import DiskParseCache
+from demisto_sdk.commands.common.tools import PARSED_FILE_CACHE, get_yaml
+
+
+def load_all(file_paths, rounds, disk_cache):
+    PARSED_FILE_CACHE.disk_cache = disk_cache
+    start = time.time()
+    for _ in range(rounds):
+        PARSED_FILE_CACHE.clear()
+        loaded = [get_yaml(file_path) for file_path in file_paths]
+
+    PARSED_FILE_CACHE.disk_cache = None
+    return time.time() - start, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dir', default='demisto_sdk/tests/test_files', help='The directory of the ymls to load.')
+    parser.add_argument('--rounds', type=int, default=5, help='The number of runs to load the ymls in.')
+    args = parser.parse_args()
+
+    file_paths = sorted(glob.glob(os.path.join(args.dir, '**', '*.yml'), recursive=True))
+    print('{} ymls, {} runs'.format(len(file_paths), args.rounds))
+    with tempfile.TemporaryDirectory() as cache_dir:
+        parsed_time, parsed_data = load_all(file_paths, args.rounds, None)
+        print('no disk cache: {:.3f}s'.format(parsed_time))
+
+        disk_cache = DiskParseCache(cache_dir)
+        cold_time, cold_data = load_all(file_paths, 1, disk_cache)
+        print('empty disk cache, a single run: {:.3f}s'.format(cold_time))
+
+        disk_cache = DiskParseCache(cache_dir)
+        warm_time, warm_data = load_all(file_paths, args.rounds, disk_cache)
+        print('filled disk cache: {:.3f}s ({})'.format(warm_time, dict(disk_cache.get_stats())))
+
+    assert parsed_data == cold_data == warm_data
+
+
+if __name__ == '__main__':
+    main()
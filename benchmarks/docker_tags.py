@@ -0,0 +1,81 @@
+"""Benchmark of the resolution of the latest docker image tags of changed integrations and scripts.
+
+Serves the tags from a local fake registry that answers every request after a delay, like the latency of Docker Hub, and
+resolves the images of --files files that use --images different images like before (for every file: a request for the
+registry challenge, one for a token and one for the tags, with new connections), with the resolver one file at a time,
+with the prefetch of the resolver, with the prefetch of a second run, which takes the tags from the cache, and with a
+snapshot of the tags.
+
+Usage:
+    python benchmarks/docker_tags.py [--files 40] [--images 10] [--delay 0.05]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import requests
+
+from demisto_sdk.commands.common.docker_tags import DockerTagCache, DockerTagResolver, create_snapshot, \
+    find_latest_tag_by_date, load_snapshot
+from demisto_sdk.commands.common.tests.conftest import FakeDockerRegistry
+
+
+def timed(function):
+    start = time.time()
+    function()
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--files', type=int, default=40, help='The number of changed integrations and scripts.')
+    parser.add_argument('--images', type=int, default=10, help='The number of different images they use.')
+    parser.add_argument('--delay', type=float, default=0.05, help='The seconds the registry waits before answering.')
+    args = parser.parse_args()
+
+    images = ['demisto/image{}'.format(index % args.images) for index in range(args.files)]
+    hub_tags = {image: [('1.0.{}'.format(index), '2020-01-{:02}T00:00:00.000000Z'.format(index + 1))
+                        for index in range(20)] for image in set(images)}
+    with FakeDockerRegistry(hub_tags, delay=args.delay) as registry, tempfile.TemporaryDirectory() as cache_dir:
+        def resolve_like_before():
+            for image in images:
+                requests.get('{}/v2/'.format(registry.url))
+                requests.get('{}/token'.format(registry.url), params={'scope': 'repository:{}:pull'.format(image)})
+                res = requests.get('{}/v2/repositories/{}/tags'.format(registry.url, image))
+                find_latest_tag_by_date(res.json()['results'])
+
+        def resolve_one_at_a_time():
+            resolver = DockerTagResolver(registry.url, registry.url)
+            for image in images:
+                resolver.resolve(image)
+
+        def prefetch():
+            resolver = DockerTagResolver(registry.url, registry.url, cache=DockerTagCache(cache_dir))
+            resolver.prefetch(images)
+            for image in images:
+                resolver.resolve(image)
+
+        def resolve_from_snapshot():
+            resolver = DockerTagResolver(registry.url, registry.url)
+            resolver.use_snapshot(load_snapshot(snapshot_path))
+            resolver.prefetch(images)
+            for image in images:
+                resolver.resolve(image)
+
+        snapshot_path = os.path.join(cache_dir, 'snapshot.json')
+        create_snapshot(snapshot_path, images, DockerTagResolver(registry.url, registry.url))
+        del registry.requests[:]
+        before_time = timed(resolve_like_before)
+        before_requests = len(registry.requests)
+        print('before: {:.3f}s ({} requests)'.format(before_time, before_requests))
+        for name, function in (('resolver, one file at a time', resolve_one_at_a_time), ('prefetch', prefetch),
+                               ('prefetch of cached tags', prefetch), ('snapshot', resolve_from_snapshot)):
+            del registry.requests[:]
+            function_time = timed(function)
+            speedup = before_time / function_time
+            print('{}: {:.3f}s ({:.1f}x, {} requests)'.format(name, function_time, speedup, len(registry.requests)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark of the classification of content files by their paths.
+
+Classifies every file of a repo listing the way a validation does - checked_type with the content types, the scheme
+of the file, and the regex lists of the validators that check it - --passes times, like the validators of a file that
+classify it again. The listing is of a content repo checkout given with --path, or a generated listing of --packs packs
+in the layout of the content repo. Compares matching the regexes one at a time like before, the RegexSets on their
+first pass, and the RegexSets remembering the paths.
+
+Usage:
+    python benchmarks/file_classifier.py [--path ~/dev/content] [--packs 500] [--passes 4]
+"""
+import argparse
+import os
+import re
+import time
+
+from demisto_sdk.commands.common import constants
+from demisto_sdk.commands.common.file_classifier import FileTypeClassifier, RegexSet
+
+VALIDATOR_REGEXES = [constants.CODE_FILES_REGEX, constants.OLD_YML_FORMAT_FILE, [constants.SCHEMA_REGEX],
+                     constants.YML_INTEGRATION_REGEXES, constants.YML_BETA_INTEGRATIONS_REGEXES,
+                     [constants.SCRIPT_REGEX], constants.PLAYBOOKS_REGEXES_LIST, constants.PACKAGE_SCRIPTS_REGEXES,
+                     constants.JSON_INDICATOR_AND_INCIDENT_FIELDS, constants.JSON_ALL_LAYOUT_REGEXES,
+                     [constants.REPUTATION_REGEX]]
+
+
+def generate_listing(packs):
+    """Generates the paths of a content repo with packs of an integration, a script, a playbook and json files."""
+    paths = []
+    for index in range(packs):
+        pack = 'Packs/Pack{}'.format(index)
+        paths.extend('{}/Integrations/Integration{}/Integration{}{}'.format(pack, index, index, suffix) for suffix in (
+            '.yml', '.py', '_test.py', '_image.png', '_description.md', '.md', '_CHANGELOG.md'))
+        paths.extend('{}/Scripts/Script{}/Script{}{}'.format(pack, index, index, suffix) for suffix in (
+            '.yml', '.py', '_test.py', '_CHANGELOG.md'))
+        paths.extend('{}/{}'.format(pack, name.format(index)) for name in (
+            'Playbooks/playbook-Playbook{}.yml', 'TestPlaybooks/playbook-Playbook{}_test.yml',
+            'IncidentFields/incidentfield-Field{}.json', 'Layouts/layout-details-Layout{}.json',
+            'IncidentTypes/incidenttype-Type{}.json', 'pack_metadata.json', 'README.md'))
+
+    return paths
+
+
+def list_repo(path):
+    """Lists the files of a repo checkout, relative to it."""
+    paths = []
+    for root, dirs, files in os.walk(path):
+        dirs[:] = [dir_name for dir_name in dirs if not dir_name.startswith('.')]
+        paths.extend(os.path.relpath(os.path.join(root, file_name), path) for file_name in files)
+
+    return paths
+
+
+def loop_checked_type(path, regexes):
+    for regex in regexes:
+        if re.match(regex, path, re.IGNORECASE):
+            return True
+    return False
+
+
+def loop_find_scheme_name(path):
+    for scheme_name, regexes in constants.SCHEMA_TO_REGEX.items():
+        if loop_checked_type(path, regexes):
+            return scheme_name
+    return None
+
+
+def classify_like_before(paths, passes):
+    for _ in range(passes):
+        for path in paths:
+            loop_checked_type(path, constants.CHECKED_TYPES_REGEXES)
+            loop_find_scheme_name(path)
+            for regexes in VALIDATOR_REGEXES:
+                loop_checked_type(path, regexes)
+
+
+def classify_with_regex_sets(paths, passes, regex_sets, classifier):
+    for _ in range(passes):
+        for path in paths:
+            regex_sets[0].match(path)
+            classifier.get_file_type(path)
+            for regex_set in regex_sets[1:]:
+                regex_set.match(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--path', help='A content repo checkout to list, a generated listing by default.')
+    parser.add_argument('--packs', type=int, default=500, help='The number of packs of the generated listing.')
+    parser.add_argument('--passes', type=int, default=4, help='The number of times every path is classified.')
+    args = parser.parse_args()
+
+    paths = list_repo(os.path.expanduser(args.path)) if args.path else generate_listing(args.packs)
+    print('{} paths, {} passes'.format(len(paths), args.passes))
+
+    start = time.time()
+    classify_like_before(paths, args.passes)
+    before_time = time.time() - start
+    print('before: {:.3f}s'.format(before_time))
+
+    start = time.time()
+    regex_sets = [RegexSet(regexes) for regexes in [constants.CHECKED_TYPES_REGEXES] + VALIDATOR_REGEXES]
+    classifier = FileTypeClassifier()
+    compile_time = time.time() - start
+    # a single pass over every path, the results of the other passes are remembered
+    classify_with_regex_sets(paths, 1, regex_sets, classifier)
+    first_pass_time = time.time() - start
+    classify_with_regex_sets(paths, args.passes - 1, regex_sets, classifier)
+    total_time = time.time() - start
+    print('compiling the regex sets: {:.3f}s'.format(compile_time))
+    print('regex sets, first pass: {:.3f}s ({:.1f}x of a pass before)'.format(
+        first_pass_time, before_time / args.passes / first_pass_time))
+    print('regex sets, {} passes: {:.3f}s ({:.1f}x)'.format(args.passes, total_time, before_time / total_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark of the id_set duplicates detection.
+
+Compares the previous detection (a `has_duplicate` scan of the whole section for every id, comparing every pair of
+duplicates with LooseVersion) with the single pass index and version ranges sweep of `find_duplicates`.
+
+Usage:
+    python benchmarks/find_duplicates.py [--entries 10000]
+"""
+import argparse
+import itertools
+import time
+from distutils.version import LooseVersion
+
+from demisto_sdk.commands.common.update_id_set import find_duplicates
+
+
+def create_id_set(entries):
+    """Creates an id_set with `entries` entities per section, every 10th id has a second, non-overlapping version."""
+    id_set = {}
+    for section in ('scripts', 'integrations', 'playbooks', 'TestPlaybooks'):
+        id_set[section] = []
+        for index in range(entries):
+            entity_id = '{}{}'.format(section, index - index % 10 if index % 10 < 2 else index)
+            data = {'name': entity_id, 'file_path': entity_id}
+            if index % 10 == 0:
+                data['toversion'] = '4.9.9'
+            elif index % 10 == 1:
+                data['fromversion'] = '5.0.0'
+            id_set[section].append({entity_id: data})
+
+    return id_set
+
+
+def pairwise_has_duplicate(id_set, id_to_check):
+    duplicates = [duplicate for duplicate in id_set if duplicate.get(id_to_check)]
+    if len(duplicates) < 2:
+        return False
+
+    for dup1, dup2 in itertools.combinations(duplicates, 2):
+        dict1 = list(dup1.values())[0]
+        dict2 = list(dup2.values())[0]
+        dict1_from_version = LooseVersion(dict1.get('fromversion', '0.0.0'))
+        dict2_from_version = LooseVersion(dict2.get('fromversion', '0.0.0'))
+        dict1_to_version = LooseVersion(dict1.get('toversion', '99.99.99'))
+        dict2_to_version = LooseVersion(dict2.get('toversion', '99.99.99'))
+        if any([
+            dict1_from_version <= dict2_from_version < dict1_to_version,
+            dict1_from_version < dict2_to_version <= dict1_to_version,
+            dict2_from_version <= dict1_from_version < dict2_to_version,
+            dict2_from_version < dict1_to_version <= dict2_to_version,
+        ]):
+            return True
+
+    return False
+
+
+def pairwise_find_duplicates(id_set):
+    duplicates = []
+    for section in ('scripts', 'integrations', 'playbooks', 'TestPlaybooks'):
+        entities = id_set[section]
+        entity_ids = set(list(entity.keys())[0] for entity in entities)
+        duplicates.append([entity_id for entity_id in entity_ids if pairwise_has_duplicate(entities, entity_id)])
+
+    return tuple(duplicates)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entries', type=int, default=10000, help='The number of entries in each id_set section.')
+    args = parser.parse_args()
+
+    id_set = create_id_set(args.entries)
+
+    start = time.time()
+    pairwise_duplicates = pairwise_find_duplicates(id_set)
+    print('pairwise: {:.3f}s'.format(time.time() - start))
+
+    start = time.time()
+    duplicates = find_duplicates(id_set)
+    print('indexed: {:.3f}s'.format(time.time() - start))
+
+    assert sorted(map(sorted, pairwise_duplicates)) == sorted(map(sorted, duplicates)) == [[], [], [], []]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark of the generated schema validators.
+
+Loads a few valid content files and validates them repeatedly against their schemas with pykwalify (the compiled
+schema) and with the generated validator, and reports the throughput of both. The parsing of the files is excluded -
+only the validation is measured. The time to generate the validator modules and to load them from the cache is
+reported too.
+
+Usage:
+    python benchmarks/generated_schema_validation.py [--rounds 50]
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from demisto_sdk.commands.common.compiled_schema import get_compiled_schema, load_yaml_for_schema
+from demisto_sdk.commands.common.schema_codegen import load_validator
+
+SCHEMAS_DIR = os.path.abspath(os.path.join('demisto_sdk', 'commands', 'common', 'schemas'))
+TEST_FILES_DIR = os.path.join('demisto_sdk', 'tests', 'test_files')
+FILES = (
+    ('integration-Zoom.yml', 'integration'),
+    ('fake-script.yml', 'script'),
+    ('Playbooks.playbook-test.yml', 'playbook'),
+    ('incidentfield-valid.json', 'incidentfield'),
+    ('dashboard-valid.json', 'dashboard'),
+)
+
+
+def validate_all(items, rounds, validate_function):
+    start = time.time()
+    for _ in range(rounds):
+        for schema_path, data in items:
+            validate_function(schema_path, data)
+
+    return time.time() - start
+
+
+def validate_with_compiled_schema(schema_path, data):
+    get_compiled_schema(schema_path).validate(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=50, help='The number of times to validate every file.')
+    args = parser.parse_args()
+
+    # pykwalify logs every validation
+    logging.disable(logging.INFO)
+    items = []
+    for file_name, schema_name in FILES:
+        with open(os.path.join(TEST_FILES_DIR, file_name), 'r') as file_obj:
+            items.append((os.path.join(SCHEMAS_DIR, schema_name + '.yml'), load_yaml_for_schema(file_obj)))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        start = time.time()
+        validators = {schema_path: load_validator(schema_path, cache_dir) for schema_path, _ in items}
+        print('generating {} validators: {:.3f}s'.format(len(validators), time.time() - start))
+        start = time.time()
+        validators = {schema_path: load_validator(schema_path, cache_dir) for schema_path, _ in items}
+        print('loading them from the cache: {:.3f}s'.format(time.time() - start))
+
+    for schema_path, data in items:
+        # both must pass the files, or the comparison is meaningless
+        validate_with_compiled_schema(schema_path, data)
+        assert validators[schema_path](data), schema_path
+
+    validations = len(items) * args.rounds
+    compiled_time = validate_all(items, args.rounds, validate_with_compiled_schema)
+    print('pykwalify: {:.3f}s ({:.0f} files/s)'.format(compiled_time, validations / compiled_time))
+    generated_time = validate_all(items, args.rounds, lambda schema_path, data: validators[schema_path](data))
+    print('generated validators: {:.3f}s ({:.0f} files/s, {:.1f}x)'.format(
+        generated_time, validations / generated_time, compiled_time / generated_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark of the id_set creation over a synthetic content repo.
+
+Compares the previous staged processing (a pool.map per entity type with the default chunksize) with the single
+type-dispatching pool used by `create_id_set_dict`.
+
+Usage:
+    python benchmarks/id_set_creation.py [--items 4000] [--workers 8]
+"""
+import argparse
+import contextlib
+import os
+import tempfile
+import time
+from multiprocessing import Pool, cpu_count
+
+import yaml
+
+from demisto_sdk.commands.common.update_id_set import process_integration, process_playbook, process_script, \
+    process_test_playbook_path, get_integrations_paths, get_playbooks_paths, get_scripts_paths, \
+    get_test_playbooks_paths, get_entities_work_items, process_entities
+
+
+def write_yml(path, data):
+    with open(path, 'w') as yml_file:
+        yaml.safe_dump(data, yml_file)
+
+
+def create_content_repo(root, items):
+    """Creates `items` entities split between integrations, scripts, playbooks and test playbooks.
+
+    Every 50th integration is much bigger than the rest, like the big integrations of the content repo.
+    """
+    for directory in ('Integrations', 'Scripts', 'Playbooks', 'TestPlaybooks'):
+        os.makedirs(os.path.join(root, directory))
+
+    for index in range(items // 4):
+        commands_count = 400 if index % 50 == 0 else 10
+        write_yml(os.path.join(root, 'Integrations', 'integration-Test{}.yml'.format(index)), {
+            'commonfields': {'id': 'Test{}'.format(index)},
+            'name': 'Test{}'.format(index),
+            'fromversion': '5.0.0',
+            'script': {'commands': [{'name': 'test{}-command{}'.format(index, command),
+                                     'arguments': [{'name': 'arg{}'.format(arg)} for arg in range(5)],
+                                     'outputs': [{'contextPath': 'Test.Output{}'.format(output)}
+                                                 for output in range(10)]}
+                                    for command in range(commands_count)]},
+        })
+        write_yml(os.path.join(root, 'Scripts', 'script-Script{}.yml'.format(index)), {
+            'commonfields': {'id': 'Script{}'.format(index)},
+            'name': 'Script{}'.format(index),
+            'script': 'demisto.executeCommand("test{}-command0", {{}})'.format(index),
+            'dependson': {'must': ['Test{0}|||test{0}-command0'.format(index)]},
+        })
+        playbook = {
+            'id': 'Playbook{}'.format(index),
+            'name': 'Playbook{}'.format(index),
+            'tasks': {str(task): {'task': {'scriptName': 'Script{}'.format(task),
+                                           'script': 'Test{0}|||test{0}-command1'.format(task)}}
+                      for task in range(20)},
+        }
+        write_yml(os.path.join(root, 'Playbooks', 'playbook-Playbook{}.yml'.format(index)), playbook)
+        write_yml(os.path.join(root, 'TestPlaybooks', 'playbook-Playbook{}_Test.yml'.format(index)), playbook)
+
+
+def run_staged(workers):
+    pool = Pool(processes=workers)
+    pool.map(process_integration, get_integrations_paths())
+    pool.map(process_playbook, get_playbooks_paths())
+    pool.map(process_script, get_scripts_paths())
+    pool.map(process_test_playbook_path, get_test_playbooks_paths())
+    pool.close()
+    pool.join()
+
+
+def run_single_pass(workers):
+    process_entities(get_entities_work_items(), workers=workers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=4000)
+    parser.add_argument('--workers', type=int, default=cpu_count() * 2)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        create_content_repo(root, args.items)
+        os.chdir(root)
+        for name, run in (('staged', run_staged), ('single pass', run_single_pass)):
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                    run(args.workers)
+                timings.append(time.perf_counter() - start)
+            print('{:<12} items={} workers={} best={:.2f}s'.format(name, args.items, args.workers, min(timings)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark of the memory taken to look entities up in a big id_set.
+
+Compares loading the whole id_set.json with `IdSet.load` to `LazyIdSet.load`, which keeps only the offsets of the
+entities in memory - first when the offsets index has to be scanned from the id_set, then when it is read from the
+offsets cache. The offsets are cached in the temporary directory of the benchmark.
+
+Usage:
+    python benchmarks/id_set_loading.py [--entries 50000]
+"""
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from collections import OrderedDict
+
+from demisto_sdk.commands.common.id_set import IdSet
+from demisto_sdk.commands.common.id_set_stream import ID_SET_OFFSETS_CACHE_DIR_ENV, LazyIdSet
+
+
+def create_id_set(entries):
+    """Creates an id_set with `entries` scripts, playbooks and integrations."""
+    id_set = OrderedDict((section, []) for section in ('scripts', 'playbooks', 'integrations', 'TestPlaybooks'))
+    for index in range(entries):
+        id_set['scripts'].append({'script{}'.format(index): OrderedDict([
+            ('name', 'script{}'.format(index)), ('file_path', 'Scripts/script{}.yml'.format(index)),
+            ('depends_on', ['command{}'.format(index % 100), 'script{}'.format(index // 2)]),
+            ('tests', ['No test'])])})
+        id_set['playbooks'].append({'playbook{}'.format(index): OrderedDict([
+            ('name', 'playbook{}'.format(index)), ('file_path', 'Playbooks/playbook{}.yml'.format(index)),
+            ('implementing_scripts', ['script{}'.format(index), 'script{}'.format(index // 3)]),
+            ('command_to_integration', {'command{}'.format(index % 100): 'integration{}'.format(index % 100)})])})
+        id_set['integrations'].append({'integration{}'.format(index): OrderedDict([
+            ('name', 'integration{}'.format(index)), ('file_path', 'Integrations/integration{}.yml'.format(index)),
+            ('commands', ['command{}-{}'.format(index, command) for command in range(10)])])})
+
+    return id_set
+
+
+def measure(name, load, lookups):
+    tracemalloc.start()
+    start = time.time()
+    id_set = load()
+    load_time = time.time() - start
+    load_peak = tracemalloc.get_traced_memory()[1]
+
+    start = time.time()
+    results = [id_set.find(entity_id) for entity_id in lookups]
+    lookup_time = time.time() - start
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print('{}: loaded in {:.3f}s with a peak of {:.1f} MB, {} lookups in {:.3f}s, holding {:.1f} MB'.format(
+        name, load_time, load_peak / 2 ** 20, len(lookups), lookup_time, held / 2 ** 20))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entries', type=int, default=50000, help='The number of entities in each id_set section.')
+    args = parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp()
+    os.environ[ID_SET_OFFSETS_CACHE_DIR_ENV] = os.path.join(temp_dir, 'cache')
+    try:
+        id_set_path = os.path.join(temp_dir, 'id_set.json')
+        IdSet(create_id_set(args.entries)).dump(id_set_path)
+        print('id_set.json: {:.1f} MB'.format(os.path.getsize(id_set_path) / 2 ** 20))
+        rand = random.Random(0)
+        lookups = ['{}{}'.format(rand.choice(['script', 'playbook', 'integration']), rand.randrange(args.entries))
+                   for _ in range(100)]
+
+        loaded = measure('IdSet', lambda: IdSet.load(id_set_path), lookups)
+        scanned = measure('LazyIdSet, scanning the offsets', lambda: LazyIdSet.load(id_set_path), lookups)
+        indexed = measure('LazyIdSet, reading the offsets', lambda: LazyIdSet.load(id_set_path), lookups)
+
+        assert loaded == scanned == indexed
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    main()
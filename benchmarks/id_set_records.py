@@ -0,0 +1,78 @@
+"""Benchmark of the memory and IPC cost of the id_set extraction results.
+
+Every content entity extracted by the id_set pool is pickled from a worker back to the main process and held until the
+id_set is written. This compares holding the results as {id: OrderedDict} entities with holding them as slotted
+records with interned names: the size of the pickled results, the time to pickle and load them, and the memory the
+loaded results take.
+
+Usage:
+    python benchmarks/id_set_records.py [--entries 10000] [--chunksize 64]
+"""
+import argparse
+import os
+import pickle
+import time
+import tracemalloc
+
+from demisto_sdk.commands.common.id_set_records import EntityRecord
+from demisto_sdk.commands.common.update_id_set import get_integration_record, get_playbook_record, \
+    get_script_record
+
+TEST_FILES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'demisto_sdk', 'tests',
+                          'test_files')
+
+
+def create_records(entries):
+    """Extracts the records of the test content files and copies them to `entries` records with distinct ids."""
+    templates = [
+        get_integration_record(os.path.join(TEST_FILES, 'integration-test.yml')),
+        get_integration_record(os.path.join(TEST_FILES, 'integration-Zoom.yml')),
+        get_script_record(os.path.join(TEST_FILES, 'script-valid.yml')),
+        get_playbook_record(os.path.join(TEST_FILES, 'CortexXDR', 'Playbooks', 'Cortex_XDR_Incident_Handling.yml')),
+    ]
+    records = []
+    for index in range(entries):
+        template = templates[index % len(templates)]
+        entity = template.to_entity()[template.entity_id]
+        entity['file_path'] = '{}_{}'.format(entity['file_path'], index)
+        records.append(type(template).from_entity({'{}_{}'.format(template.entity_id, index): entity}))
+
+    return records
+
+
+def measure(name, results, chunksize):
+    """Pickles the results in chunks like the pool does, then loads them and measures the memory they take."""
+    start = time.time()
+    chunks = [pickle.dumps(results[index:index + chunksize]) for index in range(0, len(results), chunksize)]
+    pickle_time = time.time() - start
+
+    tracemalloc.start()
+    start = time.time()
+    loaded = [result for chunk in chunks for result in pickle.loads(chunk)]
+    load_time = time.time() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print('{}: pickled {:.2f} MB in {:.3f}s, loaded in {:.3f}s, holding {:.2f} MB'.format(
+        name, sum(len(chunk) for chunk in chunks) / 2 ** 20, pickle_time, load_time, memory / 2 ** 20))
+    return loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entries', type=int, default=10000, help='The number of extracted entities.')
+    parser.add_argument('--chunksize', type=int, default=64, help='The number of results pickled together.')
+    args = parser.parse_args()
+
+    records = create_records(args.entries)
+    entities = [record.to_entity() for record in records]
+
+    loaded_entities = measure('entities', entities, args.chunksize)
+    loaded_records = measure('records', records, args.chunksize)
+
+    assert all(isinstance(record, EntityRecord) for record in loaded_records)
+    assert [record.to_entity() for record in loaded_records] == loaded_entities
+
+
+if __name__ == '__main__':
+    main()
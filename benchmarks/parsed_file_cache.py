@@ -0,0 +1,42 @@
+"""Benchmark of the parsed files cache.
+
+Validating an integration loads its yml once in each of the structure, docker, image and description validators and
+in the file type checks. This loads a yml that many times with `get_yaml`, with the cache cleared before every load
+(parsing the file every time, like before the cache) and with the cache kept.
+
+Usage:
+    python benchmarks/parsed_file_cache.py [--file demisto_sdk/tests/test_files/integration-Zoom.yml] [--loads 8]
+"""
+import argparse
+import time
+
+from demisto_sdk.commands.common.tools import PARSED_FILE_CACHE, get_yaml
+
+
+def load(file_path, loads, clear):
+    PARSED_FILE_CACHE.clear()
+    start = time.time()
+    for _ in range(loads):
+        if clear:
+            PARSED_FILE_CACHE.clear()
+        data = get_yaml(file_path)
+
+    return time.time() - start, data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--file', default='demisto_sdk/tests/test_files/integration-Zoom.yml', help='The yml to load.')
+    parser.add_argument('--loads', type=int, default=8, help='The number of times the yml is loaded.')
+    args = parser.parse_args()
+
+    uncached_time, uncached_data = load(args.file, args.loads, clear=True)
+    print('parsed every time: {:.3f}s'.format(uncached_time))
+    cached_time, cached_data = load(args.file, args.loads, clear=False)
+    print('cached: {:.3f}s ({})'.format(cached_time, dict(PARSED_FILE_CACHE.get_stats())))
+
+    assert uncached_data == cached_data
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark of the download of old file versions.
+
+Serves files from a local stub server that answers every request after a delay, like the latency of GitHub, and
+downloads them like before (a requests.get per file, one at a time), with the pooled session one at a time, with the
+concurrent prefetch, and with the prefetch of a second run, which revalidates the cached files.
+
+Usage:
+    python benchmarks/remote_files.py [--count 100] [--delay 0.05]
+"""
+import argparse
+import tempfile
+import time
+
+import requests
+import urllib3
+
+from demisto_sdk.commands.common.remote_files import RemoteFileCache, RemoteFileFetcher
+from demisto_sdk.commands.common.tests.conftest import StubHTTPServer
+
+
+def timed(function):
+    start = time.time()
+    function()
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100, help='The number of files to download.')
+    parser.add_argument('--delay', type=float, default=0.05, help='The seconds the server waits before answering.')
+    args = parser.parse_args()
+
+    urllib3.disable_warnings()
+    paths = ['Integrations/Integration{0}/Integration{0}.yml'.format(index) for index in range(args.count)]
+    files = {'master/' + path: ('name: Integration\n' + 'x: 1\n' * 1000).encode('utf-8') for path in paths}
+    with StubHTTPServer(files, delay=args.delay) as server, tempfile.TemporaryDirectory() as cache_dir:
+        def download_with_requests():
+            for path in paths:
+                requests.get('{}/master/{}'.format(server.url, path), verify=False).raise_for_status()
+
+        def download_with_session():
+            fetcher = RemoteFileFetcher(server.url)
+            for path in paths:
+                fetcher.fetch(path)
+
+        def prefetch():
+            RemoteFileFetcher(server.url, cache=RemoteFileCache(cache_dir)).prefetch(paths)
+
+        requests_time = timed(download_with_requests)
+        print('requests.get per file: {:.3f}s'.format(requests_time))
+        session_time = timed(download_with_session)
+        print('pooled session: {:.3f}s ({:.1f}x)'.format(session_time, requests_time / session_time))
+        prefetch_time = timed(prefetch)
+        print('prefetch: {:.3f}s ({:.1f}x)'.format(prefetch_time, requests_time / prefetch_time))
+        server.requests.clear()
+        cached_time = timed(prefetch)
+        not_modified = sum(1 for _, etag in server.requests if etag)
+        print('prefetch of cached files: {:.3f}s ({:.1f}x, {} of {} revalidated)'.format(
+            cached_time, requests_time / cached_time, not_modified, len(server.requests)))
+
+
+if __name__ == '__main__':
+    main()
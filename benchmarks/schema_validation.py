@@ -0,0 +1,65 @@
+"""Benchmark of the scheme validation of integrations.
+
+Copies an integration yml to a few hundred integration files and validates their scheme with a pykwalify Core built
+from the file paths, like before (reading the schema and building its rules for every file), and with the schema
+compiled once (reading every file once through the parsed files cache).
+
+Usage:
+    python benchmarks/schema_validation.py [--file demisto_sdk/tests/test_files/integration-Zoom.yml] [--count 300]
+"""
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from pykwalify.core import Core
+
+from demisto_sdk.commands.common.compiled_schema import get_compiled_schema, load_yaml_for_schema
+from demisto_sdk.commands.common.parsed_file_cache import PARSED_FILE_CACHE
+
+SCHEMA_PATH = os.path.abspath(os.path.join('demisto_sdk', 'commands', 'common', 'schemas', 'integration.yml'))
+
+
+def validate_with_core(file_path):
+    Core(source_file=file_path, schema_files=[SCHEMA_PATH]).validate(raise_exception=True)
+
+
+def validate_with_compiled_schema(file_path):
+    with open(file_path, 'r') as file_obj:
+        get_compiled_schema(SCHEMA_PATH).validate(PARSED_FILE_CACHE.parse(file_obj, load_yaml_for_schema))
+
+
+def validate_all(file_paths, validate_function):
+    start = time.time()
+    for file_path in file_paths:
+        validate_function(file_path)
+
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--file', default='demisto_sdk/tests/test_files/integration-Zoom.yml',
+                        help='The integration yml to validate.')
+    parser.add_argument('--count', type=int, default=300, help='The number of integrations to validate.')
+    args = parser.parse_args()
+
+    # pykwalify logs every validation
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as integrations_dir:
+        file_paths = []
+        for index in range(args.count):
+            file_paths.append(os.path.join(integrations_dir, 'integration-{}.yml'.format(index)))
+            shutil.copyfile(args.file, file_paths[-1])
+
+        core_time = validate_all(file_paths, validate_with_core)
+        print('Core per file: {:.3f}s'.format(core_time))
+        PARSED_FILE_CACHE.clear()
+        compiled_time = validate_all(file_paths, validate_with_compiled_schema)
+        print('compiled schema: {:.3f}s ({:.1f}x)'.format(compiled_time, core_time / compiled_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark of updating the id_set for a single changed script.
+
+Compares the previous update (OrderedDict load, a scan of the section for the script, a sort of all the sections and a
+rewrite of the file) with the IdSet update (plain dict load, indexed lookup, bisect insert, rewrite only if changed).
+
+Usage:
+    python benchmarks/update_id_set.py [--entries 10000]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+
+from demisto_sdk.commands.common.id_set import IdSet
+
+
+def create_id_set(entries):
+    id_set = OrderedDict()
+    for section in ('scripts', 'playbooks', 'integrations', 'TestPlaybooks'):
+        id_set[section] = [{'{}{:06}'.format(section, index): {
+            'name': '{}{:06}'.format(section, index),
+            'file_path': '{}/{}{}.yml'.format(section, section, index),
+            'fromversion': '5.0.0',
+            'tests': ['No test'],
+        }} for index in range(entries)]
+
+    return id_set
+
+
+def previous_update(id_set_path, entity):
+    with open(id_set_path, 'r') as id_set_file:
+        ids_dict = json.load(id_set_file, object_pairs_hook=OrderedDict)
+
+    scripts = ids_dict['scripts']
+    entity_id = list(entity.keys())[0]
+    for instance in scripts:
+        instance_id = list(instance.keys())[0]
+        if instance_id == entity_id and instance[instance_id].get('fromversion') == entity[entity_id]['fromversion']:
+            instance[entity_id] = entity[entity_id]
+            break
+    else:
+        scripts.append(entity)
+
+    for section in ids_dict.values():
+        section.sort(key=lambda r: list(r.keys())[0].lower())
+
+    with open(id_set_path, 'w') as id_set_file:
+        json.dump(ids_dict, id_set_file, indent=4)
+
+
+def indexed_update(id_set_path, entity):
+    id_set = IdSet.load(id_set_path)
+    id_set.upsert('scripts', entity)
+    id_set.sort()
+    if id_set.modified:
+        id_set.dump(id_set_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entries', type=int, default=10000, help='The number of entries in each id_set section.')
+    args = parser.parse_args()
+
+    new_entity = {'scripts005000a': {'name': 'new', 'file_path': 'Scripts/new.yml', 'fromversion': '5.0.0'}}
+    unchanged_entity = {'scripts000001': create_id_set(2)['scripts'][1]['scripts000001']}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        id_set_path = os.path.join(temp_dir, 'id_set.json')
+        for update in (previous_update, indexed_update):
+            for description, entity in (('new script', new_entity), ('unchanged script', unchanged_entity)):
+                with open(id_set_path, 'w') as id_set_file:
+                    json.dump(create_id_set(args.entries), id_set_file, indent=4)
+
+                start = time.time()
+                update(id_set_path, entity)
+                print('{} - {}: {:.3f}s'.format(update.__name__, description, time.time() - start))
+
+
+if __name__ == '__main__':
+    main()
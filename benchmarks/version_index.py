@@ -0,0 +1,81 @@
+"""Benchmark of version range queries over the id_set.
+
+Compares looking up the versions of an id that are active on a server version, or that overlap a version range, by
+comparing LooseVersion objects of every version of the id, with the queries of the IdSet version range index.
+
+Usage:
+    python benchmarks/version_index.py [--entries 10000] [--versions 4]
+"""
+import argparse
+import random
+import time
+from distutils.version import LooseVersion
+
+from demisto_sdk.commands.common.id_set import IdSet, get_version_range
+from demisto_sdk.commands.common.version_index import is_version_overlap
+
+
+def create_id_set(entries, versions):
+    """Creates an id_set with `entries` script ids, each with `versions` consecutive versions."""
+    scripts = []
+    for index in range(entries):
+        entity_id = 'script{}'.format(index)
+        for version in range(versions):
+            data = {'name': entity_id, 'file_path': '{}_{}.yml'.format(entity_id, version)}
+            if version:
+                data['fromversion'] = '4.{}.0'.format(version)
+            if version < versions - 1:
+                data['toversion'] = '4.{}.9'.format(version)
+            scripts.append({entity_id: data})
+
+    return IdSet({'scripts': scripts, 'playbooks': [], 'integrations': [], 'TestPlaybooks': []})
+
+
+def loose_version_get_active(id_set, entity_id, version):
+    version = LooseVersion(version)
+    return [data for data in id_set.get_all('scripts', entity_id)
+            if LooseVersion(get_version_range(data)[0]) <= version <= LooseVersion(get_version_range(data)[1])]
+
+
+def loose_version_get_overlapping(id_set, entity_id, fromversion, toversion):
+    version_range = (LooseVersion(fromversion), LooseVersion(toversion))
+    return [data for data in id_set.get_all('scripts', entity_id)
+            if is_version_overlap(version_range, tuple(map(LooseVersion, get_version_range(data))))]
+
+
+def run(name, queries, query):
+    start = time.time()
+    results = [query(*arguments) for arguments in queries]
+    print('{}: {:.3f}s'.format(name, time.time() - start))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entries', type=int, default=10000, help='The number of script ids in the id_set.')
+    parser.add_argument('--versions', type=int, default=4, help='The number of versions of every script id.')
+    args = parser.parse_args()
+
+    id_set = create_id_set(args.entries, args.versions)
+    rand = random.Random(0)
+    server_versions = ['4.{}.{}'.format(minor, patch) for minor in range(args.versions) for patch in range(10)]
+    point_queries = [('script{}'.format(rand.randrange(args.entries)), rand.choice(server_versions))
+                     for _ in range(args.entries)]
+    range_queries = [(entity_id, version, '99.99.99') for entity_id, version in point_queries]
+
+    loose_version_active = run('LooseVersion active', point_queries,
+                               lambda entity_id, version: loose_version_get_active(id_set, entity_id, version))
+    # the index of the section is built by the first query
+    indexed_active = run('indexed active', point_queries,
+                         lambda entity_id, version: id_set.get_active('scripts', entity_id, version))
+    loose_version_overlapping = run('LooseVersion overlapping', range_queries,
+                                    lambda *query: loose_version_get_overlapping(id_set, *query))
+    indexed_overlapping = run('indexed overlapping', range_queries,
+                              lambda *query: id_set.get_overlapping('scripts', *query))
+
+    assert loose_version_active == indexed_active
+    assert loose_version_overlapping == indexed_overlapping
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark of the yml loaders.
+
+Loads every yml of the test files with the pure Python loaders of PyYAML and yamlordereddictloader and with the
+yaml_io loaders, which use the libyaml C parser when PyYAML was built with it.
+
+Usage:
+    python benchmarks/yaml_io.py [--dir demisto_sdk/tests/test_files] [--rounds 5]
+"""
+import argparse
+import glob
+import os
+import time
+
+import yaml
+import yamlordereddictloader
+
+from demisto_sdk.commands.common import yaml_io
+
+
+def load_all(contents, load_function, rounds):
+    start = time.time()
+    for _ in range(rounds):
+        loaded = [load_function(content) for content in contents]
+
+    return time.time() - start, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dir', default='demisto_sdk/tests/test_files', help='The directory of the ymls to load.')
+    parser.add_argument('--rounds', type=int, default=5, help='The number of times every yml is loaded.')
+    args = parser.parse_args()
+
+    contents = []
+    for file_path in sorted(glob.glob(os.path.join(args.dir, '**', '*.yml'), recursive=True)):
+        with open(file_path) as yml_file:
+            contents.append(yml_file.read())
+
+    print('{} ymls, {:.1f} MB, libyaml available: {}'.format(
+        len(contents), sum(len(content) for content in contents) / 2 ** 20, yaml_io.IS_LIBYAML_AVAILABLE))
+    loaders = [
+        ('yaml.safe_load', yaml.safe_load, yaml_io.safe_load),
+        ('yamlordereddictloader.SafeLoader',
+         lambda content: yaml.load(content, Loader=yamlordereddictloader.SafeLoader), yaml_io.ordered_load),
+    ]
+    for name, python_load, fast_load in loaders:
+        python_time, python_data = load_all(contents, python_load, args.rounds)
+        fast_time, fast_data = load_all(contents, fast_load, args.rounds)
+        print('{}: {:.3f}s, yaml_io: {:.3f}s ({:.1f}x)'.format(name, python_time, fast_time, python_time / fast_time))
+        assert python_data == fast_data
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 # Site packages
 import os
+import json
 from pkg_resources import get_distribution
 import sys
 
@@ -18,6 +19,7 @@ from demisto_sdk.commands.lint.lint_manager import LintManager
 from demisto_sdk.commands.secrets.secrets import SecretsValidator
 from demisto_sdk.commands.run_playbook.playbook_runner import PlaybookRunner
 from demisto_sdk.commands.validate.file_validator import FilesValidator
+from demisto_sdk.commands.validate.watch import ValidationWatcher
 from demisto_sdk.commands.create_artifacts.content_creator import ContentCreator
 from demisto_sdk.commands.json_to_outputs.json_to_outputs import json_to_outputs
 from demisto_sdk.commands.generate_test_playbook.test_playbook_generator import PlaybookTestsGenerator
@@ -25,6 +27,14 @@ from demisto_sdk.commands.generate_docs.generate_integration_doc import generate
 from demisto_sdk.commands.generate_docs.generate_script_doc import generate_script_doc
 from demisto_sdk.commands.generate_docs.generate_playbook_doc import generate_playbook_doc
 from demisto_sdk.validation.type_file.find_type import find_type
+from demisto_sdk.commands.common.update_id_set import re_create_id_set, verify_id_set_cache, ID_SET_PATH
+from demisto_sdk.commands.common.id_set_dependencies import DependencyIndex, DEPENDENCY_KINDS
+from demisto_sdk.commands.common.id_set_db import IdSetDB, get_db_path
+from demisto_sdk.commands.common.parsed_file_cache import PARSED_FILE_CACHE
+from demisto_sdk.commands.common.disk_parse_cache import DiskParseCache
+from demisto_sdk.commands.common.file_watcher import DEFAULT_POLLING_INTERVAL, get_file_watcher
+from demisto_sdk.commands.common.docker_tags import DOCKER_TAG_RESOLVER, DOCKER_TAGS_SNAPSHOT_ENV, \
+    DOCKER_TAGS_SNAPSHOT_PATH, create_snapshot, get_yml_image_name, load_snapshot
 
 # Common tools
 from demisto_sdk.commands.common.tools import print_error
@@ -54,9 +64,17 @@ pass_config = click.make_pass_decorator(DemistoSDK, ensure=True)
     '-v', '--version', help='Get the demisto-sdk version.',
     is_flag=True, default=False, show_default=True
 )
+@click.option(
+    '--parse-cache', help='Keep the parsed yml and json files in a cache directory (~/.cache/demisto-sdk/parsed or '
+                          '$DEMISTO_SDK_PARSE_CACHE_DIR) and reuse them in the next runs while the files are '
+                          'unchanged.',
+    is_flag=True, default=False, envvar='DEMISTO_SDK_PARSE_CACHE'
+)
 @pass_config
-def main(config, version, env_dir):
+def main(config, version, env_dir, parse_cache):
     config.configuration = Configuration()
+    if parse_cache:
+        PARSED_FILE_CACHE.disk_cache = DiskParseCache()
     if version:
         version = get_distribution('demisto-sdk').version
         print(version)
@@ -194,6 +212,33 @@ def unify(**kwargs):
 @click.option(
     '-p', '--path', help='Path of file to validate specifically.'
 )
+@click.option(
+    '--jobs', type=click.IntRange(min=1), default=1, show_default=True,
+    help='The number of worker processes to validate the schemes of all the files with, when all the files are '
+         'validated.')
+@click.option(
+    '--fast-schema', is_flag=True,
+    help='Validate the schemes with Python validators generated from the schemas, which are cached in '
+         '~/.cache/demisto-sdk/schemas. Files they find invalid are validated again by pykwalify for its errors.')
+@click.option(
+    '--no-validation-cache', is_flag=True,
+    help='Validate all the modified and added files, including files that passed the same validation before. The '
+         'results are cached in ~/.cache/demisto-sdk/validation or $DEMISTO_SDK_VALIDATION_CACHE_DIR.')
+@click.option(
+    '--docker-tags-snapshot', type=click.Path(exists=True, dir_okay=False), envvar=DOCKER_TAGS_SNAPSHOT_ENV,
+    help='Check the latest docker image tags against a snapshot written by create-docker-tags-snapshot, without '
+         'connecting to the registry. (default: $DEMISTO_SDK_DOCKER_TAGS_SNAPSHOT)')
+@click.option(
+    '--watch', is_flag=True,
+    help='After validating, keep watching the content files and validate the files that change, and the files that '
+         'depend on them, until interrupted.')
+@click.option(
+    '--watch-polling', is_flag=True,
+    help='Watch the files by scanning them every --watch-interval seconds, e.g. on network or container mounts. '
+         'They are watched with inotify by default, where it is available.')
+@click.option(
+    '--watch-interval', type=click.FloatRange(min=0.05), default=DEFAULT_POLLING_INTERVAL, show_default=True,
+    help='The seconds between two scans of the files, when they are watched by scanning them.')
 @pass_config
 def validate(config, **kwargs):
     sys.path.append(config.configuration.env_dir)
@@ -204,14 +249,212 @@ def validate(config, **kwargs):
         print_error(F'File {file_path} was not found')
         return 1
     else:
+        if kwargs['docker_tags_snapshot']:
+            try:
+                DOCKER_TAG_RESOLVER.use_snapshot(load_snapshot(kwargs['docker_tags_snapshot']))
+            except ValueError as error:
+                print_error(str(error))
+                return 1
+
         validator = FilesValidator(configuration=config.configuration,
                                    is_backward_check=not kwargs['no_backward_comp'],
                                    is_circle=kwargs['post_commit'], prev_ver=kwargs['prev_ver'],
                                    validate_conf_json=kwargs['conf_json'], use_git=kwargs['use_git'],
-                                   file_path=kwargs.get('path'))
+                                   file_path=kwargs.get('path'), jobs=kwargs['jobs'],
+                                   fast_schema=kwargs['fast_schema'],
+                                   validation_cache=not kwargs['no_validation_cache'])
+        if kwargs['watch']:
+            file_watcher = get_file_watcher(polling=kwargs['watch_polling'], interval=kwargs['watch_interval'])
+            return ValidationWatcher(validator, file_watcher).run()
+
         return validator.run()
 
 
+# ====================== create-docker-tags-snapshot ====================== #
+@main.command(name="create-docker-tags-snapshot",
+              short_help='Write the latest tags of the docker images of the integrations and scripts to a snapshot, '
+                         'for validate --docker-tags-snapshot on machines without access to the registry.')
+@click.help_option(
+    '-h', '--help'
+)
+@click.option(
+    '-o', '--output', default=DOCKER_TAGS_SNAPSHOT_PATH, show_default=True, help='The path to write the snapshot to.')
+@click.option(
+    '--image', 'images', multiple=True,
+    help='An image to add to the snapshot, e.g. demisto/python3, in addition to the images of the content repo. '
+         'Can be given more than once.')
+def create_docker_tags_snapshot(**kwargs):
+    image_names = {get_yml_image_name(file_path)
+                   for file_path, _ in FilesValidator.get_files_of_schemes({'integration', 'script'})}
+    image_names.update(kwargs['images'])
+    image_names.discard(None)
+    errors = create_snapshot(kwargs['output'], image_names)
+    for image_name, error in sorted(errors.items()):
+        print_error('Failed getting tag for: {}. {}'.format(image_name, error))
+
+    print('Wrote the latest tags of {} docker images to {}'.format(len(image_names) - len(errors), kwargs['output']))
+    return 1 if errors else 0
+
+
+# ====================== create-id-set ====================== #
+@main.command(name="create-id-set",
+              short_help='Create the id_set.json file of the content repo. Only files changed since the previous run '
+                         'are re-processed, the rest are taken from the id_set cache.')
+@click.help_option(
+    '-h', '--help'
+)
+@click.option(
+    '-o', '--output', default=ID_SET_PATH, show_default=True, help='The path to write the id_set.json file to.')
+@click.option(
+    '--cache-path', help='The path of the id_set cache file. (default: a file per content repo in '
+                         '~/.cache/demisto-sdk/id_set or $DEMISTO_SDK_ID_SET_CACHE_DIR)')
+@click.option(
+    '--no-cache', is_flag=True, help='Re-process all the content files and ignore the id_set cache.')
+@click.option(
+    '--verify', is_flag=True, help='Verify that an id_set created from the cache is identical to a full rebuild.')
+@click.option(
+    '-w', '--workers', type=int, help='The number of worker processes. (default: twice the number of CPUs)')
+@click.option(
+    '--sqlite', is_flag=True, help='Also write the id_set to a SQLite store (id_set.db) next to the id_set.json file, '
+                                   'an existing store is always updated.')
+def create_id_set(**kwargs):
+    if kwargs['verify'] and not verify_id_set_cache(cache_path=kwargs['cache_path'], workers=kwargs['workers']):
+        return 1
+
+    re_create_id_set(id_set_path=kwargs['output'], use_cache=not kwargs['no_cache'], cache_path=kwargs['cache_path'],
+                     workers=kwargs['workers'], use_db=kwargs['sqlite'])
+    return 0
+
+
+# ====================== id-set ====================== #
+@main.group(name="id-set", short_help='Query the id_set.json file of the content repo.')
+@click.help_option(
+    '-h', '--help'
+)
+def id_set_group():
+    pass
+
+
+@id_set_group.command(name="used-by",
+                      short_help='List the scripts, playbooks and integrations that use a script, an integration '
+                                 'command or a playbook.')
+@click.help_option(
+    '-h', '--help'
+)
+@click.option(
+    '-i', '--input', help='The id of the script or playbook, or the name of the integration command.', required=True)
+@click.option(
+    '-k', '--kind', type=click.Choice(DEPENDENCY_KINDS), default='scripts', show_default=True,
+    help='The kind of the entity given in the input.')
+@click.option(
+    '--id-set', 'id_set_path', default=ID_SET_PATH, show_default=True, help='The path of the id_set.json file.')
+def id_set_used_by(**kwargs):
+    if not os.path.isfile(kwargs['id_set_path']):
+        print_error(F'id_set.json file {kwargs["id_set_path"]} was not found')
+        return 1
+
+    dependency_index = DependencyIndex.for_id_set(kwargs['id_set_path'])
+    for user in dependency_index.get_used_by(kwargs['input'], kind=kwargs['kind']):
+        print('{}: {} ({})'.format(user['section'], user['id'], user['name']))
+
+    return 0
+
+
+@id_set_group.command(name="query",
+                      short_help='Query the SQLite store of the id_set, written by create-id-set --sqlite.')
+@click.help_option(
+    '-h', '--help'
+)
+@click.option(
+    '-s', '--section', type=click.Choice(['scripts', 'playbooks', 'integrations', 'TestPlaybooks']),
+    help='The id_set section of the entities.')
+@click.option(
+    '--id', 'entity_id', help='The id of the entities.')
+@click.option(
+    '--name', help='The name of the entities.')
+@click.option(
+    '--command', help='An integration command the entities implement.')
+@click.option(
+    '--uses-script', help='A script the entities use.')
+@click.option(
+    '--uses-command', help='An integration command the entities use.')
+@click.option(
+    '--uses-playbook', help='A sub-playbook the entities use.')
+@click.option(
+    '--max-from-version', help='Only entities with fromversion lower or equal to this version.')
+@click.option(
+    '--min-to-version', help='Only entities with toversion higher or equal to this version.')
+@click.option(
+    '--json', 'as_json', is_flag=True, help='Print the id_set data of the matching entities as json.')
+@click.option(
+    '--db', 'db_path', default=get_db_path(ID_SET_PATH), show_default=True, help='The path of the id_set.db file.')
+def id_set_query(db_path, as_json, **kwargs):
+    if not os.path.isfile(db_path):
+        print_error(F'id_set store {db_path} was not found, create it with `demisto-sdk create-id-set --sqlite`')
+        return 1
+
+    with IdSetDB(db_path) as id_set_db:
+        entities = id_set_db.query(**kwargs)
+
+    if as_json:
+        print(json.dumps([{entity_id: entity_data} for _, entity_id, entity_data in entities], indent=4))
+    else:
+        for section, entity_id, entity_data in entities:
+            print('{}: {} ({})'.format(section, entity_id, entity_data.get('file_path')))
+
+    return 0
+
+
+@id_set_group.command(name="export", short_help='Export the SQLite store of the id_set to an id_set.json file.')
+@click.help_option(
+    '-h', '--help'
+)
+@click.option(
+    '-o', '--output', default=ID_SET_PATH, show_default=True, help='The path to write the id_set.json file to.')
+@click.option(
+    '--db', 'db_path', default=get_db_path(ID_SET_PATH), show_default=True, help='The path of the id_set.db file.')
+def id_set_export(db_path, output):
+    if not os.path.isfile(db_path):
+        print_error(F'id_set store {db_path} was not found, create it with `demisto-sdk create-id-set --sqlite`')
+        return 1
+
+    with IdSetDB(db_path) as id_set_db:
+        id_set_db.export(output)
+
+    return 0
+
+
+# ====================== parse-cache ====================== #
+@main.group(name="parse-cache", short_help='Manage the cache of parsed files used with `demisto-sdk --parse-cache`.')
+@click.help_option(
+    '-h', '--help'
+)
+def parse_cache_group():
+    pass
+
+
+@parse_cache_group.command(name="stats", short_help='Print the number of cached files and their size.')
+@click.help_option(
+    '-h', '--help'
+)
+def parse_cache_stats():
+    for stat, value in DiskParseCache().get_stats().items():
+        if stat in ('cache_dir', 'entries', 'bytes', 'max_bytes'):
+            print('{}: {}'.format(stat, value))
+
+    return 0
+
+
+@parse_cache_group.command(name="clear", short_help='Delete all the cached files.')
+@click.help_option(
+    '-h', '--help'
+)
+def parse_cache_clear():
+    disk_cache = DiskParseCache()
+    print('Deleted {} cached files from {}'.format(disk_cache.clear(), disk_cache.cache_dir))
+    return 0
+
+
 # ====================== create ====================== #
 @main.command(name="create-content-artifacts",
               short_help='Create content artifacts. This will generate content_new.zip file which can be used to '
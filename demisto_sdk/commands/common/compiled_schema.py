@@ -0,0 +1,169 @@
+"""pykwalify schemas loaded and compiled once per process.
+
+pykwalify's Core reads the schema file and builds its rules for every file it validates. CompiledSchema reads a schema
+once and builds the rules of its root and of its partial (`schema;<name>`) schemas once, and validates already loaded
+data with them through a Core whose rules are the compiled ones - the validation itself and its errors are pykwalify's.
+
+pykwalify loads yml files with YAML 1.2 (ruamel), where `yes` and `no` are strings, while the SDK loads them with YAML
+1.1 (PyYAML), where they are booleans. The data to validate a yml against its schema is loaded like pykwalify loads it,
+by load_yaml_for_schema - with the libyaml C parser and the YAML 1.2 scalar resolution of ruamel. Documents it doesn't
+load the same way - YAML directives, explicit tags, merge keys, duplicate keys and errors - are loaded with pykwalify's
+own loader.
+"""
+from functools import lru_cache
+from io import StringIO
+
+import pykwalify
+import yaml
+from pykwalify.compat import yml
+from pykwalify.core import Core
+from pykwalify.rule import Rule
+from ruamel.yaml import resolver as ruamel_resolver
+from ruamel.yaml.constructor import SafeConstructor as RuamelSafeConstructor
+
+from demisto_sdk.commands.common import yaml_io
+
+MERGE_TAG = 'tag:yaml.org,2002:merge'
+
+
+class UnsupportedDocument(Exception):
+    """Raised by SchemaSourceLoader for documents that are loaded with pykwalify's loader."""
+
+
+class SchemaSourceLoader(yaml_io.BaseSafeLoader):  # type: ignore
+    """Loads YAML 1.2 core schema documents like pykwalify's loader, using the libyaml parser when available."""
+    yaml_implicit_resolvers = {}  # type: dict
+    yaml_constructors = {}  # type: dict
+    timestamp_regexp = RuamelSafeConstructor.timestamp_regexp
+    construct_yaml_timestamp = RuamelSafeConstructor.construct_yaml_timestamp
+
+    def resolve(self, kind, value, implicit):
+        if kind is yaml.ScalarNode and implicit == (False, False):
+            # the non specific `!` tag, ruamel resolves it differently
+            raise UnsupportedDocument('!')
+
+        return super().resolve(kind, value, implicit)
+
+    def construct_yaml_int(self, node):
+        # ruamel's YAML 1.2 ints - a leading 0 is not octal
+        value = self.construct_scalar(node).replace('_', '')
+        sign = -1 if value[0] == '-' else 1
+        if value[0] in '+-':
+            value = value[1:]
+        for prefix, base in (('0b', 2), ('0x', 16), ('0o', 8)):
+            if value.startswith(prefix):
+                return sign * int(value[2:], base)
+
+        return sign * int(value)
+
+    def construct_mapping(self, node, deep=False):
+        if isinstance(node, yaml.MappingNode) and any(key_node.tag == MERGE_TAG for key_node, _ in node.value):
+            raise UnsupportedDocument('merge keys')
+
+        mapping = yaml.constructor.BaseConstructor.construct_mapping(self, node, deep=deep)
+        if len(mapping) != len(node.value):
+            raise UnsupportedDocument('duplicate keys')
+
+        return mapping
+
+    def construct_unsupported(self, node):
+        raise UnsupportedDocument(node.tag)
+
+
+for versions, tag, regexp, first in ruamel_resolver.implicit_resolvers:
+    if (1, 2) in versions:
+        SchemaSourceLoader.add_implicit_resolver(tag, regexp, first)
+
+for tag, constructor in (('null', yaml.constructor.SafeConstructor.construct_yaml_null),
+                         ('bool', yaml.constructor.SafeConstructor.construct_yaml_bool),
+                         ('int', SchemaSourceLoader.construct_yaml_int),
+                         ('float', yaml.constructor.SafeConstructor.construct_yaml_float),
+                         ('timestamp', SchemaSourceLoader.construct_yaml_timestamp),
+                         ('str', yaml.constructor.SafeConstructor.construct_yaml_str),
+                         ('seq', yaml.constructor.SafeConstructor.construct_yaml_seq),
+                         ('map', yaml.constructor.SafeConstructor.construct_yaml_map)):
+    SchemaSourceLoader.add_constructor('tag:yaml.org,2002:' + tag, constructor)
+SchemaSourceLoader.add_constructor(None, SchemaSourceLoader.construct_unsupported)
+
+
+def load_yaml_for_schema(stream):
+    """Loads a yml like pykwalify loads the files it validates.
+
+    Args:
+        stream (str|file): the YAML document.
+
+    Returns:
+        object. The parsed document.
+    """
+    content = stream.read() if hasattr(stream, 'read') else stream
+    if '%YAML' not in content:
+        try:
+            return yaml.load(content, Loader=SchemaSourceLoader)
+        except Exception:
+            # pykwalify's loader decides, and raises its own errors for invalid documents
+            pass
+
+    if hasattr(stream, 'read'):
+        content_stream = StringIO(content)
+        content_stream.name = getattr(stream, 'name', '<file>')
+        return yml.load(content_stream)
+
+    return yml.load(content)
+
+
+class CompiledSchemaCore(Core):
+    """A pykwalify Core that validates with the rules of a CompiledSchema instead of building them."""
+
+    def __init__(self, compiled_schema, source_data):
+        super().__init__(source_data=source_data, schema_data=compiled_schema.schema)
+        self.compiled_schema = compiled_schema
+
+    def _start_validate(self, value=None):
+        self.errors = []
+        # the partial schemas are global in pykwalify, register them again in case another schema replaced them
+        pykwalify.partial_schemas.update(self.compiled_schema.partial_rules)
+        self.root_rule = self.compiled_schema.root_rule
+        self._validate(value, self.root_rule, '', [])
+
+
+class CompiledSchema:
+    """CompiledSchema holds the rules of a pykwalify schema file.
+
+    Attributes:
+        schema_path (str): the path of the schema file.
+        schema (dict): the root schema, without the partial schemas.
+        root_rule (Rule): the rule of the root schema.
+        partial_rules (dict): maps the name of a partial schema to its rule.
+    """
+
+    def __init__(self, schema_path):
+        self.schema_path = schema_path
+        with open(schema_path, 'r') as schema_file:
+            schema_data = yml.load(schema_file)
+
+        self.schema = {}
+        self.partial_rules = {}
+        for key, value in schema_data.items():
+            if key.startswith('schema;'):
+                self.partial_rules[key.split(';', 1)[1]] = Rule(schema=value)
+            else:
+                self.schema[key] = value
+
+        self.root_rule = Rule(schema=self.schema)
+
+    def validate(self, source_data):
+        """Validates data against the schema, like Core(...).validate(raise_exception=True).
+
+        Args:
+            source_data (object): the data to validate, it is not changed.
+
+        Returns:
+            object. The validated data. pykwalify.errors.SchemaError is raised if it is invalid.
+        """
+        return CompiledSchemaCore(self, source_data).validate(raise_exception=True)
+
+
+@lru_cache(maxsize=None)
+def get_compiled_schema(schema_path):
+    """Returns the compiled schema of a schema file, compiled on its first use in the process."""
+    return CompiledSchema(schema_path)
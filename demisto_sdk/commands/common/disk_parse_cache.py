@@ -0,0 +1,222 @@
+"""Persistent cache of parsed yml and json files, shared between runs of the SDK.
+
+Every run of validate, lint or create-id-set parses the same unchanged content files again. When the disk cache is
+enabled (`demisto-sdk --parse-cache ...`), a parsed file is pickled to the cache directory, keyed by a sha1 of its
+content and of the parser, and the next run that reads the same content unpickles it instead of parsing it.
+
+The parser part of the key holds the name of the parse function, the versions of PyYAML and Python and
+DISK_PARSE_CACHE_VERSION, so upgrading any of them starts a new set of entries - the old ones are evicted in time. The
+cache is bounded in size, the least recently used entries are deleted first (a hit touches the mtime of its entry).
+
+Entries are pickles, the cache directory is created readable by its owner only and should not be shared.
+"""
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from collections import OrderedDict
+from io import StringIO
+
+import yaml
+
+DISK_PARSE_CACHE_DIR_ENV = 'DEMISTO_SDK_PARSE_CACHE_DIR'
+# bump when the parsed data changes without a change of the parser, older entries are ignored
+DISK_PARSE_CACHE_VERSION = 1
+DEFAULT_MAX_BYTES = 512 * 2 ** 20
+ENTRY_SUFFIX = '.pickle'
+# evict down to this part of the maximal size, so a full cache isn't scanned on every write
+EVICT_TO_RATIO = 0.9
+_MISSING = object()
+
+
+def get_default_cache_dir():
+    """Returns the directory of the parse cache, $DEMISTO_SDK_PARSE_CACHE_DIR or ~/.cache/demisto-sdk/parsed."""
+    if os.environ.get(DISK_PARSE_CACHE_DIR_ENV):
+        return os.path.expanduser(os.environ[DISK_PARSE_CACHE_DIR_ENV])
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'demisto-sdk', 'parsed')
+
+
+def get_parser_key(parse_function):
+    """Returns the part of the cache key that identifies a parser and the versions the parsed data depends on."""
+    return '{}.{}:{}:{}.{}:{}'.format(getattr(parse_function, '__module__', ''),
+                                      getattr(parse_function, '__qualname__', repr(parse_function)),
+                                      yaml.__version__, sys.version_info[0], sys.version_info[1],
+                                      DISK_PARSE_CACHE_VERSION)
+
+
+class DiskParseCache:
+    """DiskParseCache keeps parsed files as pickles in a directory, keyed by their content and parser.
+
+    Attributes:
+        cache_dir (str): the directory of the cache entries.
+        max_bytes (int): the total size of the entries to keep.
+        hits (int): the number of files served from the cache in this process.
+        misses (int): the number of files that were parsed in this process.
+        writes (int): the number of entries written in this process.
+        evictions (int): the number of entries deleted in this process to keep the cache within its size.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or get_default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        # the total size of the entries, scanned on the first write and kept up to date by this process
+        self._size = None  # type: ignore
+
+    def get_entry_path(self, content, parse_function):
+        """Returns the path of the entry of a content parsed by a parser.
+
+        Args:
+            content (bytes): the content of the file.
+            parse_function (function): the parser.
+
+        Returns:
+            str. The path of the entry, whether it exists or not.
+        """
+        key_hash = hashlib.sha1(get_parser_key(parse_function).encode('utf-8'))
+        key_hash.update(b'\0')
+        key_hash.update(content)
+        key = key_hash.hexdigest()
+        return os.path.join(self.cache_dir, key[:2], key + ENTRY_SUFFIX)
+
+    def parse(self, content, parse_function):
+        """Parses a content, or returns its cached parsed data if it was parsed before by the same parser.
+
+        Args:
+            content (str): the content of the file.
+            parse_function (function): the parser, called with a file like object of the content.
+
+        Returns:
+            object. The parsed data, errors of the parser are raised and nothing is cached.
+        """
+        entry_path = self.get_entry_path(content.encode('utf-8'), parse_function)
+        data = self._read(entry_path)
+        if data is not _MISSING:
+            self.hits += 1
+            return data
+
+        self.misses += 1
+        data = parse_function(StringIO(content))
+        self._write(entry_path, data)
+        return data
+
+    def _read(self, entry_path):
+        try:
+            with open(entry_path, 'rb') as entry_file:
+                data = pickle.load(entry_file)
+        except FileNotFoundError:
+            return _MISSING
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, TypeError):
+            # a truncated or unreadable entry is parsed again and rewritten
+            self._delete(entry_path)
+            return _MISSING
+
+        try:
+            # mark the entry as recently used
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        return data
+
+    def _write(self, entry_path, data):
+        try:
+            pickled_data = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+
+        if len(pickled_data) > self.max_bytes:
+            return
+
+        entry_dir = os.path.dirname(entry_path)
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            os.makedirs(entry_dir, mode=0o700, exist_ok=True)
+            # write to a temporary file and rename it, so concurrent runs never read a partial entry
+            file_descriptor, temp_path = tempfile.mkstemp(dir=entry_dir, suffix='.tmp')
+            try:
+                with os.fdopen(file_descriptor, 'wb') as temp_file:
+                    temp_file.write(pickled_data)
+                os.replace(temp_path, entry_path)
+            except BaseException:
+                self._delete(temp_path)
+                raise
+        except OSError:
+            # the cache is an optimization, a read only or full disk just disables it for this file
+            return
+
+        self.writes += 1
+        if self._size is None:
+            self._size = sum(entry_size for _, entry_size, _ in self._scan())
+        else:
+            self._size += len(pickled_data)
+
+        if self._size > self.max_bytes:
+            self._evict(int(self.max_bytes * EVICT_TO_RATIO))
+
+    @staticmethod
+    def _delete(path):
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+    def _scan(self):
+        """Iterates over the (path, size, mtime) of the entries."""
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        for sub_dir in os.scandir(self.cache_dir):
+            if not sub_dir.is_dir():
+                continue
+
+            for entry in os.scandir(sub_dir.path):
+                if entry.name.endswith(ENTRY_SUFFIX):
+                    try:
+                        entry_stat = entry.stat()
+                    except OSError:
+                        continue
+
+                    yield entry.path, entry_stat.st_size, entry_stat.st_mtime_ns
+
+    def _evict(self, target_bytes):
+        """Deletes the least recently used entries until the entries take at most target_bytes."""
+        entries = sorted(self._scan(), key=lambda entry: entry[2])
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for entry_path, entry_size, _ in entries:
+            if size <= target_bytes:
+                break
+
+            if self._delete(entry_path):
+                self.evictions += 1
+            size -= entry_size
+
+        self._size = size
+
+    def clear(self):
+        """Deletes all the entries.
+
+        Returns:
+            int. The number of deleted entries.
+        """
+        deleted = 0
+        for entry_path, _, _ in list(self._scan()):
+            deleted += self._delete(entry_path)
+
+        self._size = 0
+        return deleted
+
+    def get_stats(self):
+        """Returns the entries and size of the cache directory and the counters of this process."""
+        entries = list(self._scan())
+        return OrderedDict([('cache_dir', self.cache_dir), ('entries', len(entries)),
+                            ('bytes', sum(entry_size for _, entry_size, _ in entries)), ('max_bytes', self.max_bytes),
+                            ('hits', self.hits), ('misses', self.misses), ('writes', self.writes),
+                            ('evictions', self.evictions)])
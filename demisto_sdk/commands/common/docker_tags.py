@@ -0,0 +1,527 @@
+"""Latest tags of docker images, resolved concurrently and cached between runs.
+
+DockerImageValidator checks that integrations and scripts use the latest tag of their docker image. Every check used to
+authenticate to the registry and request the tags of the image with new connections, one image at a time, even when
+many of the files use the same image.
+
+DockerTagResolver resolves the latest tag of every image once per process. The tags are requested from Docker Hub, and
+from the registry API when Docker Hub doesn't answer. Each host gets one requests session, so its connections are kept
+alive and reused, and the authentication challenge of a registry and its tokens are reused until they expire. Resolved
+tags are kept in a DockerTagCache on disk for DEFAULT_TTL seconds, so the next runs don't request them again. Once the
+changed files are known, prefetch resolves the images of all of them concurrently.
+
+CI runners without internet access can't resolve tags at all. A snapshot - a JSON file of the latest tag of every image,
+written by create_snapshot where the registry is reachable - is used instead: with a snapshot the resolver takes every
+tag from it and sends no requests, so the latest tag checks are deterministic and take no time.
+"""
+import hashlib
+import json
+import os
+import pickle
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+
+from pkg_resources import parse_version
+
+from demisto_sdk.commands.common import yaml_io
+from demisto_sdk.commands.common.parsed_file_cache import PARSED_FILE_CACHE
+from demisto_sdk.commands.common.remote_files import create_session
+from demisto_sdk.commands.common.tools import find_scheme_name
+
+DOCKER_TAGS_CACHE_DIR_ENV = 'DEMISTO_SDK_DOCKER_TAGS_CACHE_DIR'
+DOCKER_TAGS_SNAPSHOT_ENV = 'DEMISTO_SDK_DOCKER_TAGS_SNAPSHOT'
+# bump when the format of the snapshots changes, older snapshots are rejected
+DOCKER_TAGS_SNAPSHOT_VERSION = 1
+DOCKER_TAGS_SNAPSHOT_PATH = 'docker_tags_snapshot.json'
+# bump when the cache entries change, older entries are ignored
+DOCKER_TAGS_CACHE_VERSION = 1
+ENTRY_SUFFIX = '.pickle'
+# new tags are released every few days, an hour old tag is almost always still the latest
+DEFAULT_TTL = 60 * 60
+DEFAULT_WORKERS = 8
+# use 10 seconds timeout for requests
+TIMEOUT = 10
+DOCKER_HUB_URL = 'https://hub.docker.com'
+DEFAULT_REGISTRY = 'registry-1.docker.io'
+DEFAULT_REALM = 'https://auth.docker.io/token'
+DEFAULT_SERVICE = 'registry.docker.io'
+# tokens that expire within this many seconds are requested again
+TOKEN_EXPIRY_MARGIN = 5
+# the lifetime of a token without expires_in, by the docker token specification
+DEFAULT_TOKEN_LIFETIME = 60
+DEFAULT_DOCKER_IMAGE = 'demisto/python'
+ACCEPT_HEADER = {
+    'Accept': 'application/json, '
+              'application/vnd.docker.distribution.manifest.v2+json, '
+              'application/vnd.docker.distribution.manifest.list.v2+json'
+}
+
+
+def get_default_cache_dir():
+    """Returns the directory of the resolved tags, $DEMISTO_SDK_DOCKER_TAGS_CACHE_DIR or ~/.cache/demisto-sdk/docker."""
+    if os.environ.get(DOCKER_TAGS_CACHE_DIR_ENV):
+        return os.path.expanduser(os.environ[DOCKER_TAGS_CACHE_DIR_ENV])
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'demisto-sdk', 'docker')
+
+
+def get_image_name(docker_image):
+    """Gets the name of a docker image the way DockerImageValidator parses it, without printing errors.
+
+    Args:
+        docker_image (str): the docker image of a yml, e.g. demisto/python:1.3-alpine.
+
+    Returns:
+        str. The name of the image, demisto/python if there's no image and None if it isn't a demisto image.
+    """
+    if not docker_image:
+        return DEFAULT_DOCKER_IMAGE
+
+    image = re.findall(r'(demisto\/.+)', docker_image, re.IGNORECASE)
+    return image[0].split(':')[0] if image else None
+
+
+def get_yml_image_name(file_path):
+    """Gets the name of the docker image of an integration or a script yml, without printing errors.
+
+    Args:
+        file_path (str): the path of the file.
+
+    Returns:
+        str. The name of the image, None if the file isn't an integration or a script, can't be parsed or its image
+        isn't a demisto image.
+    """
+    scheme_name = find_scheme_name(file_path)
+    if scheme_name not in ('integration', 'script') or not os.path.isfile(file_path):
+        return None
+
+    try:
+        # errors are printed by the validators of the file
+        with open(file_path) as yml_file:
+            yml_data = PARSED_FILE_CACHE.parse(yml_file, yaml_io.safe_load)
+    except Exception:
+        return None
+
+    if scheme_name == 'integration':
+        yml_data = yml_data.get('script') if isinstance(yml_data, dict) else None
+
+    return get_image_name(yml_data.get('dockerimage', '')) if isinstance(yml_data, dict) else None
+
+
+def parse_www_auth(www_auth):
+    """Parse realm and service from www-authenticate string of the form:
+    Bearer realm="https://auth.docker.io/token",service="registry.docker.io"
+
+    :param www_auth: www-authenticate header value
+    :type www_auth: string
+    """
+    match = re.match(r'.*realm="(.+)",service="(.+)".*', www_auth, re.IGNORECASE)
+    if not match:
+        return ()
+    return match.groups()
+
+
+def clear_non_numbered_tags(tags):
+    """Clears a given tags list to only keep numbered tags
+
+    Args:
+        tags(list): list of docker image tag names - ordered in lexical order
+
+    Returns:
+        a tag list with only numbered tags
+    """
+    return [tag for tag in tags if re.match(r'^(?:\d+\.)*\d+$', tag) is not None]
+
+
+def lexical_find_latest_tag(tags):
+    """Will return the latest numeric docker image tag if possible - otherwise will return the last lexical tag.
+
+    for example for the tag list: [2.0.2000, 2.1.2700 2.1.373, latest], will return 2.1.2700
+
+    Args:
+        tags(list): list of docker image tag names - ordered in lexical order
+    """
+    only_numbered_tags = clear_non_numbered_tags(tags)
+
+    if len(only_numbered_tags) == 0:
+        return tags[-1]
+
+    max_tag = only_numbered_tags[0]
+
+    for num_tag in only_numbered_tags:
+        if parse_version(max_tag) < parse_version(num_tag):
+            max_tag = num_tag
+
+    return max_tag
+
+
+def find_latest_tag_by_date(tags):
+    """Get the latest tags by datetime comparison.
+
+    Args:
+        tags(list): List of dictionaries representing the docker image tags
+
+    Returns:
+        The last updated docker image tag name
+    """
+    latest_tag_name = 'latest'
+    latest_tag_date = datetime.now() - timedelta(days=400000)
+    for tag in tags:
+        tag_date = datetime.strptime(tag.get('last_updated'), '%Y-%m-%dT%H:%M:%S.%fZ')
+        if tag_date >= latest_tag_date:
+            latest_tag_date = tag_date
+            latest_tag_name = tag.get('name')
+
+    return latest_tag_name
+
+
+class DockerTagCache:
+    """DockerTagCache keeps the latest tags of docker images on disk, with the time they were resolved.
+
+    Attributes:
+        cache_dir (str): the directory of the cache entries.
+        ttl (int): the seconds a resolved tag is used for.
+    """
+
+    def __init__(self, cache_dir=None, ttl=DEFAULT_TTL):
+        self.cache_dir = cache_dir or get_default_cache_dir()
+        self.ttl = ttl
+
+    def get_entry_path(self, image_name):
+        key = hashlib.sha1('{}\0{}'.format(DOCKER_TAGS_CACHE_VERSION, image_name).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key + ENTRY_SUFFIX)
+
+    def get(self, image_name):
+        """Gets the cached latest tag of an image.
+
+        Args:
+            image_name (str): the name of the image, e.g. demisto/python.
+
+        Returns:
+            str. The latest tag, None if it isn't cached or older than the ttl.
+        """
+        try:
+            with open(self.get_entry_path(image_name), 'rb') as entry_file:
+                entry = pickle.load(entry_file)
+            if 0 <= time.time() - entry['time'] <= self.ttl:
+                return entry['tag']
+        except FileNotFoundError:
+            pass
+        except (OSError, EOFError, pickle.UnpicklingError, KeyError, TypeError, AttributeError, ImportError):
+            # a truncated entry is resolved again and rewritten
+            pass
+
+        return None
+
+    def set(self, image_name, tag):
+        """Caches the latest tag of an image, a read only or full disk leaves it uncached.
+
+        Args:
+            image_name (str): the name of the image, e.g. demisto/python.
+            tag (str): the latest tag of the image.
+        """
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            # write to a temporary file and rename it, so concurrent runs never read a partial entry
+            file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(file_descriptor, 'wb') as temp_file:
+                    pickle.dump({'image': image_name, 'tag': tag, 'time': time.time()}, temp_file,
+                                pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self.get_entry_path(image_name))
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError:
+            pass
+
+    def clear(self):
+        """Deletes all the entries, returns the number of deleted entries."""
+        deleted = 0
+        if os.path.isdir(self.cache_dir):
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(ENTRY_SUFFIX):
+                    try:
+                        os.remove(entry.path)
+                        deleted += 1
+                    except OSError:
+                        pass
+
+        return deleted
+
+
+class DockerTagResolver:
+    """DockerTagResolver finds the latest tags of docker images.
+
+    Every image is resolved once per process, the result - the tag or the error - is kept for the next callers.
+
+    Attributes:
+        hub_url (str): the url of Docker Hub, the tags of an image are listed by date at
+            <hub_url>/v2/repositories/<image>/tags.
+        registry_url (str): the url of the registry, the tags of an image are listed at
+            <registry_url>/v2/<image>/tags/list.
+        cache (DockerTagCache): the cache of the resolved tags, None to resolve them every time.
+        max_workers (int): the number of images prefetch resolves concurrently.
+        requests_count (int): the number of requests sent in this process.
+        cached_count (int): the number of images whose tags were taken from the cache.
+        snapshot (dict): maps images to their latest tags, which are used instead of the registry and the cache, None
+            to resolve the tags.
+    """
+
+    def __init__(self, hub_url=DOCKER_HUB_URL, registry_url='https://' + DEFAULT_REGISTRY, cache=None,
+                 max_workers=DEFAULT_WORKERS):
+        self.hub_url = hub_url
+        self.registry_url = registry_url
+        self.cache = cache
+        self.max_workers = max_workers
+        self.requests_count = 0
+        self.cached_count = 0
+        self._sessions = {}  # type: dict
+        # the realm and service of every registry, and the tokens by realm, service and scope
+        self._challenges = {}  # type: dict
+        self._tokens = {}  # type: dict
+        self._results = {}  # type: dict
+        self.snapshot = None  # type: dict
+        self._lock = threading.Lock()
+        self._challenge_lock = threading.Lock()
+
+    def get_session(self, url):
+        """Returns the session of the host of a url, the connections of every host are kept alive separately."""
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._sessions:
+                self._sessions[host] = create_session(pool_size=self.max_workers)
+
+            return self._sessions[host]
+
+    def _get(self, url, **kwargs):
+        with self._lock:
+            self.requests_count += 1
+
+        kwargs.setdefault('timeout', TIMEOUT)
+        return self.get_session(url).get(url, **kwargs)
+
+    def get_challenge(self, registry_url, verify=None):
+        """Gets the authentication challenge of a registry.
+
+        Args:
+            registry_url (str): the url of the registry.
+            verify (bool): whether to verify the certificate of the registry, None for the default of the session.
+
+        Returns:
+            tuple. (realm, service) of the registry, None if it doesn't require authentication.
+        """
+        # the concurrent resolutions of a prefetch wait for the first one to get the challenge
+        with self._challenge_lock:
+            if registry_url not in self._challenges:
+                res = self._get('{}/v2/'.format(registry_url), headers=ACCEPT_HEADER, verify=verify)
+                if res.status_code == 401:  # need to authenticate
+                    # defaults in case we fail for some reason
+                    realm, service = DEFAULT_REALM, DEFAULT_SERVICE
+                    # Should contain header: Www-Authenticate
+                    www_auth = res.headers.get('www-authenticate')
+                    if www_auth:
+                        parse_auth = parse_www_auth(www_auth)
+                        if parse_auth:
+                            realm, service = parse_auth
+                    self._challenges[registry_url] = (realm, service)
+                else:
+                    res.raise_for_status()
+                    self._challenges[registry_url] = None
+
+            return self._challenges[registry_url]
+
+    def get_auth_token(self, image_name, registry_url=None, verify=None):
+        """Authenticate to the docker service. Return an authentication token if authentication is required.
+
+        Tokens are reused until they expire.
+
+        Args:
+            image_name (str): the name of the image to pull, e.g. demisto/python.
+            registry_url (str): the url of the registry, the registry of the resolver by default.
+            verify (bool): whether to verify the certificates, None for the default of the session.
+
+        Returns:
+            str. The token, None if the registry doesn't require authentication.
+        """
+        challenge = self.get_challenge(registry_url or self.registry_url, verify)
+        if challenge is None:
+            return None
+
+        realm, service = challenge
+        scope = 'repository:{}:pull'.format(image_name)
+        with self._lock:
+            token, expires_at = self._tokens.get((realm, service, scope), (None, 0))
+        if token and time.time() < expires_at - TOKEN_EXPIRY_MARGIN:
+            return token
+
+        res = self._get(realm, params={'scope': scope, 'service': service}, headers=ACCEPT_HEADER, verify=verify)
+        res.raise_for_status()
+        res_json = res.json()
+        token = res_json.get('token')
+        expires_at = time.time() + (res_json.get('expires_in') or DEFAULT_TOKEN_LIFETIME)
+        with self._lock:
+            self._tokens[(realm, service, scope)] = (token, expires_at)
+
+        return token
+
+    def _resolve(self, image_name):
+        if not image_name:
+            raise ValueError('The docker image is not of demisto format')
+
+        if self.snapshot is not None:
+            if image_name not in self.snapshot:
+                raise LookupError('{} is not in the docker tags snapshot'.format(image_name))
+            return self.snapshot[image_name]
+
+        tag = self.cache.get(image_name) if self.cache is not None else None
+        if tag is not None:
+            with self._lock:
+                self.cached_count += 1
+            return tag
+
+        tag = ''
+        # first try to get the docker image tags using normal http request
+        res = self._get('{}/v2/repositories/{}/tags'.format(self.hub_url, image_name))
+        if res.status_code == 200:
+            tags = res.json().get('results', [])
+            # if http request successful find the latest tag by date in the response
+            if tags:
+                tag = find_latest_tag_by_date(tags)
+
+        else:
+            # if http request did not succeed than get tags using the API.
+            # See: https://docs.docker.com/registry/spec/api/#listing-image-tags
+            headers = ACCEPT_HEADER.copy()
+            auth_token = self.get_auth_token(image_name)
+            if auth_token:
+                headers['Authorization'] = 'Bearer {}'.format(auth_token)
+
+            res = self._get('{}/v2/{}/tags/list'.format(self.registry_url, image_name), headers=headers)
+            res.raise_for_status()
+            # the API returns tags in lexical order with no date info - so try an get the numeric highest tag
+            tags = res.json().get('tags', [])
+            if tags:
+                tag = lexical_find_latest_tag(tags)
+
+        if tag and self.cache is not None:
+            self.cache.set(image_name, tag)
+
+        return tag
+
+    def _resolve_result(self, image_name):
+        try:
+            return self._resolve(image_name), None
+        except Exception as error:
+            return None, error
+
+    def resolve(self, image_name):
+        """Gets the latest tag of a docker image, resolving it if it wasn't resolved or prefetched before.
+
+        Args:
+            image_name (str): the name of the image, e.g. demisto/python.
+
+        Returns:
+            str. The latest tag, an empty string if the image has no tags. The error of the resolution is raised if it
+            failed.
+        """
+        if image_name not in self._results:
+            self._results[image_name] = self._resolve_result(image_name)
+
+        tag, error = self._results[image_name]
+        if error is not None:
+            raise error
+
+        return tag
+
+    def prefetch(self, image_names):
+        """Resolves images concurrently, for the later resolve calls.
+
+        Args:
+            image_names (iterable): the names of the images.
+        """
+        image_names = sorted({image_name for image_name in image_names
+                              if image_name and image_name not in self._results})
+        if not image_names:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(image_names))) as executor:
+            for image_name, result in zip(image_names, executor.map(self._resolve_result, image_names)):
+                self._results[image_name] = result
+
+    def use_snapshot(self, snapshot):
+        """Takes the tags from a snapshot from now on, instead of resolving them.
+
+        Args:
+            snapshot (dict): maps images to their latest tags, None to resolve the tags again.
+        """
+        self.snapshot = snapshot
+        self.clear()
+
+    def clear(self):
+        """Drops the tags resolved in this process."""
+        self._results.clear()
+
+
+def load_snapshot(snapshot_path):
+    """Loads a snapshot of the latest tags of docker images, written by create_snapshot.
+
+    Args:
+        snapshot_path (str): the path of the snapshot.
+
+    Returns:
+        dict. Maps the images to their latest tags.
+
+    Raises:
+        ValueError: if the file isn't a snapshot of this version.
+    """
+    with open(snapshot_path) as snapshot_file:
+        snapshot = json.load(snapshot_file)
+
+    if not isinstance(snapshot, dict) or snapshot.get('version') != DOCKER_TAGS_SNAPSHOT_VERSION or \
+            not isinstance(snapshot.get('images'), dict):
+        raise ValueError('{} is not a docker tags snapshot of version {}, create it again'.format(
+            snapshot_path, DOCKER_TAGS_SNAPSHOT_VERSION))
+
+    return snapshot['images']
+
+
+def create_snapshot(snapshot_path, image_names, resolver=None):
+    """Resolves the latest tags of docker images concurrently and writes them to a snapshot.
+
+    Args:
+        snapshot_path (str): the path to write the snapshot to.
+        image_names (iterable): the names of the images.
+        resolver (DockerTagResolver): the resolver of the tags, by default a new resolver without a cache, so the
+            snapshot has the current tags.
+
+    Returns:
+        dict. Maps the images that failed to resolve to their errors, they are left out of the snapshot.
+    """
+    resolver = resolver or DockerTagResolver()
+    image_names = sorted({image_name for image_name in image_names if image_name})
+    resolver.prefetch(image_names)
+    images, errors = {}, {}
+    for image_name in image_names:
+        try:
+            images[image_name] = resolver.resolve(image_name)
+        except Exception as error:
+            errors[image_name] = error
+
+    snapshot = {'version': DOCKER_TAGS_SNAPSHOT_VERSION,
+                'created': datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'images': images}
+    with open(snapshot_path, 'w') as snapshot_file:
+        json.dump(snapshot, snapshot_file, indent=4, sort_keys=True)
+        snapshot_file.write('\n')
+
+    return errors
+
+
+DOCKER_TAG_RESOLVER = DockerTagResolver(cache=DockerTagCache())
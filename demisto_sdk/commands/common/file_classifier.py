@@ -0,0 +1,200 @@
+"""Classification of content files by their paths, with precompiled regexes.
+
+The type of a content file is told by the first regex from `constants` its path matches. checked_type and
+find_scheme_name looped over dozens of regex strings with `re.match` for every path - a lookup in the cache of the re
+module and an attempt per regex - and every validator of a file classified its path again.
+
+RegexSet compiles a list of regexes once into a single alternation, each regex in a named group, so one match finds
+the first regex of the list the path matches, and remembers the result of every path. The numbered backreferences and
+the named groups of the regexes are renumbered and renamed to their place in the alternation. FileTypeClassifier
+classifies paths to the FileType of their scheme with one RegexSet of all the schemes' regexes.
+"""
+import re
+from enum import Enum
+from functools import lru_cache
+
+from demisto_sdk.commands.common.constants import REPUTATION_REGEX, SCHEMA_TO_REGEX
+
+# the results of a RegexSet are dropped when it has this many, a content repo has a few thousand files
+MAX_CACHED_PATHS = 1 << 16
+NAMED_GROUP_PATTERN = re.compile(r'\(\?P<([^>]+)>|\(\?P=([^)]+)\)|\(\?\((\w+)\)')
+OCTAL_DIGITS = '01234567'
+
+
+class FileType(Enum):
+    """The types of the content files, named after their schemes."""
+    INTEGRATION = 'integration'
+    PLAYBOOK = 'playbook'
+    SCRIPT = 'script'
+    WIDGET = 'widget'
+    DASHBOARD = 'dashboard'
+    CANVAS_CONTEXT_CONNECTIONS = 'canvas-context-connections'
+    CLASSIFIER = 'classifier'
+    LAYOUT = 'layout'
+    INCIDENT_FIELD = 'incidentfield'
+    INCIDENT_TYPE = 'incidenttype'
+    IMAGE = 'image'
+    REPUTATION = 'reputation'
+
+
+def shift_groups(regex, group_offset, name_prefix):
+    """Renumbers the backreferences and renames the named groups of a regex, for placing it after other groups.
+
+    Args:
+        regex (str): the regex.
+        group_offset (int): the number of groups before the regex.
+        name_prefix (str): the prefix of the names of its named groups.
+
+    Returns:
+        str. The regex with `\\N` and `(?(N)` referring to group N + group_offset, and `(?P<name>`, `(?P=name)` and
+        `(?(name)` to the group name_prefix + name.
+    """
+    def rename(match):
+        name = match.group(1) or match.group(2) or match.group(3)
+        if match.group(1):
+            return '(?P<{}{}>'.format(name_prefix, name)
+        if match.group(2):
+            return '(?P={}{})'.format(name_prefix, name)
+        if name.isdigit():
+            return '(?({})'.format(int(name) + group_offset)
+        return '(?({}{})'.format(name_prefix, name)
+
+    parts = []
+    index = 0
+    in_class = False
+    class_start = 0
+    while index < len(regex):
+        char = regex[index]
+        if char == '\\':
+            escape = regex[index + 1:index + 2]
+            digits = re.match(r'\d{1,3}', regex[index + 1:])
+            # outside of a class, \N and \NN are backreferences, \0 and three octal digits are octal escapes
+            if not in_class and digits and escape != '0' and not (
+                    len(digits.group()) == 3 and all(digit in OCTAL_DIGITS for digit in digits.group())):
+                group = digits.group()[:2]
+                parts.append('\\{}'.format(int(group) + group_offset))
+                index += 1 + len(group)
+                continue
+
+            parts.append(regex[index:index + 2])
+            index += 2
+            continue
+
+        if in_class:
+            # a ] right after the [ or the [^ is a literal
+            if char == ']' and not re.match(r'\[\^?$', regex[class_start:index]):
+                in_class = False
+        elif char == '[':
+            in_class = True
+            class_start = index
+        elif char == '(':
+            match = NAMED_GROUP_PATTERN.match(regex, index)
+            if match:
+                parts.append(rename(match))
+                index = match.end()
+                continue
+
+        parts.append(char)
+        index += 1
+
+    return ''.join(parts)
+
+
+class RegexSet:
+    """RegexSet matches paths against a list of regexes the way `re.match` with re.IGNORECASE does, one at a time.
+
+    Attributes:
+        regexes (tuple): the regexes.
+        pattern (Pattern): the alternation of the regexes, the alternative of regexes[i] is the group `_i`.
+    """
+
+    def __init__(self, regexes):
+        self.regexes = tuple(regexes)
+        alternatives = []
+        group_offset = 0
+        for index, regex in enumerate(self.regexes):
+            # the group of the alternative comes before the groups of the regex
+            group_offset += 1
+            alternatives.append('(?P<_{}>{})'.format(index, shift_groups(regex, group_offset, '_{}_'.format(index))))
+            group_offset += re.compile(regex).groups
+
+        self.pattern = re.compile('|'.join(alternatives), re.IGNORECASE)
+        self._results = {}  # type: dict
+
+    def match(self, path):
+        """Finds the first regex a path matches.
+
+        Args:
+            path (str): the path.
+
+        Returns:
+            int. The index of the regex, None if the path matches none of them.
+        """
+        try:
+            return self._results[path]
+        except KeyError:
+            pass
+
+        match = self.pattern.match(path)
+        # alternatives are tried in order and the group of the matched one is the outermost, so it is the last group
+        result = int(match.lastgroup[1:]) if match else None
+        if len(self._results) >= MAX_CACHED_PATHS:
+            self._results.clear()
+        self._results[path] = result
+        return result
+
+
+@lru_cache(maxsize=None)
+def _get_regex_set(regexes):
+    return RegexSet(regexes)
+
+
+def get_regex_set(regexes):
+    """Returns the RegexSet of a list of regexes, compiled once per process.
+
+    Args:
+        regexes (iterable): the regexes.
+
+    Returns:
+        RegexSet. The RegexSet of the regexes.
+    """
+    return _get_regex_set(tuple(regexes))
+
+
+class FileTypeClassifier:
+    """FileTypeClassifier tells the types of content files by their paths.
+
+    A path is of the type of the first scheme in SCHEMA_TO_REGEX whose regexes it matches, and a reputation if it
+    matches none of them but REPUTATION_REGEX.
+
+    Attributes:
+        regex_set (RegexSet): the regexes of all the types.
+        file_types (list): the FileType of every regex of regex_set.
+    """
+
+    def __init__(self, type_regexes=None):
+        """
+        Args:
+            type_regexes (list): (FileType, regexes) of the types, in the order they are matched.
+        """
+        if type_regexes is None:
+            type_regexes = [(FileType(scheme_name), regexes) for scheme_name, regexes in SCHEMA_TO_REGEX.items()]
+            type_regexes.append((FileType.REPUTATION, [REPUTATION_REGEX]))
+
+        self.file_types = [file_type for file_type, regexes in type_regexes for _ in regexes]
+        self.regex_set = get_regex_set(regex for _, regexes in type_regexes for regex in regexes)
+
+    def get_file_type(self, file_path):
+        """Gets the type of a content file.
+
+        Args:
+            file_path (str): the path of the file.
+
+        Returns:
+            FileType. The type of the file, None if it isn't of any type.
+        """
+        index = self.regex_set.match(file_path)
+        return self.file_types[index] if index is not None else None
+
+
+FILE_TYPE_CLASSIFIER = FileTypeClassifier()
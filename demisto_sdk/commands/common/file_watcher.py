@@ -0,0 +1,236 @@
+"""Watching the files of a directory tree for changes.
+
+InotifyWatcher is told about changes by the Linux kernel, through inotify, as soon as a file is written. It watches
+every directory of the tree, and the directories created in it. Where inotify isn't available - other platforms, or
+when the tree has more directories than the inotify watches limit allows - PollingWatcher scans the tree every
+interval and compares the mtime and size of the files to the previous scan.
+
+Both skip hidden directories, e.g. `.git`, and report the changed files by their paths relative to the watched
+directory, the way git lists them.
+"""
+import ctypes
+import errno
+import os
+import select
+import struct
+import time
+
+from demisto_sdk.commands.common.tools import print_warning
+
+DEFAULT_POLLING_INTERVAL = 0.5
+# inotify events of files that were written, created, deleted or moved
+IN_MODIFY = 0x2
+IN_CLOSE_WRITE = 0x8
+IN_MOVED_FROM = 0x40
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+# struct inotify_event is followed by its NUL padded name
+EVENT_HEADER = struct.Struct('iIII')
+READ_SIZE = 64 * 1024
+
+
+def walk_directories(root):
+    """Lists the directories of a tree, skipping hidden directories.
+
+    Args:
+        root (str): the root of the tree.
+
+    Returns:
+        iterator. (directory, file names) of the root and the directories under it.
+    """
+    for directory, dir_names, file_names in os.walk(root):
+        dir_names[:] = [dir_name for dir_name in dir_names if not dir_name.startswith('.')]
+        yield directory, file_names
+
+
+def get_relative_path(root, path):
+    """Returns the path of a file relative to the watched directory, with / separators."""
+    return os.path.relpath(path, root).replace(os.sep, '/')
+
+
+class PollingWatcher:
+    """PollingWatcher finds the changed files of a directory tree by scanning it every interval.
+
+    Attributes:
+        root (str): the watched directory.
+        interval (float): the seconds between two scans.
+    """
+
+    def __init__(self, root='.', interval=DEFAULT_POLLING_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self._files = self._scan()
+
+    def _scan(self):
+        """Returns the (mtime, size) of every file of the tree, by path."""
+        files = {}
+        for directory, file_names in walk_directories(self.root):
+            for file_name in file_names:
+                path = os.path.join(directory, file_name)
+                try:
+                    file_stat = os.stat(path)
+                except OSError:
+                    # deleted since it was listed
+                    continue
+
+                files[path] = (file_stat.st_mtime_ns, file_stat.st_size)
+
+        return files
+
+    def wait(self, timeout=None):
+        """Waits for files of the tree to change.
+
+        Args:
+            timeout (float): the seconds to wait, forever if None.
+
+        Returns:
+            set. The paths of the created, changed and deleted files, empty if none changed before the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(self.interval if deadline is None else max(0, min(self.interval, deadline - time.monotonic())))
+            files = self._scan()
+            changed_paths = {path for path in files.keys() | self._files.keys()
+                             if files.get(path) != self._files.get(path)}
+            self._files = files
+            if changed_paths or (deadline is not None and time.monotonic() >= deadline):
+                return {get_relative_path(self.root, path) for path in changed_paths}
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """InotifyWatcher is told about the changed files of a directory tree by inotify.
+
+    Attributes:
+        root (str): the watched directory.
+    """
+
+    def __init__(self, root='.'):
+        self.root = root
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+
+        self._directories = {}  # type: dict
+        try:
+            for directory, _ in walk_directories(self.root):
+                self._add_watch(directory)
+        except OSError:
+            self.close()
+            raise
+
+    @staticmethod
+    def is_supported():
+        """Returns whether inotify is available on this platform."""
+        return hasattr(ctypes.CDLL(None), 'inotify_init1')
+
+    def _add_watch(self, directory):
+        """Watches a directory, OSError is raised when it fails, e.g. ENOSPC when the watches limit is reached."""
+        watch_descriptor = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if watch_descriptor < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, 'Failed to watch {}: {}'.format(directory, os.strerror(error)))
+
+        self._directories[watch_descriptor] = directory
+
+    def _add_created_directory(self, directory, changed_paths):
+        """Watches a directory created in the tree, and its directories.
+
+        The files written to it before it was watched aren't reported by inotify, so they are reported as changed.
+        """
+        for created_directory, file_names in walk_directories(directory):
+            try:
+                self._add_watch(created_directory)
+            except OSError as error:
+                # deleted since it was created, or no more watches are allowed
+                if error.errno != errno.ENOENT:
+                    print_warning('{}, its changes are not watched'.format(error.strerror))
+                continue
+
+            changed_paths.update(os.path.join(created_directory, file_name) for file_name in file_names)
+
+    def _read_events(self, changed_paths):
+        """Reads the pending events, the changed files are added to changed_paths."""
+        try:
+            data = os.read(self._fd, READ_SIZE)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset < len(data):
+            watch_descriptor, mask, _, name_length = EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + name_length].rstrip(b'\0')
+            offset += EVENT_HEADER.size + name_length
+            if mask & IN_Q_OVERFLOW:
+                print_warning('Too many files changed at once, some of them may not be validated again')
+                continue
+
+            directory = self._directories.get(watch_descriptor)
+            if mask & IN_IGNORED:
+                self._directories.pop(watch_descriptor, None)
+                continue
+
+            if directory is None or not name:
+                continue
+
+            path = os.path.join(directory, os.fsdecode(name))
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and not os.path.basename(path).startswith('.'):
+                    self._add_created_directory(path, changed_paths)
+                continue
+
+            changed_paths.add(path)
+
+    def wait(self, timeout=None):
+        """Waits for files of the tree to change.
+
+        Args:
+            timeout (float): the seconds to wait, forever if None.
+
+        Returns:
+            set. The paths of the created, changed and deleted files, empty if none changed before the timeout.
+        """
+        changed_paths = set()  # type: set
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if readable:
+            self._read_events(changed_paths)
+
+        return {get_relative_path(self.root, path) for path in changed_paths}
+
+    def close(self):
+        """Stops watching the tree."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def get_file_watcher(root='.', polling=False, interval=DEFAULT_POLLING_INTERVAL):
+    """Returns a watcher of a directory tree, with inotify when it is available.
+
+    Args:
+        root (str): the directory to watch.
+        polling (bool): whether to scan the tree every interval, even if inotify is available.
+        interval (float): the seconds between two scans of the tree, when polling.
+
+    Returns:
+        InotifyWatcher|PollingWatcher. The watcher.
+    """
+    if not polling and InotifyWatcher.is_supported():
+        try:
+            return InotifyWatcher(root)
+        except OSError as error:
+            print_warning('Failed to watch the files with inotify, scanning them every {} seconds instead: {}'.format(
+                interval, error.strerror))
+
+    return PollingWatcher(root, interval)
@@ -0,0 +1,161 @@
+"""Changed files of the git repository, listed once per process.
+
+validate, lint, secrets, format and the id_set update each listed the changed files with their own `git diff
+--name-status` calls, and parsed the text output line by line: split on whitespace, which breaks on paths with spaces,
+with renames told apart by the number of fields. validate ran three diffs and parsed each of them, and lint ran two
+diffs for every package.
+
+GitChanges runs `git diff --name-status -z -M` - NUL delimited, with rename detection - once per compared revision, and
+keeps the parsed GitChange records for the rest of the process. The staged and unstaged changes come from a single
+diff against HEAD, and commands and validators that compare the same revisions share one invocation.
+"""
+import os
+import subprocess
+import sys
+from typing import List, NamedTuple, Optional, Tuple
+
+from demisto_sdk.commands.common.tools import print_error
+
+ADDED = 'A'
+MODIFIED = 'M'
+DELETED = 'D'
+RENAMED = 'R'
+COPIED = 'C'
+# statuses followed by the source path and the destination path, the others by a single path
+TWO_PATH_STATUSES = (RENAMED, COPIED)
+
+
+class GitChange(NamedTuple):
+    """GitChange is a file changed between two revisions of the repository.
+
+    Attributes:
+        status (str): the status letter of the change, e.g. A, M, D or R.
+        path (str): the path of the file relative to the root of the repository, its new path if it was renamed.
+        old_path (str): the path the file was renamed or copied from, None for other changes.
+        score (int): the similarity percent of a renamed or copied file, None for other changes.
+    """
+    status: str
+    path: str
+    old_path: Optional[str] = None
+    score: Optional[int] = None
+
+
+def parse_name_status_z(output: str) -> List[GitChange]:
+    """Parses the output of `git diff --name-status -z`.
+
+    Args:
+        output (str): the NUL delimited output, `<status>\\0<path>\\0` per change, or
+            `<status>\\0<old path>\\0<path>\\0` for renames and copies.
+
+    Returns:
+        list. The GitChange records, in the order of the output.
+    """
+    fields = output.split('\0')
+    changes = []
+    index = 0
+    # the output ends with a NUL, so the last field is empty
+    while index < len(fields) - 1:
+        status = fields[index]
+        if status[:1] in TWO_PATH_STATUSES:
+            changes.append(GitChange(status[0], fields[index + 2], fields[index + 1], int(status[1:] or 0)))
+            index += 3
+        else:
+            changes.append(GitChange(status, fields[index + 1]))
+            index += 2
+
+    return changes
+
+
+def parse_name_status(output: str) -> List[GitChange]:
+    """Parses the text output of `git diff --name-status`, a whitespace separated change per line.
+
+    Args:
+        output (str): the output.
+
+    Returns:
+        list. The GitChange records, in the order of the output.
+    """
+    changes = []
+    for line in output.split('\n'):
+        fields = line.split()
+        if len(fields) < 2:
+            continue
+
+        status = fields[0].upper()
+        if status[:1] in TWO_PATH_STATUSES and len(fields) > 2:
+            changes.append(GitChange(status[0], fields[2], fields[1], int(status[1:] or 0)))
+        else:
+            changes.append(GitChange(status, fields[1]))
+
+    return changes
+
+
+def get_change_records(changes) -> List[GitChange]:
+    """Returns GitChange records of changes given as records, or as the text output of `git diff --name-status`."""
+    return parse_name_status(changes) if isinstance(changes, str) else list(changes)
+
+
+class GitChanges:
+    """GitChanges lists the files changed between revisions of the repository, once per process.
+
+    Attributes:
+        cwd (str): the directory to run git in, the current directory if None.
+        git_calls (int): the number of git invocations.
+    """
+
+    def __init__(self, cwd=None):
+        self.cwd = cwd
+        self.git_calls = 0
+        self._changes = {}  # type: dict
+        self._branches = {}  # type: dict
+
+    def _run_git(self, *args) -> str:
+        """Runs a git command and returns its output, exits like run_command when it fails."""
+        self.git_calls += 1
+        command = ('git',) + args
+        try:
+            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True,
+                                    cwd=self.cwd)
+        except OSError as error:
+            print_error('Failed to run command {}\nerror details:\n{}'.format(' '.join(command), error))
+            sys.exit(1)
+
+        # git warns on stderr, e.g. when there are too many files for rename detection, only the exit code fails it
+        if result.returncode != 0:
+            print_error('Failed to run command {}\nerror details:\n{}'.format(' '.join(command), result.stderr))
+            sys.exit(1)
+
+        return result.stdout
+
+    def get_changes(self, *revisions: str) -> Tuple[GitChange, ...]:
+        """Lists the changed files, the way `git diff --name-status <revisions>` does.
+
+        Args:
+            *revisions: the compared revisions, e.g. `HEAD` for the staged and unstaged changes,
+                `origin/master...branch` for the committed changes of a branch, or none for the unstaged changes.
+
+        Returns:
+            tuple. The GitChange records, sorted by their paths.
+        """
+        key = (os.path.abspath(self.cwd or os.getcwd()), revisions)
+        if key not in self._changes:
+            output = self._run_git('diff', '--name-status', '-z', '-M', *revisions, '--')
+            self._changes[key] = tuple(parse_name_status_z(output))
+
+        return self._changes[key]
+
+    def get_current_branch(self) -> str:
+        """Returns the name of the checked out branch, HEAD when it is detached."""
+        base_dir = os.path.abspath(self.cwd or os.getcwd())
+        if base_dir not in self._branches:
+            self._branches[base_dir] = self._run_git('rev-parse', '--abbrev-ref', 'HEAD').strip()
+
+        return self._branches[base_dir]
+
+    def clear(self):
+        """Drops the changes listed so far, for the next calls to list them again."""
+        self._changes.clear()
+        self._branches.clear()
+
+
+GIT_CHANGES = GitChanges()
@@ -0,0 +1,184 @@
+"""Old versions of content files, read from the local git repository.
+
+The backward compatibility validations compare a modified file to its version in the branch it is compared to. The old
+versions used to be downloaded from GitHub for every file - slow, rate limited and impossible offline. When the ref is
+in the local repository, LocalGitFileProvider reads them from it instead, through a single `git cat-file --batch`
+process that serves all the files of the run. Callers fall back to GitHub when the ref or the file isn't found locally.
+
+A `master` ref is looked up as `origin/master` first - the remote tracking branch is what GitHub has, as far as the
+last fetch knows - and as the local `master` branch after it.
+"""
+import atexit
+import os
+import subprocess
+import threading
+
+REMOTE_PREFIX = 'origin/'
+
+
+class GitCatFileBatch:
+    """GitCatFileBatch is a long lived `git cat-file --batch` process, reading git objects by name.
+
+    The process is started on the first read, and again in a forked process, which can't share the pipes of its
+    parent.
+
+    Attributes:
+        cwd (str): the directory to run git in, the current directory if None.
+    """
+
+    def __init__(self, cwd=None):
+        self.cwd = cwd
+        self._process = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        self._process = subprocess.Popen(['git', 'cat-file', '--batch'], stdin=subprocess.PIPE,
+                                         stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=self.cwd)
+        self._pid = os.getpid()
+
+    def read(self, object_name):
+        """Reads a blob.
+
+        Args:
+            object_name (str): the name of the object, e.g. `<commit>:<path>`.
+
+        Returns:
+            bytes. The content of the blob, None if there is no such blob.
+        """
+        if '\n' in object_name:
+            return None
+
+        with self._lock:
+            if self._process is None or self._pid != os.getpid() or self._process.poll() is not None:
+                self._start()
+            try:
+                self._process.stdin.write(object_name.encode('utf-8') + b'\n')
+                self._process.stdin.flush()
+                header_line = self._process.stdout.readline()
+                if header_line.endswith((b' missing\n', b' ambiguous\n')):
+                    return None
+
+                # `<sha> <type> <size>`
+                header = header_line.split()
+                size = int(header[2])
+                content = self._process.stdout.read(size)
+                # every object is followed by a newline
+                self._process.stdout.read(1)
+            except (OSError, ValueError, IndexError):
+                # the process died, the next read starts a new one
+                self.close()
+                return None
+
+        return content if header[1] == b'blob' and len(content) == size else None
+
+    def close(self):
+        """Stops the git process, if it was started by this process."""
+        process, self._process = self._process, None
+        if process is not None and self._pid == os.getpid():
+            try:
+                process.stdin.close()
+                process.wait()
+            except OSError:
+                pass
+
+
+class LocalGitFileProvider:
+    """LocalGitFileProvider reads files as they are in refs of the local git repository.
+
+    The repository is the one of the current directory, or of cwd if it is given. Each repository gets its own
+    GitCatFileBatch process.
+
+    Attributes:
+        cwd (str): the directory to look for the repository from, the current directory if None.
+    """
+
+    def __init__(self, cwd=None):
+        self.cwd = cwd
+        self._top_levels = {}  # type: dict
+        self._commits = {}  # type: dict
+        self._batches = {}  # type: dict
+
+    @staticmethod
+    def _run_git(cwd, *args):
+        try:
+            result = subprocess.run(('git',) + args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                    universal_newlines=True, cwd=cwd)
+        except OSError:
+            return None
+
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    def get_top_level(self):
+        """Returns the root directory of the repository, an empty string outside of a repository."""
+        base_dir = os.path.abspath(self.cwd or os.getcwd())
+        if base_dir not in self._top_levels:
+            self._top_levels[base_dir] = self._run_git(base_dir, 'rev-parse', '--show-toplevel') or ''
+
+        return self._top_levels[base_dir]
+
+    def get_commit(self, tag):
+        """Resolves a branch, tag or commit to a commit of the repository.
+
+        Args:
+            tag (str): the ref, `master` is looked up as `origin/master` first.
+
+        Returns:
+            str. The sha of the commit, None if the ref isn't in the repository.
+        """
+        top_level = self.get_top_level()
+        if not top_level:
+            return None
+
+        if (top_level, tag) not in self._commits:
+            refs = [tag] if tag.startswith(REMOTE_PREFIX) else [REMOTE_PREFIX + tag, tag]
+            self._commits[(top_level, tag)] = None
+            for ref in refs:
+                commit = self._run_git(top_level, 'rev-parse', '--verify', '--quiet', '{}^{{commit}}'.format(ref))
+                if commit:
+                    self._commits[(top_level, tag)] = commit
+                    break
+
+        return self._commits[(top_level, tag)]
+
+    def get_repository_path(self, file_path):
+        """Returns the path of a file relative to the root of the repository, None if it is outside of it."""
+        top_level = self.get_top_level()
+        if not top_level:
+            return None
+
+        relative_path = os.path.relpath(os.path.join(os.path.abspath(self.cwd or os.getcwd()), file_path), top_level)
+        if relative_path == '..' or relative_path.startswith('..' + os.sep):
+            return None
+
+        return relative_path.replace(os.sep, '/')
+
+    def get_file_content(self, file_path, tag='master'):
+        """Reads a file as it is in a ref.
+
+        Args:
+            file_path (str): the path of the file, relative to the current directory or absolute.
+            tag (str): the branch, tag or commit.
+
+        Returns:
+            bytes. The content of the file, None if the ref or the file isn't in the repository.
+        """
+        repository_path = self.get_repository_path(file_path)
+        commit = self.get_commit(tag)
+        if repository_path is None or commit is None:
+            return None
+
+        top_level = self.get_top_level()
+        if top_level not in self._batches:
+            self._batches[top_level] = GitCatFileBatch(top_level)
+
+        return self._batches[top_level].read('{}:{}'.format(commit, repository_path))
+
+    def close(self):
+        """Stops the git processes."""
+        for batch in self._batches.values():
+            batch.close()
+
+
+LOCAL_GIT_FILE_PROVIDER = LocalGitFileProvider()
+atexit.register(LOCAL_GIT_FILE_PROVIDER.close)
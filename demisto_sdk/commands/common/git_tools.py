@@ -1,6 +1,7 @@
 import re
 from typing import Callable, List
 
+from demisto_sdk.commands.common.git_changes import GIT_CHANGES
 from demisto_sdk.commands.common.tools import run_command
 
 
@@ -19,21 +20,8 @@ def get_current_working_branch() -> str:
 
 
 def get_changed_files(from_branch: str = 'master', filter_results: Callable = None):
-    temp_files = run_command(f'git diff --name-status {from_branch}').split('\n')
-    files: List = []
-    for file in temp_files:
-        if file:
-            temp_file_data = {
-                'status': file[0]
-            }
-            if file.lower().startswith('r'):
-                file = file.split('\t')
-                temp_file_data['name'] = file[2]
-            else:
-                temp_file_data['name'] = file[2:]
-            files.append(temp_file_data)
-
+    files: List = [{'status': change.status, 'name': change.path} for change in GIT_CHANGES.get_changes(from_branch)]
     if filter_results:
-        filter(filter_results, files)
+        files = list(filter(filter_results, files))
 
     return files
@@ -1,8 +1,7 @@
 from demisto_sdk.commands.common.constants import Errors
-from demisto_sdk.commands.common.tools import get_yaml, print_error
-from distutils.version import LooseVersion
-from pkg_resources import parse_version
-from datetime import datetime, timedelta
+from demisto_sdk.commands.common.tools import get_yaml, print_error, server_version_compare
+from demisto_sdk.commands.common.docker_tags import DOCKER_TAG_RESOLVER, DEFAULT_REGISTRY, parse_www_auth, \
+    clear_non_numbered_tags, lexical_find_latest_tag, find_latest_tag_by_date
 import re
 import requests
 
@@ -10,16 +9,6 @@ import requests
 # disable insecure warnings
 requests.packages.urllib3.disable_warnings()
 
-ACCEPT_HEADER = {
-    'Accept': 'application/json, '
-              'application/vnd.docker.distribution.manifest.v2+json, '
-              'application/vnd.docker.distribution.manifest.list.v2+json'
-}
-
-# use 10 seconds timeout for requests
-TIMEOUT = 10
-DEFAULT_REGISTRY = 'registry-1.docker.io'
-
 
 class DockerImageValidator(object):
 
@@ -49,9 +38,8 @@ class DockerImageValidator(object):
             self.is_latest_tag = False
             return self.is_latest_tag
 
-        server_version = LooseVersion(self.from_version)
         # Case of a modified file with version >= 5.0.0
-        if self.is_modified_file and server_version >= '5.0.0':
+        if self.is_modified_file and server_version_compare(self.from_version, '5.0.0') >= 0:
             if self.docker_image_latest_tag != self.docker_image_tag and not \
                     'demisto/python:1.3-alpine' == '{}:{}'.format(self.docker_image_name, self.docker_image_tag):
                 # If docker image name are different and if the docker image isn't the default one
@@ -85,49 +73,14 @@ class DockerImageValidator(object):
         :param www_auth: www-authenticate header value
         :type www_auth: string
         """
-        match = re.match(r'.*realm="(.+)",service="(.+)".*', www_auth, re.IGNORECASE)
-        if not match:
-            return ()
-        return match.groups()
+        return parse_www_auth(www_auth)
 
     @staticmethod
     def docker_auth(image_name, verify_ssl=True, registry=DEFAULT_REGISTRY):
         """
         Authenticate to the docker service. Return an authentication token if authentication is required.
         """
-        res = requests.get(
-            'https://{}/v2/'.format(registry),
-            headers=ACCEPT_HEADER,
-            timeout=TIMEOUT,
-            verify=verify_ssl
-        )
-        if res.status_code == 401:  # need to authenticate
-            # defaults in case we fail for some reason
-            realm = 'https://auth.docker.io/token'
-            service = 'registry.docker.io'
-            # Should contain header: Www-Authenticate
-            www_auth = res.headers.get('www-authenticate')
-            if www_auth:
-                parse_auth = DockerImageValidator.parse_www_auth(www_auth)
-                if parse_auth:
-                    realm, service = parse_auth
-            params = {
-                'scope': 'repository:{}:pull'.format(image_name),
-                'service': service
-            }
-            res = requests.get(
-                url=realm,
-                params=params,
-                headers=ACCEPT_HEADER,
-                timeout=TIMEOUT,
-                verify=verify_ssl
-            )
-            res.raise_for_status()
-            res_json = res.json()
-            return res_json.get('token')
-        else:
-            res.raise_for_status()
-            return None
+        return DOCKER_TAG_RESOLVER.get_auth_token(image_name, 'https://{}'.format(registry), verify_ssl)
 
     @staticmethod
     def clear_non_numbered_tags(tags):
@@ -139,7 +92,7 @@ class DockerImageValidator(object):
         Returns:
             a tag list with only numbered tags
         """
-        return [tag for tag in tags if re.match(r'^(?:\d+\.)*\d+$', tag) is not None]
+        return clear_non_numbered_tags(tags)
 
     @staticmethod
     def lexical_find_latest_tag(tags):
@@ -150,19 +103,7 @@ class DockerImageValidator(object):
         Args:
             tags(list): list of docker image tag names - ordered in lexical order
         """
-
-        only_numbered_tags = DockerImageValidator.clear_non_numbered_tags(tags)
-
-        if len(only_numbered_tags) == 0:
-            return tags[-1]
-
-        max_tag = only_numbered_tags[0]
-
-        for num_tag in only_numbered_tags:
-            if parse_version(max_tag) < parse_version(num_tag):
-                max_tag = num_tag
-
-        return max_tag
+        return lexical_find_latest_tag(tags)
 
     @staticmethod
     def find_latest_tag_by_date(tags):
@@ -174,20 +115,15 @@ class DockerImageValidator(object):
         Returns:
             The last updated docker image tag name
         """
-        latest_tag_name = 'latest'
-        latest_tag_date = datetime.now() - timedelta(days=400000)
-        for tag in tags:
-            tag_date = datetime.strptime(tag.get('last_updated'), '%Y-%m-%dT%H:%M:%S.%fZ')
-            if tag_date >= latest_tag_date:
-                latest_tag_date = tag_date
-                latest_tag_name = tag.get('name')
-
-        return latest_tag_name
+        return find_latest_tag_by_date(tags)
 
     @staticmethod
     def get_docker_image_latest_tag(docker_image_name, yml_docker_image):
         """Returns the docker image latest tag of the given docker image
 
+        The tags are resolved by DOCKER_TAG_RESOLVER, once per image, and taken from its cache while they are fresh, or
+        from its snapshot when validating with --docker-tags-snapshot.
+
         Args:
             docker_image_name: The name of the docker image
             yml_docker_image: The docker image as it appears in the yml file
@@ -196,38 +132,11 @@ class DockerImageValidator(object):
             The last updated docker image tag
         """
         try:
-            tag = ''
-            auth_token = DockerImageValidator.docker_auth(docker_image_name, False, DEFAULT_REGISTRY)
-            headers = ACCEPT_HEADER.copy()
-            if auth_token:
-                headers['Authorization'] = 'Bearer {}'.format(auth_token)
-
-            # first try to get the docker image tags using normal http request
-            res = requests.get(
-                url='https://hub.docker.com/v2/repositories/{}/tags'.format(docker_image_name),
-                verify=False,
-            )
-            if res.status_code == 200:
-                tags = res.json().get('results', [])
-                # if http request successful find the latest tag by date in the response
-                if tags:
-                    tag = DockerImageValidator.find_latest_tag_by_date(tags)
-
-            else:
-                # if http request did not succeed than get tags using the API.
-                # See: https://docs.docker.com/registry/spec/api/#listing-image-tags
-                res = requests.get(
-                    'https://{}/v2/{}/tags/list'.format(DEFAULT_REGISTRY, docker_image_name),
-                    headers=headers,
-                    timeout=TIMEOUT,
-                    verify=False
-                )
-                res.raise_for_status()
-                # the API returns tags in lexical order with no date info - so try an get the numeric highest tag
-                tags = res.json().get('tags', [])
-                if tags:
-                    tag = DockerImageValidator.lexical_find_latest_tag(tags)
-            return tag
+            return DOCKER_TAG_RESOLVER.resolve(docker_image_name)
+        except LookupError:
+            print_error('Failed getting tag for: {}. It is not in the docker tags snapshot, create the snapshot again '
+                        'with demisto-sdk create-docker-tags-snapshot.'.format(docker_image_name))
+            return ''
         except (requests.exceptions.RequestException, Exception):
             if not docker_image_name:
                 docker_image_name = yml_docker_image
@@ -7,13 +7,17 @@ import os
 import re
 from typing import Optional
 
-import yaml
 from pykwalify.core import Core
 
 from demisto_sdk.commands.common.constants import Errors, ACCEPTED_FILE_EXTENSIONS, FILE_TYPES_PATHS_TO_VALIDATE, \
-    SCHEMA_TO_REGEX, REPUTATION_REGEX
-from demisto_sdk.commands.common.tools import get_remote_file, get_matching_regex, print_error
+    SCHEMA_TO_REGEX
+from demisto_sdk.commands.common.file_classifier import FILE_TYPE_CLASSIFIER
+from demisto_sdk.commands.common.tools import get_remote_file, print_error
 from demisto_sdk.commands.common.configuration import Configuration
+from demisto_sdk.commands.common.parsed_file_cache import PARSED_FILE_CACHE
+from demisto_sdk.commands.common.compiled_schema import get_compiled_schema, load_yaml_for_schema
+from demisto_sdk.commands.common.schema_codegen import get_fast_schema
+from demisto_sdk.commands.common import yaml_io
 
 
 class StructureValidator:
@@ -27,17 +31,19 @@ class StructureValidator:
             file_type (str): equal to scheme_name if there's a scheme.
             current_file (dict): loaded json.
             old_file: (dict) loaded file from git.
+            fast_schema (bool): whether to validate the scheme with the validator generated from the scheme.
+            prev_ver (str): the branch or tag to get the old file from.
         """
     SCHEMAS_PATH = "schemas"
 
     FILE_SUFFIX_TO_LOAD_FUNCTION = {
-        '.yml': yaml.safe_load,
+        '.yml': yaml_io.safe_load,
         '.json': json.load,
     }
 
     def __init__(self, file_path, is_new_file=False, old_file_path=None, predefined_scheme=None,
-                 configuration=Configuration()):
-        # type: (str, Optional[bool], Optional[str], Optional[str], Configuration) -> None
+                 configuration=Configuration(), fast_schema=False, prev_ver='master'):
+        # type: (str, Optional[bool], Optional[str], Optional[str], Configuration, bool, str) -> None
         self.is_valid = True
         self.file_path = file_path
         self.scheme_name = predefined_scheme or self.scheme_of_file_by_path()
@@ -46,8 +52,9 @@ class StructureValidator:
         if is_new_file:
             self.old_file = {}
         else:
-            self.old_file = get_remote_file(old_file_path if old_file_path else file_path)
+            self.old_file = get_remote_file(old_file_path if old_file_path else file_path, prev_ver)
         self.configuration = configuration
+        self.fast_schema = fast_schema
 
     def is_valid_file(self):
         # type: () -> bool
@@ -76,12 +83,9 @@ class StructureValidator:
             (str): Type of file by scheme name
         """
 
-        for scheme_name, regex_list in SCHEMA_TO_REGEX.items():
-            if get_matching_regex(self.file_path, regex_list):
-                return scheme_name
-
-        if get_matching_regex(self.file_path, [REPUTATION_REGEX]):
-            return 'reputation'
+        file_type = FILE_TYPE_CLASSIFIER.get_file_type(self.file_path)
+        if file_type:
+            return file_type.value
 
         pretty_formated_string_of_regexes = json.dumps(SCHEMA_TO_REGEX, indent=4, sort_keys=True)
 
@@ -101,9 +105,18 @@ class StructureValidator:
         try:
             path = os.path.normpath(
                 os.path.join(__file__, "..", "..", self.SCHEMAS_PATH, '{}.yml'.format(self.scheme_name)))
-            core = Core(source_file=self.file_path,
-                        schema_files=[path])
-            core.validate(raise_exception=True)
+            file_extension = os.path.splitext(self.file_path)[1]
+            schema = get_fast_schema(path) if self.fast_schema else get_compiled_schema(path)
+            if file_extension == '.json':
+                # json is loaded the same by pykwalify
+                schema.validate(self.current_file)
+            elif file_extension in ('.yml', '.yaml'):
+                with open(self.file_path, 'r') as file_obj:
+                    schema.validate(PARSED_FILE_CACHE.parse(file_obj, load_yaml_for_schema))
+            else:
+                core = Core(source_file=self.file_path,
+                            schema_files=[path])
+                core.validate(raise_exception=True)
         except Exception as err:
             print_error('Failed: {} failed.\n{}'.format(self.file_path, str(err)))
             self.is_valid = False
@@ -200,7 +213,7 @@ class StructureValidator:
             if file_extension in self.FILE_SUFFIX_TO_LOAD_FUNCTION:
                 load_function = self.FILE_SUFFIX_TO_LOAD_FUNCTION[file_extension]
                 with open(self.file_path, 'r') as file_obj:
-                    loaded_file_data = load_function(file_obj)  # type: ignore
+                    loaded_file_data = PARSED_FILE_CACHE.parse(file_obj, load_function)
                     return loaded_file_data
 
             # Ignore loading image
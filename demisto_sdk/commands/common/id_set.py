@@ -0,0 +1,293 @@
+"""In-memory model of the id_set.json file.
+
+The id_set is stored as a dict of sections, each section is a list of single key {id: data} dicts. IdSet keeps that
+layout as is, so it is written back exactly as it was read, and indexes the entities by id and by name so looking an
+entity up doesn't scan its section.
+"""
+import json
+import os
+from bisect import bisect_right
+from collections import OrderedDict
+
+from demisto_sdk.commands.common.version_index import VersionRangeIndex
+
+ID_SET_SECTIONS = ('scripts', 'playbooks', 'integrations', 'TestPlaybooks')
+DEFAULT_FROM_VERSION = '0.0.0'
+DEFAULT_TO_VERSION = '99.99.99'
+
+
+def get_entity_id(entity):
+    """Returns the id of a single key {id: data} id_set entity."""
+    return next(iter(entity))
+
+
+def get_sort_key(entity):
+    """Returns the key the id_set sections are sorted by - the entity id, case insensitive."""
+    return get_entity_id(entity).lower()
+
+
+def get_version_range(entity_data):
+    """Returns the (fromversion, toversion) of the data of an id_set entity, with the id_set defaults."""
+    return (entity_data.get('fromversion', DEFAULT_FROM_VERSION),
+            entity_data.get('toversion', DEFAULT_TO_VERSION))
+
+
+class IdSet:
+    """IdSet holds the id_set sections and indexes their entities.
+
+    Attributes:
+        sections (OrderedDict): maps a section name to its list of {id: data} entities, in the id_set.json layout.
+        changes (list): the (section, entity, fromversion, toversion) arguments of every upsert, in order.
+        modified (bool): whether the content of the id_set changed since it was created.
+    """
+
+    def __init__(self, id_set=None):
+        """
+        Args:
+            id_set (dict): the id_set sections, the section lists are used as is and updated in place.
+        """
+        self.sections = OrderedDict()  # type: OrderedDict
+        self._ids = {}  # type: dict
+        self._names = {}  # type: dict
+        self.changes = []  # type: list
+        self.modified = False
+        # the sort keys of the sections that are known to be sorted, kept in sync to insert new entities with bisect
+        self._sort_keys = {}  # type: dict
+        # the version range indexes of the sections that were queried by version, kept in sync on upsert
+        self._version_indexes = {}  # type: dict
+        if id_set is None:
+            id_set = OrderedDict((section, []) for section in ID_SET_SECTIONS)
+
+        for section, entities in id_set.items():
+            self.sections[section] = entities
+            for entity in entities:
+                self._add_to_index(section, entity)
+
+    @classmethod
+    def load(cls, id_set_path):
+        """Loads an id_set.json file.
+
+        Args:
+            id_set_path (str): the path of the id_set.json file.
+
+        Returns:
+            IdSet. The loaded id_set, raises ValueError if the file isn't a valid json.
+        """
+        with open(id_set_path, 'r') as id_set_file:
+            # dicts keep the keys order, the OrderedDict hook would only slow down loading
+            return cls(json.load(id_set_file))
+
+    def _add_to_index(self, section, entity):
+        entity_id = get_entity_id(entity)
+        self._ids.setdefault(entity_id, []).append((section, entity))
+        self._names.setdefault(entity[entity_id].get('name'), []).append((section, entity))
+
+    def _remove_from_index(self, section, entity):
+        entity_id = get_entity_id(entity)
+        self._ids[entity_id] = [item for item in self._ids[entity_id] if item[1] is not entity]
+        name = entity[entity_id].get('name')
+        self._names[name] = [item for item in self._names[name] if item[1] is not entity]
+
+    def get(self, section, entity_id, fromversion=DEFAULT_FROM_VERSION, toversion=DEFAULT_TO_VERSION):
+        """Gets the data of the entity with the given id and version range in a section.
+
+        Args:
+            section (str): the id_set section, e.g. scripts.
+            entity_id (str): the id of the entity.
+            fromversion (str): the fromversion of the entity.
+            toversion (str): the toversion of the entity.
+
+        Returns:
+            dict. The data of the entity, None if it isn't in the id_set.
+        """
+        for entity_data in self.get_all(section, entity_id):
+            if get_version_range(entity_data) == (fromversion, toversion):
+                return entity_data
+
+        return None
+
+    def get_all(self, section, entity_id):
+        """Gets the data of all the versions of an entity in a section.
+
+        Args:
+            section (str): the id_set section, e.g. scripts.
+            entity_id (str): the id of the entity.
+
+        Returns:
+            list. The data dicts of the entities with the given id, in id_set order.
+        """
+        return [entity[entity_id] for entity_section, entity in self._ids.get(entity_id, [])
+                if entity_section == section]
+
+    def find(self, entity_id):
+        """Gets all the entities with the given id in every section.
+
+        Args:
+            entity_id (str): the id of the entity.
+
+        Returns:
+            list. (section, data) tuples of the entities with the given id.
+        """
+        return [(section, entity[entity_id]) for section, entity in self._ids.get(entity_id, [])]
+
+    def get_by_name(self, name):
+        """Gets all the entities with the given name in every section.
+
+        Args:
+            name (str): the name of the entity.
+
+        Returns:
+            list. (section, id, data) tuples of the entities with the given name.
+        """
+        result = []
+        for section, entity in self._names.get(name, []):
+            entity_id = get_entity_id(entity)
+            result.append((section, entity_id, entity[entity_id]))
+
+        return result
+
+    def upsert(self, section, entity, fromversion=None, toversion=None):
+        """Replaces the data of an entity in a section, or adds the entity if it isn't in the section.
+
+        Args:
+            section (str): the id_set section, e.g. scripts.
+            entity (dict): a single key {id: data} entity.
+            fromversion (str): the fromversion of the entity to replace, defaults to the one of the given entity.
+            toversion (str): the toversion of the entity to replace, defaults to the one of the given entity.
+
+        Returns:
+            bool. True if an existing entity was replaced, False if the entity was added.
+        """
+        entity_id = get_entity_id(entity)
+        entity_from_version, entity_to_version = get_version_range(entity[entity_id])
+        version_range = (fromversion or entity_from_version, toversion or entity_to_version)
+        self.changes.append((section, entity, fromversion, toversion))
+
+        for entity_section, existing_entity in self._ids.get(entity_id, []):
+            if entity_section == section and get_version_range(existing_entity[entity_id]) == version_range:
+                if existing_entity[entity_id] != entity[entity_id]:
+                    self._remove_from_index(section, existing_entity)
+                    existing_entity[entity_id] = entity[entity_id]
+                    self._add_to_index(section, existing_entity)
+                    if version_range != (entity_from_version, entity_to_version):
+                        # the version index of the section is rebuilt with the new range on its next use
+                        self._version_indexes.pop(section, None)
+                    self.modified = True
+
+                return True
+
+        entities = self.sections.setdefault(section, [])
+        sort_keys = self._get_sort_keys(section)
+        if sort_keys is None:
+            entities.append(entity)
+        else:
+            sort_key = get_sort_key(entity)
+            position = bisect_right(sort_keys, sort_key)
+            sort_keys.insert(position, sort_key)
+            entities.insert(position, entity)
+
+        self._add_to_index(section, entity)
+        if section in self._version_indexes:
+            self._version_indexes[section].add(entity_id, *get_version_range(entity[entity_id]), payload=entity)
+
+        self.modified = True
+        return False
+
+    def get_version_index(self, section):
+        """Gets the version range index of a section, built on first use.
+
+        Args:
+            section (str): the id_set section, e.g. scripts.
+
+        Returns:
+            VersionRangeIndex. Maps the ids of the section to the version ranges of their entities, the payload of each
+            range is its {id: data} entity.
+        """
+        if section not in self._version_indexes:
+            version_index = VersionRangeIndex()
+            for entity in self.sections.get(section, []):
+                entity_id = get_entity_id(entity)
+                version_index.add(entity_id, *get_version_range(entity[entity_id]), payload=entity)
+            self._version_indexes[section] = version_index
+
+        return self._version_indexes[section]
+
+    def get_active(self, section, entity_id, version):
+        """Gets the versions of an entity in a section that are supported on a server version.
+
+        Args:
+            section (str): the id_set section, e.g. scripts.
+            entity_id (str): the id of the entity.
+            version (str): the server version, e.g. 5.0.0
+
+        Returns:
+            list. The data dicts of the entities with fromversion <= version <= toversion, sorted by fromversion.
+        """
+        return [entity[entity_id] for entity in self.get_version_index(section).get_active(entity_id, version)]
+
+    def get_overlapping(self, section, entity_id, fromversion=DEFAULT_FROM_VERSION, toversion=DEFAULT_TO_VERSION):
+        """Gets the versions of an entity in a section whose version range overlaps the given one.
+
+        Args:
+            section (str): the id_set section, e.g. scripts.
+            entity_id (str): the id of the entity.
+            fromversion (str): the first server version of the range.
+            toversion (str): the last server version of the range.
+
+        Returns:
+            list. The data dicts of the overlapping entities, sorted by fromversion.
+        """
+        return [entity[entity_id] for entity
+                in self.get_version_index(section).get_overlapping(entity_id, fromversion, toversion)]
+
+    def _get_sort_keys(self, section):
+        """Returns the sort keys of a section if it is sorted, None otherwise."""
+        if section not in self._sort_keys:
+            sort_keys = [get_sort_key(entity) for entity in self.sections.get(section, [])]
+            is_sorted = all(sort_keys[i] <= sort_keys[i + 1] for i in range(len(sort_keys) - 1))
+            self._sort_keys[section] = sort_keys if is_sorted else None
+
+        return self._sort_keys[section]
+
+    def iter_section(self, section):
+        """Iterates over the entities of a section.
+
+        Args:
+            section (str): the id_set section, e.g. scripts.
+
+        Returns:
+            iterator. (id, data) tuples of the entities in the section, in id_set order.
+        """
+        for entity in self.sections.get(section, []):
+            entity_id = get_entity_id(entity)
+            yield entity_id, entity[entity_id]
+
+    def sort(self):
+        """Sorts each section by the entity ids, case insensitive. Sections that are already sorted are left as is."""
+        for section, entities in self.sections.items():
+            if self._get_sort_keys(section) is None:
+                entities.sort(key=get_sort_key)
+                self._sort_keys[section] = [get_sort_key(entity) for entity in entities]
+                self.modified = True
+
+    def to_dict(self):
+        """Returns the id_set sections in the id_set.json layout."""
+        return self.sections
+
+    def dump(self, id_set_path):
+        """Writes the id_set to an id_set.json file.
+
+        The id_set is written to a temporary file that is moved over the id_set.json file, so a failure midway never
+        leaves a truncated id_set.
+
+        Args:
+            id_set_path (str): the path of the id_set.json file.
+        """
+        temp_path = id_set_path + '.tmp'
+        try:
+            with open(temp_path, 'w') as id_set_file:
+                json.dump(self.to_dict(), id_set_file, indent=4)
+            os.replace(temp_path, id_set_path)
+        finally:
+            if os.path.isfile(temp_path):
+                os.remove(temp_path)
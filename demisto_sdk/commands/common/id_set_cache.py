@@ -0,0 +1,216 @@
+"""Persistent cache of the records extracted while creating the id_set.
+
+Every content path processed by `re_create_id_set` is stored together with a fingerprint of the files it was built
+from (size, mtime and a sha1 of their content). On the next run only paths whose fingerprint changed are re-parsed.
+The whole cache is discarded when the extractors change - it records the version of the SDK and a sha1 of the sources
+of the extractors, since a development install keeps its version while they change.
+
+The cache of a content repo is kept out of it, in ~/.cache/demisto-sdk/id_set or $DEMISTO_SDK_ID_SET_CACHE_DIR, in a
+file named after a hash of the path of the repo - the cached paths are relative to the repo.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from functools import lru_cache
+
+from pkg_resources import DistributionNotFound, get_distribution
+
+from demisto_sdk.commands.common.tools import print_warning
+
+ID_SET_CACHE_DIR_ENV = 'DEMISTO_SDK_ID_SET_CACHE_DIR'
+# bump when the structure of the extracted records changes, old caches are discarded
+ID_SET_CACHE_VERSION = 1
+COMMANDS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# the sources of the extraction of the id_set records from the content files
+EXTRACTOR_SOURCE_PATHS = (
+    os.path.join(COMMANDS_DIR, 'common', 'update_id_set.py'),
+    os.path.join(COMMANDS_DIR, 'common', 'id_set_records.py'),
+    os.path.join(COMMANDS_DIR, 'common', 'tools.py'),
+    os.path.join(COMMANDS_DIR, 'unify', 'unifier.py'),
+)
+
+
+def get_default_cache_dir():
+    """Returns the directory of the id_set caches, $DEMISTO_SDK_ID_SET_CACHE_DIR or ~/.cache/demisto-sdk/id_set."""
+    if os.environ.get(ID_SET_CACHE_DIR_ENV):
+        return os.path.expanduser(os.environ[ID_SET_CACHE_DIR_ENV])
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'demisto-sdk', 'id_set')
+
+
+@lru_cache()
+def get_extractors_key():
+    """Returns a sha1 of the version of the SDK and the sources of the id_set extractors.
+
+    A development install keeps its version while the extractors change, so the sources are a part of the key too.
+    """
+    try:
+        version = get_distribution('demisto-sdk').version
+    except DistributionNotFound:
+        version = 'unknown'
+
+    key_hash = hashlib.sha1('{}:{}\0'.format(version, ID_SET_CACHE_VERSION).encode('utf-8'))
+    for source_path in EXTRACTOR_SOURCE_PATHS:
+        key_hash.update(os.path.basename(source_path).encode('utf-8') + b'\0')
+        with open(source_path, 'rb') as source_file:
+            key_hash.update(source_file.read())
+
+    return key_hash.hexdigest()
+
+
+def get_default_cache_path(content_dir='.'):
+    """Returns the path of the id_set cache of a content repo, named after a hash of the path of the repo.
+
+    Args:
+        content_dir (str): the root of the content repo.
+
+    Returns:
+        str. The path of the cache file.
+    """
+    repo_hash = hashlib.sha1(os.path.realpath(content_dir).encode('utf-8')).hexdigest()
+    return os.path.join(get_default_cache_dir(), repo_hash + '.json')
+
+
+class IdSetCache:
+    """IdSetCache keeps the extracted id_set records of each content path between runs.
+
+    Attributes:
+        cache_path (str): path of the json file the cache is persisted to.
+        entries (dict): maps an entity kind to a dict of path -> cached entry.
+        hits (int): number of paths served from the cache.
+        misses (int): number of paths that had to be processed.
+    """
+
+    def __init__(self, cache_path=None):
+        """
+        Args:
+            cache_path (str): the path of the cache file, the cache of the content repo in the current directory in
+                get_default_cache_dir() if None.
+        """
+        self.cache_path = cache_path or get_default_cache_path()
+        self.entries = {}  # type: dict
+        self.hits = 0
+        self.misses = 0
+        self._seen = set()  # type: set
+        self._pending = {}  # type: dict
+
+    def load(self):
+        """Loads the cache file, an unreadable or outdated cache is treated as empty."""
+        self.entries = {}
+        if not os.path.isfile(self.cache_path):
+            return self
+
+        try:
+            with open(self.cache_path, 'r') as cache_file:
+                cache_data = json.load(cache_file, object_pairs_hook=OrderedDict)
+        except ValueError:
+            print_warning('The id_set cache {} is corrupted, rebuilding it.'.format(self.cache_path))
+            return self
+
+        if cache_data.get('version') == ID_SET_CACHE_VERSION and cache_data.get('extractors') == get_extractors_key():
+            self.entries = cache_data.get('entries', {})
+
+        return self
+
+    def save(self):
+        """Writes the cache, dropping the paths that were not processed in this run (deleted files).
+
+        A read only or full disk leaves the previous cache in place.
+        """
+        entries = {}
+        for kind, path in sorted(self._seen):
+            entries.setdefault(kind, {})[path] = self.entries[kind][path]
+
+        cache_dir = os.path.dirname(os.path.abspath(self.cache_path))
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # write to a temporary file and rename it, so an interrupted run never leaves a partial cache
+            file_descriptor, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(file_descriptor, 'w') as temp_file:
+                    json.dump({'version': ID_SET_CACHE_VERSION, 'extractors': get_extractors_key(),
+                               'entries': entries}, temp_file)
+                os.replace(temp_path, self.cache_path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError as error:
+            print_warning('Could not save the id_set cache to {}: {}'.format(self.cache_path, error))
+
+    @staticmethod
+    def get_entity_files(path):
+        """Returns the files an entity path is built from - the file itself or the files of a package directory."""
+        if os.path.isdir(path):
+            return sorted(os.path.join(path, name) for name in os.listdir(path)
+                          if os.path.isfile(os.path.join(path, name)))
+
+        return [path]
+
+    @staticmethod
+    def get_stat(files):
+        stat = []
+        for file_path in files:
+            file_stat = os.stat(file_path)
+            stat.append([os.path.basename(file_path), file_stat.st_size, file_stat.st_mtime_ns])
+
+        return stat
+
+    @staticmethod
+    def get_hash(files):
+        content_hash = hashlib.sha1()
+        for file_path in files:
+            content_hash.update(os.path.basename(file_path).encode('utf-8'))
+            with open(file_path, 'rb') as entity_file:
+                content_hash.update(entity_file.read())
+
+        return content_hash.hexdigest()
+
+    def get(self, kind, path):
+        """Gets the cached result of processing `path` as an entity of the given kind.
+
+        The stat of the entity files is compared first, the content hash is computed only when it differs.
+
+        Args:
+            kind (str): the entity kind the path was processed as (integration, script, etc.).
+            path (str): the processed path.
+
+        Returns:
+            The cached result, None if the path has changed or was never processed.
+        """
+        self._seen.add((kind, path))
+        files = self.get_entity_files(path)
+        stat = self.get_stat(files)
+        entry = self.entries.get(kind, {}).get(path)
+        if entry and entry['stat'] == stat:
+            self.hits += 1
+            return entry['result']
+
+        content_hash = self.get_hash(files)
+        if entry and entry['hash'] == content_hash:
+            # only the mtime changed (e.g. after a checkout), the extracted data is still valid
+            entry['stat'] = stat
+            self.hits += 1
+            return entry['result']
+
+        self._pending[(kind, path)] = (stat, content_hash)
+        self.misses += 1
+        return None
+
+    def put(self, kind, path, result):
+        """Stores the result of processing `path`, using the fingerprint computed in `get` when available."""
+        self._seen.add((kind, path))
+        if (kind, path) in self._pending:
+            stat, content_hash = self._pending.pop((kind, path))
+        else:
+            files = self.get_entity_files(path)
+            stat, content_hash = self.get_stat(files), self.get_hash(files)
+
+        self.entries.setdefault(kind, {})[path] = {
+            'stat': stat,
+            'hash': content_hash,
+            # round trip through json so cached and fresh results are indistinguishable
+            'result': json.loads(json.dumps(result), object_pairs_hook=OrderedDict),
+        }
@@ -0,0 +1,320 @@
+"""SQLite store of the id_set.
+
+An optional companion of id_set.json, written next to it as id_set.db. The entities, integration commands, dependencies
+and version ranges of the id_set are stored in indexed tables, so queries like "the playbooks that use a command with
+fromversion <= 5.0.0" don't parse the whole id_set.json. The id_set.json layout can always be exported back from it.
+The store records a sha1 of the id_set.json it matches, so an id_set.json changed outside of the id_set update, e.g.
+checked out from master, is detected and the store is re-written instead of applying the update's changes to it.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+from collections import OrderedDict
+
+from demisto_sdk.commands.common.id_set import IdSet, get_entity_id, get_version_range
+from demisto_sdk.commands.common.id_set_dependencies import DEPENDENCY_FIELDS, get_entity_dependencies
+from demisto_sdk.commands.common.tools import version_to_tuple
+
+ID_SET_DB_FILE_NAME = 'id_set.db'
+# the dependency fields that hold both scripts and commands
+AMBIGUOUS_DEPENDENCY_FIELDS = [field for field, kind in DEPENDENCY_FIELDS.items() if kind is None]
+# bump when the tables change, older stores are re-created
+ID_SET_DB_VERSION = 2
+
+SCHEMA = '''
+CREATE TABLE metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE sections (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL
+);
+CREATE TABLE entities (
+    rowid INTEGER PRIMARY KEY,
+    section TEXT NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT,
+    file_path TEXT,
+    sort_key TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX entities_by_id ON entities (id, section);
+CREATE INDEX entities_by_name ON entities (name);
+CREATE INDEX entities_by_section ON entities (section, sort_key);
+CREATE TABLE version_ranges (
+    entity INTEGER PRIMARY KEY REFERENCES entities (rowid),
+    fromversion TEXT NOT NULL,
+    toversion TEXT NOT NULL,
+    from_key INTEGER NOT NULL,
+    to_key INTEGER NOT NULL
+);
+CREATE TABLE commands (
+    entity INTEGER NOT NULL REFERENCES entities (rowid),
+    command TEXT NOT NULL
+);
+CREATE INDEX commands_by_command ON commands (command);
+CREATE TABLE dependencies (
+    entity INTEGER NOT NULL REFERENCES entities (rowid),
+    field TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    target TEXT NOT NULL
+);
+CREATE INDEX dependencies_by_target ON dependencies (kind, target);
+'''
+
+
+def get_db_path(id_set_path):
+    """Returns the path of the SQLite store of an id_set.json file."""
+    return os.path.join(os.path.dirname(id_set_path), ID_SET_DB_FILE_NAME)
+
+
+def get_id_set_fingerprint(id_set_path):
+    """Returns the sha1 of an id_set.json file, which identifies the id_set a store matches."""
+    content_hash = hashlib.sha1()
+    with open(id_set_path, 'rb') as id_set_file:
+        for chunk in iter(lambda: id_set_file.read(1024 * 1024), b''):
+            content_hash.update(chunk)
+
+    return content_hash.hexdigest()
+
+
+def get_version_key(version):
+    """Encodes an x.y.z version as an integer that sorts like the version, for range queries in SQL.
+
+    Args:
+        version (str): the version, e.g. 4.5.0
+
+    Returns:
+        int. The encoded version, components that aren't numbers are treated as 0.
+    """
+    components = [component if isinstance(component, int) else 0 for component in version_to_tuple(version)[:3]]
+    components += [0] * (3 - len(components))
+    return (components[0] * 10000 + components[1]) * 10000 + components[2]
+
+
+class IdSetDB:
+    """IdSetDB reads and writes the SQLite store of the id_set.
+
+    Attributes:
+        db_path (str): the path of the id_set.db file.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            if not os.path.isfile(self.db_path):
+                raise IOError('The id_set store {} was not found'.format(self.db_path))
+
+            self._connection = sqlite3.connect(self.db_path)
+            if self._connection.execute('PRAGMA user_version').fetchone()[0] != ID_SET_DB_VERSION:
+                self.close()
+                raise ValueError('The id_set store {} is outdated, re-create the id_set'.format(self.db_path))
+
+        return self._connection
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def get_fingerprint(self):
+        """Returns the fingerprint of the id_set.json the store matches, None if it wasn't recorded."""
+        row = self.connection.execute('SELECT value FROM metadata WHERE key = ?', ('id_set_fingerprint',)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_fingerprint(connection, id_set_fingerprint):
+        connection.execute('INSERT OR REPLACE INTO metadata VALUES (?, ?)', ('id_set_fingerprint', id_set_fingerprint))
+
+    def write(self, id_set, id_set_fingerprint=None):
+        """Writes the whole id_set to the store, replacing its previous content.
+
+        The store is created in a temporary file and moved over the old one, so readers never see a partial store.
+
+        Args:
+            id_set (IdSet): the id_set, or its sections dict.
+            id_set_fingerprint (str): the fingerprint of the id_set.json file of the id_set, see get_id_set_fingerprint.
+        """
+        if not isinstance(id_set, IdSet):
+            id_set = IdSet(id_set)
+
+        self.close()
+        temp_path = self.db_path + '.tmp'
+        if os.path.isfile(temp_path):
+            os.remove(temp_path)
+
+        connection = sqlite3.connect(temp_path)
+        try:
+            with connection:
+                connection.executescript(SCHEMA)
+                connection.execute('PRAGMA user_version = {}'.format(ID_SET_DB_VERSION))
+                self._set_fingerprint(connection, id_set_fingerprint)
+                script_ids = set(script_id for script_id, _ in id_set.iter_section('scripts'))
+                for position, section in enumerate(id_set.sections):
+                    connection.execute('INSERT INTO sections VALUES (?, ?)', (section, position))
+                    for entity_id, entity_data in id_set.iter_section(section):
+                        self._insert_entity(connection, section, entity_id, entity_data, script_ids)
+        finally:
+            connection.close()
+
+        os.replace(temp_path, self.db_path)
+
+    @staticmethod
+    def _insert_entity(connection, section, entity_id, entity_data, script_ids, rowid=None):
+        cursor = connection.execute(
+            'INSERT INTO entities (rowid, section, id, name, file_path, sort_key, data) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (rowid, section, entity_id, entity_data.get('name'), entity_data.get('file_path'), entity_id.lower(),
+             json.dumps(entity_data)))
+        rowid = cursor.lastrowid
+
+        from_version, to_version = get_version_range(entity_data)
+        connection.execute('INSERT INTO version_ranges VALUES (?, ?, ?, ?, ?)',
+                           (rowid, from_version, to_version, get_version_key(from_version),
+                            get_version_key(to_version)))
+        connection.executemany('INSERT INTO commands VALUES (?, ?)',
+                               [(rowid, command) for command in entity_data.get('commands', [])])
+        connection.executemany('INSERT INTO dependencies VALUES (?, ?, ?, ?)',
+                               [(rowid, field, kind, target) for field, kind, target
+                                in get_entity_dependencies(entity_data, script_ids)])
+
+    @staticmethod
+    def _delete_entity(connection, rowid):
+        for table in ('version_ranges', 'commands', 'dependencies'):
+            connection.execute('DELETE FROM {} WHERE entity = ?'.format(table), (rowid,))
+        connection.execute('DELETE FROM entities WHERE rowid = ?', (rowid,))
+
+    def apply(self, changes, id_set_fingerprint=None):
+        """Applies id_set upserts to the store in a single transaction.
+
+        Args:
+            changes (list): (section, entity, fromversion, toversion) upserts, as recorded in IdSet.changes.
+            id_set_fingerprint (str): the fingerprint of the id_set.json file with the changes, the recorded one is
+                kept if not given.
+        """
+        connection = self.connection
+        with connection:
+            for section, entity, fromversion, toversion in changes:
+                self._upsert(connection, section, entity, fromversion, toversion)
+            if id_set_fingerprint is not None:
+                self._set_fingerprint(connection, id_set_fingerprint)
+
+    def upsert(self, section, entity, fromversion=None, toversion=None):
+        """Replaces the data of an entity in a section, or adds the entity, like IdSet.upsert.
+
+        Args:
+            section (str): the id_set section, e.g. scripts.
+            entity (dict): a single key {id: data} entity.
+            fromversion (str): the fromversion of the entity to replace, defaults to the one of the given entity.
+            toversion (str): the toversion of the entity to replace, defaults to the one of the given entity.
+        """
+        self.apply([(section, entity, fromversion, toversion)])
+
+    def _upsert(self, connection, section, entity, fromversion, toversion):
+        entity_id = get_entity_id(entity)
+        entity_data = entity[entity_id]
+        entity_from_version, entity_to_version = get_version_range(entity_data)
+        row = connection.execute(
+            'SELECT entities.rowid FROM entities JOIN version_ranges ON version_ranges.entity = entities.rowid '
+            'WHERE section = ? AND id = ? AND fromversion = ? AND toversion = ? ORDER BY entities.rowid LIMIT 1',
+            (section, entity_id, fromversion or entity_from_version, toversion or entity_to_version)).fetchone()
+
+        if row:
+            # the entity keeps its rowid, which orders entities with the same id on export
+            self._delete_entity(connection, row[0])
+
+        if not connection.execute('SELECT 1 FROM sections WHERE name = ?', (section,)).fetchone():
+            connection.execute('INSERT INTO sections VALUES (?, (SELECT COUNT(*) FROM sections))', (section,))
+
+        used_ids = [used_id for field in AMBIGUOUS_DEPENDENCY_FIELDS for used_id in entity_data.get(field, [])]
+        script_ids = set(script_id for script_id, in connection.execute(
+            'SELECT id FROM entities WHERE section = ? AND id IN ({})'.format(', '.join('?' * len(used_ids))),
+            ['scripts'] + used_ids))
+        self._insert_entity(connection, section, entity_id, entity_data, script_ids, rowid=row[0] if row else None)
+
+        if section == 'scripts':
+            # a new script turns the dependencies on a command with the same name to script dependencies
+            connection.execute(
+                'UPDATE dependencies SET kind = ? WHERE kind = ? AND target = ? AND field IN ({})'.format(
+                    ', '.join('?' * len(AMBIGUOUS_DEPENDENCY_FIELDS))),
+                ['scripts', 'commands', entity_id] + AMBIGUOUS_DEPENDENCY_FIELDS)
+
+    def query(self, section=None, entity_id=None, name=None, command=None, uses_script=None, uses_command=None,
+              uses_playbook=None, max_from_version=None, min_to_version=None):
+        """Queries the id_set entities, all the given conditions must match.
+
+        Args:
+            section (str): the id_set section of the entities.
+            entity_id (str): the id of the entities.
+            name (str): the name of the entities.
+            command (str): a command the entities (integrations) implement.
+            uses_script (str): a script the entities use.
+            uses_command (str): an integration command the entities use.
+            uses_playbook (str): a sub-playbook the entities use.
+            max_from_version (str): the entities' fromversion is lower or equal to this version.
+            min_to_version (str): the entities' toversion is higher or equal to this version.
+
+        Returns:
+            list. (section, id, data) tuples of the matching entities, in id_set order.
+        """
+        conditions = []
+        parameters = []  # type: list
+        for column, value in (('entities.section', section), ('entities.id', entity_id), ('entities.name', name)):
+            if value is not None:
+                conditions.append('{} = ?'.format(column))
+                parameters.append(value)
+
+        if command is not None:
+            conditions.append('entities.rowid IN (SELECT entity FROM commands WHERE command = ?)')
+            parameters.append(command)
+
+        for kind, target in (('scripts', uses_script), ('commands', uses_command), ('playbooks', uses_playbook)):
+            if target is not None:
+                conditions.append('entities.rowid IN (SELECT entity FROM dependencies WHERE kind = ? AND target = ?)')
+                parameters.extend([kind, target])
+
+        if max_from_version is not None:
+            conditions.append('version_ranges.from_key <= ?')
+            parameters.append(get_version_key(max_from_version))
+
+        if min_to_version is not None:
+            conditions.append('version_ranges.to_key >= ?')
+            parameters.append(get_version_key(min_to_version))
+
+        rows = self.connection.execute(
+            'SELECT entities.section, entities.id, entities.data FROM entities '
+            'JOIN version_ranges ON version_ranges.entity = entities.rowid '
+            'JOIN sections ON sections.name = entities.section {} '
+            'ORDER BY sections.position, entities.sort_key, entities.rowid'.format(
+                'WHERE ' + ' AND '.join(conditions) if conditions else ''), parameters)
+
+        return [(row_section, row_id, json.loads(data, object_pairs_hook=OrderedDict))
+                for row_section, row_id, data in rows]
+
+    def to_id_set(self):
+        """Reads the whole store back to an IdSet, sections sorted like id_set.json."""
+        id_set = OrderedDict((section, []) for section, in self.connection.execute(
+            'SELECT name FROM sections ORDER BY position'))
+        for section, entity_id, entity_data in self.query():
+            id_set[section].append({entity_id: entity_data})
+
+        return IdSet(id_set)
+
+    def export(self, id_set_path):
+        """Exports the store to an id_set.json file.
+
+        Args:
+            id_set_path (str): the path of the id_set.json file to write.
+        """
+        self.to_id_set().dump(id_set_path)
@@ -0,0 +1,200 @@
+"""Reverse dependency index of the id_set.
+
+The id_set records for every entity what it uses - the scripts a playbook runs, the commands a script depends on and
+the sub-playbooks of a playbook. The dependency index inverts those edges so "what uses X" is a dict lookup. It is
+built in a single pass over the id_set when the id_set is created or updated, and saved out of the content repo, in
+~/.cache/demisto-sdk/id_set_dependencies or $DEMISTO_SDK_DEPENDENCIES_CACHE_DIR, in a file named after a hash of
+the path of the id_set. The saved index is used while the size and mtime of the id_set are the ones it was built from.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+from demisto_sdk.commands.common.id_set import IdSet
+from demisto_sdk.commands.common.tools import print_warning
+
+ID_SET_DEPENDENCIES_CACHE_DIR_ENV = 'DEMISTO_SDK_DEPENDENCIES_CACHE_DIR'
+# bump when the index changes, older indexes are rebuilt
+ID_SET_DEPENDENCIES_VERSION = 1
+
+# the kinds of entities that can be depended on
+DEPENDENCY_KINDS = ('scripts', 'commands', 'playbooks')
+# the id_set fields that hold dependencies and the kind of entity they refer to, None if it can be a script or a command
+DEPENDENCY_FIELDS = OrderedDict([
+    ('implementing_scripts', 'scripts'),
+    ('implementing_playbooks', 'playbooks'),
+    ('command_to_integration', 'commands'),
+    ('depends_on', None),
+    ('script_executions', None),
+])
+
+
+def get_default_cache_dir():
+    """Returns the index directory, $DEMISTO_SDK_DEPENDENCIES_CACHE_DIR or ~/.cache/demisto-sdk/id_set_dependencies."""
+    if os.environ.get(ID_SET_DEPENDENCIES_CACHE_DIR_ENV):
+        return os.path.expanduser(os.environ[ID_SET_DEPENDENCIES_CACHE_DIR_ENV])
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'demisto-sdk', 'id_set_dependencies')
+
+
+def get_dependencies_path(id_set_path):
+    """Returns the path of the dependency index of an id_set.json file, named after a hash of the path of the id_set."""
+    id_set_hash = hashlib.sha1(os.path.realpath(id_set_path).encode('utf-8')).hexdigest()
+    return os.path.join(get_default_cache_dir(), id_set_hash + '.json')
+
+
+def get_id_set_stat(id_set_path):
+    id_set_stat = os.stat(id_set_path)
+    return [id_set_stat.st_size, id_set_stat.st_mtime_ns]
+
+
+def get_entity_dependencies(entity_data, script_ids):
+    """Gets the entities an id_set entity uses.
+
+    Args:
+        entity_data (dict): the data of the id_set entity.
+        script_ids (set): the ids of all the scripts in the id_set, to tell a script dependency from a command one.
+
+    Returns:
+        list. (field, kind, id) tuples of the entities used by the given entity and the id_set field they are in.
+    """
+    dependencies = []
+    for field, kind in DEPENDENCY_FIELDS.items():
+        for used_id in entity_data.get(field, []):
+            # a script may depend on, or execute, both scripts and integration commands
+            dependencies.append((field, kind or ('scripts' if used_id in script_ids else 'commands'), used_id))
+
+    return dependencies
+
+
+class DependencyIndex:
+    """DependencyIndex maps every script, integration command and playbook to the entities that use it.
+
+    Attributes:
+        used_by (dict): maps a dependency kind to a dict of id -> list of {section, id, name, fields} of its users,
+            fields are the id_set fields the user has the id in.
+    """
+
+    def __init__(self, used_by=None):
+        self.used_by = used_by or OrderedDict((kind, OrderedDict()) for kind in DEPENDENCY_KINDS)
+
+    @classmethod
+    def build(cls, id_set):
+        """Builds the dependency index in a single pass over the id_set.
+
+        Args:
+            id_set (IdSet): the id_set, or its sections dict.
+
+        Returns:
+            DependencyIndex. The index of the given id_set.
+        """
+        if not isinstance(id_set, IdSet):
+            id_set = IdSet(id_set)
+
+        script_ids = set(script_id for script_id, _ in id_set.iter_section('scripts'))
+        used_by = {kind: {} for kind in DEPENDENCY_KINDS}  # type: dict
+        for section in id_set.sections:
+            for entity_id, entity_data in id_set.iter_section(section):
+                user = (section, entity_id, entity_data.get('name', entity_id))
+                for field, kind, used_id in get_entity_dependencies(entity_data, script_ids):
+                    used_by[kind].setdefault(used_id, {}).setdefault(user, set()).add(field)
+
+        # sorted so the users are listed in the same order between runs
+        index = cls()
+        for kind in DEPENDENCY_KINDS:
+            for used_id in sorted(used_by[kind]):
+                users = used_by[kind][used_id]
+                index.used_by[kind][used_id] = [
+                    OrderedDict([('section', section), ('id', entity_id), ('name', name),
+                                 ('fields', sorted(users[(section, entity_id, name)]))])
+                    for section, entity_id, name in sorted(users)]
+
+        return index
+
+    @classmethod
+    def load(cls, id_set_path):
+        """Loads the saved dependency index of an id_set.json file.
+
+        Args:
+            id_set_path (str): the path of the id_set.json file.
+
+        Returns:
+            DependencyIndex. The saved index, None if there is none or it was built from another version of the id_set.
+        """
+        try:
+            with open(get_dependencies_path(id_set_path), 'r') as dependencies_file:
+                dependencies_data = json.load(dependencies_file, object_pairs_hook=OrderedDict)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if dependencies_data.get('version') != ID_SET_DEPENDENCIES_VERSION or \
+                dependencies_data.get('stat') != get_id_set_stat(id_set_path):
+            return None
+
+        return cls(dependencies_data['used_by'])
+
+    @classmethod
+    def for_id_set(cls, id_set_path):
+        """Gets the dependency index of an id_set.json file.
+
+        The saved index is used if it was built from the current id_set, otherwise the index is built from the id_set
+        and saved for the next time.
+
+        Args:
+            id_set_path (str): the path of the id_set.json file.
+
+        Returns:
+            DependencyIndex. The index of the given id_set.
+        """
+        index = cls.load(id_set_path)
+        if index is None:
+            index = cls.build(IdSet.load(id_set_path))
+            index.save(id_set_path)
+
+        return index
+
+    def save(self, id_set_path):
+        """Saves the dependency index of an id_set.json file, a read only or full disk leaves it unsaved.
+
+        Args:
+            id_set_path (str): the path of the id_set.json file the index was built from.
+        """
+        dependencies_path = get_dependencies_path(id_set_path)
+        try:
+            os.makedirs(os.path.dirname(dependencies_path), exist_ok=True)
+            # write to a temporary file and rename it, so concurrent runs never read a partial index
+            file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(dependencies_path), suffix='.tmp')
+            try:
+                with os.fdopen(file_descriptor, 'w') as temp_file:
+                    json.dump({'version': ID_SET_DEPENDENCIES_VERSION, 'stat': get_id_set_stat(id_set_path),
+                               'used_by': self.used_by}, temp_file)
+                os.replace(temp_path, dependencies_path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except (IOError, OSError) as error:
+            print_warning('Could not save the id_set dependency index to {}: {}'.format(dependencies_path, error))
+
+    def get_used_by(self, entity_id, kind='scripts', sections=None, fields=None):
+        """Gets the entities that use the given script, command or playbook.
+
+        Args:
+            entity_id (str): the id of the script or playbook, or the name of the command.
+            kind (str): one of scripts, commands or playbooks.
+            sections (tuple): id_set sections to filter the users by, all the sections if not given.
+            fields (tuple): id_set fields to filter the users by, e.g. implementing_scripts for the users that run a
+                script as a task, all the fields if not given.
+
+        Returns:
+            list. {section, id, name, fields} dicts of the users, sorted by section and id.
+        """
+        if kind not in DEPENDENCY_KINDS:
+            raise ValueError('Unknown dependency kind "{}", expected one of: {}'.format(
+                kind, ', '.join(DEPENDENCY_KINDS)))
+
+        return [user for user in self.used_by[kind].get(entity_id, [])
+                if (sections is None or user['section'] in sections) and
+                (fields is None or any(field in fields for field in user['fields']))]
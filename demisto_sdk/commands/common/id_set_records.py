@@ -0,0 +1,141 @@
+"""Compact records of the content entities extracted to the id_set.
+
+Creating the id_set extracts a record from every integration, script and playbook in a pool of worker processes. The
+records are pickled back to the main process and held until the id_set is written, so they are kept small - a slotted
+object per entity instead of a {id: OrderedDict} pair, with the names of the entities, commands and scripts interned so
+the ones that repeat across entities are stored once. They are converted to the id_set.json layout only when written.
+"""
+import sys
+from collections import OrderedDict
+
+
+def intern_strings(value):
+    """Interns a string, or the strings in a list or a dict.
+
+    Args:
+        value (object): the value to intern.
+
+    Returns:
+        object. The value with its strings interned, values of other types are returned as is.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [intern_strings(item) for item in value]
+    if isinstance(value, dict):
+        return type(value)((intern_strings(key), intern_strings(item)) for key, item in value.items())
+
+    return value
+
+
+class EntityRecord:
+    """EntityRecord holds the id_set data of a content entity.
+
+    Attributes:
+        entity_id (str): the id of the entity.
+        FIELDS (tuple): the id_set data fields of the entity, in the order they are written to id_set.json.
+        INTERNED_FIELDS (tuple): the fields whose strings are interned.
+    """
+    __slots__ = ('entity_id', 'name', 'file_path', 'toversion', 'fromversion', 'tests')
+    FIELDS = ('name', 'file_path', 'toversion', 'fromversion', 'tests')  # type: tuple
+    INTERNED_FIELDS = ('name',)  # type: tuple
+
+    def __init__(self, entity_id, **fields):
+        """
+        Args:
+            entity_id (str): the id of the entity.
+            **fields: the id_set data fields of the entity, missing fields are left empty.
+        """
+        unknown_fields = set(fields) - set(self.FIELDS)
+        if unknown_fields:
+            raise TypeError('Unknown {} fields: {}'.format(type(self).__name__, ', '.join(sorted(unknown_fields))))
+
+        self.entity_id = intern_strings(entity_id)
+        for field in self.FIELDS:
+            value = fields.get(field)
+            setattr(self, field, intern_strings(value) if field in self.INTERNED_FIELDS else value)
+
+    @classmethod
+    def from_entity(cls, entity):
+        """Creates a record from a single key {id: data} id_set entity.
+
+        Args:
+            entity (dict): the id_set entity.
+
+        Returns:
+            EntityRecord. The record of the entity.
+        """
+        entity_id = next(iter(entity))
+        return cls(entity_id, **entity[entity_id])
+
+    def to_entity(self):
+        """Returns the entity in the id_set.json layout - a single key {id: data} dict without the empty fields."""
+        data = OrderedDict()  # type: OrderedDict
+        for field in self.FIELDS:
+            value = getattr(self, field)
+            if value:
+                data[field] = value
+
+        return {self.entity_id: data}
+
+    def get(self, field, default=None):
+        """Gets a data field like the id_set data dict of the entity, where empty fields are missing."""
+        value = getattr(self, field) if field in self.FIELDS else None
+        return value if value else default
+
+    def __getitem__(self, field):
+        value = self.get(field)
+        if value is None:
+            raise KeyError(field)
+
+        return value
+
+    def __getstate__(self):
+        return (self.entity_id,) + tuple(getattr(self, field) for field in self.FIELDS)
+
+    def __setstate__(self, state):
+        # unpickled strings are new objects, intern them again in the receiving process
+        self.entity_id = intern_strings(state[0])
+        for field, value in zip(self.FIELDS, state[1:]):
+            setattr(self, field, intern_strings(value) if value and field in self.INTERNED_FIELDS else value)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.__getstate__() == other.__getstate__()
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self.to_entity())
+
+
+class IntegrationRecord(EntityRecord):
+    __slots__ = ('commands',)
+    FIELDS = ('name', 'file_path', 'toversion', 'fromversion', 'commands', 'tests')
+    INTERNED_FIELDS = ('name', 'commands')
+
+
+class ScriptRecord(EntityRecord):
+    __slots__ = ('deprecated', 'depends_on', 'script_executions', 'command_to_integration')
+    FIELDS = ('name', 'file_path', 'toversion', 'fromversion', 'deprecated', 'depends_on', 'script_executions',
+              'command_to_integration', 'tests')
+    INTERNED_FIELDS = ('name', 'depends_on', 'script_executions', 'command_to_integration')
+
+
+class PlaybookRecord(EntityRecord):
+    __slots__ = ('implementing_scripts', 'implementing_playbooks', 'command_to_integration')
+    FIELDS = ('name', 'file_path', 'toversion', 'fromversion', 'implementing_scripts', 'implementing_playbooks',
+              'command_to_integration', 'tests')
+    INTERNED_FIELDS = ('name', 'implementing_scripts', 'implementing_playbooks', 'command_to_integration')
+
+
+def records_to_id_set(record_sections):
+    """Converts id_set sections of records to the id_set.json layout.
+
+    Args:
+        record_sections (dict): maps a section name to its list of records.
+
+    Returns:
+        OrderedDict. Maps a section name to its list of {id: data} entities.
+    """
+    return OrderedDict((section, [record.to_entity() for record in records])
+                       for section, records in record_sections.items())
@@ -0,0 +1,326 @@
+"""Streaming reader of the id_set.json file.
+
+The id_set of a big content repo takes a lot of memory once parsed, while most readers need a single section or a few
+entities. The id_set is read here an entity at a time - the file is read in chunks and every entity is decoded on its
+own, so memory is bounded by the biggest entity rather than by the file.
+
+For lookups by id, a scan of the id_set maps every id to the byte offsets of its entities. LazyIdSet loads only that
+index and reads an entity from the id_set when it is asked for. The index is saved for the next time out of the
+content repo, in ~/.cache/demisto-sdk/id_set_offsets or $DEMISTO_SDK_ID_SET_OFFSETS_CACHE_DIR, in a file named after a
+hash of the path of the id_set - it is used while the size and mtime of the id_set are the ones it was scanned from.
+"""
+import codecs
+import hashlib
+import json
+import os
+import re
+from collections import OrderedDict
+
+from demisto_sdk.commands.common.id_set import DEFAULT_FROM_VERSION, DEFAULT_TO_VERSION, get_entity_id, \
+    get_version_range
+from demisto_sdk.commands.common.tools import print_warning
+
+ID_SET_OFFSETS_CACHE_DIR_ENV = 'DEMISTO_SDK_ID_SET_OFFSETS_CACHE_DIR'
+# bump when the offsets index changes, older indexes are rebuilt
+ID_SET_OFFSETS_VERSION = 1
+CHUNK_SIZE = 1 << 16
+WHITESPACE_REGEX = re.compile(r'[ \t\n\r]*')
+
+
+def get_default_cache_dir():
+    """Returns the offsets directory, $DEMISTO_SDK_ID_SET_OFFSETS_CACHE_DIR or ~/.cache/demisto-sdk/id_set_offsets."""
+    if os.environ.get(ID_SET_OFFSETS_CACHE_DIR_ENV):
+        return os.path.expanduser(os.environ[ID_SET_OFFSETS_CACHE_DIR_ENV])
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'demisto-sdk', 'id_set_offsets')
+
+
+def get_offsets_path(id_set_path):
+    """Returns the path of the offsets index of an id_set.json file, named after a hash of the path of the id_set."""
+    id_set_hash = hashlib.sha1(os.path.realpath(id_set_path).encode('utf-8')).hexdigest()
+    return os.path.join(get_default_cache_dir(), id_set_hash + '.json')
+
+
+class IdSetScanner:
+    """IdSetScanner reads an id_set.json file an entity at a time, keeping track of the byte offsets of the entities.
+
+    Only the layout of the id_set is parsed here - an object of sections, each a list of entities. The entities and
+    the section names are decoded with the json module.
+    """
+
+    def __init__(self, id_set_file, chunk_size=CHUNK_SIZE):
+        """
+        Args:
+            id_set_file (file): the id_set.json file, opened in binary mode.
+            chunk_size (int): the number of bytes to read at a time.
+        """
+        self.id_set_file = id_set_file
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._position = 0
+        self._eof = False
+        # the byte offset of a position in the buffer, advanced as the buffer is consumed
+        self._cursor_position = 0
+        self._cursor_offset = 0
+        self._is_ascii = True
+
+    def _fill(self):
+        """Reads the next chunk to the buffer, dropping the consumed part. Returns False at the end of the file."""
+        if self._eof:
+            return False
+
+        self._cursor_offset = self.get_offset(self._position)
+        self._buffer = self._buffer[self._position:]
+        self._cursor_position = self._position = 0
+
+        chunk = self.id_set_file.read(self.chunk_size)
+        self._eof = not chunk
+        text = self._text_decoder.decode(chunk, final=self._eof)
+        self._is_ascii = self._buffer.isascii() and text.isascii()
+        self._buffer += text
+        return not self._eof or bool(text)
+
+    def get_offset(self, position):
+        """Returns the byte offset in the file of a position in the buffer, positions must not go back."""
+        if self._is_ascii:
+            return self._cursor_offset + position - self._cursor_position
+
+        self._cursor_offset += len(self._buffer[self._cursor_position:position].encode('utf-8'))
+        self._cursor_position = position
+        return self._cursor_offset
+
+    def _skip_whitespace(self):
+        while True:
+            self._position = WHITESPACE_REGEX.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer) or not self._fill():
+                return
+
+    def _read_char(self, expected):
+        """Consumes the next non whitespace char, which must be one of the expected chars, and returns it."""
+        self._skip_whitespace()
+        char = self._buffer[self._position:self._position + 1]
+        if not char or char not in expected:
+            raise json.JSONDecodeError('Expecting one of "{}"'.format(expected), self._buffer, self._position)
+
+        self._position += 1
+        return char
+
+    def _decode(self):
+        """Decodes the next json value, reading more chunks while the value is incomplete."""
+        self._skip_whitespace()
+        while True:
+            # only strings and objects are decoded here, they fail to decode until the buffer holds all of them
+            try:
+                value, end = self.decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+
+            start = self._position
+            self._position = end
+            return value, start, end
+
+    def scan(self):
+        """Iterates over the entities of the id_set.
+
+        Returns:
+            iterator. (section, entity, offset, length) tuples - the section name, the {id: data} entity and the byte
+            range of the entity in the file.
+        """
+        self._read_char('{')
+        if self._read_char('"}') == '}':
+            self._read_end()
+            return
+
+        self._position -= 1
+        while True:
+            section, _, _ = self._decode()
+            if not isinstance(section, str):
+                raise ValueError('Unexpected id_set section name: {}'.format(section))
+
+            self._read_char(':')
+            self._read_char('[')
+            self._skip_whitespace()
+            if self._buffer[self._position:self._position + 1] == ']':
+                self._position += 1
+            else:
+                while True:
+                    entity, start, end = self._decode()
+                    if not isinstance(entity, dict) or len(entity) != 1:
+                        raise ValueError('Unexpected entity in the {} section of the id_set'.format(section))
+
+                    offset = self.get_offset(start)
+                    yield section, entity, offset, self.get_offset(end) - offset
+                    if self._read_char(',]') == ']':
+                        break
+
+            if self._read_char(',}') == '}':
+                self._read_end()
+                return
+
+    def _read_end(self):
+        """Checks that nothing but whitespace follows the id_set, like a merge conflict left in the file."""
+        self._skip_whitespace()
+        if self._position < len(self._buffer):
+            raise json.JSONDecodeError('Extra data', self._buffer, self._position)
+
+
+def iter_id_set(id_set_path, sections=None):
+    """Iterates over the entities of an id_set.json file without loading the whole file.
+
+    Args:
+        id_set_path (str): the path of the id_set.json file.
+        sections (tuple): the sections to iterate over, all the sections if not given.
+
+    Returns:
+        iterator. (section, id, data) tuples of the entities, in id_set order.
+    """
+    with open(id_set_path, 'rb') as id_set_file:
+        for section, entity, _, _ in IdSetScanner(id_set_file).scan():
+            if sections is None or section in sections:
+                entity_id = get_entity_id(entity)
+                yield section, entity_id, entity[entity_id]
+
+
+class IdSetOffsets:
+    """IdSetOffsets maps the ids of an id_set.json file to the byte ranges of their entities.
+
+    Attributes:
+        sections (list): the section names, in id_set order.
+        ids (dict): maps an id to a list of [section index, offset, length] of its entities, in id_set order.
+        stat (list): the [size, mtime_ns] of the id_set.json file the offsets were scanned from.
+    """
+
+    def __init__(self, sections=None, ids=None, stat=None):
+        self.sections = sections or []
+        self.ids = ids or {}
+        self.stat = stat
+
+    @staticmethod
+    def get_stat(id_set_path):
+        id_set_stat = os.stat(id_set_path)
+        return [id_set_stat.st_size, id_set_stat.st_mtime_ns]
+
+    @classmethod
+    def build(cls, id_set_path):
+        """Scans an id_set.json file for the offsets of its entities.
+
+        Args:
+            id_set_path (str): the path of the id_set.json file.
+
+        Returns:
+            IdSetOffsets. The offsets of the entities of the id_set.
+        """
+        offsets = cls(stat=cls.get_stat(id_set_path))
+        section_indexes = {}  # type: dict
+        with open(id_set_path, 'rb') as id_set_file:
+            for section, entity, offset, length in IdSetScanner(id_set_file).scan():
+                if section not in section_indexes:
+                    section_indexes[section] = len(offsets.sections)
+                    offsets.sections.append(section)
+
+                offsets.ids.setdefault(get_entity_id(entity), []).append([section_indexes[section], offset, length])
+
+        return offsets
+
+    @classmethod
+    def for_id_set(cls, id_set_path):
+        """Gets the offsets of an id_set.json file.
+
+        The saved index is used if it was scanned from the current id_set, otherwise the id_set is scanned and the
+        index saved for the next time.
+
+        Args:
+            id_set_path (str): the path of the id_set.json file.
+
+        Returns:
+            IdSetOffsets. The offsets of the entities of the id_set.
+        """
+        offsets_path = get_offsets_path(id_set_path)
+        if os.path.isfile(offsets_path):
+            try:
+                with open(offsets_path, 'r') as offsets_file:
+                    offsets_data = json.load(offsets_file)
+                if offsets_data.get('version') == ID_SET_OFFSETS_VERSION and \
+                        offsets_data.get('stat') == cls.get_stat(id_set_path):
+                    return cls(offsets_data['sections'], offsets_data['ids'], offsets_data['stat'])
+            except ValueError:
+                pass
+
+        offsets = cls.build(id_set_path)
+        try:
+            os.makedirs(os.path.dirname(offsets_path), exist_ok=True)
+            offsets.dump(offsets_path)
+        except (IOError, OSError) as error:
+            print_warning('Could not save the id_set offsets to {}: {}'.format(offsets_path, error))
+
+        return offsets
+
+    def dump(self, offsets_path):
+        with open(offsets_path, 'w') as offsets_file:
+            json.dump({'version': ID_SET_OFFSETS_VERSION, 'stat': self.stat, 'sections': self.sections,
+                       'ids': self.ids}, offsets_file)
+
+
+class LazyIdSet:
+    """LazyIdSet looks entities up in an id_set.json file by id, reading only the entities it is asked for.
+
+    It has the read interface of IdSet - get, get_all, find and iter_section.
+
+    Attributes:
+        id_set_path (str): the path of the id_set.json file.
+        offsets (IdSetOffsets): the offsets of the entities in the file.
+    """
+
+    def __init__(self, id_set_path, offsets):
+        self.id_set_path = id_set_path
+        self.offsets = offsets
+
+    @classmethod
+    def load(cls, id_set_path):
+        """Loads the offsets of an id_set.json file, raises ValueError if the file isn't a valid id_set."""
+        return cls(id_set_path, IdSetOffsets.for_id_set(id_set_path))
+
+    @property
+    def sections(self):
+        return self.offsets.sections
+
+    def _read_entities(self, entity_id, section=None):
+        entities = []
+        with open(self.id_set_path, 'rb') as id_set_file:
+            for section_index, offset, length in self.offsets.ids.get(entity_id, []):
+                entity_section = self.offsets.sections[section_index]
+                if section is None or entity_section == section:
+                    id_set_file.seek(offset)
+                    entity = json.loads(id_set_file.read(length).decode('utf-8'), object_pairs_hook=OrderedDict)
+                    entities.append((entity_section, entity[entity_id]))
+
+        return entities
+
+    def get(self, section, entity_id, fromversion=DEFAULT_FROM_VERSION, toversion=DEFAULT_TO_VERSION):
+        """Gets the data of the entity with the given id and version range in a section, None if there is none."""
+        for entity_data in self.get_all(section, entity_id):
+            if get_version_range(entity_data) == (fromversion, toversion):
+                return entity_data
+
+        return None
+
+    def get_all(self, section, entity_id):
+        """Gets the data of all the versions of an entity in a section, in id_set order."""
+        return [entity_data for _, entity_data in self._read_entities(entity_id, section)]
+
+    def find(self, entity_id):
+        """Gets (section, data) tuples of all the entities with the given id in every section."""
+        if entity_id not in self.offsets.ids:
+            return []
+
+        return self._read_entities(entity_id)
+
+    def iter_section(self, section):
+        """Iterates over the (id, data) of the entities of a section, reading the file an entity at a time."""
+        for _, entity_id, entity_data in iter_id_set(self.id_set_path, sections=(section,)):
+            yield entity_id, entity_data
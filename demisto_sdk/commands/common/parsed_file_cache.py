@@ -0,0 +1,104 @@
+"""Process wide cache of parsed yml and json files.
+
+Validating a single content file parses it many times - the structure, docker, image and description validators all
+load the same yml. The cache keeps every parsed file, pickled, keyed by its real path and the parser, and reuses it as
+long as the mtime and size of the file are unchanged. Every caller gets its own copy, unpickled from the cached bytes,
+so changing the returned data never changes what other callers get.
+
+With a DiskParseCache set as its disk_cache, files that are not in memory are looked up on disk before they are parsed.
+"""
+import os
+import pickle
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 64 * 2 ** 20
+
+
+class ParsedFileCache:
+    """ParsedFileCache is a LRU cache of parsed files.
+
+    Attributes:
+        max_entries (int): the number of parsed files to keep.
+        max_bytes (int): the total size of the pickled parsed files to keep.
+        hits (int): the number of files served from the cache.
+        misses (int): the number of files that were parsed.
+        evictions (int): the number of parsed files dropped to keep the cache within its bounds.
+        disk_cache (DiskParseCache): the persistent cache of the parsed files, None if it is disabled.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # type: OrderedDict
+        self._size = 0
+        self.disk_cache = None
+
+    def parse(self, file_obj, parse_function):
+        """Parses an open file, or returns a copy of its cached parsed data if the file didn't change.
+
+        Args:
+            file_obj (file): the file to parse, opened for reading.
+            parse_function (function): the parser, e.g. yaml.safe_load, part of the cache key.
+
+        Returns:
+            object. The parsed data, errors of the parser are raised and nothing is cached.
+        """
+        # the stat of the open file always matches the content that is read from it
+        file_stat = os.fstat(file_obj.fileno())
+        key = (os.path.realpath(file_obj.name), parse_function)
+        version = (file_stat.st_mtime_ns, file_stat.st_size)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return pickle.loads(entry[1])
+
+        self.misses += 1
+        if self.disk_cache is not None:
+            data = self.disk_cache.parse(file_obj.read(), parse_function)
+        else:
+            data = parse_function(file_obj)
+        try:
+            pickled_data = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # data that can't be copied is not cached
+            return data
+
+        self._remove(key)
+        if len(pickled_data) <= self.max_bytes:
+            self._entries[key] = (version, pickled_data)
+            self._size += len(pickled_data)
+            self._evict()
+
+        # the cache holds the pickled data, so the parsed data itself is the caller's
+        return data
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            _, (_, pickled_data) = self._entries.popitem(last=False)
+            self._size -= len(pickled_data)
+            self.evictions += 1
+
+    def clear(self):
+        """Drops all the parsed files and resets the counters."""
+        self._entries.clear()
+        self._size = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def get_stats(self):
+        """Returns the counters of the cache and its current size."""
+        return OrderedDict([('hits', self.hits), ('misses', self.misses), ('evictions', self.evictions),
+                            ('entries', len(self._entries)), ('bytes', self._size)])
+
+
+PARSED_FILE_CACHE = ParsedFileCache()
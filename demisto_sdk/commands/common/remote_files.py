@@ -0,0 +1,243 @@
+"""Content files downloaded from GitHub, pooled, cached and prefetched.
+
+When the old version of a file isn't in the local git repository, it is downloaded from the content repo on GitHub.
+RemoteFileFetcher downloads through a single requests session, so the connections are kept alive and reused, and
+failed requests are retried. Downloaded files are kept in a RemoteFileCache on disk, keyed by the tag and path of the
+file, with their ETag - a file that is in the cache is requested with If-None-Match, and an unchanged file is answered
+with an empty 304 response.
+
+Once the changed files are known, prefetch downloads all their old versions concurrently. The validators that need
+them later get them from the fetcher without another request.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from demisto_sdk.commands.common.constants import CONTENT_GITHUB_LINK
+
+REMOTE_FILE_CACHE_DIR_ENV = 'DEMISTO_SDK_REMOTE_CACHE_DIR'
+# bump when the cache entries change, older entries are ignored
+REMOTE_FILE_CACHE_VERSION = 1
+ENTRY_SUFFIX = '.pickle'
+DEFAULT_WORKERS = 8
+DEFAULT_RETRIES = 3
+# a host that can't be resolved or refuses the connection rarely recovers within the backoff, so offline runs give up
+CONNECT_RETRIES = 1
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+REQUEST_TIMEOUT = 60
+REMOTE_PREFIX = 'origin/'
+
+
+def get_default_cache_dir():
+    """Returns the directory of the downloaded files, $DEMISTO_SDK_REMOTE_CACHE_DIR or ~/.cache/demisto-sdk/remote."""
+    if os.environ.get(REMOTE_FILE_CACHE_DIR_ENV):
+        return os.path.expanduser(os.environ[REMOTE_FILE_CACHE_DIR_ENV])
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'demisto-sdk', 'remote')
+
+
+def strip_remote_prefix(tag):
+    """Returns a tag without its 'origin/' prefix, which is used to compare with remote branches only."""
+    return tag[len(REMOTE_PREFIX):] if tag.startswith(REMOTE_PREFIX) else tag
+
+
+def create_session(retries=DEFAULT_RETRIES, pool_size=DEFAULT_WORKERS):
+    """Creates a requests session that keeps connections alive and retries failed requests.
+
+    Args:
+        retries (int): the number of times to retry a request that failed to connect or got a server error.
+        pool_size (int): the number of connections to keep alive per host.
+
+    Returns:
+        requests.Session. The session.
+    """
+    session = requests.Session()
+    # the content repo is downloaded without verifying the certificate, like the other requests of the SDK
+    session.verify = False
+    retry = Retry(total=retries, connect=min(retries, CONNECT_RETRIES), backoff_factor=RETRY_BACKOFF_FACTOR,
+                  status_forcelist=RETRY_STATUSES, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class RemoteFileCache:
+    """RemoteFileCache keeps downloaded files on disk with their ETags, keyed by their tag and path.
+
+    Attributes:
+        cache_dir (str): the directory of the cache entries.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or get_default_cache_dir()
+
+    def get_entry_path(self, tag, file_path):
+        key = hashlib.sha1('{}\0{}\0{}'.format(REMOTE_FILE_CACHE_VERSION, tag, file_path).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key + ENTRY_SUFFIX)
+
+    def get(self, tag, file_path):
+        """Gets a cached file.
+
+        Args:
+            tag (str): the branch or tag of the file.
+            file_path (str): the path of the file in the repo.
+
+        Returns:
+            tuple. (etag, content) of the file, None if it isn't cached.
+        """
+        try:
+            with open(self.get_entry_path(tag, file_path), 'rb') as entry_file:
+                entry = pickle.load(entry_file)
+            return entry['etag'], entry['content']
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError, KeyError, TypeError, AttributeError, ImportError):
+            # a truncated entry is downloaded again and rewritten
+            return None
+
+    def set(self, tag, file_path, etag, content):
+        """Caches a file, a read only or full disk leaves it uncached.
+
+        Args:
+            tag (str): the branch or tag of the file.
+            file_path (str): the path of the file in the repo.
+            etag (str): the ETag of the file.
+            content (bytes): the content of the file.
+        """
+        entry_path = self.get_entry_path(tag, file_path)
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            # write to a temporary file and rename it, so concurrent runs never read a partial entry
+            file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(file_descriptor, 'wb') as temp_file:
+                    pickle.dump({'tag': tag, 'path': file_path, 'etag': etag, 'content': content}, temp_file,
+                                pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, entry_path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError:
+            pass
+
+    def clear(self):
+        """Deletes all the entries, returns the number of deleted entries."""
+        deleted = 0
+        if os.path.isdir(self.cache_dir):
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(ENTRY_SUFFIX):
+                    try:
+                        os.remove(entry.path)
+                        deleted += 1
+                    except OSError:
+                        pass
+
+        return deleted
+
+
+class RemoteFileFetcher:
+    """RemoteFileFetcher downloads files of a repo by tag and path.
+
+    Every file is downloaded once per process, the result - the content or the error - is kept for the next callers.
+
+    Attributes:
+        base_url (str): the url of the repo, the files are at <base_url>/<tag>/<path>.
+        session (requests.Session): the session to download with.
+        cache (RemoteFileCache): the cache of the downloaded files, None to download them every time.
+        max_workers (int): the number of concurrent downloads of prefetch.
+        requests_count (int): the number of requests sent in this process.
+        not_modified_count (int): the number of requests that were answered with 304, from the cache.
+    """
+
+    def __init__(self, base_url=CONTENT_GITHUB_LINK, session=None, cache=None, max_workers=DEFAULT_WORKERS):
+        self.base_url = base_url
+        self.session = session or create_session(pool_size=max_workers)
+        self.cache = cache
+        self.max_workers = max_workers
+        self.requests_count = 0
+        self.not_modified_count = 0
+        self._results = {}  # type: dict
+        self._lock = threading.Lock()
+
+    def get_url(self, file_path, tag='master'):
+        """Returns the url of a file, the 'origin/' prefix of a tag is not a part of the url."""
+        # The replace in the end is for Windows support
+        return '/'.join((self.base_url, strip_remote_prefix(tag), file_path)).replace('\\', '/')
+
+    def _download(self, file_path, tag):
+        tag = strip_remote_prefix(tag)
+        cached = self.cache.get(tag, file_path) if self.cache is not None else None
+        headers = {'If-None-Match': cached[0]} if cached else {}
+        with self._lock:
+            self.requests_count += 1
+        res = self.session.get(self.get_url(file_path, tag), headers=headers, timeout=REQUEST_TIMEOUT)
+        if cached and res.status_code == 304:
+            with self._lock:
+                self.not_modified_count += 1
+            return cached[1]
+
+        res.raise_for_status()
+        etag = res.headers.get('ETag')
+        if etag and self.cache is not None:
+            self.cache.set(tag, file_path, etag, res.content)
+
+        return res.content
+
+    def _fetch_result(self, file_path, tag):
+        try:
+            return self._download(file_path, tag), None
+        except Exception as error:
+            return None, error
+
+    def fetch(self, file_path, tag='master'):
+        """Gets the content of a file, downloading it if it wasn't downloaded or prefetched before.
+
+        Args:
+            file_path (str): the path of the file in the repo.
+            tag (str): the branch or tag, with or without the 'origin/' prefix.
+
+        Returns:
+            bytes. The content of the file. The error of the download is raised if it failed.
+        """
+        key = (tag, file_path)
+        if key not in self._results:
+            self._results[key] = self._fetch_result(file_path, tag)
+
+        content, error = self._results[key]
+        if error is not None:
+            raise error
+
+        return content
+
+    def prefetch(self, file_paths, tag='master'):
+        """Downloads files concurrently, for the later fetch calls.
+
+        Args:
+            file_paths (iterable): the paths of the files in the repo.
+            tag (str): the branch or tag, with or without the 'origin/' prefix.
+        """
+        file_paths = sorted({file_path for file_path in file_paths if (tag, file_path) not in self._results})
+        if not file_paths:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(file_paths))) as executor:
+            results = executor.map(lambda file_path: self._fetch_result(file_path, tag), file_paths)
+            for file_path, result in zip(file_paths, results):
+                self._results[(tag, file_path)] = result
+
+    def clear(self):
+        """Drops the files downloaded in this process."""
+        self._results.clear()
+
+
+REMOTE_FILE_FETCHER = RemoteFileFetcher(cache=RemoteFileCache())
@@ -0,0 +1,342 @@
+"""Schema validators generated as Python code.
+
+pykwalify validates a file by walking the rules of its schema for every value - it builds a sub Core per sequence item,
+formats error messages that are dropped when another item rule matches, and logs at every step. The generator here
+translates the rules of a schema (as compiled by CompiledSchema) once to a Python module of plain functions, one per
+rule, that only decide whether data is valid. The generated modules are kept in a cache directory, keyed by a sha1 of
+the schema, of the pykwalify version and of GENERATOR_VERSION, so later runs load them without building the rules.
+
+FastSchema.validate has the interface of CompiledSchema.validate. Valid data is returned as soon as the generated
+validator passes it. Invalid data is validated again by pykwalify, which raises its SchemaError with its messages - so
+the errors are always pykwalify's, the generated code only has to agree with it on what is valid.
+
+Only the rule keywords the SDK schemas use are translated. A schema with any other keyword (pattern, range, unique,
+default, func...) raises UnsupportedSchema when generated, and FastSchema validates with pykwalify alone.
+"""
+import hashlib
+import logging
+import os
+import re
+import tempfile
+from functools import lru_cache
+
+import pykwalify
+
+from demisto_sdk.commands.common.compiled_schema import get_compiled_schema
+
+SCHEMA_CODE_CACHE_DIR_ENV = 'DEMISTO_SDK_SCHEMA_CACHE_DIR'
+# bump when the generated code changes, older modules are ignored
+GENERATOR_VERSION = 1
+# the scalar types checked inline, the others are checked with the pykwalify.types functions
+INLINE_TYPE_CHECKS = {
+    'str': 'isinstance(value, (str, bytes))',
+    'int': 'isinstance(value, int) and not isinstance(value, bool)',
+    'bool': 'isinstance(value, bool)',
+}
+TYPE_CHECKS = ('float', 'number', 'text', 'scalar', 'enum', 'none')
+ENUM_ITEM_TYPES = (str, int, float, bool)
+# pykwalify logs the result of every validation, valid data is logged the same
+pykwalify_log = logging.getLogger('pykwalify.core')
+
+
+class UnsupportedSchema(Exception):
+    """Raised when a schema has rules that are not translated to code."""
+
+
+def get_default_cache_dir():
+    """Returns the directory of the generated modules, $DEMISTO_SDK_SCHEMA_CACHE_DIR or ~/.cache/demisto-sdk/schemas."""
+    if os.environ.get(SCHEMA_CODE_CACHE_DIR_ENV):
+        return os.path.expanduser(os.environ[SCHEMA_CODE_CACHE_DIR_ENV])
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'demisto-sdk', 'schemas')
+
+
+class SchemaCodeGenerator:
+    """SchemaCodeGenerator translates the rules of a compiled schema to the source of a Python module.
+
+    The module has a `validate(value)` function, which returns whether the value is valid. Every rule is translated to
+    a `rule_<n>` function with the same checks as pykwalify's Core._validate of the rule.
+
+    Attributes:
+        compiled_schema (CompiledSchema): the schema to translate.
+    """
+
+    def __init__(self, compiled_schema):
+        self.compiled_schema = compiled_schema
+        self._lines = []  # type: list
+        self._constants = []  # type: list
+        self._rule_names = {}  # type: dict
+        self._pending_rules = []  # type: list
+        self._partial_names = {}  # type: dict
+
+    def generate(self):
+        """Returns the source of the validator module, raises UnsupportedSchema if a rule can't be translated."""
+        for partial_name, partial_rule in sorted(self.compiled_schema.partial_rules.items()):
+            self._partial_names[partial_name] = self._get_rule_name(partial_rule)
+        root_name = self._get_rule_name(self.compiled_schema.root_rule)
+
+        while self._pending_rules:
+            rule_name, rule = self._pending_rules.pop(0)
+            self._add_rule_function(rule_name, rule)
+
+        header = ['# Generated from {} by {}, do not edit.'.format(os.path.basename(self.compiled_schema.schema_path),
+                                                                   __name__),
+                  'import re', '', 'from pykwalify.types import tt', '', '']
+        footer = ['', '', 'validate = {}'.format(root_name), '']
+        return '\n'.join(header + self._lines + self._constants + footer)
+
+    def _get_rule_name(self, rule):
+        if id(rule) not in self._rule_names:
+            rule_name = 'rule_{}'.format(len(self._rule_names))
+            self._rule_names[id(rule)] = rule_name
+            self._pending_rules.append((rule_name, rule))
+
+        return self._rule_names[id(rule)]
+
+    def _get_partial_rule(self, rule):
+        if rule.include_name not in self._partial_names:
+            # pykwalify looks it up in the partial schemas of every schema loaded before, it isn't known here
+            raise UnsupportedSchema('include of unknown partial schema {}'.format(rule.include_name))
+
+        return self.compiled_schema.partial_rules[rule.include_name]
+
+    def _add_constant(self, name, source):
+        self._constants.append('{} = {}'.format(name, source))
+
+    @staticmethod
+    def _check_keywords(rule):
+        for keyword in ('assertion', 'func', 'pattern', 'range', 'length', 'unique', 'ident', 'default', 'extensions'):
+            if getattr(rule, keyword) is not None:
+                raise UnsupportedSchema('rule keyword {}'.format(keyword))
+
+    def _add_rule_function(self, rule_name, rule):
+        self._check_keywords(rule)
+        body = []
+        if (rule.required or not rule.nullable) and rule.type != 'none':
+            body += ['if value is None:', '    return False']
+
+        if rule.include_name is not None:
+            body += ['return {}(value)'.format(self._get_rule_name(self._get_partial_rule(rule)))]
+        elif rule.sequence is not None:
+            body += self._get_sequence_lines(rule_name, rule)
+        elif rule.mapping is not None or rule.allowempty_map:
+            body += self._get_mapping_lines(rule_name, rule)
+        else:
+            body += self._get_scalar_lines(rule_name, rule)
+
+        self._lines += ['def {}(value):'.format(rule_name)] + ['    ' + line for line in body] + ['', '']
+
+    def _get_sequence_lines(self, rule_name, rule):
+        lines = ['if value is None:', '    return True', 'if not isinstance(value, list):', '    return False']
+        for item_rule in rule.sequence:
+            self._check_keywords(item_rule)
+            if item_rule.type == 'map':
+                if item_rule.mapping is None:
+                    # pykwalify stops validating the sequence when it gets to a map rule without a mapping
+                    return lines + ['return True']
+                if any(key_rule.unique or key_rule.ident for key_rule in item_rule.mapping.values()):
+                    raise UnsupportedSchema('unique keys in sequence items')
+
+        if rule.matching == '*':
+            return lines + ['return True']
+
+        item_checks = ['{}(item)'.format(self._get_rule_name(item_rule)) for item_rule in rule.sequence]
+        operator = ' or ' if rule.matching == 'any' else ' and '
+        return lines + ['for item in value:',
+                        '    if not ({}):'.format(operator.join(item_checks)),
+                        '        return False',
+                        'return True']
+
+    def _get_mapping_lines(self, rule_name, rule):
+        lines = ['if not isinstance(value, dict):', '    return False']
+        if rule.mapping is None:
+            return lines + ['return True']
+
+        regex_rules = rule.regex_mappings or []
+        regex_keys = {'regex;({})'.format(regex_rule.map_regex_rule) for regex_rule in regex_rules} | \
+                     {'re;({})'.format(regex_rule.map_regex_rule) for regex_rule in regex_rules}
+        required_keys = []
+        required_regexes = []
+        key_checks = []
+        for key, key_rule in rule.mapping.items():
+            # the presence of a key is checked with the rule it includes, its value with its own rule
+            presence_rule = self._get_partial_rule(key_rule) if key_rule.include_name is not None else key_rule
+            self._check_keywords(presence_rule)
+            if presence_rule.required and key != '=':
+                if key in regex_keys:
+                    required_regexes.append(key.split(';', 1)[1][1:-1])
+                else:
+                    required_keys.append(key)
+
+            key_checks.append('{!r}: {}'.format(key, self._get_rule_name(key_rule)))
+
+        checks_name = 'KEY_CHECKS_{}'.format(rule_name.split('_')[1])
+        self._add_constant(checks_name, '{' + ', '.join(key_checks) + '}')
+        if required_keys:
+            required_name = 'REQUIRED_KEYS_{}'.format(rule_name.split('_')[1])
+            self._add_constant(required_name, repr(tuple(required_keys)))
+            lines += ['for key in {}:'.format(required_name),
+                      '    if key not in value:',
+                      '        return False']
+        for regex in required_regexes:
+            lines += ['if not any(re.search({!r}, str(key)) for key in value):'.format(regex),
+                      '    return False']
+
+        default_check = 'None'
+        if '=' in rule.mapping:
+            default_check = self._get_rule_name(rule.mapping['='])
+        lines += ['for key, item in value.items():',
+                  '    check = {}.get(key, {})'.format(checks_name, default_check),
+                  '    if check is not None:',
+                  '        if not check(item):',
+                  '            return False']
+
+        if regex_rules:
+            # pykwalify validates a key that has no rule of its own with all the regex rules it matches
+            regexes_name = 'REGEX_CHECKS_{}'.format(rule_name.split('_')[1])
+            self._add_constant(regexes_name, '(' + ''.join(
+                '(re.compile({!r}), {}), '.format(regex_rule.map_regex_rule, self._get_rule_name(regex_rule))
+                for regex_rule in regex_rules) + ')')
+            lines += ['    else:',
+                      '        matches = [regex.search(str(key)) is not None for regex, _ in {}]'.format(regexes_name),
+                      '        for is_match, (_, regex_check) in zip(matches, {}):'.format(regexes_name),
+                      '            if is_match and not regex_check(item):',
+                      '                return False',
+                      '        if not {}(matches):'.format('all' if rule.matching_rule == 'all' else 'any'),
+                      '            return False']
+        elif not rule.allowempty_map:
+            lines += ['    else:', '        return False']
+
+        return lines + ['return True']
+
+    def _get_scalar_lines(self, rule_name, rule):
+        lines = ['if value is None:', '    return True']
+        if rule.type in (None, 'map', 'seq'):
+            # empty partial schemas, maps and sequences without rules - pykwalify raises a CoreError for any value
+            return lines + ['return False']
+
+        if rule.type not in INLINE_TYPE_CHECKS and rule.type not in TYPE_CHECKS and rule.type != 'any':
+            # dates, timestamps, emails and urls
+            raise UnsupportedSchema('scalar type {}'.format(rule.type))
+
+        if rule.enum is not None:
+            if not all(type(item) in ENUM_ITEM_TYPES for item in rule.enum):
+                raise UnsupportedSchema('enum items')
+
+            enum_name = 'ENUM_{}'.format(rule_name.split('_')[1])
+            self._add_constant(enum_name, repr(tuple(rule.enum)))
+            lines += ['if value not in {}:'.format(enum_name), '    return False']
+
+        if rule.type in INLINE_TYPE_CHECKS:
+            lines += ['return {}'.format(INLINE_TYPE_CHECKS[rule.type])]
+        elif rule.type in TYPE_CHECKS:
+            lines += ['return bool(tt[{!r}](value))'.format(rule.type)]
+        else:
+            lines += ['return True']
+
+        return lines
+
+
+def get_cache_key(schema_path):
+    """Returns the key of the generated module of a schema, a sha1 of the schema, pykwalify and the generator."""
+    key_hash = hashlib.sha1('{}:{}\0'.format(pykwalify.__version__, GENERATOR_VERSION).encode('utf-8'))
+    with open(schema_path, 'rb') as schema_file:
+        key_hash.update(schema_file.read())
+
+    return key_hash.hexdigest()
+
+
+def load_validator(schema_path, cache_dir=None):
+    """Loads the generated validator of a schema, generating and caching its module if it isn't cached yet.
+
+    Args:
+        schema_path (str): the path of the schema file.
+        cache_dir (str): the directory of the generated modules, the default cache directory if not given.
+
+    Returns:
+        function. The validator, returns whether the data it is called with is valid. UnsupportedSchema is raised if
+        the schema can't be translated.
+    """
+    cache_dir = cache_dir or get_default_cache_dir()
+    module_name = os.path.splitext(os.path.basename(schema_path))[0]
+    module_path = os.path.join(cache_dir, '{}_{}.py'.format(re.sub(r'\W', '_', module_name),
+                                                            get_cache_key(schema_path)))
+    try:
+        with open(module_path, 'r') as module_file:
+            source = module_file.read()
+    except OSError:
+        source = SchemaCodeGenerator(get_compiled_schema(schema_path)).generate()
+        write_module(module_path, source)
+
+    namespace = {'__name__': 'demisto_sdk_schema_' + module_name}
+    exec(compile(source, module_path, 'exec'), namespace)
+    return namespace['validate']
+
+
+def write_module(module_path, source):
+    """Writes a generated module to the cache, a read only or full disk leaves it uncached."""
+    module_dir = os.path.dirname(module_path)
+    try:
+        os.makedirs(module_dir, mode=0o700, exist_ok=True)
+        # write to a temporary file and rename it, so concurrent runs never read a partial module
+        file_descriptor, temp_path = tempfile.mkstemp(dir=module_dir, suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'w') as temp_file:
+                temp_file.write(source)
+            os.replace(temp_path, module_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    except OSError:
+        pass
+
+
+class FastSchema:
+    """FastSchema validates data against a schema with its generated validator, and with pykwalify if it is invalid.
+
+    Attributes:
+        schema_path (str): the path of the schema file.
+        validator (function): the generated validator, None if the schema can't be translated.
+    """
+
+    def __init__(self, schema_path, cache_dir=None):
+        self.schema_path = schema_path
+        try:
+            self.validator = load_validator(schema_path, cache_dir)
+        except UnsupportedSchema:
+            self.validator = None
+
+    def is_valid(self, source_data):
+        """Returns whether data is valid, by the generated validator or by pykwalify."""
+        if self.validator is not None:
+            return self.validator(source_data)
+
+        try:
+            get_compiled_schema(self.schema_path).validate(source_data)
+        except Exception:
+            return False
+
+        return True
+
+    def validate(self, source_data):
+        """Validates data against the schema, like CompiledSchema.validate.
+
+        Args:
+            source_data (object): the data to validate, it is not changed.
+
+        Returns:
+            object. The validated data. pykwalify.errors.SchemaError is raised if it is invalid.
+        """
+        if self.validator is not None and self.validator(source_data):
+            pykwalify_log.info(u'validation.valid')
+            return source_data
+
+        # the errors of invalid data are pykwalify's
+        return get_compiled_schema(self.schema_path).validate(source_data)
+
+
+@lru_cache(maxsize=None)
+def get_fast_schema(schema_path):
+    """Returns the FastSchema of a schema file, loaded on its first use in the process."""
+    return FastSchema(schema_path)
@@ -0,0 +1,126 @@
+import glob
+import json
+import os
+
+import pytest
+from pykwalify.compat import yml
+from pykwalify.core import Core
+
+from demisto_sdk.commands.common import yaml_io
+from demisto_sdk.commands.common.compiled_schema import get_compiled_schema, load_yaml_for_schema
+from demisto_sdk.commands.common.git_tools import git_path
+from demisto_sdk.commands.common.hook_validations.structure import StructureValidator
+from demisto_sdk.tests.constants_test import INVALID_DASHBOARD_PATH, INVALID_INTEGRATION_ID_PATH, \
+    INVALID_LAYOUT_PATH, INVALID_PLAYBOOK_ID_PATH, INVALID_PLAYBOOK_PATH, INVALID_SCRIPT_PATH, \
+    INVALID_WIDGET_PATH, VALID_DASHBOARD_PATH, VALID_INCIDENT_FIELD_PATH, VALID_INTEGRATION_TEST_PATH, \
+    VALID_LAYOUT_PATH, VALID_SCRIPT_PATH, VALID_TEST_PLAYBOOK_PATH, VALID_WIDGET_PATH
+
+SCHEMAS_DIR = os.path.join(git_path(), 'demisto_sdk', 'commands', 'common', 'schemas')
+FAKE_TEST_PLAYBOOK_PATH = os.path.join(git_path(), 'demisto_sdk', 'tests', 'test_files',
+                                       'fake_integration_expected_test_playbook.yml')
+TEST_FILES = sorted(glob.glob(os.path.join(git_path(), 'demisto_sdk', 'tests', 'test_files', '**', '*.yml'),
+                              recursive=True))
+SCALARS = ['yes', 'no', 'on', 'off', 'y', 'True', 'FALSE', 'tRue', 'null', '~', '', '012', '0o12', '0x1F', '-0b101',
+           '+12', '1_000', '_', '1:20', '1:20.5', '08', '0.5', '.5', '1.', '1e3', '1.0e+3', '.inf', '-.INF', '.NaN',
+           '2020-01-01', '2001-12-14t21:59:43.10-05:00', '2001-12-14 21:59:43.10 Z', '12:30:00', '!', '! x',
+           '!!str 1', '!!binary aGk=', '"012"', "'yes'", '0xGG', '1e', '+', '-1_0']
+
+
+def validate_with_core(file_path, schema_path):
+    try:
+        Core(source_file=file_path, schema_files=[schema_path]).validate(raise_exception=True)
+        return None
+    except Exception as error:
+        return str(error)
+
+
+def validate_with_compiled_schema(file_path, schema_path):
+    try:
+        with open(file_path, 'r') as file_obj:
+            source_data = load_yaml_for_schema(file_obj) if file_path.endswith('.yml') else json.load(file_obj)
+        get_compiled_schema(schema_path).validate(source_data)
+        return None
+    except Exception as error:
+        return str(error)
+
+
+@pytest.mark.parametrize('file_path, scheme_name', [
+    (VALID_INTEGRATION_TEST_PATH, 'integration'), (INVALID_INTEGRATION_ID_PATH, 'integration'),
+    (VALID_SCRIPT_PATH, 'script'), (INVALID_SCRIPT_PATH, 'script'), (VALID_SCRIPT_PATH, 'integration'),
+    (VALID_TEST_PLAYBOOK_PATH, 'playbook'), (INVALID_PLAYBOOK_PATH, 'playbook'), (INVALID_PLAYBOOK_ID_PATH, 'playbook'),
+    (VALID_LAYOUT_PATH, 'layout'), (INVALID_LAYOUT_PATH, 'layout'), (VALID_WIDGET_PATH, 'widget'),
+    (INVALID_WIDGET_PATH, 'widget'), (VALID_DASHBOARD_PATH, 'dashboard'), (INVALID_DASHBOARD_PATH, 'dashboard'),
+    (VALID_INCIDENT_FIELD_PATH, 'incidentfield'), (VALID_INCIDENT_FIELD_PATH, 'layout'),
+])
+def test_compiled_schema_validates_like_core(file_path, scheme_name):
+    """
+    Given
+        - A content file and a schema.
+    When
+        - Validating the file with a pykwalify Core of its path and with the compiled schema.
+    Then
+        - Both find the file valid, or both fail with the same errors.
+    """
+    schema_path = os.path.join(SCHEMAS_DIR, '{}.yml'.format(scheme_name))
+    assert validate_with_compiled_schema(file_path, schema_path) == validate_with_core(file_path, schema_path)
+
+
+def test_schema_is_compiled_once():
+    schema_path = os.path.join(SCHEMAS_DIR, 'script.yml')
+    assert get_compiled_schema(schema_path) is get_compiled_schema(schema_path)
+
+
+@pytest.mark.parametrize('file_path', TEST_FILES)
+def test_load_yaml_for_schema_matches_pykwalify(file_path):
+    with open(file_path, 'r') as file_obj:
+        content = file_obj.read()
+
+    try:
+        expected = yml.load(content)
+    except Exception as error:
+        with pytest.raises(type(error)):
+            load_yaml_for_schema(content)
+        return
+
+    assert load_yaml_for_schema(content) == expected
+
+
+@pytest.mark.parametrize('scalar', SCALARS)
+@pytest.mark.parametrize('document_format', ['value: {}\n', '{}: value\n', '- {}\n'])
+def test_load_yaml_for_schema_resolves_scalars_like_pykwalify(scalar, document_format):
+    """
+    Given
+        - A scalar that YAML 1.1 and YAML 1.2 resolve differently, or that is otherwise special, as a value, a key and
+          a list item.
+    When
+        - Loading it with load_yaml_for_schema and with pykwalify's loader.
+    Then
+        - The loaded data is the same, including the types.
+    """
+    document = document_format.format(scalar)
+    try:
+        expected = repr(yml.load(document))
+    except Exception as error:
+        with pytest.raises(type(error)):
+            load_yaml_for_schema(document)
+        return
+
+    assert repr(load_yaml_for_schema(document)) == expected
+
+
+def test_yes_labels_are_strings(tmp_path):
+    """
+    Given
+        - A playbook with `yes` condition labels, booleans in YAML 1.1 and strings in YAML 1.2.
+    When
+        - Validating its scheme.
+    Then
+        - The labels are validated as the strings pykwalify loads, so the playbook is valid.
+    """
+    playbook_path = os.path.join(str(tmp_path), 'playbook-Test.yml')
+    with open(FAKE_TEST_PLAYBOOK_PATH) as playbook_file, open(playbook_path, 'w') as target_file:
+        target_file.write('description: test\n' + playbook_file.read())
+
+    with open(playbook_path) as playbook_file:
+        assert yaml_io.safe_load(playbook_file)['tasks']['3']['conditions'][0]['label'] is True
+    assert StructureValidator(playbook_path, is_new_file=True, predefined_scheme='playbook').is_valid_scheme()
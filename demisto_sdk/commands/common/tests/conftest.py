@@ -0,0 +1,189 @@
+"""Fixtures of local HTTP servers, for the tests of the downloads and of the docker tags. The benchmarks run the
+servers directly.
+"""
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+
+class StubHTTPServer:
+    """StubHTTPServer serves files from a dict in a background thread, with ETags and 304 responses.
+
+    Use it as a context manager, the files are at <url>/<path>.
+
+    Attributes:
+        files (dict): maps a path (without the leading slash) to its content.
+        delay (float): the seconds to wait before answering a request, like the latency of a remote server.
+        fail_count (int): the number of requests to answer with 503 before answering normally.
+        requests (list): the (path, If-None-Match header) of the received requests.
+        connections (set): the client ports of the received requests, one per connection.
+    """
+
+    def __init__(self, files=None, delay=0.0, fail_count=0):
+        self.files = files or {}
+        self.delay = delay
+        self.fail_count = fail_count
+        self.requests = []  # type: list
+        self.connections = set()  # type: set
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @staticmethod
+    def get_etag(content):
+        return '"{}"'.format(hashlib.sha1(content).hexdigest())
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self._server.server_address[1])
+
+    def _handle(self, handler):
+        with self._lock:
+            self.requests.append((handler.path.lstrip('/'), handler.headers.get('If-None-Match')))
+            self.connections.add(handler.client_address[1])
+            fail = self.fail_count > 0
+            self.fail_count -= fail
+
+        if self.delay:
+            time.sleep(self.delay)
+
+        content = self.files.get(handler.path.lstrip('/'))
+        if fail or content is None:
+            handler.send_response(503 if fail else 404)
+            handler.send_header('Content-Length', '0')
+            handler.end_headers()
+            return
+
+        etag = self.get_etag(content)
+        if handler.headers.get('If-None-Match') == etag:
+            handler.send_response(304)
+            handler.send_header('ETag', etag)
+            handler.end_headers()
+            return
+
+        handler.send_response(200)
+        handler.send_header('ETag', etag)
+        handler.send_header('Content-Length', str(len(content)))
+        handler.end_headers()
+        handler.wfile.write(content)
+
+    def __enter__(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # keep the connections alive, and send the responses without waiting for the acks of the headers
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                stub._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class FakeDockerRegistry(StubHTTPServer):
+    """FakeDockerRegistry serves the tags of images like Docker Hub and like a registry, in a background thread.
+
+    Docker Hub lists tags at /v2/repositories/<image>/tags. The registry lists them at /v2/<image>/tags/list with a
+    token from /token, and answers /v2/ with the challenge that points to it.
+
+    Attributes:
+        hub_tags (dict): maps an image to its (name, last_updated) tags on Docker Hub, other images are not found.
+        registry_tags (dict): maps an image to its tags in the registry.
+        token_lifetime (int): the seconds the tokens are valid for.
+        tokens (dict): maps the issued tokens to their (scope, expiry time).
+        requests (list): the (path, Authorization header) of the received requests.
+    """
+
+    def __init__(self, hub_tags=None, registry_tags=None, delay=0.0, token_lifetime=300):
+        super().__init__(delay=delay)
+        self.hub_tags = hub_tags or {}
+        self.registry_tags = registry_tags or {}
+        self.token_lifetime = token_lifetime
+        self.tokens = {}  # type: dict
+
+    @staticmethod
+    def _send_json(handler, status, data, headers=None):
+        content = json.dumps(data).encode('utf-8')
+        handler.send_response(status)
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(content)))
+        handler.end_headers()
+        handler.wfile.write(content)
+
+    def _handle(self, handler):
+        url = urlparse(handler.path)
+        authorization = handler.headers.get('Authorization')
+        with self._lock:
+            self.requests.append((url.path, authorization))
+            self.connections.add(handler.client_address[1])
+
+        if self.delay:
+            time.sleep(self.delay)
+
+        hub_match = re.match(r'^/v2/repositories/(.+)/tags$', url.path)
+        registry_match = re.match(r'^/v2/(.+)/tags/list$', url.path)
+        if hub_match:
+            image = hub_match.group(1)
+            if image not in self.hub_tags:
+                self._send_json(handler, 404, {'message': 'object not found'})
+            else:
+                self._send_json(handler, 200, {'results': [{'name': name, 'last_updated': last_updated}
+                                                           for name, last_updated in self.hub_tags[image]]})
+
+        elif url.path == '/v2/':
+            self._send_json(handler, 401, {}, {
+                'Www-Authenticate': 'Bearer realm="{}/token",service="fake-registry"'.format(self.url)})
+
+        elif url.path == '/token':
+            scope = parse_qs(url.query).get('scope', [''])[0]
+            with self._lock:
+                token = 'token-{}'.format(len(self.tokens))
+                self.tokens[token] = (scope, time.time() + self.token_lifetime)
+            self._send_json(handler, 200, {'token': token, 'expires_in': self.token_lifetime})
+
+        elif registry_match:
+            image = registry_match.group(1)
+            scope, expiry = self.tokens.get((authorization or '').replace('Bearer ', ''), (None, 0))
+            if scope != 'repository:{}:pull'.format(image) or time.time() > expiry:
+                self._send_json(handler, 401, {'errors': [{'code': 'UNAUTHORIZED'}]})
+            elif image not in self.registry_tags:
+                self._send_json(handler, 404, {'errors': [{'code': 'NAME_UNKNOWN'}]})
+            else:
+                self._send_json(handler, 200, {'name': image, 'tags': self.registry_tags[image]})
+
+        else:
+            self._send_json(handler, 404, {})
+
+
+@pytest.fixture()
+def stub_http_server():
+    """A StubHTTPServer without files, add the files to serve to its files dict."""
+    with StubHTTPServer() as server:
+        yield server
+
+
+@pytest.fixture()
+def fake_docker_registry():
+    """A FakeDockerRegistry without images, add their tags to its hub_tags and registry_tags dicts."""
+    with FakeDockerRegistry() as registry:
+        yield registry
@@ -0,0 +1,142 @@
+import json
+import os
+
+import pytest
+import yaml
+
+from demisto_sdk.commands.common import tools, yaml_io
+from demisto_sdk.commands.common.disk_parse_cache import DISK_PARSE_CACHE_DIR_ENV, DiskParseCache, \
+    get_default_cache_dir
+
+
+def test_parsed_file_is_reused_by_the_next_run(tmp_path):
+    """
+    Given
+        - A yml parsed through a disk cache.
+    When
+        - Parsing the same content through a new cache of the same directory, like a new run would.
+    Then
+        - The content is not parsed again and the data is the same.
+    """
+    content = 'script:\n  commands:\n  - name: command\n'
+    first_run = DiskParseCache(str(tmp_path))
+    assert first_run.parse(content, yaml_io.safe_load) == {'script': {'commands': [{'name': 'command'}]}}
+    assert (first_run.hits, first_run.misses, first_run.writes) == (0, 1, 1)
+
+    second_run = DiskParseCache(str(tmp_path))
+    assert second_run.parse(content, yaml_io.safe_load) == {'script': {'commands': [{'name': 'command'}]}}
+    assert (second_run.hits, second_run.misses) == (1, 0)
+
+
+def test_content_and_parser_are_the_key(tmp_path):
+    disk_cache = DiskParseCache(str(tmp_path))
+    disk_cache.parse('{"name": "first"}', json.load)
+
+    assert disk_cache.parse('{"name": "other"}', json.load) == {'name': 'other'}
+    assert disk_cache.parse('{"name": "first"}', yaml_io.safe_load) == {'name': 'first'}
+    assert (disk_cache.hits, disk_cache.misses) == (0, 3)
+
+
+def test_empty_documents_are_cached(tmp_path):
+    disk_cache = DiskParseCache(str(tmp_path))
+    disk_cache.parse('', yaml_io.safe_load)
+
+    assert disk_cache.parse('', yaml_io.safe_load) is None
+    assert disk_cache.hits == 1
+
+
+def test_corrupted_entry_is_parsed_again(tmp_path):
+    """
+    Given
+        - A cached yml whose entry was truncated.
+    When
+        - Parsing the yml again.
+    Then
+        - The yml is parsed and the entry is rewritten.
+    """
+    disk_cache = DiskParseCache(str(tmp_path))
+    disk_cache.parse('name: integration', yaml_io.safe_load)
+    entry_path = disk_cache.get_entry_path(b'name: integration', yaml_io.safe_load)
+    with open(entry_path, 'wb') as entry_file:
+        entry_file.write(b'\x80')
+
+    assert disk_cache.parse('name: integration', yaml_io.safe_load) == {'name': 'integration'}
+    assert (disk_cache.misses, disk_cache.writes) == (2, 2)
+    assert DiskParseCache(str(tmp_path)).parse('name: integration', yaml_io.safe_load) == {'name': 'integration'}
+
+
+def test_parse_errors_are_not_cached(tmp_path):
+    disk_cache = DiskParseCache(str(tmp_path))
+    for _ in range(2):
+        with pytest.raises(yaml.YAMLError):
+            disk_cache.parse('name: [', yaml_io.safe_load)
+
+    assert disk_cache.get_stats()['entries'] == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """
+    Given
+        - A disk cache with room for about two entries.
+    When
+        - Parsing a third content after using the first one again.
+    Then
+        - The second content, the least recently used, is evicted.
+    """
+    contents = ['name: {}'.format(name * 100) for name in ('a', 'b', 'c')]
+    disk_cache = DiskParseCache(str(tmp_path))
+    for timestamp, content in enumerate(contents[:2]):
+        disk_cache.parse(content, yaml_io.safe_load)
+        os.utime(disk_cache.get_entry_path(content.encode('utf-8'), yaml_io.safe_load), (timestamp, timestamp))
+
+    # the entries are of the same size
+    disk_cache.max_bytes = int(disk_cache.get_stats()['bytes'] / 2 * 2.5)
+
+    disk_cache.parse(contents[0], yaml_io.safe_load)
+    disk_cache.parse(contents[2], yaml_io.safe_load)
+
+    assert disk_cache.evictions == 1
+    assert [os.path.isfile(disk_cache.get_entry_path(content.encode('utf-8'), yaml_io.safe_load))
+            for content in contents] == [True, False, True]
+
+
+def test_clear_and_stats(tmp_path):
+    disk_cache = DiskParseCache(str(tmp_path))
+    disk_cache.parse('name: first', yaml_io.safe_load)
+    disk_cache.parse('name: second', yaml_io.safe_load)
+
+    stats = DiskParseCache(str(tmp_path)).get_stats()
+    assert stats['entries'] == 2 and stats['bytes'] > 0
+    assert DiskParseCache(str(tmp_path)).clear() == 2
+    assert DiskParseCache(str(tmp_path)).get_stats()['entries'] == 0
+
+
+def test_cache_dir_from_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv(DISK_PARSE_CACHE_DIR_ENV, str(tmp_path))
+    assert get_default_cache_dir() == str(tmp_path)
+
+    monkeypatch.delenv(DISK_PARSE_CACHE_DIR_ENV)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    assert get_default_cache_dir() == os.path.join(str(tmp_path), 'demisto-sdk', 'parsed')
+
+
+def test_get_yaml_uses_the_disk_cache(tmp_path, mocker):
+    """
+    Given
+        - The disk cache enabled on the process wide parsed files cache.
+    When
+        - Loading a yml with get_yaml in two runs - with the in process cache cleared between them.
+    Then
+        - The second run gets the yml from the disk cache.
+    """
+    file_path = str(tmp_path / 'integration.yml')
+    with open(file_path, 'w') as yml_file:
+        yml_file.write('name: integration')
+    disk_cache = DiskParseCache(str(tmp_path / 'cache'))
+    mocker.patch.object(tools.PARSED_FILE_CACHE, 'disk_cache', disk_cache)
+
+    for _ in range(2):
+        tools.PARSED_FILE_CACHE.clear()
+        assert tools.get_yaml(file_path) == {'name': 'integration'}
+
+    assert (disk_cache.hits, disk_cache.misses) == (1, 1)
@@ -0,0 +1,197 @@
+import os
+import time
+from shutil import copyfile
+
+import pytest
+import requests
+
+from demisto_sdk.commands.common import docker_tags
+from demisto_sdk.commands.common.docker_tags import DockerTagCache, DockerTagResolver, get_image_name
+from demisto_sdk.commands.common.hook_validations import docker
+from demisto_sdk.commands.common.hook_validations.docker import DockerImageValidator
+from demisto_sdk.commands.validate.file_validator import FilesValidator
+from demisto_sdk.tests.constants_test import GIT_ROOT
+
+HUB_TAGS = {'demisto/python': [('2.7.1', '2019-10-16T06:47:29.631011Z'), ('2.7.2', '2019-10-23T09:13:30.84299Z')],
+            'demisto/python3': [('3.7.4', '2019-10-16T06:47:29.631011Z')]}
+REGISTRY_TAGS = {'demisto/pyjwt': ['1.0', '1.0.10', '1.0.9', 'latest'],
+                 'demisto/stix2': ['1.0.0.204', '1.0.0.300']}
+
+
+@pytest.fixture()
+def registry(fake_docker_registry):
+    fake_docker_registry.hub_tags.update(HUB_TAGS)
+    fake_docker_registry.registry_tags.update(REGISTRY_TAGS)
+    return fake_docker_registry
+
+
+def create_resolver(registry, cache_dir=None, **kwargs):
+    return DockerTagResolver(registry.url, registry.url, cache=DockerTagCache(cache_dir) if cache_dir else None,
+                             **kwargs)
+
+
+def test_resolve_from_docker_hub(registry, tmp_path):
+    """
+    Given
+        - Images with tags on Docker Hub.
+    When
+        - Resolving them twice, then in a new resolver with the same cache, and after the cached tags expire.
+    Then
+        - The tags are the latest by date, requested once until they expire.
+    """
+    resolver = create_resolver(registry, str(tmp_path))
+    assert resolver.resolve('demisto/python') == '2.7.2'
+    assert resolver.resolve('demisto/python3') == '3.7.4'
+    assert resolver.resolve('demisto/python') == '2.7.2'
+    assert [path for path, _ in registry.requests] == ['/v2/repositories/demisto/python/tags',
+                                                       '/v2/repositories/demisto/python3/tags']
+
+    resolver = create_resolver(registry, str(tmp_path))
+    assert resolver.resolve('demisto/python') == '2.7.2'
+    assert resolver.cached_count == 1
+    assert len(registry.requests) == 2
+
+    resolver = DockerTagResolver(registry.url, registry.url, cache=DockerTagCache(str(tmp_path), ttl=-1))
+    assert resolver.resolve('demisto/python') == '2.7.2'
+    assert len(registry.requests) == 3
+
+
+def test_resolve_from_registry_reuses_the_challenge_and_tokens(registry):
+    """
+    Given
+        - Images that are not on Docker Hub, in a registry with token authentication.
+    When
+        - Resolving them, and resolving one of them again.
+    Then
+        - The challenge of the registry is requested once, a token per image, and the token is reused until it expires.
+    """
+    resolver = create_resolver(registry)
+    assert resolver.resolve('demisto/pyjwt') == '1.0.10'
+    assert resolver.resolve('demisto/stix2') == '1.0.0.300'
+    resolver.clear()
+    assert resolver.resolve('demisto/pyjwt') == '1.0.10'
+
+    assert [path for path, _ in registry.requests] == [
+        '/v2/repositories/demisto/pyjwt/tags', '/v2/', '/token', '/v2/demisto/pyjwt/tags/list',
+        '/v2/repositories/demisto/stix2/tags', '/token', '/v2/demisto/stix2/tags/list',
+        '/v2/repositories/demisto/pyjwt/tags', '/v2/demisto/pyjwt/tags/list']
+    assert registry.requests[-1][1] == registry.requests[3][1] == 'Bearer token-0'
+
+
+def test_expired_tokens_are_requested_again(registry):
+    registry.token_lifetime = docker_tags.TOKEN_EXPIRY_MARGIN
+    resolver = create_resolver(registry)
+    assert resolver.resolve('demisto/pyjwt') == '1.0.10'
+    resolver.clear()
+    assert resolver.resolve('demisto/pyjwt') == '1.0.10'
+    assert [path for path, _ in registry.requests].count('/token') == 2
+
+
+def test_prefetch(registry):
+    """
+    Given
+        - A slow registry.
+    When
+        - Prefetching images, some of them more than once, then resolving them.
+    Then
+        - The images are resolved concurrently, once each, over one session per host, and resolved without requests.
+    """
+    images = ['demisto/python', 'demisto/python3', 'demisto/pyjwt', 'demisto/stix2', 'demisto/missing']
+    registry.delay = 0.2
+    resolver = create_resolver(registry)
+    start = time.time()
+    resolver.prefetch(images * 2)
+    # 12 requests of 0.2 seconds, at most 4 of them one after the other
+    assert time.time() - start < 1.5
+    assert [path for path, _ in registry.requests].count('/v2/') == 1
+    assert len(registry.requests) == 12
+    assert len(resolver._sessions) == 1
+
+    registry.delay = 0
+    assert [resolver.resolve(image) for image in images[:4]] == ['2.7.2', '3.7.4', '1.0.10', '1.0.0.300']
+    with pytest.raises(requests.HTTPError):
+        resolver.resolve('demisto/missing')
+    assert len(registry.requests) == 12
+
+
+def test_failed_resolution_prints_an_error(registry, monkeypatch, capsys):
+    """
+    Given
+        - An image that is not on Docker Hub or in the registry.
+    When
+        - Getting its latest tag in DockerImageValidator.
+    Then
+        - An empty tag is returned and the failure is printed.
+    """
+    monkeypatch.setattr(docker, 'DOCKER_TAG_RESOLVER', create_resolver(registry))
+    assert DockerImageValidator.get_docker_image_latest_tag('demisto/missing', 'demisto/missing:1.0') == ''
+    assert DockerImageValidator.get_docker_image_latest_tag('', 'other/image:1.0') == ''
+    output = capsys.readouterr().out
+    assert 'Failed getting tag for: demisto/missing.' in output
+    assert 'Failed getting tag for: other/image:1.0.' in output
+
+
+@pytest.mark.parametrize('docker_image, image_name', [('demisto/python:1.3-alpine', 'demisto/python'),
+                                                      ('demisto/python', 'demisto/python'),
+                                                      ('', 'demisto/python'),
+                                                      ('blah/blah:1.2.3.4', None)])
+def test_get_image_name(docker_image, image_name):
+    assert get_image_name(docker_image) == image_name
+
+
+def test_prefetch_docker_image_tags_of_changed_files(tmp_path, monkeypatch, mocker):
+    """
+    Given
+        - A changed integration, a renamed script and a playbook.
+    When
+        - Prefetching the docker image tags of the changed files.
+    Then
+        - The images of the integration and the script are prefetched.
+    """
+    files = {'Integrations/Fake/Fake.yml': 'fake_integration.yml', 'Scripts/script-Fake.yml': 'fake-script.yml',
+             'Playbooks/playbook-Fake.yml': 'playbook-valid-id-test.yml'}
+    for file_path, source_name in files.items():
+        os.makedirs(os.path.dirname(str(tmp_path / file_path)), exist_ok=True)
+        copyfile(os.path.join(GIT_ROOT, 'demisto_sdk', 'tests', 'test_files', source_name), str(tmp_path / file_path))
+    monkeypatch.chdir(tmp_path)
+    prefetch = mocker.patch('demisto_sdk.commands.validate.file_validator.DOCKER_TAG_RESOLVER.prefetch')
+
+    FilesValidator.prefetch_docker_image_tags({'Integrations/Fake/Fake.yml', 'Playbooks/playbook-Fake.yml',
+                                               ('Scripts/script-Old.yml', 'Scripts/script-Fake.yml')})
+    prefetch.assert_called_once_with({'demisto/pyjwt', 'demisto/stix2'})
+
+
+def test_snapshot(registry, tmp_path, monkeypatch, capsys):
+    """
+    Given
+        - A snapshot of the tags of images in the registry, created with an image that doesn't exist.
+    When
+        - Resolving images with the snapshot, in DockerImageValidator.
+    Then
+        - The tags are taken from the snapshot without requests, images that aren't in it fail.
+    """
+    snapshot_path = str(tmp_path / 'snapshot.json')
+    errors = docker_tags.create_snapshot(snapshot_path, ['demisto/python', 'demisto/pyjwt', 'demisto/missing', None],
+                                         create_resolver(registry))
+    assert list(errors) == ['demisto/missing']
+    snapshot = docker_tags.load_snapshot(snapshot_path)
+    assert snapshot == {'demisto/python': '2.7.2', 'demisto/pyjwt': '1.0.10'}
+
+    resolver = create_resolver(registry, str(tmp_path / 'cache'))
+    resolver.use_snapshot(snapshot)
+    monkeypatch.setattr(docker, 'DOCKER_TAG_RESOLVER', resolver)
+    del registry.requests[:]
+    resolver.prefetch(['demisto/python', 'demisto/python3'])
+    assert DockerImageValidator.get_docker_image_latest_tag('demisto/python', 'demisto/python:2.7.1') == '2.7.2'
+    assert DockerImageValidator.get_docker_image_latest_tag('demisto/python3', 'demisto/python3:3.7.4') == ''
+    assert 'demisto/python3. It is not in the docker tags snapshot' in capsys.readouterr().out
+    assert registry.requests == []
+    assert resolver.requests_count == resolver.cached_count == 0
+
+
+@pytest.mark.parametrize('content', ['{"images": {}}', '{"version": 1, "images": ["demisto/python"]}', '[]'])
+def test_load_invalid_snapshot(tmp_path, content):
+    snapshot_path = tmp_path / 'snapshot.json'
+    snapshot_path.write_text(content)
+    with pytest.raises(ValueError):
+        docker_tags.load_snapshot(str(snapshot_path))
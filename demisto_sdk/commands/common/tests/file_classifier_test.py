@@ -0,0 +1,109 @@
+import re
+
+import pytest
+
+from demisto_sdk.commands.common import constants
+from demisto_sdk.commands.common.file_classifier import FILE_TYPE_CLASSIFIER, FileType, RegexSet, shift_groups
+from demisto_sdk.commands.common.tools import checked_type, find_scheme_name
+
+PATHS = [
+    'Integrations/Zoom/Zoom.yml', 'Integrations/Zoom/Zoom.py', 'Integrations/Zoom/Zoom_test.py',
+    'Integrations/Zoom/Zoom_image.png', 'Integrations/Zoom/Zoom_description.md', 'Integrations/Zoom/README.md',
+    'Integrations/integration-Zoom.yml', './Integrations/Zoom/Other.yml', 'Scripts/Hello/Hello.yml',
+    'Scripts/Hello/Hello.py', 'Scripts/script-Hello.yml', 'Beta_Integrations/Beta/Beta.yml',
+    'Packs/Zoom/Integrations/Zoom/Zoom.yml', 'Packs/Zoom/Integrations/Zoom/Zoom.PY', 'Packs/Zoom/Scripts/Hi/Hi.yml',
+    'Packs/Zoom/Scripts/Hi/Other.js', 'Packs/Zoom/Playbooks/playbook-Zoom.yml', 'Packs/Zoom/TestPlaybooks/Zoom.yml',
+    'Packs/Zoom/IncidentFields/incidentfield-Zoom.json', 'Packs/Zoom/Layouts/layout-Zoom.json',
+    'Playbooks/playbook-Zoom.yml', 'TestPlaybooks/playbook-Zoom.yml', 'Widgets/widget-Zoom.json',
+    'Dashboards/dashboard-Zoom.json', 'Reports/report-Zoom.json', 'Classifiers/classifier-Zoom.json',
+    'Connections/canvas-context-connections-Zoom.json', 'IncidentTypes/incidenttype-Zoom.json',
+    'IndicatorFields/incidentfield-Zoom.json', 'Misc/reputation-Zoom.json', 'Misc/reputations.json',
+    'Tests/schemas/playbook.yml', 'Tests/conf.json', 'README.md', 'Packs/Zoom/pack_metadata.json',
+]
+
+
+def loop_match(regexes, path):
+    """The classification before RegexSet, the index of the first regex the path matches."""
+    for index, regex in enumerate(regexes):
+        if re.match(regex, path, re.IGNORECASE):
+            return index
+    return None
+
+
+# the names of the lists of regexes in constants
+REGEX_LISTS = sorted(name for name, value in vars(constants).items()
+                     if name.endswith(('REGEX', 'REGEXES')) and isinstance(value, (list, tuple)) and value and
+                     all(isinstance(regex, str) for regex in value))
+
+
+@pytest.mark.parametrize('name', REGEX_LISTS)
+def test_regex_set_matches_like_a_loop(name):
+    """
+    Given
+        - A list of regexes from constants, some with backreferences.
+    When
+        - Matching content paths with a RegexSet of them.
+    Then
+        - The first regex each path matches is the one matching the regexes one at a time finds.
+    """
+    regexes = getattr(constants, name)
+    regex_set = RegexSet(regexes)
+    for path in PATHS:
+        assert regex_set.match(path) == loop_match(regexes, path), path
+
+
+def test_shift_groups():
+    """
+    Given
+        - Regexes with numbered and named backreferences, conditionals, octal escapes and classes.
+    When
+        - Shifting their groups after other groups.
+    Then
+        - Only the references to groups are renumbered and renamed.
+    """
+    assert shift_groups(r'Integrations/([^\\/]+)/\1\.py', 2, 'p_') == r'Integrations/([^\\/]+)/\3\.py'
+    assert shift_groups(r'(?P<a>x)(?P=a)(?(a)y)(?(1)z)', 1, 'p_') == r'(?P<p_a>x)(?P=p_a)(?(p_a)y)(?(2)z)'
+    assert shift_groups(r'[\1]\012\0[]\\1]\\1', 1, 'p_') == r'[\1]\012\0[]\\1]\\1'
+
+
+def test_regex_set_with_backreferences():
+    regex_set = RegexSet([r'(a)\1$', r'(?P<n>b)(?P=n)$', r'(x)(y)\2$', r'.*'])
+    assert [regex_set.match(path) for path in ('aa', 'AA', 'ab', 'bb', 'xyy', 'xyx')] == [0, 0, 3, 1, 2, 3]
+
+
+def test_regex_set_remembers_paths(mocker):
+    regex_set = RegexSet([r'a', r'b'])
+    pattern = mocker.patch.object(regex_set, 'pattern', wraps=regex_set.pattern)
+    assert [regex_set.match(path) for path in ('b', 'c', 'b', 'c')] == [1, None, 1, None]
+    assert pattern.match.call_count == 2
+
+
+@pytest.mark.parametrize('path, file_type', [
+    ('Packs/Zoom/Integrations/Zoom/Zoom.yml', FileType.INTEGRATION),
+    ('Scripts/script-Hello.yml', FileType.SCRIPT),
+    ('Packs/Zoom/IncidentFields/incidentfield-Zoom.json', FileType.INCIDENT_FIELD),
+    ('Connections/canvas-context-connections-Zoom.json', FileType.CANVAS_CONTEXT_CONNECTIONS),
+    ('Misc/reputation-Zoom.json', FileType.REPUTATION),
+    ('Tests/conf.json', None),
+])
+def test_get_file_type(path, file_type):
+    assert FILE_TYPE_CLASSIFIER.get_file_type(path) == file_type
+
+
+def test_tools_classify_like_before():
+    """
+    Given
+        - Content paths.
+    When
+        - Classifying them with checked_type and find_scheme_name.
+    Then
+        - The results are those of matching the regexes one at a time.
+    """
+    for path in PATHS:
+        assert checked_type(path) == (loop_match(constants.CHECKED_TYPES_REGEXES, path) is not None)
+        index = loop_match(constants.CODE_FILES_REGEX, path)
+        assert checked_type(path, constants.CODE_FILES_REGEX, return_regex=True) == (
+            constants.CODE_FILES_REGEX[index] if index is not None else False)
+        assert find_scheme_name(path) == next((scheme_name for scheme_name, regexes
+                                               in constants.SCHEMA_TO_REGEX.items()
+                                               if loop_match(regexes, path) is not None), None)
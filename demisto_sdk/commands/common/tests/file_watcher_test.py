@@ -0,0 +1,77 @@
+import pytest
+
+from demisto_sdk.commands.common.file_watcher import InotifyWatcher, PollingWatcher, get_file_watcher
+
+
+@pytest.fixture()
+def repo(tmp_path):
+    (tmp_path / 'Scripts/Hello').mkdir(parents=True)
+    (tmp_path / 'Scripts/Hello/Hello.yml').write_text('name: Hello\n')
+    (tmp_path / 'Scripts/Deleted.yml').write_text('name: Deleted\n')
+    (tmp_path / '.git').mkdir()
+    return tmp_path
+
+
+def change_files(repo):
+    """Modifies, creates and deletes files, and writes to a hidden directory."""
+    (repo / 'Scripts/Hello/Hello.yml').write_text('name: Hello World\n')
+    (repo / 'Scripts/New').mkdir()
+    (repo / 'Scripts/New/New.yml').write_text('name: New\n')
+    (repo / 'Scripts/Deleted.yml').unlink()
+    (repo / '.git/index').write_text('index')
+
+
+def wait_for_all_changes(watcher):
+    changed_paths = watcher.wait(1)
+    while True:
+        more_paths = watcher.wait(0.1)
+        if not more_paths:
+            return changed_paths
+
+        changed_paths |= more_paths
+
+
+def test_polling_watcher(repo):
+    """
+    Given
+        - A tree with files and a hidden directory, watched by scanning it.
+    When
+        - Files are modified, created in a new directory and deleted, and a file is written in the hidden directory.
+    Then
+        - The changed files are found by their relative paths, without the file in the hidden directory.
+    """
+    watcher = PollingWatcher(str(repo), interval=0.01)
+    assert watcher.wait(0.05) == set()
+    change_files(repo)
+    assert wait_for_all_changes(watcher) == {'Scripts/Hello/Hello.yml', 'Scripts/New/New.yml', 'Scripts/Deleted.yml'}
+
+
+@pytest.mark.skipif(not InotifyWatcher.is_supported(), reason='inotify is not available')
+def test_inotify_watcher(repo):
+    """
+    Given
+        - A tree with files and a hidden directory, watched with inotify.
+    When
+        - Files are modified, created in a new directory and deleted, and a file is written in the hidden directory.
+    Then
+        - The changed files are reported by their relative paths, without the file in the hidden directory.
+    """
+    watcher = InotifyWatcher(str(repo))
+    try:
+        assert watcher.wait(0.05) == set()
+        change_files(repo)
+        assert wait_for_all_changes(watcher) == {'Scripts/Hello/Hello.yml', 'Scripts/New/New.yml',
+                                                 'Scripts/Deleted.yml'}
+
+        # the new directory is watched
+        (repo / 'Scripts/New/New.yml').write_text('name: Newer\n')
+        assert wait_for_all_changes(watcher) == {'Scripts/New/New.yml'}
+    finally:
+        watcher.close()
+
+
+def test_get_file_watcher_falls_back_to_polling(repo, mocker):
+    mocker.patch.object(InotifyWatcher, 'is_supported', return_value=True)
+    mocker.patch.object(InotifyWatcher, '__init__', side_effect=OSError(28, 'No space left on device'))
+    assert isinstance(get_file_watcher(str(repo)), PollingWatcher)
+    assert isinstance(get_file_watcher(str(repo), polling=True), PollingWatcher)
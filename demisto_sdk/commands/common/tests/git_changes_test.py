@@ -0,0 +1,136 @@
+import subprocess
+
+import pytest
+
+from demisto_sdk.commands.common.git_changes import GitChange, GitChanges, parse_name_status, parse_name_status_z
+from demisto_sdk.commands.lint import lint_manager
+from demisto_sdk.commands.lint.lint_manager import LintManager
+
+
+def git(repo, *args):
+    return subprocess.run(('git',) + args, cwd=str(repo), check=True, stdout=subprocess.PIPE,
+                          universal_newlines=True).stdout.strip()
+
+
+@pytest.fixture()
+def repo(tmp_path):
+    """A repo with a feature branch that renames, modifies, adds and deletes files, with staged and unstaged changes."""
+    git(tmp_path, 'init', '-q', '-b', 'master')
+    git(tmp_path, 'config', 'user.email', 'test@example.com')
+    git(tmp_path, 'config', 'user.name', 'test')
+    files = {'Integrations/Old Name/Old Name.yml': 'name: Old\n' + 'commonfields: {}\n' * 20,
+             'Scripts/Modified/Modified.py': 'print(1)\n', 'Scripts/Deleted/Deleted.py': 'print(1)\n',
+             'Scripts/Staged/Staged.py': 'print(1)\n', 'Scripts/Unstaged/Unstaged.py': 'print(1)\n'}
+    for file_path, content in files.items():
+        (tmp_path / file_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / file_path).write_text(content)
+    git(tmp_path, 'add', '.')
+    git(tmp_path, 'commit', '-q', '-m', 'base')
+    git(tmp_path, 'update-ref', 'refs/remotes/origin/master', 'master')
+
+    git(tmp_path, 'checkout', '-q', '-b', 'feature')
+    (tmp_path / 'Integrations/New Name').mkdir()
+    git(tmp_path, 'mv', 'Integrations/Old Name/Old Name.yml', 'Integrations/New Name/New Name.yml')
+    (tmp_path / 'Scripts/Modified/Modified.py').write_text('print(2)\n')
+    (tmp_path / 'Scripts/Added').mkdir()
+    (tmp_path / 'Scripts/Added/Added.py').write_text('print("added")\n')
+    git(tmp_path, 'rm', '-q', 'Scripts/Deleted/Deleted.py')
+    git(tmp_path, 'add', '.')
+    git(tmp_path, 'commit', '-q', '-m', 'feature')
+
+    (tmp_path / 'Scripts/Staged/Staged.py').write_text('print(2)\n')
+    git(tmp_path, 'add', '.')
+    (tmp_path / 'Scripts/Unstaged/Unstaged.py').write_text('print(2)\n')
+    return tmp_path
+
+
+def test_get_changes(repo):
+    """
+    Given
+        - A branch with committed, staged and unstaged changes.
+    When
+        - Listing the changes of the branch, the uncommitted changes and the unstaged changes, twice.
+    Then
+        - The changes are parsed with their statuses and the renamed file with its old path, and listed once.
+    """
+    git_changes = GitChanges(str(repo))
+    assert git_changes.get_changes('origin/master...feature') == (
+        GitChange('R', 'Integrations/New Name/New Name.yml', 'Integrations/Old Name/Old Name.yml', 100),
+        GitChange('A', 'Scripts/Added/Added.py'),
+        GitChange('D', 'Scripts/Deleted/Deleted.py'),
+        GitChange('M', 'Scripts/Modified/Modified.py'))
+    assert git_changes.get_changes('HEAD') == (GitChange('M', 'Scripts/Staged/Staged.py'),
+                                               GitChange('M', 'Scripts/Unstaged/Unstaged.py'))
+    assert git_changes.get_changes() == (GitChange('M', 'Scripts/Unstaged/Unstaged.py'),)
+    assert git_changes.get_current_branch() == 'feature'
+    assert git_changes.git_calls == 4
+
+    git_changes.get_changes('HEAD')
+    git_changes.get_current_branch()
+    assert git_changes.git_calls == 4
+
+    git_changes.clear()
+    git_changes.get_changes('HEAD')
+    assert git_changes.git_calls == 5
+
+
+def test_failed_git_command_exits(repo, capsys):
+    with pytest.raises(SystemExit):
+        GitChanges(str(repo)).get_changes('no-such-branch')
+    assert 'Failed to run command git diff' in capsys.readouterr().out
+
+
+def test_parse_name_status():
+    """
+    Given
+        - The NUL delimited and the text outputs of git diff --name-status, with a rename.
+    When
+        - Parsing them.
+    Then
+        - The paths are parsed whole, the renamed file with its old path and similarity.
+    """
+    assert parse_name_status_z('R087\0Scripts/a b.yml\0Scripts/c d.yml\0M\0Scripts/e.yml\0') == [
+        GitChange('R', 'Scripts/c d.yml', 'Scripts/a b.yml', 87), GitChange('M', 'Scripts/e.yml')]
+    assert parse_name_status('  r087\tScripts/a.yml\tScripts/c.yml\nM\tScripts/e.yml\n\n') == [
+        GitChange('R', 'Scripts/c.yml', 'Scripts/a.yml', 87), GitChange('M', 'Scripts/e.yml')]
+
+
+def test_lint_lists_the_changes_once(repo, monkeypatch):
+    """
+    Given
+        - Packages changed in the branch, with unstaged changes, and unchanged.
+    When
+        - Checking which packages lint should run on.
+    Then
+        - The changed packages are found with two git calls for all the packages.
+    """
+    git_changes = GitChanges(str(repo))
+    monkeypatch.setattr(lint_manager, 'GIT_CHANGES', git_changes)
+    monkeypatch.delenv('CIRCLE_COMPARE_URL', raising=False)
+    monkeypatch.chdir(repo)
+    packages = ['Scripts/Modified', 'Scripts/Unstaged', 'Scripts/Staged', 'Scripts/Add', 'Integrations/New Name/']
+    assert [LintManager._check_should_run_pkg(None, package, 'feature') for package in packages] == [
+        True, True, False, False, True]
+    assert git_changes.git_calls == 2
+
+
+def test_lint_finds_the_changes_of_package_paths(repo, monkeypatch):
+    """
+    Given
+        - Changed packages given as absolute paths, with a './' prefix, and relative to a subdirectory of the repo.
+    When
+        - Checking which packages lint should run on.
+    Then
+        - The changes are matched to the packages by their paths relative to the root of the repo.
+    """
+    monkeypatch.setattr(lint_manager, 'GIT_CHANGES', GitChanges(str(repo)))
+    monkeypatch.delenv('CIRCLE_COMPARE_URL', raising=False)
+    monkeypatch.chdir(repo)
+    packages = [str(repo / 'Scripts/Modified'), './Scripts/Unstaged', './Integrations/New Name/', str(repo / 'Scripts'),
+                str(repo / 'Scripts/Staged')]
+    assert [LintManager._check_should_run_pkg(None, package, 'feature') for package in packages] == [
+        True, True, True, True, False]
+
+    monkeypatch.chdir(repo / 'Scripts')
+    assert [LintManager._check_should_run_pkg(None, package, 'feature') for package in ('Modified', 'Staged')] == [
+        True, False]
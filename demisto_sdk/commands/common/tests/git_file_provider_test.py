@@ -0,0 +1,133 @@
+import subprocess
+
+import pytest
+
+from demisto_sdk.commands.common import tools
+from demisto_sdk.commands.common.git_file_provider import GitCatFileBatch, LocalGitFileProvider
+
+INTEGRATION_PATH = 'Integrations/Test/Test.yml'
+
+
+def git(repo, *args):
+    return subprocess.run(('git', '-c', 'user.name=test', '-c', 'user.email=test@test.com') + args, cwd=str(repo),
+                          check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout.strip()
+
+
+def commit_file(repo, file_path, content):
+    (repo / file_path).parent.mkdir(parents=True, exist_ok=True)
+    (repo / file_path).write_text(content)
+    git(repo, 'add', file_path)
+    git(repo, 'commit', '-q', '-m', 'commit {}'.format(file_path))
+    return git(repo, 'rev-parse', 'HEAD')
+
+
+@pytest.fixture()
+def repo(tmp_path):
+    """A repository with two versions of an integration, origin/master points to the first and master to the second."""
+    git(tmp_path, 'init', '-q')
+    first_commit = commit_file(tmp_path, INTEGRATION_PATH, 'name: old\n')
+    git(tmp_path, 'update-ref', 'refs/remotes/origin/master', first_commit)
+    git(tmp_path, 'tag', 'old-tag')
+    commit_file(tmp_path, INTEGRATION_PATH, 'name: new\n')
+    git(tmp_path, 'checkout', '-q', '-B', 'master')
+    return tmp_path
+
+
+def test_get_file_content(repo):
+    """
+    Given
+        - A repository with origin/master and master branches.
+    When
+        - Reading a file as it is in master, in origin/master, in a tag and in a local branch.
+    Then
+        - master is read from origin/master, the other refs as they are.
+    """
+    provider = LocalGitFileProvider(str(repo))
+    try:
+        assert provider.get_file_content(INTEGRATION_PATH) == b'name: old\n'
+        assert provider.get_file_content(INTEGRATION_PATH, 'origin/master') == b'name: old\n'
+        assert provider.get_file_content(INTEGRATION_PATH, 'old-tag') == b'name: old\n'
+        assert provider.get_file_content(INTEGRATION_PATH, 'HEAD') == b'name: new\n'
+        assert provider.get_file_content(str(repo / INTEGRATION_PATH), 'HEAD') == b'name: new\n'
+    finally:
+        provider.close()
+
+
+@pytest.mark.parametrize('file_path, tag', [
+    ('Integrations/Test/Missing.yml', 'master'),
+    ('Integrations/Test', 'master'),
+    (INTEGRATION_PATH, 'no-such-branch'),
+    ('../outside.yml', 'master'),
+])
+def test_get_missing_file_content(repo, file_path, tag):
+    """
+    Given
+        - A file or a ref that is not in the repository, a directory, and a path outside of the repository.
+    When
+        - Reading the file.
+    Then
+        - None is returned.
+    """
+    provider = LocalGitFileProvider(str(repo))
+    try:
+        assert provider.get_file_content(file_path, tag) is None
+    finally:
+        provider.close()
+
+
+def test_get_file_content_outside_of_repository(tmp_path):
+    provider = LocalGitFileProvider(str(tmp_path))
+    assert provider.get_file_content(INTEGRATION_PATH) is None
+
+
+def test_files_are_read_by_a_single_process(repo, mocker):
+    """
+    Given
+        - A repository.
+    When
+        - Reading several files and versions, including missing ones.
+    Then
+        - A single `git cat-file --batch` process reads all of them.
+    """
+    start = mocker.spy(GitCatFileBatch, '_start')
+    provider = LocalGitFileProvider(str(repo))
+    try:
+        for _ in range(3):
+            assert provider.get_file_content(INTEGRATION_PATH, 'master') == b'name: old\n'
+            assert provider.get_file_content('Integrations/Test/Missing.yml', 'master') is None
+            assert provider.get_file_content(INTEGRATION_PATH, 'HEAD') == b'name: new\n'
+    finally:
+        provider.close()
+
+    assert start.call_count == 1
+
+
+def test_get_remote_file_reads_local_repository(repo, monkeypatch, mocker):
+    """
+    Given
+        - A content repository with the file in origin/master.
+    When
+        - Getting the file as it is in master.
+    Then
+        - The file is read from the local repository, without downloading it.
+    """
+    monkeypatch.chdir(repo)
+    fetch = mocker.patch.object(tools.REMOTE_FILE_FETCHER, 'fetch')
+    assert tools.get_remote_file(INTEGRATION_PATH) == {'name': 'old'}
+    assert tools.get_remote_file(INTEGRATION_PATH, 'origin/master') == {'name': 'old'}
+    assert not fetch.called
+
+
+def test_get_remote_file_falls_back_to_github(repo, monkeypatch, mocker):
+    """
+    Given
+        - A content repository without the requested branch.
+    When
+        - Getting a file as it is in that branch.
+    Then
+        - The file is downloaded from GitHub.
+    """
+    monkeypatch.chdir(repo)
+    fetch = mocker.patch.object(tools.REMOTE_FILE_FETCHER, 'fetch', return_value=b'name: remote\n')
+    assert tools.get_remote_file(INTEGRATION_PATH, '20.1.0') == {'name': 'remote'}
+    fetch.assert_called_once_with(INTEGRATION_PATH, '20.1.0')
@@ -0,0 +1,184 @@
+import os
+
+from demisto_sdk.commands.common import id_set_cache
+from demisto_sdk.commands.common.id_set_cache import IdSetCache
+from demisto_sdk.commands.common import update_id_set
+from demisto_sdk.commands.common.id_set_records import ScriptRecord
+from demisto_sdk.commands.common.update_id_set import process_entities
+
+RESULT = [{'test': {'name': 'test', 'file_path': 'Scripts/script-test.yml'}}]
+
+
+class FakePool:
+    processed = []  # type: list
+
+    def __init__(self, processes):
+        self.processes = processes
+
+    def imap_unordered(self, function, items, chunksize):
+        FakePool.processed.extend(path for _, _, path in items)
+        return reversed([function(item) for item in items])
+
+    def close(self):
+        pass
+
+    def join(self):
+        pass
+
+
+def write_file(path, content):
+    with open(path, 'w') as file_obj:
+        file_obj.write(content)
+
+
+class TestIdSetCache:
+    def test_unchanged_file_is_taken_from_cache(self, tmp_path):
+        file_path = str(tmp_path / 'script-test.yml')
+        cache_path = str(tmp_path / 'cache.json')
+        write_file(file_path, 'name: test')
+
+        cache = IdSetCache(cache_path)
+        assert cache.get('scripts', file_path) is None
+        cache.put('scripts', file_path, RESULT)
+        cache.save()
+
+        cache = IdSetCache(cache_path).load()
+        assert cache.get('scripts', file_path) == RESULT
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_touched_file_with_same_content_is_taken_from_cache(self, tmp_path):
+        file_path = str(tmp_path / 'script-test.yml')
+        cache = IdSetCache(str(tmp_path / 'cache.json'))
+        write_file(file_path, 'name: test')
+        cache.put('scripts', file_path, RESULT)
+
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        assert cache.get('scripts', file_path) == RESULT
+
+    def test_modified_file_is_processed(self, tmp_path):
+        file_path = str(tmp_path / 'script-test.yml')
+        cache = IdSetCache(str(tmp_path / 'cache.json'))
+        write_file(file_path, 'name: test')
+        cache.put('scripts', file_path, RESULT)
+
+        write_file(file_path, 'name: test2')
+        assert cache.get('scripts', file_path) is None
+
+    def test_package_is_processed_when_code_changes(self, tmp_path):
+        package_path = tmp_path / 'Test'
+        package_path.mkdir()
+        write_file(str(package_path / 'Test.yml'), 'name: test')
+        write_file(str(package_path / 'Test.py'), 'print(1)')
+        cache = IdSetCache(str(tmp_path / 'cache.json'))
+        cache.put('scripts', str(package_path), RESULT)
+        assert cache.get('scripts', str(package_path)) == RESULT
+
+        write_file(str(package_path / 'Test.py'), 'print(2)')
+        assert cache.get('scripts', str(package_path)) is None
+
+    def test_deleted_files_are_dropped_on_save(self, tmp_path):
+        first_path = str(tmp_path / 'script-first.yml')
+        second_path = str(tmp_path / 'script-second.yml')
+        cache_path = str(tmp_path / 'cache.json')
+        write_file(first_path, 'name: first')
+        write_file(second_path, 'name: second')
+        cache = IdSetCache(cache_path)
+        cache.put('scripts', first_path, RESULT)
+        cache.put('scripts', second_path, RESULT)
+        cache.save()
+
+        cache = IdSetCache(cache_path).load()
+        cache.get('scripts', first_path)
+        cache.save()
+        assert list(IdSetCache(cache_path).load().entries['scripts']) == [first_path]
+
+    def test_corrupted_cache_is_ignored(self, tmp_path):
+        cache_path = str(tmp_path / 'cache.json')
+        write_file(cache_path, '{"version": 1, "entries": ')
+        assert IdSetCache(cache_path).load().entries == {}
+
+    def test_cache_of_other_extractors_is_ignored(self, tmp_path, mocker):
+        """
+        Given
+            - A cache saved by a version of the SDK with other id_set extractors.
+        When
+            - Loading it.
+        Then
+            - The cached records are discarded, so every path is processed by the current extractors.
+        """
+        file_path = str(tmp_path / 'script-test.yml')
+        cache_path = str(tmp_path / 'cache.json')
+        write_file(file_path, 'name: test')
+        mocker.patch.object(id_set_cache, 'get_extractors_key', return_value='old')
+        cache = IdSetCache(cache_path)
+        cache.put('scripts', file_path, RESULT)
+        cache.save()
+        assert IdSetCache(cache_path).load().get('scripts', file_path) == RESULT
+
+        id_set_cache.get_extractors_key.return_value = 'new'
+        assert IdSetCache(cache_path).load().get('scripts', file_path) is None
+
+    def test_save_on_a_read_only_cache(self, tmp_path, capsys):
+        """
+        Given
+            - A cache path in a directory that can't be created.
+        When
+            - Saving the cache.
+        Then
+            - A warning is printed instead of failing the id_set creation, and no partial cache is left.
+        """
+        write_file(str(tmp_path / 'cache'), 'not a directory')
+        cache_path = str(tmp_path / 'cache' / 'cache.json')
+        IdSetCache(cache_path).save()
+        assert 'Could not save the id_set cache' in capsys.readouterr().out
+        assert os.listdir(str(tmp_path)) == ['cache']
+
+    def test_default_cache_is_outside_of_the_repo(self, tmp_path, monkeypatch):
+        """
+        Given
+            - Two content repos and a user cache directory.
+        When
+            - Saving the id_set cache of each repo without a cache path.
+        Then
+            - Each repo gets its own cache file in the user cache directory, and nothing is written to the repos.
+        """
+        monkeypatch.delenv('DEMISTO_SDK_ID_SET_CACHE_DIR', raising=False)
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+        cache_paths = []
+        for repo_name in ('first', 'second'):
+            (tmp_path / repo_name).mkdir()
+            monkeypatch.chdir(tmp_path / repo_name)
+            IdSetCache().save()
+            assert os.listdir('.') == []
+            cache_paths.append(IdSetCache().cache_path)
+
+        assert cache_paths[0] != cache_paths[1]
+        assert sorted(os.listdir(str(tmp_path / 'cache' / 'demisto-sdk' / 'id_set'))) == sorted(
+            os.path.basename(cache_path) for cache_path in cache_paths)
+
+
+def test_process_entities_only_processes_changed_paths(tmp_path, mocker):
+    paths = []
+    for name in ('first', 'second', 'third'):
+        paths.append(str(tmp_path / 'script-{}.yml'.format(name)))
+        write_file(paths[-1], 'name: {}'.format(name))
+
+    mocker.patch.object(update_id_set, 'Pool', FakePool)
+    mocker.patch.dict(update_id_set.ENTITY_PROCESSORS, {'scripts': lambda path: [ScriptRecord(path, name=path)]})
+    work_items = [('scripts', path) for path in paths]
+    cache = IdSetCache(str(tmp_path / 'cache.json'))
+
+    FakePool.processed = []
+    first_results = process_entities(work_items, cache)
+    assert FakePool.processed == paths
+    assert first_results == [[ScriptRecord(path, name=path)] for path in paths]
+
+    write_file(paths[1], 'name: changed')
+    FakePool.processed = []
+    assert process_entities(work_items, cache) == first_results
+    assert FakePool.processed == [paths[1]]
+
+    FakePool.processed = []
+    assert process_entities(work_items, cache) == first_results
+    assert FakePool.processed == []
@@ -0,0 +1,115 @@
+import json
+import sqlite3
+from collections import OrderedDict
+
+import pytest
+
+from demisto_sdk.commands.common.id_set import IdSet
+from demisto_sdk.commands.common.id_set_db import IdSetDB, get_version_key
+
+
+def get_id_set_dict():
+    return OrderedDict([
+        ('scripts', [
+            {'ScriptA': OrderedDict([('name', 'ScriptA'), ('file_path', 'Scripts/a.yml'),
+                                     ('depends_on', ['ScriptB', 'some-command'])])},
+            {'ScriptB': OrderedDict([('name', 'ScriptB'), ('file_path', 'Scripts/b.yml'), ('toversion', '4.9.9')])},
+            {'ScriptB': OrderedDict([('name', 'ScriptB'), ('file_path', 'Scripts/b_new.yml'),
+                                     ('fromversion', '5.0.0')])},
+        ]),
+        ('playbooks', [
+            {'PlaybookA': OrderedDict([('name', 'Playbook A'), ('file_path', 'Playbooks/a.yml'),
+                                       ('fromversion', '4.5.0'),
+                                       ('command_to_integration', {'some-command': 'Integration'})])},
+            {'PlaybookB': OrderedDict([('name', 'Playbook B'), ('file_path', 'Playbooks/b.yml'),
+                                       ('fromversion', '5.5.0'),
+                                       ('command_to_integration', {'some-command': ''})])},
+        ]),
+        ('integrations', [
+            {'Integration': OrderedDict([('name', 'Integration'), ('file_path', 'Integrations/i.yml'),
+                                         ('commands', ['some-command'])])},
+        ]),
+        ('TestPlaybooks', []),
+    ])
+
+
+@pytest.fixture
+def id_set_db(tmp_path):
+    id_set_db = IdSetDB(str(tmp_path / 'id_set.db'))
+    id_set_db.write(get_id_set_dict())
+    yield id_set_db
+    id_set_db.close()
+
+
+def get_ids(entities):
+    return [(section, entity_id) for section, entity_id, _ in entities]
+
+
+def test_export_keeps_the_id_set_layout(id_set_db, tmp_path):
+    id_set_path = str(tmp_path / 'id_set.json')
+    id_set_db.export(id_set_path)
+
+    with open(id_set_path) as id_set_file:
+        assert id_set_file.read() == json.dumps(get_id_set_dict(), indent=4)
+
+
+@pytest.mark.parametrize('query, ids', [
+    ({'section': 'scripts', 'entity_id': 'ScriptB'}, [('scripts', 'ScriptB'), ('scripts', 'ScriptB')]),
+    ({'name': 'Playbook A'}, [('playbooks', 'PlaybookA')]),
+    ({'command': 'some-command'}, [('integrations', 'Integration')]),
+    ({'uses_script': 'ScriptB'}, [('scripts', 'ScriptA')]),
+    ({'uses_command': 'some-command'},
+     [('scripts', 'ScriptA'), ('playbooks', 'PlaybookA'), ('playbooks', 'PlaybookB')]),
+    ({'section': 'playbooks', 'uses_command': 'some-command', 'max_from_version': '5.0'}, [('playbooks', 'PlaybookA')]),
+    ({'section': 'scripts', 'min_to_version': '5.0.0'}, [('scripts', 'ScriptA'), ('scripts', 'ScriptB')]),
+])
+def test_query(id_set_db, query, ids):
+    assert get_ids(id_set_db.query(**query)) == ids
+
+
+def test_apply_matches_id_set_upsert(id_set_db):
+    """
+    Given
+        - An id_set and its SQLite store.
+    When
+        - Upserting entities to the id_set and applying the recorded changes to the store.
+    Then
+        - The store exports the same id_set as the updated one.
+        - A command dependency becomes a script dependency once a script with that id is added.
+    """
+    id_set = IdSet(get_id_set_dict())
+    id_set.upsert('scripts', {'ScriptB': OrderedDict([('name', 'ScriptB'), ('file_path', 'Scripts/b_new.yml'),
+                                                      ('fromversion', '5.0.0'), ('tests', ['test'])])})
+    id_set.upsert('scripts', {'some-command': OrderedDict([('name', 'some-command'), ('file_path', 'Scripts/c.yml')])})
+    id_set.upsert('TestPlaybooks', {'Test': OrderedDict([('name', 'Test'), ('file_path', 'TestPlaybooks/t.yml')])})
+    id_set.sort()
+
+    id_set_db.apply(id_set.changes)
+
+    assert id_set_db.to_id_set().to_dict() == id_set.to_dict()
+    assert get_ids(id_set_db.query(uses_script='some-command')) == [('scripts', 'ScriptA')]
+    assert get_ids(id_set_db.query(uses_command='some-command')) == [
+        ('playbooks', 'PlaybookA'), ('playbooks', 'PlaybookB')]
+
+
+def test_apply_is_transactional(id_set_db):
+    with pytest.raises(Exception):
+        id_set_db.apply([
+            ('scripts', {'ScriptC': {'name': 'ScriptC', 'file_path': 'Scripts/c.yml'}}, None, None),
+            ('scripts', {'ScriptD': None}, None, None),
+        ])
+
+    assert id_set_db.query(entity_id='ScriptC') == []
+
+
+def test_outdated_store(tmp_path):
+    db_path = str(tmp_path / 'id_set.db')
+    sqlite3.connect(db_path).close()
+
+    with pytest.raises(ValueError):
+        IdSetDB(db_path).query()
+
+
+@pytest.mark.parametrize('first, second', [('4.5.0', '4.10.0'), ('4.9.9', '5.0'), ('5.0', '5.0.1'), ('0.0.0', '1')])
+def test_get_version_key(first, second):
+    assert get_version_key(first) < get_version_key(second)
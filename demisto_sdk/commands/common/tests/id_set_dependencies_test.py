@@ -0,0 +1,112 @@
+import json
+import os
+from collections import OrderedDict
+
+import pytest
+
+from demisto_sdk.commands.common import id_set_dependencies
+from demisto_sdk.commands.common.id_set_dependencies import ID_SET_DEPENDENCIES_CACHE_DIR_ENV, DependencyIndex
+
+ID_SET = OrderedDict([
+    ('scripts', [
+        {'ScriptA': {'name': 'ScriptA', 'file_path': 'a.yml', 'depends_on': ['ScriptB', 'some-command'],
+                     'script_executions': ['other-command']}},
+        {'ScriptB': {'name': 'ScriptB', 'file_path': 'b.yml'}},
+    ]),
+    ('playbooks', [
+        {'PlaybookA': {'name': 'Playbook A', 'file_path': 'pa.yml', 'implementing_scripts': ['ScriptB'],
+                       'implementing_playbooks': ['PlaybookB'],
+                       'command_to_integration': {'some-command': 'Integration'}}},
+        {'PlaybookB': {'name': 'Playbook B', 'file_path': 'pb.yml', 'implementing_scripts': ['ScriptB']}},
+    ]),
+    ('integrations', []),
+    ('TestPlaybooks', [
+        {'TestA': {'name': 'Test A', 'file_path': 'ta.yml', 'implementing_playbooks': ['PlaybookA']}},
+    ]),
+])
+
+
+def get_user_ids(users):
+    return [(user['section'], user['id']) for user in users]
+
+
+@pytest.mark.parametrize('entity_id, kind, users', [
+    ('ScriptB', 'scripts', [('playbooks', 'PlaybookA'), ('playbooks', 'PlaybookB'), ('scripts', 'ScriptA')]),
+    ('some-command', 'commands', [('playbooks', 'PlaybookA'), ('scripts', 'ScriptA')]),
+    ('other-command', 'commands', [('scripts', 'ScriptA')]),
+    ('PlaybookA', 'playbooks', [('TestPlaybooks', 'TestA')]),
+    ('PlaybookB', 'playbooks', [('playbooks', 'PlaybookA')]),
+    ('ScriptA', 'scripts', []),
+])
+def test_get_used_by(entity_id, kind, users):
+    assert get_user_ids(DependencyIndex.build(ID_SET).get_used_by(entity_id, kind=kind)) == users
+
+
+def test_get_used_by_sections():
+    users = DependencyIndex.build(ID_SET).get_used_by('ScriptB', sections=('scripts',))
+    assert users == [{'section': 'scripts', 'id': 'ScriptA', 'name': 'ScriptA', 'fields': ['depends_on']}]
+
+
+def test_get_used_by_fields():
+    """
+    Given
+        - A script that playbooks run as a task and another script depends on.
+    When
+        - Getting the users of the script through implementing_scripts only.
+    Then
+        - Only the playbooks are returned, like the "Used in" section of generate-docs lists them.
+    """
+    users = DependencyIndex.build(ID_SET).get_used_by('ScriptB', fields=('implementing_scripts',))
+    assert get_user_ids(users) == [('playbooks', 'PlaybookA'), ('playbooks', 'PlaybookB')]
+
+
+def test_get_used_by_unknown_kind():
+    with pytest.raises(ValueError):
+        DependencyIndex.build(ID_SET).get_used_by('ScriptB', kind='integrations')
+
+
+def test_for_id_set(tmp_path, monkeypatch, mocker):
+    """
+    Given
+        - An id_set.json file without a saved dependency index.
+    When
+        - Getting the dependency index of the id_set twice, then after the id_set changes.
+    Then
+        - The index is built and saved out of the content repo the first time, the second lookup reads the saved index
+          without parsing the id_set, and the index is rebuilt once the id_set changes.
+    """
+    monkeypatch.setenv(ID_SET_DEPENDENCIES_CACHE_DIR_ENV, str(tmp_path / 'cache'))
+    (tmp_path / 'Tests').mkdir()
+    id_set_path = str(tmp_path / 'Tests' / 'id_set.json')
+    with open(id_set_path, 'w') as id_set_file:
+        json.dump(ID_SET, id_set_file)
+    load_id_set = mocker.spy(id_set_dependencies.IdSet, 'load')
+
+    assert len(DependencyIndex.for_id_set(id_set_path).get_used_by('ScriptB')) == 3
+    assert len(DependencyIndex.for_id_set(id_set_path).get_used_by('ScriptB')) == 3
+    assert load_id_set.call_count == 1
+    assert os.listdir(str(tmp_path / 'Tests')) == ['id_set.json']
+
+    with open(id_set_path, 'w') as id_set_file:
+        json.dump(OrderedDict([('scripts', [])]), id_set_file)
+    assert DependencyIndex.for_id_set(id_set_path).get_used_by('ScriptB') == []
+    assert load_id_set.call_count == 2
+
+
+def test_save_on_a_read_only_cache(tmp_path, monkeypatch):
+    """
+    Given
+        - A cache directory that can't be written to.
+    When
+        - Saving the dependency index.
+    Then
+        - The index is left unsaved without failing.
+    """
+    monkeypatch.setenv(ID_SET_DEPENDENCIES_CACHE_DIR_ENV, str(tmp_path / 'cache'))
+    (tmp_path / 'cache').write_text('not a directory')
+    id_set_path = str(tmp_path / 'id_set.json')
+    with open(id_set_path, 'w') as id_set_file:
+        json.dump(ID_SET, id_set_file)
+
+    DependencyIndex.build(ID_SET).save(id_set_path)
+    assert DependencyIndex.load(id_set_path) is None
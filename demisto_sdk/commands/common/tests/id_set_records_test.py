@@ -0,0 +1,74 @@
+import json
+import os
+import pickle
+from collections import OrderedDict
+
+import pytest
+
+from demisto_sdk.commands.common.git_tools import git_path
+from demisto_sdk.commands.common.id_set_records import IntegrationRecord, PlaybookRecord, ScriptRecord, \
+    records_to_id_set
+from demisto_sdk.commands.common.update_id_set import find_duplicates, get_script_data, get_script_record
+
+TEST_FILES = os.path.join(git_path(), 'demisto_sdk', 'tests', 'test_files')
+
+
+def test_to_entity_keeps_the_id_set_layout():
+    record = ScriptRecord('script', name='Script', file_path='Scripts/script.yml', tests=['test'], deprecated=False,
+                          depends_on=['command'], fromversion='5.0.0', command_to_integration={})
+
+    assert json.dumps(record.to_entity()) == json.dumps({'script': OrderedDict([
+        ('name', 'Script'), ('file_path', 'Scripts/script.yml'), ('fromversion', '5.0.0'),
+        ('depends_on', ['command']), ('tests', ['test'])])})
+
+
+def test_extracted_record_matches_script_data():
+    file_path = os.path.join(TEST_FILES, 'script-valid.yml')
+    assert get_script_record(file_path).to_entity() == get_script_data(file_path)
+
+
+def test_pickled_records_are_interned():
+    """
+    Given
+        - Records of two integrations with the same commands.
+    When
+        - Pickling the records to another process and loading them back.
+    Then
+        - The records are equal to the original ones.
+        - The command names of both records are the same string objects.
+    """
+    records = [IntegrationRecord('integration{}'.format(index), name='Integration', file_path='integration.yml',
+                                 commands=['-'.join(['some', 'command'])]) for index in range(2)]
+
+    loaded_records = pickle.loads(pickle.dumps(records))
+
+    assert loaded_records == records
+    assert loaded_records[0].commands[0] is loaded_records[1].commands[0]
+    assert loaded_records[0].name is loaded_records[1].name
+
+
+def test_from_entity():
+    entity = {'playbook': {'name': 'Playbook', 'file_path': 'playbook.yml', 'implementing_scripts': ['script']}}
+    record = PlaybookRecord.from_entity(entity)
+
+    assert record.to_entity() == entity
+    assert record['name'] == 'Playbook'
+    assert record.get('toversion', '99.99.99') == '99.99.99'
+    with pytest.raises(KeyError):
+        record['tests']
+    with pytest.raises(TypeError):
+        PlaybookRecord.from_entity({'playbook': {'name': 'Playbook', 'commands': ['command']}})
+
+
+def test_find_duplicates_of_records():
+    id_set = OrderedDict([
+        ('scripts', [ScriptRecord('script', name='script', toversion='4.9.9'),
+                     ScriptRecord('script', name='script', fromversion='4.5.0')]),
+        ('integrations', []),
+        ('playbooks', [PlaybookRecord('playbook', name='playbook', toversion='4.9.9'),
+                       PlaybookRecord('playbook', name='playbook', fromversion='5.0.0')]),
+        ('TestPlaybooks', []),
+    ])
+
+    assert find_duplicates(id_set) == (['script'], [], [], [])
+    assert find_duplicates(records_to_id_set(id_set)) == (['script'], [], [], [])
@@ -0,0 +1,112 @@
+import json
+import os
+from collections import OrderedDict
+
+import pytest
+
+from demisto_sdk.commands.common.id_set import IdSet
+from demisto_sdk.commands.common.id_set_stream import ID_SET_OFFSETS_CACHE_DIR_ENV, IdSetOffsets, IdSetScanner, \
+    LazyIdSet, get_default_cache_dir, get_offsets_path, iter_id_set
+
+
+def get_id_set_dict():
+    return OrderedDict([
+        ('scripts', [
+            {'ScriptA': OrderedDict([('name', 'Script é中'), ('file_path', 'Scripts/a.yml')])},
+            {'ScriptB': OrderedDict([('name', 'ScriptB'), ('file_path', 'Scripts/b.yml'), ('toversion', '4.9.9')])},
+            {'ScriptB': OrderedDict([('name', 'ScriptB'), ('file_path', 'Scripts/b_new.yml'),
+                                     ('fromversion', '5.0.0')])},
+        ]),
+        ('playbooks', [
+            {'ScriptB': OrderedDict([('name', 'Playbook B'), ('file_path', 'Playbooks/b.yml'),
+                                     ('implementing_scripts', ['ScriptA', 'ScriptB'])])},
+        ]),
+        ('integrations', []),
+        ('TestPlaybooks', []),
+    ])
+
+
+@pytest.fixture(params=[True, False], ids=['ascii', 'utf-8'])
+def id_set_path(tmp_path, monkeypatch, request):
+    monkeypatch.setenv(ID_SET_OFFSETS_CACHE_DIR_ENV, str(tmp_path / 'cache'))
+    (tmp_path / 'Tests').mkdir()
+    id_set_path = str(tmp_path / 'Tests' / 'id_set.json')
+    with open(id_set_path, 'w', encoding='utf-8') as id_set_file:
+        json.dump(get_id_set_dict(), id_set_file, indent=4, ensure_ascii=request.param)
+
+    return id_set_path
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1 << 16])
+def test_scan_finds_the_entities_offsets(id_set_path, chunk_size):
+    """
+    Given
+        - An id_set.json file, with and without non ascii chars.
+    When
+        - Scanning the file in chunks of different sizes.
+    Then
+        - Every entity of the id_set is found, in order, at the byte range it is written at.
+    """
+    with open(id_set_path, 'rb') as id_set_file:
+        content = id_set_file.read()
+        id_set_file.seek(0)
+        scanned = list(IdSetScanner(id_set_file, chunk_size=chunk_size).scan())
+
+    assert [(section, entity) for section, entity, _, _ in scanned] == [
+        (section, entity) for section, entities in get_id_set_dict().items() for entity in entities]
+    for _, entity, offset, length in scanned:
+        assert json.loads(content[offset:offset + length].decode('utf-8')) == entity
+
+
+def test_iter_id_set_section(id_set_path):
+    assert [(section, entity_id) for section, entity_id, _ in iter_id_set(id_set_path, sections=('playbooks',))] == [
+        ('playbooks', 'ScriptB')]
+    assert len(list(iter_id_set(id_set_path))) == 4
+
+
+def test_lazy_id_set_matches_id_set(id_set_path):
+    id_set = IdSet(get_id_set_dict())
+    lazy_id_set = LazyIdSet.load(id_set_path)
+
+    assert lazy_id_set.get('scripts', 'ScriptB', toversion='4.9.9') == \
+        id_set.get('scripts', 'ScriptB', toversion='4.9.9')
+    assert lazy_id_set.get('scripts', 'ScriptB') is None
+    assert lazy_id_set.get_all('scripts', 'ScriptA') == id_set.get_all('scripts', 'ScriptA')
+    assert lazy_id_set.find('ScriptB') == id_set.find('ScriptB')
+    assert lazy_id_set.find('ScriptC') == []
+    assert list(lazy_id_set.iter_section('scripts')) == list(id_set.iter_section('scripts'))
+
+
+def test_offsets_are_saved_and_rebuilt_when_the_id_set_changes(id_set_path):
+    offsets = IdSetOffsets.for_id_set(id_set_path)
+    assert os.path.isfile(get_offsets_path(id_set_path))
+    # the index is saved in the cache directory, not in the content repo
+    assert os.listdir(os.path.dirname(id_set_path)) == ['id_set.json']
+    assert IdSetOffsets.for_id_set(id_set_path).ids == offsets.ids
+
+    id_set = IdSet(get_id_set_dict())
+    id_set.upsert('integrations', {'Integration': {'name': 'Integration', 'file_path': 'Integrations/i.yml'}})
+    id_set.dump(id_set_path)
+
+    assert LazyIdSet.load(id_set_path).get_all('integrations', 'Integration') == [
+        {'name': 'Integration', 'file_path': 'Integrations/i.yml'}]
+
+
+def test_cache_dir_from_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv(ID_SET_OFFSETS_CACHE_DIR_ENV, str(tmp_path))
+    assert get_default_cache_dir() == str(tmp_path)
+
+    monkeypatch.delenv(ID_SET_OFFSETS_CACHE_DIR_ENV)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    assert get_default_cache_dir() == os.path.join(str(tmp_path), 'demisto-sdk', 'id_set_offsets')
+
+
+@pytest.mark.parametrize('content', ['{"scripts": [{"a": {}}, ]}', '{"scripts": {}}', '{"scripts": [{"a": {}}]',
+                                     '{"scripts": [{"a": {}}]}\n<<<<<<< HEAD'])
+def test_invalid_id_set(tmp_path, content):
+    id_set_path = str(tmp_path / 'id_set.json')
+    with open(id_set_path, 'w') as id_set_file:
+        id_set_file.write(content)
+
+    with pytest.raises(ValueError):
+        IdSetOffsets.build(id_set_path)
@@ -0,0 +1,179 @@
+import json
+import os
+from collections import OrderedDict
+
+from demisto_sdk.commands.common import update_id_set
+from demisto_sdk.commands.common.git_changes import GitChange
+from demisto_sdk.commands.common.git_tools import git_path
+from demisto_sdk.commands.common.id_set import IdSet
+from demisto_sdk.commands.common.update_id_set import update_object_in_id_set, update_id_set as run_update_id_set
+
+FAKE_ID_SET = os.path.join(git_path(), 'demisto_sdk', 'tests', 'test_files', 'fake_id_set.json')
+
+
+def get_id_set():
+    return IdSet(OrderedDict([
+        ('scripts', [
+            {'b': {'name': 'B', 'file_path': 'Scripts/b.yml', 'toversion': '4.9.9'}},
+            {'b': {'name': 'B', 'file_path': 'Scripts/b_new.yml', 'fromversion': '5.0.0'}},
+            {'A': {'name': 'A', 'file_path': 'Scripts/a.yml'}},
+        ]),
+        ('playbooks', [
+            {'b': {'name': 'B playbook', 'file_path': 'Playbooks/b.yml'}},
+        ]),
+        ('integrations', []),
+        ('TestPlaybooks', []),
+    ]))
+
+
+class TestIdSet:
+    def test_dump_keeps_the_id_set_layout(self, tmp_path):
+        id_set_path = str(tmp_path / 'id_set.json')
+        with open(FAKE_ID_SET) as fake_id_set_file:
+            fake_id_set = json.load(fake_id_set_file, object_pairs_hook=OrderedDict)
+        with open(id_set_path, 'w') as id_set_file:
+            json.dump(fake_id_set, id_set_file, indent=4)
+        with open(id_set_path) as id_set_file:
+            expected = id_set_file.read()
+
+        IdSet.load(id_set_path).dump(id_set_path)
+
+        with open(id_set_path) as id_set_file:
+            assert id_set_file.read() == expected
+
+    def test_get(self):
+        id_set = get_id_set()
+        assert id_set.get('scripts', 'b', toversion='4.9.9')['file_path'] == 'Scripts/b.yml'
+        assert id_set.get('scripts', 'b', fromversion='5.0.0')['file_path'] == 'Scripts/b_new.yml'
+        assert id_set.get('scripts', 'b') is None
+        assert id_set.get('playbooks', 'b')['file_path'] == 'Playbooks/b.yml'
+        assert [section for section, _ in id_set.find('b')] == ['scripts', 'scripts', 'playbooks']
+        assert [entity_id for _, entity_id, _ in id_set.get_by_name('A')] == ['A']
+
+    def test_upsert(self):
+        id_set = get_id_set()
+        assert id_set.upsert('scripts', {'A': {'name': 'A2', 'file_path': 'Scripts/a2.yml'}})
+        assert not id_set.upsert('scripts', {'A': {'name': 'A', 'file_path': 'Scripts/a3.yml', 'toversion': '4.0.0'}})
+
+        assert [data['file_path'] for data in id_set.get_all('scripts', 'A')] == ['Scripts/a2.yml', 'Scripts/a3.yml']
+        assert len(id_set.sections['scripts']) == 4
+        assert id_set.get_by_name('A2')[0][2]['file_path'] == 'Scripts/a2.yml'
+        assert [data['file_path'] for _, _, data in id_set.get_by_name('A')] == ['Scripts/a3.yml']
+
+    def test_upsert_inserts_in_sorted_position(self):
+        id_set = get_id_set()
+        id_set.sort()
+        id_set.modified = False
+
+        id_set.upsert('scripts', {'a2': {'name': 'a2', 'file_path': 'Scripts/a2.yml'}})
+        id_set.upsert('scripts', {'B': {'name': 'B', 'file_path': 'Scripts/B.yml', 'fromversion': '6.0.0'}})
+        id_set.upsert('scripts', {'c': {'name': 'c', 'file_path': 'Scripts/c.yml'}})
+
+        assert [data['file_path'] for _, data in id_set.iter_section('scripts')] == [
+            'Scripts/a.yml', 'Scripts/a2.yml', 'Scripts/b.yml', 'Scripts/b_new.yml', 'Scripts/B.yml', 'Scripts/c.yml']
+        assert id_set.modified
+
+    def test_unchanged_id_set_is_not_modified(self):
+        id_set = get_id_set()
+        id_set.sort()
+        id_set.modified = False
+
+        id_set.sort()
+        id_set.upsert('scripts', {'A': {'name': 'A', 'file_path': 'Scripts/a.yml'}})
+        assert not id_set.modified
+
+    def test_get_active_and_overlapping(self):
+        id_set = get_id_set()
+        assert [data['file_path'] for data in id_set.get_active('scripts', 'b', '4.5.0')] == ['Scripts/b.yml']
+        assert [data['file_path'] for data in id_set.get_active('scripts', 'b', '5.0.0')] == ['Scripts/b_new.yml']
+
+        id_set.upsert('scripts', {'b': {'name': 'B', 'file_path': 'Scripts/b_6.yml', 'fromversion': '6.0.0'}})
+        assert [data['file_path'] for data in id_set.get_active('scripts', 'b', '6.0.0')] == [
+            'Scripts/b_new.yml', 'Scripts/b_6.yml']
+        assert [data['file_path'] for data in id_set.get_overlapping('scripts', 'b', '4.0.0', '5.5.0')] == [
+            'Scripts/b.yml', 'Scripts/b_new.yml']
+        assert id_set.get_active('playbooks', 'A', '5.0.0') == []
+
+    def test_upsert_of_a_new_range_updates_the_active_entities(self):
+        """
+        Given
+            - An id_set whose version index was already used.
+        When
+            - Replacing an entity picked by its old version range with data of another version range.
+        Then
+            - The entity is active in its new range only.
+        """
+        id_set = get_id_set()
+        assert [data['file_path'] for data in id_set.get_active('scripts', 'b', '5.5.0')] == ['Scripts/b_new.yml']
+
+        assert id_set.upsert('scripts', {'b': {'name': 'B', 'file_path': 'Scripts/b_new.yml', 'fromversion': '6.0.0'}},
+                             fromversion='5.0.0')
+        assert id_set.get_active('scripts', 'b', '5.5.0') == []
+        assert [data['file_path'] for data in id_set.get_active('scripts', 'b', '6.0.0')] == ['Scripts/b_new.yml']
+
+    def test_dump_replaces_the_file(self, tmp_path):
+        id_set_path = str(tmp_path / 'id_set.json')
+        get_id_set().dump(id_set_path)
+
+        assert IdSet.load(id_set_path).to_dict() == get_id_set().to_dict()
+        assert os.listdir(str(tmp_path)) == ['id_set.json']
+
+    def test_iter_section_and_sort(self):
+        id_set = get_id_set()
+        id_set.sort()
+        assert [entity_id for entity_id, _ in id_set.iter_section('scripts')] == ['A', 'b', 'b']
+        assert list(id_set.iter_section('integrations')) == []
+
+
+def test_update_object_in_id_set(mocker):
+    """
+    Given
+        - A modified script that has two versions in the id_set.
+    When
+        - Updating the script in the id_set.
+    Then
+        - Only the version with the same fromversion and toversion as the file is replaced.
+    """
+    mocker.patch.object(update_id_set, 'run_command', return_value='')
+    mocker.patch.object(update_id_set, 'get_from_version', return_value='5.0.0')
+    mocker.patch.object(update_id_set, 'get_to_version', return_value='99.99.99')
+    id_set = get_id_set()
+
+    new_data = {'name': 'B', 'file_path': 'Scripts/b_new.yml', 'fromversion': '5.0.0', 'tests': ['test']}
+    update_object_in_id_set('b', {'b': new_data}, 'Scripts/b_new.yml', id_set, 'scripts')
+
+    assert id_set.get_all('scripts', 'b') == [
+        {'name': 'B', 'file_path': 'Scripts/b.yml', 'toversion': '4.9.9'},
+        new_data,
+    ]
+
+
+def test_update_id_set_rewrites_only_changed_id_set(tmp_path, mocker, monkeypatch):
+    """
+    Given
+        - A sorted id_set.json and a new script file.
+    When
+        - Updating the id_set after the script was added, and again with no further changes.
+    Then
+        - The script is inserted in its sorted position.
+        - The id_set.json file isn't rewritten when its content didn't change.
+    """
+    (tmp_path / 'Tests').mkdir()
+    (tmp_path / 'Scripts').mkdir()
+    (tmp_path / 'Scripts' / 'script-b.yml').write_text('commonfields:\n  id: b\nname: b\nscript: ""\n')
+    id_set = get_id_set()
+    id_set.sort()
+    id_set.dump(str(tmp_path / 'Tests' / 'id_set.json'))
+    monkeypatch.chdir(tmp_path)
+    mocker.patch.object(update_id_set, 'run_command', return_value='* master')
+    mocker.patch.object(update_id_set.GIT_CHANGES, 'get_changes',
+                        return_value=(GitChange('A', 'Scripts/script-b.yml'),))
+
+    run_update_id_set()
+    scripts = [data['file_path'] for _, data in IdSet.load(update_id_set.ID_SET_PATH).iter_section('scripts')]
+    assert scripts == ['Scripts/a.yml', 'Scripts/b.yml', 'Scripts/b_new.yml', 'Scripts/script-b.yml']
+
+    modified_time = os.stat(update_id_set.ID_SET_PATH).st_mtime_ns
+    os.utime(update_id_set.ID_SET_PATH, ns=(modified_time - 10 ** 9, modified_time - 10 ** 9))
+    run_update_id_set()
+    assert os.stat(update_id_set.ID_SET_PATH).st_mtime_ns == modified_time - 10 ** 9
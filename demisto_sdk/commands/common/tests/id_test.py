@@ -1,5 +1,10 @@
+import pytest
+
 from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.hook_validations.id import IDSetValidator
+from demisto_sdk.commands.common.id_set import IdSet
+from demisto_sdk.commands.common.update_id_set import find_duplicates
+
 CONFIG = Configuration()
 
 
@@ -15,7 +20,10 @@ def test_validness_in_set():
         obj_data,
     ]
 
-    assert validator.is_valid_in_id_set(file_path="test", obj_data=obj_data, obj_set=obj_set), \
+    validator.id_set = IdSet({
+        "scripts": obj_set
+    })
+    assert validator.is_valid_in_id_set(file_path="test", obj_data=obj_data, section="scripts"), \
         "The id validator couldn't find id as valid one"
 
 
@@ -37,7 +45,10 @@ def test_obj_not_found_in_set():
         actual_obj_set,
     ]
 
-    assert validator.is_valid_in_id_set(file_path="test", obj_data=obj_data, obj_set=obj_set) is False, \
+    validator.id_set = IdSet({
+        "scripts": obj_set
+    })
+    assert validator.is_valid_in_id_set(file_path="test", obj_data=obj_data, section="scripts") is False, \
         "The id validator couldn't find id as valid one"
 
 
@@ -58,7 +69,10 @@ def test_obj_data_mismatch_in_set():
         actual_obj_set,
     ]
 
-    assert validator.is_valid_in_id_set(file_path="test", obj_data=obj_data, obj_set=obj_set) is False, \
+    validator.id_set = IdSet({
+        "scripts": obj_set
+    })
+    assert validator.is_valid_in_id_set(file_path="test", obj_data=obj_data, section="scripts") is False, \
         "The id validator couldn't find id as valid one"
 
 
@@ -79,9 +93,9 @@ def test_duplicated_id_same_set():
         actual_obj_set,
     ]
 
-    validator.id_set = {
+    validator.id_set = IdSet({
         "testing_set": obj_set
-    }
+    })
     assert validator.is_id_duplicated(obj_id="test", obj_data=obj_data, obj_type="testing_set") is False, \
         "The id validator found the id as duplicated although it is not"
 
@@ -103,9 +117,9 @@ def test_duplicated_id_different_set():
         actual_obj_set,
     ]
 
-    validator.id_set = {
+    validator.id_set = IdSet({
         "not_testing_set": obj_set
-    }
+    })
     assert validator.is_id_duplicated(obj_id="test", obj_data=obj_data, obj_type="testing_set"), \
         "The id validator couldn't find id as duplicated one(In different sets)"
 
@@ -127,9 +141,9 @@ def test_duplicated_id_with_same_versioning_diff_data():
         actual_obj_set,
     ]
 
-    validator.id_set = {
+    validator.id_set = IdSet({
         "not_testing_set": obj_set
-    }
+    })
     assert validator.is_id_duplicated(obj_id="test", obj_data=obj_data, obj_type="testing_set"), \
         "The id validator couldn't find id as duplicated one(In different sets)"
 
@@ -153,8 +167,35 @@ def test_duplicated_id_with_diff_versioning():
         actual_obj_set,
     ]
 
-    validator.id_set = {
+    validator.id_set = IdSet({
         "testing_set": obj_set
-    }
+    })
     assert validator.is_id_duplicated(obj_id="test", obj_data=obj_data, obj_type="testing_set"), \
         "The id validator couldn't find id as duplicated one(In different sets)"
+
+
+@pytest.mark.parametrize('existing_range, new_range', [
+    ({'toversion': '4.9.9'}, {'fromversion': '5.0.0'}),
+    ({'toversion': '5.0.0'}, {'fromversion': '5.0.0'}),
+    ({'toversion': '5.5.0'}, {'fromversion': '5.0.0'}),
+    ({'fromversion': '3.0.0', 'toversion': '3.0.0'}, {'fromversion': '2.0.0', 'toversion': '3.0.0'}),
+    ({}, {'fromversion': '5.0.0'}),
+])
+def test_duplicated_id_matches_find_duplicates(existing_range, new_range):
+    """
+    Given
+        - An entity in the id_set, and a new entity with the same id and another version range.
+    When
+        - Checking if the id of the new entity is duplicated.
+    Then
+        - It is duplicated exactly when find_duplicates finds the two entities as duplicates.
+    """
+    validator = IDSetValidator(is_circle=False, is_test_run=True, configuration=CONFIG)
+    existing_data = dict(existing_range, name='test', file_path='Scripts/old.yml')
+    new_data = dict(new_range, name='test', file_path='Scripts/new.yml')
+    validator.id_set = IdSet({'scripts': [{'test': existing_data}]})
+
+    is_duplicated = validator.is_id_duplicated(obj_id='test', obj_data={'test': new_data}, obj_type='scripts')
+    id_set = {'scripts': [{'test': existing_data}, {'test': new_data}], 'integrations': [], 'playbooks': [],
+              'TestPlaybooks': []}
+    assert is_duplicated == any(find_duplicates(id_set))
@@ -0,0 +1,103 @@
+import json
+import os
+
+import pytest
+import yaml
+
+from demisto_sdk.commands.common import tools
+from demisto_sdk.commands.common.parsed_file_cache import ParsedFileCache
+
+
+def write_file(file_path, content):
+    with open(file_path, 'w') as file_obj:
+        file_obj.write(content)
+
+
+def parse(cache, file_path, parse_function=yaml.safe_load):
+    with open(file_path) as file_obj:
+        return cache.parse(file_obj, parse_function)
+
+
+def test_file_is_parsed_once_and_copied(tmp_path):
+    """
+    Given
+        - A yml file.
+    When
+        - Parsing it twice through the cache and changing the first result.
+    Then
+        - The file is parsed once and the second result isn't affected by the change.
+    """
+    file_path = str(tmp_path / 'integration.yml')
+    write_file(file_path, 'script:\n  commands:\n  - name: command\n')
+    cache = ParsedFileCache()
+
+    first = parse(cache, file_path)
+    first['script']['commands'].append({'name': 'other'})
+    second = parse(cache, file_path)
+
+    assert second == {'script': {'commands': [{'name': 'command'}]}}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_changed_file_is_parsed_again(tmp_path):
+    file_path = str(tmp_path / 'integration.yml')
+    write_file(file_path, 'name: first')
+    cache = ParsedFileCache()
+    parse(cache, file_path)
+
+    file_stat = os.stat(file_path)
+    write_file(file_path, 'name: other')
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1))
+
+    assert parse(cache, file_path) == {'name': 'other'}
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert cache.get_stats()['entries'] == 1
+
+
+def test_parser_is_part_of_the_key(tmp_path):
+    file_path = str(tmp_path / 'file.json')
+    write_file(file_path, '{"name": "json"}')
+    cache = ParsedFileCache()
+
+    parse(cache, file_path, json.load)
+    parse(cache, file_path)
+
+    assert cache.misses == 2
+
+
+def test_least_recently_used_files_are_evicted(tmp_path):
+    cache = ParsedFileCache(max_entries=2)
+    file_paths = []
+    for name in ('first', 'second', 'third'):
+        file_paths.append(str(tmp_path / '{}.yml'.format(name)))
+        write_file(file_paths[-1], 'name: {}'.format(name))
+
+    parse(cache, file_paths[0])
+    parse(cache, file_paths[1])
+    parse(cache, file_paths[0])
+    parse(cache, file_paths[2])
+    parse(cache, file_paths[0])
+    parse(cache, file_paths[1])
+
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 4, 2)
+
+
+def test_parse_errors_are_not_cached(tmp_path):
+    file_path = str(tmp_path / 'file.yml')
+    write_file(file_path, 'name: [')
+    cache = ParsedFileCache()
+
+    for _ in range(2):
+        with pytest.raises(yaml.YAMLError):
+            parse(cache, file_path)
+
+    assert (cache.misses, cache.get_stats()['entries']) == (2, 0)
+
+
+def test_get_yaml_uses_the_cache(tmp_path):
+    file_path = str(tmp_path / 'integration.yml')
+    write_file(file_path, 'name: integration')
+    tools.PARSED_FILE_CACHE.clear()
+
+    assert tools.get_yaml(file_path) == tools.get_yaml(file_path) == {'name': 'integration'}
+    assert (tools.PARSED_FILE_CACHE.hits, tools.PARSED_FILE_CACHE.misses) == (1, 1)
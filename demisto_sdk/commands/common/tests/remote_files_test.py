@@ -0,0 +1,130 @@
+import pytest
+import requests
+
+from demisto_sdk.commands.common import tools
+from demisto_sdk.commands.common.remote_files import RemoteFileCache, RemoteFileFetcher, create_session
+
+FILES = {'master/Integrations/Test/Test.yml': b'name: Test\n',
+         'master/Scripts/script-Test.yml': b'name: script\n',
+         '20.1.0/Integrations/Test/Test.yml': b'name: Old\n'}
+
+
+@pytest.fixture()
+def server(stub_http_server):
+    stub_http_server.files.update(FILES)
+    return stub_http_server
+
+
+def test_fetch(server, tmp_path):
+    """
+    Given
+        - A server with files of two tags.
+    When
+        - Fetching files by tag and path, with and without the 'origin/' prefix, and a missing file.
+    Then
+        - The files of the tags are returned, each downloaded once. The error of the missing file is raised.
+    """
+    fetcher = RemoteFileFetcher(server.url, cache=RemoteFileCache(str(tmp_path)))
+    assert fetcher.fetch('Integrations/Test/Test.yml') == b'name: Test\n'
+    assert fetcher.fetch('Integrations/Test/Test.yml', '20.1.0') == b'name: Old\n'
+    assert fetcher.fetch('Integrations/Test/Test.yml', 'origin/20.1.0') == b'name: Old\n'
+    assert fetcher.fetch('Integrations/Test/Test.yml') == b'name: Test\n'
+    with pytest.raises(requests.HTTPError):
+        fetcher.fetch('Integrations/Missing/Missing.yml')
+
+    assert [path for path, _ in server.requests] == ['master/Integrations/Test/Test.yml',
+                                                     '20.1.0/Integrations/Test/Test.yml',
+                                                     '20.1.0/Integrations/Test/Test.yml',
+                                                     'master/Integrations/Missing/Missing.yml']
+
+
+def test_cached_files_are_revalidated(server, tmp_path):
+    """
+    Given
+        - Files downloaded in a previous run.
+    When
+        - Fetching them again in a new fetcher, after one of them changed on the server.
+    Then
+        - They are requested with their ETags, the unchanged file is taken from the cache and the changed one is
+          downloaded again.
+    """
+    RemoteFileFetcher(server.url, cache=RemoteFileCache(str(tmp_path))).prefetch(
+        ['Integrations/Test/Test.yml', 'Scripts/script-Test.yml'])
+    server.files['master/Scripts/script-Test.yml'] = b'name: changed\n'
+    server.requests.clear()
+
+    fetcher = RemoteFileFetcher(server.url, cache=RemoteFileCache(str(tmp_path)))
+    assert fetcher.fetch('Integrations/Test/Test.yml') == b'name: Test\n'
+    assert fetcher.fetch('Scripts/script-Test.yml') == b'name: changed\n'
+    assert server.requests == [('master/Integrations/Test/Test.yml', server.get_etag(b'name: Test\n')),
+                               ('master/Scripts/script-Test.yml', server.get_etag(b'name: script\n'))]
+    assert fetcher.not_modified_count == 1
+    assert RemoteFileCache(str(tmp_path)).get('master', 'Scripts/script-Test.yml') == \
+        (server.get_etag(b'name: changed\n'), b'name: changed\n')
+
+
+def test_prefetch(server, tmp_path):
+    """
+    Given
+        - A slow server.
+    When
+        - Prefetching files and then fetching them.
+    Then
+        - The files are downloaded concurrently once, over kept alive connections, and fetched without requests.
+    """
+    paths = ['Integrations/Test/Test.yml', 'Scripts/script-Test.yml', 'Integrations/Missing/Missing.yml']
+    server.delay = 0.2
+    fetcher = RemoteFileFetcher(server.url, cache=RemoteFileCache(str(tmp_path)))
+    fetcher.prefetch(paths * 2)
+    assert len(server.requests) == 3
+    assert len(server.connections) <= 3
+
+    server.delay = 0
+    assert fetcher.fetch('Integrations/Test/Test.yml') == b'name: Test\n'
+    assert fetcher.fetch('Scripts/script-Test.yml') == b'name: script\n'
+    with pytest.raises(requests.HTTPError):
+        fetcher.fetch('Integrations/Missing/Missing.yml')
+    assert len(server.requests) == 3
+
+
+def test_session_reuses_connections(server):
+    session = create_session()
+    for _ in range(5):
+        session.get(server.url + '/master/Integrations/Test/Test.yml').raise_for_status()
+
+    assert len(server.requests) == 5
+    assert len(server.connections) == 1
+
+
+def test_failed_requests_are_retried(server, tmp_path):
+    """
+    Given
+        - A server that fails the first two requests with 503.
+    When
+        - Fetching a file.
+    Then
+        - The request is retried until the file is downloaded.
+    """
+    server.fail_count = 2
+    fetcher = RemoteFileFetcher(server.url, cache=RemoteFileCache(str(tmp_path)))
+    assert fetcher.fetch('Integrations/Test/Test.yml') == b'name: Test\n'
+    assert len(server.requests) == 3
+
+
+def test_get_remote_file_uses_prefetched_files(server, tmp_path, monkeypatch):
+    """
+    Given
+        - A tag that is not in the local git repository.
+    When
+        - Prefetching files of the tag and getting them with get_remote_file.
+    Then
+        - The files are parsed from the prefetched downloads.
+    """
+    fetcher = RemoteFileFetcher(server.url, cache=RemoteFileCache(str(tmp_path)))
+    monkeypatch.setattr(tools, 'REMOTE_FILE_FETCHER', fetcher)
+    tools.prefetch_remote_files(['Integrations/Test/Test.yml', 'Integrations/Missing/Missing.yml'], 'origin/20.1.0')
+    assert len(server.requests) == 2
+
+    assert tools.get_remote_file('Integrations/Test/Test.yml', 'origin/20.1.0') == {'name': 'Old'}
+    assert tools.get_remote_file('Integrations/Missing/Missing.yml', 'origin/20.1.0') == {}
+    assert len(server.requests) == 2
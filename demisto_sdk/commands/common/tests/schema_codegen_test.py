@@ -0,0 +1,217 @@
+import copy
+import glob
+import json
+import os
+import random
+
+import pytest
+from pykwalify.errors import SchemaError
+
+from demisto_sdk.commands.common import schema_codegen
+from demisto_sdk.commands.common.compiled_schema import CompiledSchema, get_compiled_schema, load_yaml_for_schema
+from demisto_sdk.commands.common.git_tools import git_path
+from demisto_sdk.commands.common.hook_validations.structure import StructureValidator
+from demisto_sdk.commands.common.schema_codegen import FastSchema, SchemaCodeGenerator, UnsupportedSchema, \
+    load_validator
+from demisto_sdk.tests.constants_test import INVALID_PLAYBOOK_PATH, VALID_INTEGRATION_TEST_PATH
+
+SCHEMAS_DIR = os.path.join(git_path(), 'demisto_sdk', 'commands', 'common', 'schemas')
+SCHEMA_PATHS = sorted(glob.glob(os.path.join(SCHEMAS_DIR, '*.yml')))
+TEST_FILES_DIR = os.path.join(git_path(), 'demisto_sdk', 'tests', 'test_files')
+TEST_FILES = sorted(glob.glob(os.path.join(TEST_FILES_DIR, '**', '*.yml'), recursive=True) +
+                    glob.glob(os.path.join(TEST_FILES_DIR, '**', '*.json'), recursive=True))
+MUTATION_VALUES = [None, 0, 1, True, False, 1.5, '', 'x', 'yes', [], ['x'], [{}], {}, {'x': 1}]
+
+
+@pytest.fixture(scope='module')
+def validators(tmp_path_factory):
+    cache_dir = str(tmp_path_factory.mktemp('schemas'))
+    return {schema_path: load_validator(schema_path, cache_dir) for schema_path in SCHEMA_PATHS}
+
+
+def load_test_file(file_path):
+    with open(file_path, 'r') as file_obj:
+        return json.load(file_obj) if file_path.endswith('.json') else load_yaml_for_schema(file_obj)
+
+
+def is_valid_by_pykwalify(schema_path, source_data):
+    try:
+        get_compiled_schema(schema_path).validate(copy.deepcopy(source_data))
+        return True
+    except Exception:
+        return False
+
+
+@pytest.mark.parametrize('file_path', TEST_FILES)
+def test_generated_validators_match_pykwalify(file_path, validators):
+    """
+    Given
+        - A file of the test files.
+    When
+        - Validating it against every schema with pykwalify and with the generated validator.
+    Then
+        - The generated validator passes the file against exactly the schemas pykwalify passes it against.
+    """
+    try:
+        source_data = load_test_file(file_path)
+    except Exception:
+        pytest.skip('not a valid yml or json file')
+
+    for schema_path in SCHEMA_PATHS:
+        assert validators[schema_path](source_data) == is_valid_by_pykwalify(schema_path, source_data), schema_path
+
+
+def iter_value_paths(value, path=()):
+    yield path
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from iter_value_paths(item, path + (key,))
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from iter_value_paths(item, path + (index,))
+
+
+def test_generated_validators_match_pykwalify_on_mutated_files(validators):
+    """
+    Given
+        - The test files that are valid against a schema, each changed at a random place - a value replaced by a value
+          of another type, a key removed or an unknown key added.
+    When
+        - Validating the changed files with pykwalify and with the generated validator.
+    Then
+        - Both find the same changed files valid.
+    """
+    rand = random.Random(1)
+    mutations = invalid_mutations = 0
+    for file_path in TEST_FILES:
+        try:
+            source_data = load_test_file(file_path)
+        except Exception:
+            continue
+
+        for schema_path in SCHEMA_PATHS:
+            if not is_valid_by_pykwalify(schema_path, source_data):
+                continue
+
+            value_paths = list(iter_value_paths(source_data))[1:]
+            for _ in range(20):
+                mutated_data = copy.deepcopy(source_data)
+                value_path = rand.choice(value_paths)
+                parent = mutated_data
+                for key in value_path[:-1]:
+                    parent = parent[key]
+                operation = rand.random()
+                if operation < 0.2 and isinstance(parent, dict):
+                    del parent[value_path[-1]]
+                elif operation < 0.3 and isinstance(parent, dict):
+                    parent['unknownKey'] = 'x'
+                else:
+                    parent[value_path[-1]] = rand.choice(MUTATION_VALUES)
+
+                is_valid = is_valid_by_pykwalify(schema_path, mutated_data)
+                assert validators[schema_path](mutated_data) == is_valid, (file_path, schema_path, value_path)
+                mutations += 1
+                invalid_mutations += not is_valid
+
+    # the mutations cover both valid and invalid files
+    assert 0 < invalid_mutations < mutations
+
+
+def test_fast_schema_errors_are_pykwalify_errors(tmp_path):
+    """
+    Given
+        - An invalid playbook.
+    When
+        - Validating it with a FastSchema.
+    Then
+        - The SchemaError of pykwalify is raised, with the errors of the compiled schema.
+    """
+    schema_path = os.path.join(SCHEMAS_DIR, 'playbook.yml')
+    source_data = load_test_file(INVALID_PLAYBOOK_PATH)
+    with pytest.raises(SchemaError) as expected_error:
+        get_compiled_schema(schema_path).validate(source_data)
+
+    with pytest.raises(SchemaError) as error:
+        FastSchema(schema_path, str(tmp_path)).validate(source_data)
+    assert str(error.value) == str(expected_error.value)
+
+
+def test_generated_module_is_cached(tmp_path, mocker):
+    """
+    Given
+        - An empty cache directory.
+    When
+        - Loading the validator of a schema twice.
+    Then
+        - The module is generated once, written to the cache directory and loaded from it the second time.
+    """
+    schema_path = os.path.join(SCHEMAS_DIR, 'integration.yml')
+    generate = mocker.spy(SchemaCodeGenerator, 'generate')
+    source_data = load_test_file(VALID_INTEGRATION_TEST_PATH)
+    assert load_validator(schema_path, str(tmp_path))(source_data)
+    assert load_validator(schema_path, str(tmp_path))(source_data)
+    assert generate.call_count == 1
+    assert [path.name for path in tmp_path.iterdir()] == \
+        ['integration_{}.py'.format(schema_codegen.get_cache_key(schema_path))]
+
+
+def test_changed_schema_is_generated_again(tmp_path):
+    """
+    Given
+        - A schema whose validator is cached.
+    When
+        - Changing the schema and loading its validator.
+    Then
+        - A new validator is generated, with the rules of the changed schema.
+    """
+    schema_path = tmp_path / 'widget.yml'
+    schema_path.write_text('type: map\nmapping:\n  name:\n    type: str\n    required: true\n')
+    cache_dir = str(tmp_path / 'cache')
+    assert not load_validator(str(schema_path), cache_dir)({'name': 1})
+
+    schema_path.write_text('type: map\nmapping:\n  name:\n    type: int\n    required: true\n')
+    get_compiled_schema.cache_clear()
+    assert load_validator(str(schema_path), cache_dir)({'name': 1})
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_unsupported_schema_is_validated_by_pykwalify(tmp_path):
+    """
+    Given
+        - A schema with a pattern rule, which is not translated to code.
+    When
+        - Validating data with a FastSchema of it.
+    Then
+        - The schema is not generated and the data is validated by pykwalify.
+    """
+    schema_path = tmp_path / 'pattern.yml'
+    schema_path.write_text("type: map\nmapping:\n  name:\n    type: str\n    pattern: '^[a-z]+$'\n")
+    with pytest.raises(UnsupportedSchema):
+        SchemaCodeGenerator(CompiledSchema(str(schema_path))).generate()
+
+    fast_schema = FastSchema(str(schema_path), str(tmp_path / 'cache'))
+    assert fast_schema.validator is None
+    assert fast_schema.validate({'name': 'abc'}) == {'name': 'abc'}
+    assert not fast_schema.is_valid({'name': 'ABC'})
+
+
+@pytest.mark.parametrize('file_path, scheme_name, is_valid', [
+    (VALID_INTEGRATION_TEST_PATH, 'integration', True), (INVALID_PLAYBOOK_PATH, 'playbook', False),
+])
+def test_structure_validator_with_fast_schema(file_path, scheme_name, is_valid, tmp_path, monkeypatch):
+    """
+    Given
+        - A valid integration and an invalid playbook.
+    When
+        - Validating their scheme with a StructureValidator with fast_schema.
+    Then
+        - The scheme is validated with the generated validator, with the same result as without fast_schema.
+    """
+    monkeypatch.setenv(schema_codegen.SCHEMA_CODE_CACHE_DIR_ENV, str(tmp_path))
+    schema_codegen.get_fast_schema.cache_clear()
+    fast_validator = StructureValidator(file_path, is_new_file=True, predefined_scheme=scheme_name, fast_schema=True)
+    assert fast_validator.is_valid_scheme() is is_valid
+    validator = StructureValidator(file_path, is_new_file=True, predefined_scheme=scheme_name)
+    assert validator.is_valid_scheme() is is_valid
+    assert os.listdir(str(tmp_path))
+    schema_codegen.get_fast_schema.cache_clear()
@@ -1,9 +1,12 @@
 import os
+import shutil
 import unittest
 import pytest
 from collections import OrderedDict
 from demisto_sdk.commands.common.update_id_set import has_duplicate, get_integration_data, get_script_data, \
-    get_playbook_data
+    get_playbook_data, create_id_set_dict, find_duplicates, update_id_set_db
+from demisto_sdk.commands.common.id_set import IdSet
+from demisto_sdk.commands.common.id_set_db import IdSetDB, get_id_set_fingerprint
 from demisto_sdk.commands.common.git_tools import git_path
 
 MOCKED_DATA = [
@@ -87,6 +90,63 @@ def test_had_duplicates(id_set, id_to_check, result):
     assert result == has_duplicate(id_set, id_to_check)
 
 
+def build_entities(entity_id, version_ranges):
+    entities = []
+    for from_version, to_version in version_ranges:
+        data = {'name': entity_id, 'file_path': entity_id}
+        if from_version:
+            data['fromversion'] = from_version
+        if to_version:
+            data['toversion'] = to_version
+        entities.append({entity_id: data})
+
+    return entities
+
+
+@pytest.mark.parametrize('version_ranges, result', [
+    ([('3.0.0', '4.0.0'), ('4.0.0', None)], False),
+    ([('4.0.0', None), ('3.0.0', '4.0.0'), (None, '3.0.0')], False),
+    ([('3.0.0', '4.0.0'), ('3.9.9', None)], True),
+    ([('3.0.0', '3.0.0'), ('3.0.0', '4.0.0')], True),
+    ([('3.0.0', '3.0.0'), ('3.0.0', '3.0.0')], False),
+    ([('3.0.0', '3.0.0'), ('2.0.0', '3.0.0')], True),
+    ([('3.5.0', '3.5.0'), ('3.0.0', '4.0.0')], True),
+    ([('2.0.0', '2.0.0'), ('3.0.0', '4.0.0'), ('5.0.0', '5.0.0')], False),
+    ([('4.10.0', None), ('4.5.0', '4.9.0')], False),
+    ([('4.5.0', '4.10.0'), ('4.9.0', None)], True),
+    ([('5.0.0', '3.0.0'), ('2.0.0', '4.0.0')], True),
+])
+def test_has_duplicate_version_ranges(version_ranges, result):
+    """
+    Given
+        - Entities with the same id and different version ranges.
+    When
+        - Checking if the id is duplicated.
+    Then
+        - The id is duplicated only if two of the ranges overlap.
+    """
+    assert has_duplicate(build_entities('Test', version_ranges), 'Test') == result
+
+
+def test_find_duplicates():
+    """
+    Given
+        - An id_set with overlapping ids in each section and a non-overlapping id.
+    When
+        - Finding the duplicates.
+    Then
+        - Each duplicate is reported in its own section, the non-overlapping id isn't reported.
+    """
+    id_set = {
+        'scripts': build_entities('script', [(None, None), ('5.0.0', None)]) + build_entities('other', [(None, None)]),
+        'integrations': build_entities('integration', [('4.0.0', '5.0.0'), ('5.0.0', None)]),
+        'playbooks': build_entities('playbook', [(None, '5.0.0'), ('4.5.0', None)]),
+        'TestPlaybooks': build_entities('test_playbook', [(None, None), (None, None)]),
+    }
+
+    assert find_duplicates(id_set) == (['script'], [], ['playbook'], ['test_playbook'])
+
+
 INTEGRATION_DATA = {
     "Cortex XDR - IR": OrderedDict(
         [
@@ -173,5 +233,66 @@ class TestIntegration(unittest.TestCase):
         self.assertDictEqual(data['command_to_integration'], PLAYBOOK_DATA['command_to_integration'])
 
 
+def test_create_id_set_dict(tmp_path, monkeypatch):
+    """
+    Given
+        - A content repo with an integration, a script package, a playbook and a test playbook.
+    When
+        - Creating the id_set with a single pool over all the entities.
+    Then
+        - Each entity is added to its section, sorted by id.
+    """
+    test_files = os.path.join(git_path(), 'demisto_sdk', 'tests', 'test_files')
+    for directory in ('Integrations', 'Playbooks', 'TestPlaybooks', 'Scripts'):
+        (tmp_path / directory).mkdir()
+    shutil.copy(os.path.join(test_files, 'integration-test.yml'), str(tmp_path / 'Integrations'))
+    shutil.copy(os.path.join(test_files, 'CortexXDR', 'Playbooks', 'Cortex_XDR_Incident_Handling.yml'),
+                str(tmp_path / 'Playbooks' / 'playbook-Cortex_XDR_Incident_Handling.yml'))
+    shutil.copy(os.path.join(test_files, 'CortexXDR', 'TestPlaybooks', 'Cortex_XDR.yml'),
+                str(tmp_path / 'TestPlaybooks' / 'playbook-Cortex_XDR.yml'))
+    shutil.copytree(os.path.join(test_files, 'CalculateGeoDistance'),
+                    str(tmp_path / 'Scripts' / 'CalculateGeoDistance'))
+    shutil.copy(os.path.join(test_files, 'script-valid.yml'), str(tmp_path / 'Scripts'))
+    monkeypatch.chdir(tmp_path)
+
+    id_set = create_id_set_dict(workers=2)
+
+    assert list(id_set.keys()) == ['scripts', 'playbooks', 'integrations', 'TestPlaybooks']
+    assert [list(script.keys())[0] for script in id_set['scripts']] == ['CalculateGeoDistance', 'TestCreateDuplicates']
+    assert [list(playbook.keys())[0] for playbook in id_set['playbooks']] == ['Cortex XDR Incident Handling']
+    assert len(id_set['integrations']) == 1
+    assert len(id_set['TestPlaybooks']) == 1
+
+
+@pytest.mark.parametrize('is_id_set_replaced', [False, True])
+def test_update_id_set_db(tmp_path, is_id_set_replaced):
+    """
+    Given
+        - An id_set.json file with a SQLite store, and an id_set.json that may have been replaced after the store was
+          written, like when it is checked out from master.
+    When
+        - Updating the store with the changes of an id_set update.
+    Then
+        - The changes are applied to a store that matches the loaded id_set.json, and a store of another id_set.json is
+          re-written from the updated id_set. Either way the store matches the updated id_set.json afterwards.
+    """
+    id_set_path = str(tmp_path / 'id_set.json')
+    db_path = str(tmp_path / 'id_set.db')
+    IdSet(OrderedDict([('scripts', [{'ScriptA': {'name': 'ScriptA'}}])])).dump(id_set_path)
+    IdSetDB(db_path).write(IdSet.load(id_set_path), get_id_set_fingerprint(id_set_path))
+    if is_id_set_replaced:
+        IdSet(OrderedDict([('scripts', [{'ScriptB': {'name': 'ScriptB'}}])])).dump(id_set_path)
+
+    id_set = IdSet.load(id_set_path)
+    loaded_fingerprint = get_id_set_fingerprint(id_set_path)
+    id_set.upsert('scripts', {'ScriptC': {'name': 'ScriptC'}})
+    id_set.dump(id_set_path)
+    update_id_set_db(id_set, id_set_path, loaded_fingerprint)
+
+    with IdSetDB(db_path) as id_set_db:
+        assert id_set_db.get_fingerprint() == get_id_set_fingerprint(id_set_path)
+        assert id_set_db.to_id_set().to_dict() == IdSet.load(id_set_path).to_dict()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,129 @@
+import os
+import time
+
+import pytest
+
+from demisto_sdk.commands.common import validation_cache
+from demisto_sdk.commands.common.validation_cache import ValidationResultCache, get_dependency_paths
+
+INTEGRATION_PATH = os.path.join('Integrations', 'Test', 'Test.yml')
+
+
+@pytest.fixture()
+def repo(tmp_path, monkeypatch, mocker):
+    """A content repo with an integration package and a playbook, whose old versions are the current ones."""
+    for file_path, content in ((INTEGRATION_PATH, 'name: Test\n'), ('Integrations/Test/Test.py', 'print(1)\n'),
+                               ('Integrations/Test/CHANGELOG.md', '## [Unreleased]\n'),
+                               ('Playbooks/playbook-Test.yml', 'id: Test\n'),
+                               ('Playbooks/playbook-Other.yml', 'id: Other\n')):
+        (tmp_path / file_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / file_path).write_text(content)
+
+    monkeypatch.chdir(tmp_path)
+    mocker.patch.object(validation_cache, 'get_remote_file_content',
+                        side_effect=lambda file_path, tag: open(file_path, 'rb').read())
+    mocker.patch.object(validation_cache.LOCAL_GIT_FILE_PROVIDER, 'get_file_content', return_value=None)
+    return tmp_path
+
+
+def test_get_dependency_paths(repo):
+    """
+    Given
+        - A file of a package and a file outside of a package.
+    When
+        - Getting the files their validation depends on.
+    Then
+        - The files of the package are returned with the package yml, the other file depends on itself and its changelog
+          only.
+    """
+    assert get_dependency_paths(INTEGRATION_PATH) == [os.path.join('Integrations', 'Test', name)
+                                                      for name in ('CHANGELOG.md', 'Test.py', 'Test.yml')]
+    assert get_dependency_paths(os.path.join('Playbooks', 'playbook-Test.yml')) == [
+        os.path.join('Playbooks', 'playbook-Test.yml'), os.path.join('Playbooks', 'playbook-Test_CHANGELOG.md')]
+
+
+@pytest.mark.parametrize('change', [
+    lambda repo: (repo / INTEGRATION_PATH).write_text('name: Changed\n'),
+    lambda repo: (repo / 'Integrations/Test/Test.py').write_text('print(2)\n'),
+    lambda repo: (repo / 'Integrations/Test/Test_image.png').write_bytes(b'png'),
+    lambda repo: (repo / 'Integrations/Test/CHANGELOG.md').write_text('## [Unreleased]\n - Fixed.\n'),
+    lambda repo: validation_cache.get_remote_file_content.configure_mock(side_effect=Exception('Not found')),
+])
+def test_key_changes_with_the_files(repo, change):
+    """
+    Given
+        - The key of a validation of a modified integration.
+    When
+        - Changing the integration, its code, image, changelog or old version.
+    Then
+        - The key changes, and it doesn't change without a change.
+    """
+    cache = ValidationResultCache(str(repo / 'cache'))
+    key = cache.get_key(INTEGRATION_PATH, 'modified', tag='origin/master')
+    assert cache.get_key(INTEGRATION_PATH, 'modified', tag='origin/master') == key
+
+    change(repo)
+    assert cache.get_key(INTEGRATION_PATH, 'modified', tag='origin/master') != key
+
+
+def test_key_of_validation(repo, mocker):
+    """
+    Given
+        - The key of a validation of a new playbook.
+    When
+        - Changing the options of the validation, another playbook, the schema of playbooks and the validators.
+    Then
+        - The key changes with everything but the other playbook.
+    """
+    cache = ValidationResultCache(str(repo / 'cache'))
+    playbook_path = os.path.join('Playbooks', 'playbook-Test.yml')
+    key = cache.get_key(playbook_path, 'added')
+    assert cache.get_key(playbook_path, 'modified') != key
+    assert cache.get_key(playbook_path, 'added', tag='origin/master') != key
+
+    (repo / 'Playbooks' / 'playbook-Other.yml').write_text('id: Changed\n')
+    assert cache.get_key(playbook_path, 'added') == key
+
+    schema_path = repo / 'playbook.yml'
+    schema_path.write_text('type: map\n')
+    mocker.patch.object(validation_cache, 'get_schema_path', return_value=str(schema_path))
+    assert cache.get_key(playbook_path, 'added') != key
+
+    mocker.patch.object(validation_cache, 'get_validators_key', return_value='other')
+    mocker.patch.object(validation_cache, 'get_schema_path', return_value=None)
+    assert cache.get_key(playbook_path, 'added') != key
+
+
+def test_get_and_set(tmp_path):
+    """
+    Given
+        - Results of a passed and a failed validation.
+    When
+        - Caching them and getting them, before and after they expire.
+    Then
+        - The results are returned until they expire, hits are the passed results only.
+    """
+    cache = ValidationResultCache(str(tmp_path))
+    assert cache.get('passed') is None
+    cache.set('passed', True, [('stdout', 'passed\n')])
+    cache.set('failed', False, [('stdout', 'failed\n')])
+
+    assert cache.get('passed') == (True, [('stdout', 'passed\n')])
+    assert cache.get('failed') == (False, [('stdout', 'failed\n')])
+    assert (cache.hits, cache.misses, cache.writes) == (1, 2, 2)
+
+    expired = time.time() - cache.max_age - 1
+    os.utime(cache.get_entry_path('passed'), (expired, expired))
+    assert cache.get('passed') is None
+    assert cache.prune() == 1
+    assert cache.clear() == 1
+    assert cache.get_stats()['entries'] == 0
+
+
+def test_truncated_entry_is_a_miss(tmp_path):
+    cache = ValidationResultCache(str(tmp_path))
+    cache.set('key', True, [])
+    with open(cache.get_entry_path('key'), 'r+b') as entry_file:
+        entry_file.truncate(5)
+
+    assert cache.get('key') is None
@@ -0,0 +1,85 @@
+import itertools
+import random
+
+import pytest
+
+from demisto_sdk.commands.common.tools import version_to_tuple
+from demisto_sdk.commands.common.version_index import VersionRangeIndex, is_version_overlap
+
+VERSIONS = ['0.0.0', '3.0.0', '3.5.0', '4.1.0', '4.10.0', '4.5.0', '5.0.0', '99.99.99']
+
+
+def get_version_index():
+    version_index = VersionRangeIndex()
+    version_index.add('A', '0.0.0', '4.9.9', payload='A 4')
+    version_index.add('A', '5.0.0', '99.99.99', payload='A 5')
+    version_index.add('A', '4.5.0', '4.10.0', payload='A 4.5')
+    version_index.add('B', '5.0.0', '5.0.0', payload='B 5')
+    return version_index
+
+
+@pytest.mark.parametrize('key, version, payloads', [
+    ('A', '4.0.0', ['A 4']),
+    ('A', '4.9.9', ['A 4', 'A 4.5']),
+    ('A', '4.10.0', ['A 4.5']),
+    ('A', '5.0.0', ['A 5']),
+    ('A', '100.0.0', []),
+    ('B', '5.0.0', ['B 5']),
+    ('B', '5.0.1', []),
+    ('C', '5.0.0', []),
+])
+def test_get_active(key, version, payloads):
+    assert get_version_index().get_active(key, version) == payloads
+
+
+@pytest.mark.parametrize('key, from_version, to_version, payloads', [
+    ('A', '4.9.9', '5.0.0', ['A 4.5']),
+    ('A', '4.0.0', '5.0.1', ['A 4', 'A 4.5', 'A 5']),
+    ('A', '4.11.0', '6.0.0', ['A 5']),
+    ('A', '4.9.9', '4.9.9', ['A 4', 'A 4.5']),
+    ('B', '0.0.0', '5.0.0', ['B 5']),
+    ('B', '5.0.0', '5.0.0', []),
+])
+def test_get_overlapping(key, from_version, to_version, payloads):
+    assert get_version_index().get_overlapping(key, from_version, to_version) == payloads
+
+
+def test_has_overlaps():
+    version_index = get_version_index()
+    assert version_index.has_overlaps('A')
+    assert not version_index.has_overlaps('B')
+    assert not version_index.has_overlaps('C')
+
+
+def test_matches_pairwise_comparison():
+    """
+    Given
+        - Random version ranges, including single versions and ranges that end before they start.
+    When
+        - Querying the version index.
+    Then
+        - The results are the same as comparing the query with every range.
+    """
+    rand = random.Random(0)
+    for _ in range(300):
+        version_ranges = [(rand.choice(VERSIONS), rand.choice(VERSIONS)) for _ in range(rand.randint(1, 6))]
+        if rand.random() < 0.7:
+            version_ranges = [tuple(sorted(version_range, key=version_to_tuple)) for version_range in version_ranges]
+
+        version_index = VersionRangeIndex()
+        for position, version_range in enumerate(version_ranges):
+            version_index.add('id', *version_range, payload=position)
+
+        parsed_ranges = [(version_to_tuple(from_version), version_to_tuple(to_version))
+                         for from_version, to_version in version_ranges]
+        assert version_index.has_overlaps('id') == any(
+            is_version_overlap(first, second) for first, second in itertools.combinations(parsed_ranges, 2))
+
+        query = tuple(sorted((rand.choice(VERSIONS), rand.choice(VERSIONS)), key=version_to_tuple))
+        parsed_query = (version_to_tuple(query[0]), version_to_tuple(query[1]))
+        assert sorted(version_index.get_overlapping('id', *query)) == [
+            position for position, parsed_range in enumerate(parsed_ranges)
+            if is_version_overlap(parsed_query, parsed_range)]
+        assert sorted(version_index.get_active('id', query[0])) == [
+            position for position, (from_version, to_version) in enumerate(parsed_ranges)
+            if from_version <= parsed_query[0] <= to_version]
@@ -0,0 +1,83 @@
+import glob
+import os
+from collections import OrderedDict
+
+import pytest
+import yaml
+import yamlordereddictloader
+
+from demisto_sdk.commands.common import yaml_io
+from demisto_sdk.commands.common.git_tools import git_path
+
+TEST_FILES = sorted(glob.glob(os.path.join(git_path(), 'demisto_sdk', 'tests', 'test_files', '**', '*.yml'),
+                              recursive=True))
+
+
+def read_file(file_path):
+    with open(file_path) as file_obj:
+        return file_obj.read()
+
+
+@pytest.mark.parametrize('file_path', TEST_FILES)
+def test_safe_load_matches_pyyaml(file_path):
+    """
+    Given
+        - A yml file of the test files.
+    When
+        - Loading it with yaml_io.safe_load.
+    Then
+        - The data is the same as yaml.safe_load's.
+    """
+    content = read_file(file_path)
+    assert yaml_io.safe_load(content) == yaml.safe_load(content)
+
+
+@pytest.mark.parametrize('file_path', TEST_FILES)
+def test_ordered_load_matches_yamlordereddictloader(file_path):
+    """
+    Given
+        - A yml file of the test files.
+    When
+        - Loading it with yaml_io.ordered_load.
+    Then
+        - The data and the order of the keys are the same as yamlordereddictloader.SafeLoader's.
+    """
+    content = read_file(file_path)
+    data = yaml_io.ordered_load(content)
+    expected = yaml.load(content, Loader=yamlordereddictloader.SafeLoader)
+
+    assert data == expected
+    assert yaml.dump(data, Dumper=yamlordereddictloader.SafeDumper) == \
+        yaml.dump(expected, Dumper=yamlordereddictloader.SafeDumper)
+
+
+def test_ordered_load_keeps_the_order():
+    """
+    Given
+        - A yml with nested mappings whose keys are not sorted.
+    When
+        - Loading it with yaml_io.ordered_load.
+    Then
+        - The mappings are OrderedDicts with the keys in the file order.
+    """
+    data = yaml_io.ordered_load('b: 1\na:\n  d: 2\n  c: [3]\n')
+
+    assert isinstance(data, OrderedDict) and isinstance(data['a'], OrderedDict)
+    assert list(data) == ['b', 'a']
+    assert list(data['a']) == ['d', 'c']
+
+
+def test_safe_load_rejects_python_tags():
+    """
+    Given
+        - A yml with a python object tag.
+    When
+        - Loading it with yaml_io.safe_load and yaml_io.ordered_load.
+    Then
+        - Both raise like yaml.safe_load, nothing is constructed.
+    """
+    content = '!!python/object/apply:os.system ["echo"]'
+    with pytest.raises(yaml.constructor.ConstructorError):
+        yaml_io.safe_load(content)
+    with pytest.raises(yaml.constructor.ConstructorError):
+        yaml_io.ordered_load(content)
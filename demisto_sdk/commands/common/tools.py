@@ -4,17 +4,21 @@ import sys
 import json
 import glob
 import argparse
+from functools import lru_cache
 from subprocess import Popen, PIPE, DEVNULL, check_output
 from distutils.version import LooseVersion
 from typing import Union, Optional, Tuple
 
 import urllib3
-import yaml
-import requests
 
 from demisto_sdk.commands.common.constants import CHECKED_TYPES_REGEXES, PACKAGE_SUPPORTING_DIRECTORIES,\
-    CONTENT_GITHUB_LINK, PACKAGE_YML_FILE_REGEX, UNRELEASE_HEADER, RELEASE_NOTES_REGEX, PACKS_DIR, PACKS_DIR_REGEX,\
-    DEF_DOCKER
+    PACKAGE_YML_FILE_REGEX, UNRELEASE_HEADER, RELEASE_NOTES_REGEX, PACKS_DIR, PACKS_DIR_REGEX,\
+    DEF_DOCKER, SCHEMA_TO_REGEX
+from demisto_sdk.commands.common.file_classifier import FILE_TYPE_CLASSIFIER, get_regex_set
+from demisto_sdk.commands.common.parsed_file_cache import PARSED_FILE_CACHE
+from demisto_sdk.commands.common.git_file_provider import LOCAL_GIT_FILE_PROVIDER
+from demisto_sdk.commands.common.remote_files import REMOTE_FILE_FETCHER
+from demisto_sdk.commands.common import yaml_io
 
 # disable insecure warnings
 urllib3.disable_warnings()
@@ -84,29 +88,64 @@ def run_command(command, is_silenced=True, exit_on_error=True, cwd=None):
     return output
 
 
+def get_remote_file_content(full_file_path, tag='master'):
+    """Gets the content of a file as it is in a branch or tag of the content repo, like get_remote_file.
+
+    Args:
+        full_file_path (str): the path of the file in the content repo.
+        tag (str): the branch or tag, with or without the 'origin/' prefix.
+
+    Returns:
+        bytes. The content of the file, the error of the download is raised if it isn't in the local repository and
+        couldn't be downloaded.
+    """
+    content = LOCAL_GIT_FILE_PROVIDER.get_file_content(full_file_path, tag)
+    if content is None:
+        content = REMOTE_FILE_FETCHER.fetch(full_file_path, tag)
+
+    return content
+
+
 def get_remote_file(full_file_path, tag='master'):
-    # 'origin/' prefix is used to compared with remote branches but it is not a part of the github url.
-    tag = tag.lstrip('origin/')
+    """Gets a file as it is in a branch or tag of the content repo.
+
+    The file is read from the local git repository when the ref is in it, and downloaded from GitHub otherwise (or
+    taken from the files prefetched by prefetch_remote_files).
+
+    Args:
+        full_file_path (str): the path of the file in the content repo.
+        tag (str): the branch or tag, with or without the 'origin/' prefix.
 
-    # The replace in the end is for Windows support
-    github_path = os.path.join(CONTENT_GITHUB_LINK, tag, full_file_path).replace('\\', '/')
+    Returns:
+        dict. The parsed file, an empty dict if it wasn't found.
+    """
     try:
-        res = requests.get(github_path, verify=False)
-        res.raise_for_status()
+        content = get_remote_file_content(full_file_path, tag)
     except Exception as exc:
         print_warning('Could not find the old entity file under "{}".\n'
                       'please make sure that you did not break backward compatibility. '
-                      'Reason: {}'.format(github_path, exc))
+                      'Reason: {}'.format(REMOTE_FILE_FETCHER.get_url(full_file_path, tag), exc))
         return {}
 
     if full_file_path.endswith('json'):
-        details = json.loads(res.content)
+        details = json.loads(content)
     else:
-        details = yaml.safe_load(res.content)
+        details = yaml_io.safe_load(content)
 
     return details
 
 
+def prefetch_remote_files(file_paths, tag='master'):
+    """Downloads the files get_remote_file will be called with concurrently, unless the ref is in the local repository.
+
+    Args:
+        file_paths (iterable): the paths of the files in the content repo.
+        tag (str): the branch or tag, with or without the 'origin/' prefix.
+    """
+    if LOCAL_GIT_FILE_PROVIDER.get_commit(tag) is None:
+        REMOTE_FILE_FETCHER.prefetch(file_paths, tag)
+
+
 def filter_packagify_changes(modified_files, added_files, removed_files, tag='master'):
     """
     Mark scripts/integrations that were removed and added as modifiied.
@@ -135,7 +174,7 @@ def filter_packagify_changes(modified_files, added_files, removed_files, tag='ma
     for file_path in added_files:
         if file_path.split("/")[0] in PACKAGE_SUPPORTING_DIRECTORIES:
             with open(file_path) as f:
-                details = yaml.safe_load(f.read())
+                details = yaml_io.safe_load(f.read())
 
             uniq_identifier = '_'.join([
                 details['name'],
@@ -200,7 +239,8 @@ def get_file(method, file_path, type_of_file):
     with open(os.path.expanduser(file_path), "r") as f:
         if file_path.endswith(type_of_file):
             try:
-                data_dictionary = method(f)
+                # the file is parsed once per process while it is unchanged, each call gets its own copy
+                data_dictionary = PARSED_FILE_CACHE.parse(f, method)
             except Exception as e:
                 print_error(
                     "{} has a structure issue of file type{}. Error was: {}".format(file_path, type_of_file, str(e)))
@@ -211,7 +251,7 @@ def get_file(method, file_path, type_of_file):
 
 
 def get_yaml(file_path):
-    return get_file(yaml.safe_load, file_path, ('yml', 'yaml'))
+    return get_file(yaml_io.safe_load, file_path, ('yml', 'yaml'))
 
 
 def get_json(file_path):
@@ -309,13 +349,13 @@ def get_latest_release_notes_text(rn_path):
 
 
 def checked_type(file_path, compared_regexes=None, return_regex=False):
-    compared_regexes = compared_regexes or CHECKED_TYPES_REGEXES
-    for regex in compared_regexes:
-        if re.match(regex, file_path, re.IGNORECASE):
-            if return_regex:
-                return regex
-            return True
-    return False
+    # the regexes are compiled once to a RegexSet, which remembers the result of every path
+    regex_set = get_regex_set(compared_regexes or CHECKED_TYPES_REGEXES)
+    index = regex_set.match(file_path)
+    if index is None:
+        return False
+
+    return regex_set.regexes[index] if return_regex else True
 
 
 def server_version_compare(v1, v2):
@@ -333,7 +373,7 @@ def server_version_compare(v1, v2):
         negative if v2 later version than v1.
     """
 
-    _v1, _v2 = LooseVersion(v1), LooseVersion(v2)
+    _v1, _v2 = version_to_tuple(v1), version_to_tuple(v2)
     if _v1 == _v2:
         return 0
     if _v1 > _v2:
@@ -341,6 +381,32 @@ def server_version_compare(v1, v2):
     return -1
 
 
+LOOSE_VERSION_COMPONENT_REGEX = re.compile(r'(\d+ | [a-z]+ | \.)', re.VERBOSE)
+
+
+@lru_cache(maxsize=None)
+def version_to_tuple(version):
+    """Parses a version string to a tuple that compares the same as its LooseVersion.
+
+    Parsing once and comparing tuples is much cheaper than comparing LooseVersion objects.
+
+    Args:
+        version (string): the version to parse, e.g. 4.5.0
+
+    Returns:
+        tuple. The version components, numeric components are converted to ints.
+    """
+    components = []  # type: list
+    for component in LOOSE_VERSION_COMPONENT_REGEX.split(str(version)):
+        if component and component != '.':
+            try:
+                components.append(int(component))
+            except ValueError:
+                components.append(component)
+
+    return tuple(components)
+
+
 def run_threads_list(threads_list):
     """
     Start a list of threads and wait for completion (join)
@@ -394,6 +460,19 @@ def get_matching_regex(string_to_match, regexes):
     return checked_type(string_to_match, regexes, return_regex=True)
 
 
+def find_scheme_name(file_path):
+    """Finds the scheme of a content file by the first SCHEMA_TO_REGEX regexes it matches.
+
+    Args:
+        file_path (str): the path of the file.
+
+    Returns:
+        str. The name of the scheme, None if the file matches no scheme.
+    """
+    file_type = FILE_TYPE_CLASSIFIER.get_file_type(file_path)
+    return file_type.value if file_type and file_type.value in SCHEMA_TO_REGEX else None
+
+
 def get_docker_images(script_obj):
     imgs = [script_obj.get('dockerimage') or DEF_DOCKER]
     alt_imgs = script_obj.get('alt_dockerimages')
@@ -1,12 +1,10 @@
 # !/usr/bin/env python
-import itertools
 import os
 import glob
 import json
 import re
 from collections import OrderedDict
 from multiprocessing import Pool, cpu_count
-from distutils.version import LooseVersion
 import time
 
 from demisto_sdk.commands.common.constants import INTEGRATION_REGEX, INTEGRATION_YML_REGEX, \
@@ -15,8 +13,19 @@ from demisto_sdk.commands.common.constants import INTEGRATION_REGEX, INTEGRATION
     BETA_PLAYBOOK_REGEX, TEST_SCRIPT_REGEX, PACKS_INTEGRATION_YML_REGEX
 from demisto_sdk.commands.common.tools import get_yaml, get_to_version, get_from_version, collect_ids, \
     get_script_or_integration_id, LOG_COLORS, print_color, print_error, print_warning, run_command
+from demisto_sdk.commands.common.file_classifier import get_regex_set
+from demisto_sdk.commands.common.git_changes import GIT_CHANGES, RENAMED, get_change_records
+from demisto_sdk.commands.common.id_set import IdSet, get_entity_id, get_version_range
+from demisto_sdk.commands.common.id_set_cache import IdSetCache
+from demisto_sdk.commands.common.id_set_records import EntityRecord, IntegrationRecord, PlaybookRecord, \
+    ScriptRecord, records_to_id_set
+from demisto_sdk.commands.common.id_set_db import IdSetDB, get_db_path, get_id_set_fingerprint
+from demisto_sdk.commands.common.id_set_dependencies import DependencyIndex
+from demisto_sdk.commands.common.version_index import VersionRangeIndex
 from demisto_sdk.commands.unify.unifier import Unifier
 
+ID_SET_PATH = './Tests/id_set.json'
+
 CHECKED_TYPES_REGEXES = (
     # Integrations
     INTEGRATION_REGEX,
@@ -41,26 +50,26 @@ INTEGRATIONS_PATH_LIST = [
 
 
 def checked_type(file_path, regex_list=CHECKED_TYPES_REGEXES):
-    for regex in regex_list:
-        if re.match(regex, file_path, re.IGNORECASE):
-            return True
-    return False
+    return get_regex_set(regex_list).match(file_path) is not None
+
 
+def get_changed_files(changes):
+    """Gets the added and modified files and script packages, renamed files are modified at their new path.
 
-def get_changed_files(files_string):
-    all_files = files_string.split('\n')
+    Args:
+        changes (iterable): GitChange records of the changed files, or the output of `git diff --name-status`.
+
+    Returns:
+        tuple. (added_files, modified_files, added_scripts, modified_scripts) sets.
+    """
     deleted_files = set([])
     added_files_list = set([])
     added_script_list = set([])
     modified_script_list = set([])
     modified_files_list = set([])
-    for f in all_files:
-        file_data = f.split()
-        if not file_data:
-            continue
-
-        file_status = file_data[0]
-        file_path = file_data[1]
+    for change in get_change_records(changes):
+        file_status = 'm' if change.status == RENAMED else change.status
+        file_path = change.path
 
         if file_status.lower() == 'a' and checked_type(file_path) and not file_path.startswith('.'):
             added_files_list.add(file_path)
@@ -105,7 +114,8 @@ def get_task_ids_from_playbook(param_to_enrich_by, data_dict):
         if enriched_id:
             implementing_ids.add(enriched_id)
 
-    return list(implementing_ids)
+    # sorted so the id_set is identical between runs regardless of the set iteration order
+    return sorted(implementing_ids)
 
 
 def get_commmands_from_playbook(data_dict):
@@ -125,102 +135,74 @@ def get_commmands_from_playbook(data_dict):
     return command_to_integration
 
 
-def get_integration_data(file_path):
-    integration_data = OrderedDict()
+def get_integration_record(file_path):
     data_dictionary = get_yaml(file_path)
-    id = data_dictionary.get('commonfields', {}).get('id', '-')
-    name = data_dictionary.get('name', '-')
-
-    tests = data_dictionary.get('tests')
-    toversion = data_dictionary.get('toversion')
-    fromversion = data_dictionary.get('fromversion')
     commands = data_dictionary.get('script', {}).get('commands', [])
-    cmd_list = [command.get('name') for command in commands]
 
-    integration_data['name'] = name
-    integration_data['file_path'] = file_path
-    if toversion:
-        integration_data['toversion'] = toversion
-    if fromversion:
-        integration_data['fromversion'] = fromversion
-    if cmd_list:
-        integration_data['commands'] = cmd_list
-    if tests:
-        integration_data['tests'] = tests
+    return IntegrationRecord(
+        data_dictionary.get('commonfields', {}).get('id', '-'),
+        name=data_dictionary.get('name', '-'),
+        file_path=file_path,
+        toversion=data_dictionary.get('toversion'),
+        fromversion=data_dictionary.get('fromversion'),
+        commands=[command.get('name') for command in commands],
+        tests=data_dictionary.get('tests'),
+    )
+
 
-    return {id: integration_data}
+def get_integration_data(file_path):
+    return get_integration_record(file_path).to_entity()
 
 
-def get_playbook_data(file_path):
-    playbook_data = OrderedDict()
+def get_playbook_record(file_path):
     data_dictionary = get_yaml(file_path)
-    id = data_dictionary.get('id', '-')
-    name = data_dictionary.get('name', '-')
-
-    tests = data_dictionary.get('tests')
-    toversion = data_dictionary.get('toversion')
-    fromversion = data_dictionary.get('fromversion')
-    implementing_scripts = get_task_ids_from_playbook('scriptName', data_dictionary)
-    implementing_playbooks = get_task_ids_from_playbook('playbookName', data_dictionary)
-    command_to_integration = get_commmands_from_playbook(data_dictionary)
-
-    playbook_data['name'] = name
-    playbook_data['file_path'] = file_path
-    if toversion:
-        playbook_data['toversion'] = toversion
-    if fromversion:
-        playbook_data['fromversion'] = fromversion
-    if implementing_scripts:
-        playbook_data['implementing_scripts'] = implementing_scripts
-    if implementing_playbooks:
-        playbook_data['implementing_playbooks'] = implementing_playbooks
-    if command_to_integration:
-        playbook_data['command_to_integration'] = command_to_integration
-    if tests:
-        playbook_data['tests'] = tests
-
-    return {id: playbook_data}
 
+    return PlaybookRecord(
+        data_dictionary.get('id', '-'),
+        name=data_dictionary.get('name', '-'),
+        file_path=file_path,
+        toversion=data_dictionary.get('toversion'),
+        fromversion=data_dictionary.get('fromversion'),
+        implementing_scripts=get_task_ids_from_playbook('scriptName', data_dictionary),
+        implementing_playbooks=get_task_ids_from_playbook('playbookName', data_dictionary),
+        command_to_integration=get_commmands_from_playbook(data_dictionary),
+        tests=data_dictionary.get('tests'),
+    )
 
-def get_script_data(file_path, script_code=None):
-    script_data = OrderedDict()
+
+def get_playbook_data(file_path):
+    return get_playbook_record(file_path).to_entity()
+
+
+def get_script_record(file_path, script_code=None):
     data_dictionary = get_yaml(file_path)
-    id = data_dictionary.get('commonfields', {}).get('id', '-')
     if script_code is None:
         script_code = data_dictionary.get('script', '')
 
-    name = data_dictionary.get('name', '-')
-
-    tests = data_dictionary.get('tests')
-    toversion = data_dictionary.get('toversion')
-    deprecated = data_dictionary.get('deprecated')
-    fromversion = data_dictionary.get('fromversion')
     depends_on, command_to_integration = get_depends_on(data_dictionary)
     script_executions = sorted(list(set(re.findall(r"demisto.executeCommand\(['\"]([\w-]+)['\"].*", script_code))))
 
-    script_data['name'] = name
-    script_data['file_path'] = file_path
-    if toversion:
-        script_data['toversion'] = toversion
-    if fromversion:
-        script_data['fromversion'] = fromversion
-    if deprecated:
-        script_data['deprecated'] = deprecated
-    if depends_on:
-        script_data['depends_on'] = depends_on
-    if script_executions:
-        script_data['script_executions'] = script_executions
-    if command_to_integration:
-        script_data['command_to_integration'] = command_to_integration
-    if tests:
-        script_data['tests'] = tests
-
-    return {id: script_data}
+    return ScriptRecord(
+        data_dictionary.get('commonfields', {}).get('id', '-'),
+        name=data_dictionary.get('name', '-'),
+        file_path=file_path,
+        toversion=data_dictionary.get('toversion'),
+        fromversion=data_dictionary.get('fromversion'),
+        deprecated=data_dictionary.get('deprecated'),
+        depends_on=depends_on,
+        script_executions=script_executions,
+        command_to_integration=command_to_integration,
+        tests=data_dictionary.get('tests'),
+    )
+
+
+def get_script_data(file_path, script_code=None):
+    return get_script_record(file_path, script_code).to_entity()
 
 
 def get_depends_on(data_dict):
     depends_on = data_dict.get('dependson', {}).get('must', [])
-    depends_on_list = list(set([cmd.split('|')[-1] for cmd in depends_on]))
+    depends_on_list = sorted(set([cmd.split('|')[-1] for cmd in depends_on]))
     command_to_integration = {}
     for cmd in depends_on:
         splitted_cmd = cmd.split('|')
@@ -230,7 +212,16 @@ def get_depends_on(data_dict):
     return depends_on_list, command_to_integration
 
 
-def update_object_in_id_set(obj_id, obj_data, file_path, instances_set):
+def update_object_in_id_set(obj_id, obj_data, file_path, id_set, section):
+    """Updates the id_set entity of a modified file, or adds it if no entity matches its versions.
+
+    Args:
+        obj_id (str): the id of the entity.
+        obj_data (dict): a single key {id: data} entity extracted from the file.
+        file_path (str): the path of the modified file.
+        id_set (IdSet): the id_set to update.
+        section (str): the id_set section of the entity.
+    """
     change_string = run_command("git diff HEAD {0}".format(file_path))
     is_added_from_version = True if re.search(r'\+fromversion: .*', change_string) else False
     is_added_to_version = True if re.search(r'\+toversion: .*', change_string) else False
@@ -238,43 +229,15 @@ def update_object_in_id_set(obj_id, obj_data, file_path, instances_set):
     file_to_version = get_to_version(file_path)
     file_from_version = get_from_version(file_path)
 
-    updated = False
-    for instance in instances_set:
-        instance_id = instance.keys()[0]
-        integration_to_version = instance[instance_id].get('toversion', '99.99.99')
-        integration_from_version = instance[instance_id].get('fromversion', '0.0.0')
+    for instance_data in id_set.get_all(section, obj_id):
+        instance_from_version, instance_to_version = get_version_range(instance_data)
+        if (is_added_from_version or file_from_version == instance_from_version) and \
+                (is_added_to_version or file_to_version == instance_to_version):
+            id_set.upsert(section, obj_data, instance_from_version, instance_to_version)
+            return
 
-        if obj_id == instance_id:
-            if is_added_from_version or (not is_added_from_version and file_from_version == integration_from_version):
-                if is_added_to_version or (not is_added_to_version and file_to_version == integration_to_version):
-                    instance[obj_id] = obj_data[obj_id]
-                    updated = True
-                    break
-
-    if not updated:
-        # in case we didn't found then we need to create one
-        add_new_object_to_id_set(obj_id, obj_data, instances_set)
-
-
-def add_new_object_to_id_set(obj_id: str, obj_data: OrderedDict, instances_set: list):
-    obj_in_set = False
-
-    obj_data_list = list(obj_data.values())
-    dict_value = obj_data_list[0]
-    file_to_version = dict_value.get('toversion', '99.99.99')
-    file_from_version = dict_value.get('fromversion', '0.0.0')
-
-    for instance in instances_set:
-        instance_id = list(instance.keys())[0]
-        integration_to_version = instance[instance_id].get('toversion', '99.99.99')
-        integration_from_version = instance[instance_id].get('fromversion', '0.0.0')
-        if obj_id == instance_id and file_from_version == integration_from_version and \
-                file_to_version == integration_to_version:
-            instance[obj_id] = obj_data[obj_id]
-            obj_in_set = True
-
-    if not obj_in_set:
-        instances_set.append(obj_data)
+    # in case we didn't found then we need to create one
+    id_set.upsert(section, obj_data)
 
 
 def process_integration(file_path):
@@ -285,13 +248,13 @@ def process_integration(file_path):
         file_path {string} -- file path to integration file
 
     Returns:
-        list -- integration data list (may be empty)
+        list -- integration records list (may be empty)
     """
     res = []
     if os.path.isfile(file_path):
         if checked_type(file_path, (INTEGRATION_REGEX, BETA_INTEGRATION_REGEX, PACKS_INTEGRATION_REGEX)):
             print("adding {0} to id_set".format(file_path))
-            res.append(get_integration_data(file_path))
+            res.append(get_integration_record(file_path))
     else:
         # package integration
         package_name = os.path.basename(file_path)
@@ -299,7 +262,7 @@ def process_integration(file_path):
         if os.path.isfile(file_path):
             # locally, might have leftover dirs without committed files
             print("adding {0} to id_set".format(file_path))
-            res.append(get_integration_data(file_path))
+            res.append(get_integration_record(file_path))
     return res
 
 
@@ -308,13 +271,13 @@ def process_script(file_path):
     if os.path.isfile(file_path):
         if checked_type(file_path, (SCRIPT_REGEX, PACKS_SCRIPT_YML_REGEX)):
             print("adding {0} to id_set".format(file_path))
-            res.append(get_script_data(file_path))
+            res.append(get_script_record(file_path))
     else:
         # package script
         unifier = Unifier(file_path)
         yml_path, code = unifier.get_script_package_data()
         print("adding {0} to id_set".format(file_path))
-        res.append(get_script_data(yml_path, script_code=code))
+        res.append(get_script_record(yml_path, script_code=code))
 
     return res
 
@@ -323,7 +286,7 @@ def process_playbook(file_path):
     res = []
     if checked_type(file_path, (PACKS_PLAYBOOK_YML_REGEX, PLAYBOOK_REGEX, BETA_PLAYBOOK_REGEX)):
         print('adding {0} to id_set'.format(file_path))
-        res.append(get_playbook_data(file_path))
+        res.append(get_playbook_record(file_path))
     return res
 
 
@@ -344,9 +307,9 @@ def process_test_playbook_path(file_path):
         yml_data = get_yaml(file_path)
         if 'commonfields' in yml_data:
             # script files contain this key
-            script = get_script_data(file_path)
+            script = get_script_record(file_path)
         else:
-            playbook = get_playbook_data(file_path)
+            playbook = get_playbook_record(file_path)
 
     return playbook, script
 
@@ -397,182 +360,375 @@ def get_test_playbooks_paths():
     return test_playbook_files
 
 
-def re_create_id_set():
-    start_time = time.time()
-    scripts_list = []
-    playbooks_list = []
-    integration_list = []
-    testplaybooks_list = []
+ENTITY_PROCESSORS = OrderedDict([
+    ('integrations', process_integration),
+    ('playbooks', process_playbook),
+    ('scripts', process_script),
+    ('TestPlaybooks', process_test_playbook_path),
+])
+
+
+ENTITY_RECORD_TYPES = {
+    'integrations': IntegrationRecord,
+    'playbooks': PlaybookRecord,
+    'scripts': ScriptRecord,
+}
+
+
+def get_entities_work_items():
+    """Lists the paths of all the content entities, tagged with the kind of processing each one needs.
+
+    Returns:
+        list. (kind, path) tuples, integrations first then playbooks, scripts and test playbooks.
+    """
+    paths_getters = OrderedDict([
+        ('integrations', get_integrations_paths),
+        ('playbooks', get_playbooks_paths),
+        ('scripts', get_scripts_paths),
+        ('TestPlaybooks', get_test_playbooks_paths),
+    ])
+    return [(kind, path) for kind, get_paths in paths_getters.items() for path in get_paths()]
+
+
+def result_to_json(kind, result):
+    """Converts the records a work item was processed to to the id_set layout, to store them in the id_set cache."""
+    if kind == 'TestPlaybooks':
+        return [record.to_entity() if record else None for record in result]
+
+    return [record.to_entity() for record in result]
+
+
+def result_from_json(kind, result):
+    """Converts a result stored in the id_set cache back to records."""
+    if kind == 'TestPlaybooks':
+        playbook, script = result
+        return (PlaybookRecord.from_entity(playbook) if playbook else None,
+                ScriptRecord.from_entity(script) if script else None)
+
+    return [ENTITY_RECORD_TYPES[kind].from_entity(entity) for entity in result]
+
+
+def process_entity(indexed_work_item):
+    """Pool worker - dispatches a single work item to the processing function of its kind.
+
+    Args:
+        indexed_work_item (tuple): (index, kind, path).
+
+    Returns:
+        tuple. (index, result) so the results can be put back in order.
+    """
+    index, kind, path = indexed_work_item
+    return index, ENTITY_PROCESSORS[kind](path)
+
+
+def get_chunksize(items_count, workers):
+    """Small enough chunks to keep all workers busy until the end, big enough to keep the IPC overhead low."""
+    return max(1, min(64, items_count // (workers * 4)))
+
+
+def process_entities(work_items, cache=None, workers=None):
+    """Processes all the work items in a single pool, taking the results of unchanged paths from the cache.
+
+    Args:
+        work_items (list): (kind, path) tuples as returned from `get_entities_work_items`.
+        cache (IdSetCache): the cache to use, None to process all the paths.
+        workers (int): the number of worker processes, defaults to twice the number of CPUs.
+
+    Returns:
+        list. The results of processing each work item, in the order of `work_items`.
+    """
+    results = [None] * len(work_items)  # type: list
+    changed_items = []
+    for index, (kind, path) in enumerate(work_items):
+        cached_result = cache.get(kind, path) if cache else None
+        if cached_result is None:
+            changed_items.append((index, kind, path))
+        else:
+            results[index] = result_from_json(kind, cached_result)
+
+    if not changed_items:
+        return results
 
-    pool = Pool(processes=cpu_count() * 2)
+    workers = min(workers or cpu_count() * 2, len(changed_items))
+    print_color("Processing {} changed content entities with {} workers".format(len(changed_items), workers),
+                LOG_COLORS.GREEN)
+    pool = Pool(processes=workers)
+    try:
+        chunksize = get_chunksize(len(changed_items), workers)
+        for index, result in pool.imap_unordered(process_entity, changed_items, chunksize=chunksize):
+            results[index] = result
+            if cache:
+                kind, path = work_items[index]
+                cache.put(kind, path, result_to_json(kind, result))
+    finally:
+        pool.close()
+        pool.join()
+
+    return results
+
+
+def create_id_set_records(cache=None, workers=None):
+    """Creates the id_set records of the content repo in the current working directory.
+
+    Args:
+        cache (IdSetCache): the cache of previously extracted records, None for a full rebuild.
+        workers (int): the number of worker processes, defaults to twice the number of CPUs.
+
+    Returns:
+        OrderedDict. The id_set sections, each a list of records sorted by id.
+    """
+    sections = ('scripts', 'playbooks', 'integrations', 'TestPlaybooks')
+    id_set_lists = OrderedDict((section, []) for section in sections)  # type: OrderedDict
+
+    work_items = get_entities_work_items()
+    for (kind, _), result in zip(work_items, process_entities(work_items, cache, workers)):
+        if kind == 'TestPlaybooks':
+            # test playbooks directories hold both playbooks and scripts
+            playbook, script = result
+            if playbook:
+                id_set_lists['TestPlaybooks'].append(playbook)
+            if script:
+                id_set_lists['scripts'].append(script)
+        else:
+            id_set_lists[kind].extend(result)
+
+    for section_list in id_set_lists.values():
+        section_list.sort(key=lambda record: record.entity_id.lower())
+
+    return id_set_lists
+
+
+def create_id_set_dict(cache=None, workers=None):
+    """Creates the id_set of the content repo in the current working directory.
+
+    Args:
+        cache (IdSetCache): the cache of previously extracted records, None for a full rebuild.
+        workers (int): the number of worker processes, defaults to twice the number of CPUs.
+
+    Returns:
+        OrderedDict. The id_set sections.
+    """
+    return records_to_id_set(create_id_set_records(cache, workers))
+
+
+def re_create_id_set(id_set_path=ID_SET_PATH, use_cache=True, cache_path=None, workers=None,
+                     use_db=False):
+    """Re-creates the id_set.json file of the content repo in the current working directory.
+
+    Args:
+        id_set_path (str): the path to write the id_set to.
+        use_cache (bool): whether to re-process only the files that changed since the previous run.
+        cache_path (str): the path of the id_set cache file, the cache of the content repo in the user's cache
+            directory if None.
+        workers (int): the number of worker processes, defaults to twice the number of CPUs.
+        use_db (bool): whether to also write the SQLite store of the id_set, it is written anyway if it exists.
+
+    Returns:
+        OrderedDict. The created id_set.
+    """
+    start_time = time.time()
+    cache = IdSetCache(cache_path).load() if use_cache else None
 
     print_color("Starting the creation of the id_set", LOG_COLORS.GREEN)
-    print_color("Starting iterating over Integrations", LOG_COLORS.GREEN)
-    for arr in pool.map(process_integration, get_integrations_paths()):
-        integration_list.extend(arr)
-
-    print_color("Starting iterating over Playbooks", LOG_COLORS.GREEN)
-    for arr in pool.map(process_playbook, get_playbooks_paths()):
-        playbooks_list.extend(arr)
-
-    print_color("Starting iterating over Scripts", LOG_COLORS.GREEN)
-    for arr in pool.map(process_script, get_scripts_paths()):
-        scripts_list.extend(arr)
-
-    print_color("Starting iterating over TestPlaybooks", LOG_COLORS.GREEN)
-    for pair in pool.map(process_test_playbook_path, get_test_playbooks_paths()):
-        if pair[0]:
-            testplaybooks_list.append(pair[0])
-        if pair[1]:
-            scripts_list.append(pair[1])
-
-    new_ids_dict = OrderedDict()
-    # we sort each time the whole set in case someone manually changed something
-    # it shouldn't take too much time
-    new_ids_dict['scripts'] = sort(scripts_list)
-    new_ids_dict['playbooks'] = sort(playbooks_list)
-    new_ids_dict['integrations'] = sort(integration_list)
-    new_ids_dict['TestPlaybooks'] = sort(testplaybooks_list)
-
-    with open('./Tests/id_set.json', 'w') as id_set_file:
-        json.dump(new_ids_dict, id_set_file, indent=4)
+    id_set_records = create_id_set_records(cache, workers)
+    duplicates = find_duplicates(id_set_records)
+    # the records are converted to the id_set layout only to be written
+    new_ids_dict = records_to_id_set(id_set_records)
+    del id_set_records
+
+    IdSet(new_ids_dict).dump(id_set_path)
+    DependencyIndex.build(new_ids_dict).save(id_set_path)
+    db_path = get_db_path(id_set_path)
+    if use_db or os.path.isfile(db_path):
+        IdSetDB(db_path).write(new_ids_dict, get_id_set_fingerprint(id_set_path))
+
+    if cache:
+        cache.save()
+        print_color("Processed {} changed paths, took {} paths from the id_set cache".format(cache.misses, cache.hits),
+                    LOG_COLORS.GREEN)
+
     exec_time = time.time() - start_time
     print_color("Finished the creation of the id_set. Total time: {} seconds".format(exec_time), LOG_COLORS.GREEN)
 
-    duplicates = find_duplicates(new_ids_dict)
     if any(duplicates):
         print_error('The following duplicates were found: {}'.format(duplicates))
 
+    return new_ids_dict
+
+
+def verify_id_set_cache(cache_path=None, workers=None):
+    """Verifies that an id_set built from the cache is identical to a full rebuild.
+
+    Args:
+        cache_path (str): the path of the id_set cache file, the cache of the content repo in the user's cache
+            directory if None.
+        workers (int): the number of worker processes, defaults to twice the number of CPUs.
+
+    Returns:
+        bool. Whether the cached and the full id_set serialize to the exact same json.
+    """
+    cache = IdSetCache(cache_path).load()
+    cached_id_set = json.dumps(create_id_set_dict(cache, workers), indent=4)
+    cache.save()
+    full_id_set = json.dumps(create_id_set_dict(workers=workers), indent=4)
+    if cached_id_set != full_id_set:
+        print_error('The id_set created from the cache {} differs from a full rebuild, '
+                    'run with --no-cache and delete the cache file.'.format(cache.cache_path))
+        return False
+
+    print_color('The id_set created from the cache is identical to a full rebuild', LOG_COLORS.GREEN)
+    return True
+
 
 def find_duplicates(id_set):
-    scripts = id_set['scripts']
-    script_ids = set(list(script.keys())[0] for script in scripts)
+    """Finds the ids that appear more than once with overlapping versions in each id_set section.
 
-    scripts_list = []
-    for script_id in script_ids:
-        if has_duplicate(scripts, script_id):
-            scripts_list.append(script_id)
+    Args:
+        id_set (dict): the id_set sections, lists of {id: data} entities or of records.
 
-    integrations = id_set['integrations']
-    integration_ids = set(list(integration.keys())[0] for integration in integrations)
+    Returns:
+        tuple. The duplicated scripts, integrations, playbooks and test playbooks ids.
+    """
+    duplicates = []
+    for section in ('scripts', 'integrations', 'playbooks', 'TestPlaybooks'):
+        entities_by_id = get_entities_by_id(id_set[section])
+        duplicates.append([entity_id for entity_id, entities in entities_by_id.items()
+                           if len(entities) > 1 and has_version_overlap(entities)])
 
-    integration_list = []
-    for integration_id in integration_ids:
-        if has_duplicate(integrations, integration_id):
-            integration_list.append(integration_id)
+    return tuple(duplicates)
 
-    playbooks = id_set['playbooks']
-    playbook_ids = set(list(playbook.keys())[0] for playbook in playbooks)
 
-    playbooks_list = []
-    for playbook_id in playbook_ids:
-        if has_duplicate(playbooks, playbook_id):
-            integration_list.append(playbook_id)
+def get_entities_by_id(id_set_section):
+    """Indexes an id_set section in a single pass.
 
-    test_playbooks = id_set['TestPlaybooks']
-    test_playbook_ids = set(list(test_playbook.keys())[0] for test_playbook in test_playbooks)
+    Args:
+        id_set_section (list): list of {id: data} dicts or of records.
 
-    test_playbooks_list = []
-    for test_playbook_id in test_playbook_ids:
-        if has_duplicate(test_playbooks, test_playbook_id):
-            test_playbooks_list.append(test_playbook_id)
+    Returns:
+        OrderedDict. Maps each id to the list of data dicts, or records, with that id, in order of appearance.
+    """
+    entities_by_id = OrderedDict()  # type: OrderedDict
+    for entity in id_set_section:
+        if isinstance(entity, EntityRecord):
+            entities_by_id.setdefault(entity.entity_id, []).append(entity)
+            continue
 
-    return scripts_list, integration_list, playbooks_list, test_playbooks_list
+        for entity_id, entity_data in entity.items():
+            entities_by_id.setdefault(entity_id, []).append(entity_data)
 
+    return entities_by_id
 
-def has_duplicate(id_set, id_to_check):
-    duplicates = [duplicate for duplicate in id_set if duplicate.get(id_to_check)]
 
-    if len(duplicates) < 2:
-        return False
+def has_version_overlap(entities, warn_on_names=True):
+    """Checks if any two of the given entities with the same id are active on the same server version.
 
-    for dup1, dup2 in itertools.combinations(duplicates, 2):
-        dict1 = list(dup1.values())[0]
-        dict2 = list(dup2.values())[0]
-        dict1_from_version = LooseVersion(dict1.get('fromversion', '0.0.0'))
-        dict2_from_version = LooseVersion(dict2.get('fromversion', '0.0.0'))
-        dict1_to_version = LooseVersion(dict1.get('toversion', '99.99.99'))
-        dict2_to_version = LooseVersion(dict2.get('toversion', '99.99.99'))
+    Args:
+        entities (list): the data dicts, or records, of entities sharing an id.
+        warn_on_names (bool): whether to warn about entities with the same id and different names.
 
-        if dict1['name'] != dict2['name']:
+    Returns:
+        bool. Whether the version ranges of two of the entities overlap.
+    """
+    names = set()
+    version_index = VersionRangeIndex()
+    for entity in entities:
+        if warn_on_names and entity['name'] != entities[0]['name'] and entity['name'] not in names:
             print_warning('The following objects has the same ID but different names: '
-                          '"{}", "{}".'.format(dict1['name'], dict2['name']))
+                          '"{}", "{}".'.format(entities[0]['name'], entity['name']))
+        names.add(entity['name'])
+        version_index.add(None, *get_version_range(entity))
 
-        # A: 3.0.0 - 3.6.0
-        # B: 3.5.0 - 4.5.0
-        # C: 3.5.2 - 3.5.4
-        # D: 4.5.0 - 99.99.99
-        if any([
-            dict1_from_version <= dict2_from_version < dict1_to_version,  # will catch (B, C), (A, B), (A, C)
-            dict1_from_version < dict2_to_version <= dict1_to_version,  # will catch (B, C), (A, C)
-            dict2_from_version <= dict1_from_version < dict2_to_version,  # will catch (C, B), (B, A), (C, A)
-            dict2_from_version < dict1_to_version <= dict2_to_version,  # will catch (C, B), (C, A)
-        ]):
-            return True
+    return version_index.has_overlaps(None)
 
-    return False
+
+def has_duplicate(id_set, id_to_check):
+    duplicates = [duplicate[id_to_check] for duplicate in id_set if duplicate.get(id_to_check)]
+
+    if len(duplicates) < 2:
+        return False
+
+    return has_version_overlap(duplicates)
 
 
 def sort(data):
-    data.sort(key=lambda r: list(r.keys())[0].lower())  # Sort data by key value
+    data.sort(key=lambda r: get_entity_id(r).lower())  # Sort data by key value
     return data
 
 
+def update_id_set_db(id_set, id_set_path, loaded_fingerprint):
+    """Applies the changes made to the id_set to its SQLite store, if there is one, in a single transaction.
+
+    The changes are applied only if the store matches the id_set.json the id_set was loaded from, otherwise the store
+    is re-written from the id_set.
+
+    Args:
+        id_set (IdSet): the updated id_set, already written to id_set_path.
+        id_set_path (str): the path of the id_set.json file.
+        loaded_fingerprint (str): the fingerprint of the id_set.json file the id_set was loaded from.
+    """
+    db_path = get_db_path(id_set_path)
+    if not os.path.isfile(db_path):
+        return
+
+    id_set_fingerprint = get_id_set_fingerprint(id_set_path)
+    with IdSetDB(db_path) as id_set_db:
+        try:
+            if loaded_fingerprint is not None and id_set_db.get_fingerprint() == loaded_fingerprint:
+                id_set_db.apply(id_set.changes, id_set_fingerprint)
+                return
+        except ValueError:
+            # an outdated store is re-created
+            pass
+
+        # id_set.json was changed outside of the update, e.g. checked out from master, or the store is outdated
+        id_set_db.write(id_set, id_set_fingerprint)
+
+
 def update_id_set():
     branches = run_command("git branch")
     branch_name_reg = re.search(r"\* (.*)", branches)
     branch_name = branch_name_reg.group(1)
 
     print("Getting added files")
-    files_string = run_command("git diff --name-status HEAD")
-    second_files_string = run_command("git diff --name-status origin/master...{}".format(branch_name))
-    added_files, modified_files, added_scripts, modified_scripts = \
-        get_changed_files(files_string + '\n' + second_files_string)
+    added_files, modified_files, added_scripts, modified_scripts = get_changed_files(
+        GIT_CHANGES.get_changes('HEAD') + GIT_CHANGES.get_changes('origin/master...{}'.format(branch_name)))
 
     if added_files or modified_files or added_scripts or modified_scripts:
         print("Updating id_set.json")
 
-        with open('./Tests/id_set.json', 'r') as id_set_file:
-            try:
-                ids_dict = json.load(id_set_file, object_pairs_hook=OrderedDict)
-            except ValueError as ex:
-                if "Expecting property name" in str(ex):
-                    # if we got this error it means we have corrupted id_set.json
-                    # usually it will happen if we merged from master and we had a conflict in id_set.json
-                    # so we checkout the id_set.json to be exact as in master and then run update_id_set
-                    run_command("git checkout origin/master Tests/id_set.json")
-                    with open('./Tests/id_set.json', 'r') as id_set_file_from_master:
-                        ids_dict = json.load(id_set_file_from_master, object_pairs_hook=OrderedDict)
-                else:
-                    raise
-
-        test_playbook_set = ids_dict['TestPlaybooks']
-        integration_set = ids_dict['integrations']
-        playbook_set = ids_dict['playbooks']
-        script_set = ids_dict['scripts']
+        try:
+            id_set = IdSet.load(ID_SET_PATH)
+        except ValueError as ex:
+            if "Expecting property name" in str(ex):
+                # if we got this error it means we have corrupted id_set.json
+                # usually it will happen if we merged from master and we had a conflict in id_set.json
+                # so we checkout the id_set.json to be exact as in master and then run update_id_set
+                run_command("git checkout origin/master Tests/id_set.json")
+                id_set = IdSet.load(ID_SET_PATH)
+            else:
+                raise
+
+        # the SQLite store gets only the changes of this update if it matches the loaded id_set.json
+        loaded_fingerprint = get_id_set_fingerprint(ID_SET_PATH) if os.path.isfile(get_db_path(ID_SET_PATH)) \
+            else None
 
     if added_files:
         for file_path in added_files:
             if re.match(INTEGRATION_REGEX, file_path, re.IGNORECASE) or \
                     re.match(INTEGRATION_YML_REGEX, file_path, re.IGNORECASE):
-                add_new_object_to_id_set(get_script_or_integration_id(file_path), get_integration_data(file_path),
-                                         integration_set)
+                id_set.upsert('integrations', get_integration_data(file_path))
                 print("Adding {0} to id_set".format(get_script_or_integration_id(file_path)))
             if re.match(SCRIPT_REGEX, file_path, re.IGNORECASE):
-                add_new_object_to_id_set(get_script_or_integration_id(file_path), get_script_data(file_path),
-                                         script_set)
+                id_set.upsert('scripts', get_script_data(file_path))
                 print("Adding {0} to id_set".format(get_script_or_integration_id(file_path)))
             if re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                add_new_object_to_id_set(collect_ids(file_path), get_playbook_data(file_path),
-                                         playbook_set)
+                id_set.upsert('playbooks', get_playbook_data(file_path))
                 print("Adding {0} to id_set".format(collect_ids(file_path)))
             if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                add_new_object_to_id_set(collect_ids(file_path), get_playbook_data(file_path),
-                                         test_playbook_set)
+                id_set.upsert('TestPlaybooks', get_playbook_data(file_path))
                 print("Adding {0} to id_set".format(collect_ids(file_path)))
             if re.match(TEST_SCRIPT_REGEX, file_path, re.IGNORECASE):
-                add_new_object_to_id_set(get_script_or_integration_id(file_path), get_script_data(file_path),
-                                         script_set)
+                id_set.upsert('scripts', get_script_data(file_path))
                 print("Adding {0} to id_set".format(collect_ids(file_path)))
 
     if modified_files:
@@ -581,31 +737,30 @@ def update_id_set():
                     re.match(INTEGRATION_YML_REGEX, file_path, re.IGNORECASE):
                 id = get_script_or_integration_id(file_path)
                 integration_data = get_integration_data(file_path)
-                update_object_in_id_set(id, integration_data, file_path, integration_set)
+                update_object_in_id_set(id, integration_data, file_path, id_set, 'integrations')
                 print("updated {0} in id_set".format(id))
             if re.match(SCRIPT_REGEX, file_path, re.IGNORECASE) or re.match(TEST_SCRIPT_REGEX,
                                                                             file_path, re.IGNORECASE):
                 id = get_script_or_integration_id(file_path)
                 script_data = get_script_data(file_path)
-                update_object_in_id_set(id, script_data, file_path, script_set)
+                update_object_in_id_set(id, script_data, file_path, id_set, 'scripts')
                 print("updated {0} in id_set".format(id))
             if re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE):
                 id = collect_ids(file_path)
                 playbook_data = get_playbook_data(file_path)
-                update_object_in_id_set(id, playbook_data, file_path, playbook_set)
+                update_object_in_id_set(id, playbook_data, file_path, id_set, 'playbooks')
                 print("updated {0} in id_set".format(id))
             if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
                 id = collect_ids(file_path)
                 playbook_data = get_playbook_data(file_path)
-                update_object_in_id_set(id, playbook_data, file_path, test_playbook_set)
+                update_object_in_id_set(id, playbook_data, file_path, id_set, 'TestPlaybooks')
                 print("updated {0} in id_set".format(id))
 
     if added_scripts:
         for added_script_package in added_scripts:
             unifier = Unifier(added_script_package)
             yml_path, code = unifier.get_script_package_data()
-            add_new_object_to_id_set(get_script_or_integration_id(yml_path),
-                                     get_script_data(yml_path, script_code=code), script_set)
+            id_set.upsert('scripts', get_script_data(yml_path, script_code=code))
             print("Adding {0} to id_set".format(get_script_or_integration_id(yml_path)))
 
     if modified_scripts:
@@ -613,19 +768,17 @@ def update_id_set():
             unifier = Unifier(modified_script_package)
             yml_path, code = unifier.get_script_package_data()
             update_object_in_id_set(get_script_or_integration_id(yml_path),
-                                    get_script_data(yml_path, script_code=code), yml_path, script_set)
+                                    get_script_data(yml_path, script_code=code), yml_path, id_set, 'scripts')
             print("Adding {0} to id_set".format(get_script_or_integration_id(yml_path)))
 
-    if added_files or modified_files:
-        new_ids_dict = OrderedDict()
-        # we sort each time the whole set in case someone manually changed something
-        # it shouldn't take too much time
-        new_ids_dict['scripts'] = sort(script_set)
-        new_ids_dict['playbooks'] = sort(playbook_set)
-        new_ids_dict['integrations'] = sort(integration_set)
-        new_ids_dict['TestPlaybooks'] = sort(test_playbook_set)
-
-        with open('./Tests/id_set.json', 'w') as id_set_file:
-            json.dump(new_ids_dict, id_set_file, indent=4)
+    if added_files or modified_files or added_scripts or modified_scripts:
+        # new entities are inserted in their sorted position, this only sorts sections someone changed manually
+        id_set.sort()
+        if id_set.modified:
+            id_set.dump(ID_SET_PATH)
+            DependencyIndex.build(id_set).save(ID_SET_PATH)
+            update_id_set_db(id_set, ID_SET_PATH, loaded_fingerprint)
+        else:
+            print("id_set.json is up to date")
 
     print("Finished updating id_set.json")
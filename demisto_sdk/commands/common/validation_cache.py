@@ -0,0 +1,292 @@
+"""Persistent cache of the results of validating content files, shared between runs of validate.
+
+Pre-commit hooks and CI builds validate the same unchanged files again and again. After a file is validated, its result
+- whether it is valid and what the validation printed - is kept in the cache directory, keyed by a sha1 of everything
+the result depends on:
+
+* the content of the file, of its changelog and, for files of a package, of the other files in the package directory.
+* the old versions of the file and of its changelog, which the backward compatibility checks compare to.
+* the schema of the file.
+* the validators - the version of the SDK and the sources of its validators, the kind of validation (of a modified or an
+  added file) and its options.
+
+A file that passed with the same key is skipped, its output is printed again. Files that failed are validated again,
+so their errors are always current. Some validators check things outside of the content repo, like the latest tag of
+a docker image, so entries expire after DEFAULT_MAX_AGE seconds.
+
+Entries are pickles, the cache directory is created readable by its owner only and should not be shared.
+"""
+import glob
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from pkg_resources import DistributionNotFound, get_distribution
+
+from demisto_sdk.commands.common.git_file_provider import LOCAL_GIT_FILE_PROVIDER
+from demisto_sdk.commands.common.constants import PACKAGE_SUPPORTING_DIRECTORIES
+from demisto_sdk.commands.common.tools import find_scheme_name, get_release_notes_file_path, get_remote_file_content
+
+VALIDATION_CACHE_DIR_ENV = 'DEMISTO_SDK_VALIDATION_CACHE_DIR'
+# bump when the cache entries or keys change, older entries are ignored
+VALIDATION_CACHE_VERSION = 1
+DEFAULT_MAX_AGE = 24 * 60 * 60
+ENTRY_SUFFIX = '.pickle'
+SCHEMAS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schemas')
+VALIDATOR_SOURCE_PATTERNS = (
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hook_validations', '*.py'),
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'validate', '*.py'),
+)
+# ReleaseNotesValidator compares the changelog to origin/master in the local repository
+RELEASE_NOTES_TAG = 'origin/master'
+
+
+def get_default_cache_dir():
+    """Returns the directory of the results, $DEMISTO_SDK_VALIDATION_CACHE_DIR or ~/.cache/demisto-sdk/validation."""
+    if os.environ.get(VALIDATION_CACHE_DIR_ENV):
+        return os.path.expanduser(os.environ[VALIDATION_CACHE_DIR_ENV])
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'demisto-sdk', 'validation')
+
+
+@lru_cache()
+def get_validators_key():
+    """Returns a sha1 of the version of the SDK and the sources of its validators.
+
+    A development install keeps its version while the validators change, so the sources are a part of the key too.
+    """
+    try:
+        version = get_distribution('demisto-sdk').version
+    except DistributionNotFound:
+        version = 'unknown'
+
+    key_hash = hashlib.sha1('{}:{}\0'.format(version, VALIDATION_CACHE_VERSION).encode('utf-8'))
+    for pattern in VALIDATOR_SOURCE_PATTERNS:
+        for source_path in sorted(glob.glob(pattern)):
+            key_hash.update(os.path.basename(source_path).encode('utf-8') + b'\0')
+            with open(source_path, 'rb') as source_file:
+                key_hash.update(source_file.read())
+
+    return key_hash.hexdigest()
+
+
+def get_schema_path(file_path):
+    """Returns the path of the schema of a content file, None if it has no schema."""
+    scheme_name = find_scheme_name(file_path)
+    return os.path.join(SCHEMAS_DIR, '{}.yml'.format(scheme_name)) if scheme_name else None
+
+
+def get_dependency_paths(file_path):
+    """Returns the paths of the files a validation of a content file reads - the file, its changelog and package.
+
+    Args:
+        file_path (str): the path of the file.
+
+    Returns:
+        list. The sorted paths, including ones that don't exist.
+    """
+    paths = {file_path, get_release_notes_file_path(file_path)}
+    package_dir = os.path.dirname(file_path)
+    # the image, description and code of a package are validated with its yml
+    if os.path.basename(os.path.dirname(package_dir)) in PACKAGE_SUPPORTING_DIRECTORIES and os.path.isdir(package_dir):
+        paths.update(entry.path for entry in os.scandir(package_dir) if entry.is_file())
+
+    return sorted(paths)
+
+
+def update_with_file(key_hash, file_path):
+    """Updates a hash with the path and content of a file, a missing file is hashed as missing."""
+    key_hash.update(file_path.encode('utf-8') + b'\0')
+    try:
+        with open(file_path, 'rb') as file_obj:
+            content = file_obj.read()
+        key_hash.update(b'%d\0' % len(content))
+        key_hash.update(content)
+    except (FileNotFoundError, IsADirectoryError):
+        key_hash.update(b'missing\0')
+
+
+def update_with_old_file(key_hash, file_path, tag, local_only=False):
+    """Updates a hash with the content of a file as it is in a branch or tag.
+
+    Args:
+        key_hash (hashlib.sha1): the hash to update.
+        file_path (str): the path of the file.
+        tag (str): the branch or tag of the old version.
+        local_only (bool): whether to read the file from the local git repository only, without downloading it.
+    """
+    key_hash.update('{}\0{}\0'.format(tag, file_path).encode('utf-8'))
+    try:
+        if local_only:
+            content = LOCAL_GIT_FILE_PROVIDER.get_file_content(file_path, tag)
+        else:
+            content = get_remote_file_content(file_path, tag)
+    except Exception:
+        # the validation doesn't get the old file either
+        content = None
+
+    if content is None:
+        key_hash.update(b'missing\0')
+    else:
+        key_hash.update(b'%d\0' % len(content))
+        key_hash.update(content)
+
+
+class ValidationResultCache:
+    """ValidationResultCache keeps the results of validating content files on disk.
+
+    Attributes:
+        cache_dir (str): the directory of the cache entries.
+        max_age (int): the seconds an entry is used for.
+        hits (int): the number of files that were skipped, since they passed before.
+        misses (int): the number of files that were validated.
+        writes (int): the number of entries written in this process.
+    """
+
+    def __init__(self, cache_dir=None, max_age=DEFAULT_MAX_AGE):
+        self.cache_dir = cache_dir or get_default_cache_dir()
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self._pruned = False
+
+    def get_key(self, file_path, validation, old_file_path=None, tag=None):
+        """Returns the key of the result of a validation of a file.
+
+        Args:
+            file_path (str): the path of the file.
+            validation (str): the kind and options of the validation.
+            old_file_path (str): the path of the file in the compared branch, if it was renamed.
+            tag (str): the branch or tag the file is compared to, None if it is a new file.
+
+        Returns:
+            str. The key, None if the file can't be read.
+        """
+        key_hash = hashlib.sha1('{}\0{}\0'.format(get_validators_key(), validation).encode('utf-8'))
+        try:
+            for dependency_path in get_dependency_paths(file_path):
+                update_with_file(key_hash, dependency_path)
+
+            schema_path = get_schema_path(file_path)
+            if schema_path:
+                update_with_file(key_hash, schema_path)
+        except OSError:
+            return None
+
+        if tag is not None:
+            update_with_old_file(key_hash, old_file_path or file_path, tag)
+            update_with_old_file(key_hash, get_release_notes_file_path(old_file_path or file_path),
+                                 RELEASE_NOTES_TAG, local_only=True)
+
+        return key_hash.hexdigest()
+
+    def get_entry_path(self, key):
+        return os.path.join(self.cache_dir, key + ENTRY_SUFFIX)
+
+    def get(self, key):
+        """Gets the result of a validation.
+
+        Args:
+            key (str): the key of the validation, from get_key.
+
+        Returns:
+            tuple. (is_valid, output) of the validation, None if it isn't cached or expired.
+        """
+        result = self._read(self.get_entry_path(key))
+        if result is not None and result[0]:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        return result
+
+    def _read(self, entry_path):
+        try:
+            if time.time() - os.stat(entry_path).st_mtime > self.max_age:
+                return None
+
+            with open(entry_path, 'rb') as entry_file:
+                entry = pickle.load(entry_file)
+            return entry['is_valid'], entry['output']
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError, KeyError, TypeError, AttributeError, ImportError):
+            # a truncated entry is validated again and rewritten
+            return None
+
+    def set(self, key, is_valid, output):
+        """Caches the result of a validation, a read only or full disk leaves it uncached.
+
+        Args:
+            key (str): the key of the validation, from get_key.
+            is_valid (bool): whether the file is valid.
+            output (list): what the validation printed, recorded by OutputRecorder.
+        """
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            if not self._pruned:
+                self._pruned = True
+                self.prune()
+
+            # write to a temporary file and rename it, so concurrent runs never read a partial entry
+            file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(file_descriptor, 'wb') as temp_file:
+                    pickle.dump({'is_valid': is_valid, 'output': output}, temp_file, pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self.get_entry_path(key))
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError:
+            return
+
+        self.writes += 1
+
+    def _scan(self):
+        """Iterates over the (path, mtime) of the entries."""
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(ENTRY_SUFFIX):
+                try:
+                    yield entry.path, entry.stat().st_mtime
+                except OSError:
+                    continue
+
+    def prune(self):
+        """Deletes the expired entries, returns the number of deleted entries."""
+        deleted = 0
+        now = time.time()
+        for entry_path, entry_mtime in list(self._scan()):
+            if now - entry_mtime > self.max_age:
+                try:
+                    os.remove(entry_path)
+                    deleted += 1
+                except OSError:
+                    pass
+
+        return deleted
+
+    def clear(self):
+        """Deletes all the entries, returns the number of deleted entries."""
+        deleted = 0
+        for entry_path, _ in list(self._scan()):
+            try:
+                os.remove(entry_path)
+                deleted += 1
+            except OSError:
+                pass
+
+        return deleted
+
+    def get_stats(self):
+        """Returns the entries of the cache directory and the counters of this process."""
+        return OrderedDict([('cache_dir', self.cache_dir), ('entries', len(list(self._scan()))), ('hits', self.hits),
+                            ('misses', self.misses), ('writes', self.writes)])
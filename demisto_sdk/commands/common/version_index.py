@@ -0,0 +1,158 @@
+"""Index of the server version ranges of content entities.
+
+Entities with the same id may exist in several versions, each supported on a range of server versions between its
+fromversion and toversion. VersionRangeIndex parses the versions once and keeps the ranges of every key sorted by
+fromversion together with the running maximum of the toversions. A query bisects to the last range starting before the
+queried versions and walks back only while a range can still reach them, so it costs O(log n) plus the matches.
+"""
+import itertools
+from bisect import bisect_right
+
+from demisto_sdk.commands.common.tools import version_to_tuple
+
+
+def is_version_overlap(first_range, second_range):
+    """Checks if two (fromversion, toversion) ranges of parsed versions overlap.
+
+    # A: 3.0.0 - 3.6.0
+    # B: 3.5.0 - 4.5.0
+    # C: 3.5.2 - 3.5.4
+    # D: 4.5.0 - 99.99.99
+    """
+    first_from, first_to = first_range
+    second_from, second_to = second_range
+    return any([
+        first_from <= second_from < first_to,  # will catch (B, C), (A, B), (A, C)
+        first_from < second_to <= first_to,  # will catch (B, C), (A, C)
+        second_from <= first_from < second_to,  # will catch (C, B), (B, A), (C, A)
+        second_from < first_to <= second_to,  # will catch (C, B), (C, A)
+    ])
+
+
+class VersionRangeIndex:
+    """VersionRangeIndex maps keys, usually entity ids, to the version ranges they are supported on."""
+
+    def __init__(self):
+        self._ranges = {}  # type: dict
+        self._sorted = {}  # type: dict
+
+    def add(self, key, fromversion, toversion, payload=None):
+        """Adds a version range.
+
+        Args:
+            key (str): the key of the range, e.g. the entity id.
+            fromversion (str): the first server version of the range.
+            toversion (str): the last server version of the range.
+            payload (object): the value queries return for the range, e.g. the entity data.
+        """
+        self._ranges.setdefault(key, []).append((version_to_tuple(fromversion), version_to_tuple(toversion), payload))
+        self._sorted.pop(key, None)
+
+    def keys(self):
+        return self._ranges.keys()
+
+    def count(self, key):
+        return len(self._ranges.get(key, []))
+
+    def _get_sorted(self, key):
+        """Returns the ranges of a key sorted by fromversion, their fromversions and the running max toversion."""
+        if key not in self._sorted:
+            ranges = sorted(self._ranges.get(key, []), key=lambda version_range: version_range[:2])
+            from_versions = [from_version for from_version, _, _ in ranges]
+            max_to_versions = list(itertools.accumulate((to_version for _, to_version, _ in ranges), max))
+            is_inverted = any(from_version > to_version for from_version, to_version, _ in ranges)
+            self._sorted[key] = (ranges, from_versions, max_to_versions, is_inverted)
+
+        return self._sorted[key]
+
+    def _get_intersecting(self, key, from_version, to_version):
+        """Returns the ranges of a key that share at least one version with [from_version, to_version]."""
+        ranges, from_versions, max_to_versions, is_inverted = self._get_sorted(key)
+        if is_inverted:
+            # the running max doesn't bound ranges that end before they start
+            return [version_range for version_range in ranges
+                    if version_range[0] <= to_version and version_range[1] >= from_version]
+
+        intersecting = []
+        index = bisect_right(from_versions, to_version) - 1
+        while index >= 0 and max_to_versions[index] >= from_version:
+            if ranges[index][1] >= from_version:
+                intersecting.append(ranges[index])
+            index -= 1
+
+        intersecting.reverse()
+        return intersecting
+
+    def get_active(self, key, version):
+        """Gets the payloads of the ranges of a key that include a server version.
+
+        Args:
+            key (str): the key of the ranges.
+            version (str): the server version, e.g. 5.0.0
+
+        Returns:
+            list. The payloads of the ranges with fromversion <= version <= toversion, sorted by fromversion.
+        """
+        parsed_version = version_to_tuple(version)
+        return [payload for _, _, payload in self._get_intersecting(key, parsed_version, parsed_version)]
+
+    def get_overlapping(self, key, fromversion, toversion):
+        """Gets the payloads of the ranges of a key that overlap a version range.
+
+        Args:
+            key (str): the key of the ranges.
+            fromversion (str): the first server version of the range.
+            toversion (str): the last server version of the range.
+
+        Returns:
+            list. The payloads of the overlapping ranges, sorted by fromversion.
+        """
+        version_range = (version_to_tuple(fromversion), version_to_tuple(toversion))
+        ranges, _, _, is_inverted = self._get_sorted(key)
+        if is_inverted or version_range[0] > version_range[1]:
+            candidates = ranges
+        else:
+            # ranges that overlap always share a version, so only intersecting ranges are candidates
+            candidates = self._get_intersecting(key, *version_range)
+
+        return [payload for from_version, to_version, payload in candidates
+                if is_version_overlap(version_range, (from_version, to_version))]
+
+    def has_overlaps(self, key):
+        """Checks if any two ranges of a key overlap.
+
+        The ranges are swept in fromversion order. A range overlaps an earlier one if it starts before the furthest
+        toversion seen. A range of a single version (fromversion == toversion) overlaps ranges that include it, but
+        not other single versions.
+
+        Args:
+            key (str): the key of the ranges.
+
+        Returns:
+            bool. Whether two of the ranges overlap.
+        """
+        ranges, _, _, is_inverted = self._get_sorted(key)
+        if is_inverted:
+            return any(is_version_overlap(first_range[:2], second_range[:2])
+                       for first_range, second_range in itertools.combinations(ranges, 2))
+
+        max_to_version = None
+        last_single_version = None
+        for from_version, to_version, _ in ranges:
+            if from_version == to_version:
+                if max_to_version is not None and from_version <= max_to_version:
+                    return True
+
+                last_single_version = from_version
+                continue
+
+            if max_to_version is not None and from_version < max_to_version:
+                return True
+
+            # single versions sort before the ranges starting on them
+            if from_version == last_single_version:
+                return True
+
+            max_to_version = to_version if max_to_version is None else max(max_to_version, to_version)
+
+        return False
@@ -0,0 +1,57 @@
+"""YAML loading of the SDK.
+
+PyYAML parses several times faster with the libyaml C parser, when it was built with it. The loaders here use the C
+parser when it is available and the pure Python one otherwise - the constructors are the same Python code in both, so
+the loaded data is the same.
+
+Files that have to be written back as they were read (the unifier, the yml splitter, the test playbook generator) keep
+using the ruamel round-trip loader. Dumping keeps using the pure Python emitter, libyaml wraps long strings differently
+and the files the SDK writes would change.
+"""
+import yaml
+import yamlordereddictloader
+
+try:
+    from yaml import CSafeLoader as BaseSafeLoader
+    IS_LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader as BaseSafeLoader  # type: ignore
+    IS_LIBYAML_AVAILABLE = False
+
+
+class SafeLoader(BaseSafeLoader):  # type: ignore
+    """Loads standard YAML tags only, like yaml.SafeLoader."""
+
+
+class OrderedSafeLoader(BaseSafeLoader):  # type: ignore
+    """Loads standard YAML tags only, mappings are loaded to OrderedDicts, like yamlordereddictloader.SafeLoader."""
+    construct_yaml_map = yamlordereddictloader.construct_yaml_map
+    construct_mapping = yamlordereddictloader.construct_mapping
+
+
+OrderedSafeLoader.add_constructor('tag:yaml.org,2002:map', OrderedSafeLoader.construct_yaml_map)
+OrderedSafeLoader.add_constructor('tag:yaml.org,2002:omap', OrderedSafeLoader.construct_yaml_map)
+
+
+def safe_load(stream):
+    """Parses a YAML document.
+
+    Args:
+        stream (str|bytes|file): the YAML document.
+
+    Returns:
+        object. The parsed document, mappings are dicts.
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def ordered_load(stream):
+    """Parses a YAML document keeping the order of the mappings.
+
+    Args:
+        stream (str|bytes|file): the YAML document.
+
+    Returns:
+        object. The parsed document, mappings are OrderedDicts.
+    """
+    return yaml.load(stream, Loader=OrderedSafeLoader)
@@ -6,10 +6,9 @@ import json
 import shutil
 import zipfile
 from typing import List
-import yaml
-import yamlordereddictloader
 
 from demisto_sdk.commands.unify.unifier import Unifier
+from demisto_sdk.commands.common import yaml_io
 from demisto_sdk.commands.common.tools import get_child_directories, get_child_files, print_warning, \
     get_yml_paths_in_dir, print_error
 from demisto_sdk.commands.common.git_tools import get_current_working_branch
@@ -149,7 +148,7 @@ class ContentCreator:
             if parent_dir_name != SCRIPTS_DIR:
                 script_obj = yml_info['script']
             with io.open(path, mode='r', encoding='utf-8') as file_:
-                yml_data = yaml.load(file_, Loader=yamlordereddictloader.SafeLoader)
+                yml_data = yaml_io.ordered_load(file_)
             unifier = Unifier(os.path.dirname(path), parent_dir_name, out_path)
             out_map = unifier.write_yaml_with_docker(yml_data, yml_info, script_obj)
             if len(out_map.keys()) > 1:
@@ -175,7 +174,7 @@ class ContentCreator:
                 self.long_file_names.append(path)
 
             with open(path, 'r') as file_:
-                yml_info = yaml.safe_load(file_)
+                yml_info = yaml_io.safe_load(file_)
 
             ver = yml_info.get('fromversion', '0')
             print(f' - processing: {ver} ({path})')
@@ -3,6 +3,7 @@ import sys
 import yaml
 import yamlordereddictloader
 
+from demisto_sdk.commands.common import yaml_io
 from demisto_sdk.commands.common.tools import print_color, LOG_COLORS
 from demisto_sdk.commands.common.hook_validations.structure import StructureValidator
 
@@ -67,7 +68,7 @@ class BaseUpdateYML:
         print(F'Reading YML data')
 
         with open(self.source_file) as f:
-            return yaml.load(f, Loader=yamlordereddictloader.SafeLoader)
+            return yaml_io.ordered_load(f)
 
     def get_id_and_version_path_object(self):
         """Gets the dict that holds the id and version fields.
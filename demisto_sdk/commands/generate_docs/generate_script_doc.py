@@ -1,7 +1,7 @@
 import os
 from demisto_sdk.commands.common.update_id_set import get_depends_on
-from demisto_sdk.commands.common.tools import get_yaml, print_warning, print_error,\
-    get_from_version, get_json
+from demisto_sdk.commands.common.id_set_dependencies import DependencyIndex
+from demisto_sdk.commands.common.tools import get_yaml, print_warning, print_error, get_from_version
 from demisto_sdk.commands.generate_docs.common import save_output, generate_table_section, stringEscapeMD,\
     generate_list_section, build_example_dict
 
@@ -172,22 +172,10 @@ def get_used_in(id_set_path, script_id):
     :param script_id: the script id.
     :return: list of integrations, scripts and playbooks that used the input script
     """
-    id_set = get_json(id_set_path)
-    used_in_list = set()
-
-    id_set_sections = list(id_set.keys())
-    id_set_sections.remove('TestPlaybooks')
-
-    for key in id_set_sections:
-        items = id_set[key]
-        for item in items:
-            key = list(item.keys())[0]
-            scripts = item[key].get('implementing_scripts', [])
-            if scripts and script_id in scripts:
-                used_in_list.add(item[key].get('name', []))
-    used_in_list = list(used_in_list)
-    used_in_list.sort()
-    return used_in_list
+    # only the entities that run the script as a task, not the ones that depend on it or execute it
+    users = DependencyIndex.for_id_set(id_set_path).get_used_by(
+        script_id, sections=('scripts', 'playbooks', 'integrations'), fields=('implementing_scripts',))
+    return sorted(set(user['name'] for user in users))
 
 
 def generate_script_example(script_name, example=None):
@@ -6,6 +6,7 @@ import json
 from datetime import datetime
 from typing import Dict
 from distutils.dir_util import copy_tree
+from demisto_sdk.commands.common import yaml_io
 from demisto_sdk.commands.common.tools import print_error, print_color, LOG_COLORS
 from demisto_sdk.commands.common.constants import INTEGRATIONS_DIR, SCRIPTS_DIR, INCIDENT_FIELDS_DIR, \
     INCIDENT_TYPES_DIR, INDICATOR_FIELDS_DIR, PLAYBOOKS_DIR, LAYOUTS_DIR, TEST_PLAYBOOKS_DIR, CLASSIFIERS_DIR, \
@@ -369,7 +370,7 @@ class Initiator:
             Dict. Data from YML.
         """
         with open(file_path) as f:
-            return yaml.load(f, Loader=yamlordereddictloader.SafeLoader)
+            return yaml_io.ordered_load(f)
 
     def fix_test_file_import(self, name_to_change: str):
         """Fixes the import statement in the _test.py file in the newly created initegration/script
@@ -6,7 +6,9 @@ from typing import Tuple, List
 from demisto_sdk.commands.lint.linter import Linter
 from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.constants import PACKS_DIR, INTEGRATIONS_DIR, SCRIPTS_DIR, BETA_INTEGRATIONS_DIR
-from demisto_sdk.commands.common.tools import get_dev_requirements, print_color, LOG_COLORS, run_command
+from demisto_sdk.commands.common.git_changes import GIT_CHANGES
+from demisto_sdk.commands.common.git_file_provider import LOCAL_GIT_FILE_PROVIDER
+from demisto_sdk.commands.common.tools import get_dev_requirements, print_color, LOG_COLORS
 
 
 LOCK = threading.Lock()
@@ -181,7 +183,7 @@ class LintManager:
         print("Filtering out directories that did not change")
         pkgs_to_run = []
 
-        current_branch = run_command(f"git rev-parse --abbrev-ref HEAD")
+        current_branch = GIT_CHANGES.get_current_branch()
         print(f'current_branch = {current_branch}')
 
         if os.environ.get('CIRCLE_COMPARE_URL'):
@@ -205,22 +207,26 @@ class LintManager:
 
         # This will check if there are any changes between current master version and the last commit in master
         if os.environ.get('CIRCLE_COMPARE_URL') and current_branch == "master":
-            changes_from_last_commit_vs_master = run_command("git diff --name-only HEAD..HEAD^")
+            changes_from_last_commit_vs_master = GIT_CHANGES.get_changes('HEAD..HEAD^')
         else:
             # This will return a list of all files that changed up until the last commit (not including any changes
             # which were made but not yet committed).
-            changes_from_last_commit_vs_master = run_command(f"git diff origin/master...{current_branch} --name-only")
+            changes_from_last_commit_vs_master = GIT_CHANGES.get_changes(f'origin/master...{current_branch}')
 
         # This will check if any changes were made to the files in the package (pkg_dir) but are yet to be committed.
-        changes_since_last_commit = run_command(f"git diff --name-only -- {pkg_dir}")
-
-        # if the package is in the list of changed files or if any files within the package were changed
-        # but not yet committed, return True
-        if pkg_dir in changes_from_last_commit_vs_master or len(changes_since_last_commit) > 0:
-            return True
-
-        # if no changes were made to the package - return False.
-        return False
+        # The changes are listed once, for all the packages.
+        changes_since_last_commit = GIT_CHANGES.get_changes()
+
+        # the changed paths are relative to the root of the repository, the package directory may be absolute or
+        # relative to the current directory
+        repository_path = LOCAL_GIT_FILE_PROVIDER.get_repository_path(pkg_dir)
+        if repository_path is None:
+            return False
+
+        # if any files within the package were changed, committed or not, return True
+        pkg_prefix = '' if repository_path == '.' else repository_path.rstrip('/') + '/'
+        return any(change.path.startswith(pkg_prefix)
+                   for change in changes_from_last_commit_vs_master + changes_since_last_commit)
 
     def _run_single_package_thread(self, package_dir: str) -> Tuple[int, str]:
         """Run a thread of lint command.
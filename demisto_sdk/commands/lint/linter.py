@@ -1,7 +1,6 @@
 import os
 import io
 import sys
-import yaml
 import time
 import shutil
 import hashlib
@@ -11,6 +10,7 @@ from datetime import datetime
 import requests
 
 from demisto_sdk.commands.common.constants import Errors
+from demisto_sdk.commands.common import yaml_io
 from demisto_sdk.commands.unify.unifier import Unifier
 from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.tools import print_v, get_all_docker_images, get_python_version, \
@@ -107,7 +107,7 @@ class Linter:
             return 1
         print_v('Using yaml file: {}'.format(yml_path))
         with open(yml_path, 'r') as yml_file:
-            yml_data = yaml.safe_load(yml_file)
+            yml_data = yaml_io.safe_load(yml_file)
         script_obj = yml_data
         if isinstance(script_obj.get('script'), dict):
             script_obj = script_obj.get('script')
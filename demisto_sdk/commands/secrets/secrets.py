@@ -8,6 +8,7 @@ import PyPDF2
 from bs4 import BeautifulSoup
 from demisto_sdk.commands.common.constants import re, REQUIRED_YML_FILE_TYPES, PACKS_DIR, PACKS_WHITELIST_FILE_NAME, \
     INTEGRATION_README_REGEX, EXTERNAL_PR_REGEX
+from demisto_sdk.commands.common.git_changes import GIT_CHANGES, get_change_records
 from demisto_sdk.commands.common.tools import run_command, print_error, print_color, LOG_COLORS, checked_type, \
     is_file_path_in_pack, get_pack_name, print_warning
 
@@ -94,27 +95,20 @@ class SecretsValidator(object):
         :param is_circle: boolean to check if being ran from circle
         :return: list: list of text files
         """
-        changed_files_string = run_command("git diff --name-status origin/master...{}".format(branch_name)) \
-            if is_circle else run_command("git diff --name-status --no-merges HEAD")
-        return list(self.get_diff_text_files(changed_files_string))
+        changes = GIT_CHANGES.get_changes('origin/master...{}'.format(branch_name)) \
+            if is_circle else GIT_CHANGES.get_changes('HEAD')
+        return list(self.get_diff_text_files(changes))
 
-    def get_diff_text_files(self, files_string):
+    def get_diff_text_files(self, changes):
         """Filter out only added/modified text files from git diff
-        :param files_string: string representing the git diff files
+        :param changes: GitChange records of the changed files, or the output of git diff --name-status
         :return: text_files_list: string of full path to text files
         """
         # file statuses to filter from the diff, no need to test deleted files.
-        all_files = files_string.split('\n')
         text_files_list = set()
-        for file_name in all_files:
-            file_data = file_name.split()
-            if not file_data:
-                continue
-            file_status = file_data[0]
-            if 'r' in file_status.lower():
-                file_path = file_data[2]
-            else:
-                file_path = file_data[1]
+        for change in get_change_records(changes):
+            file_status = change.status
+            file_path = change.path
             # only modified/added file, text readable, exclude white_list file
             if (file_status.lower() in ACCEPTED_FILE_STATUSES or 'r' in file_status.lower()) and self.is_text_file(
                     file_path):
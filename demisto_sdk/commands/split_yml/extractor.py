@@ -1,4 +1,3 @@
-import yaml
 import os
 import base64
 import subprocess
@@ -9,6 +8,7 @@ from ruamel.yaml import YAML
 from ruamel.yaml.scalarstring import SingleQuotedScalarString
 
 from demisto_sdk.commands.common.configuration import Configuration
+from demisto_sdk.commands.common import yaml_io
 from demisto_sdk.commands.common.tools import print_color, LOG_COLORS, get_docker_images, get_python_version,\
     get_pipenv_dir
 
@@ -126,7 +126,7 @@ class Extractor:
         if common_server:
             common_server = "CommonServerPython" not in self.yml_path
         with open(self.yml_path, 'rb') as yml_file:
-            yml_data = yaml.safe_load(yml_file)
+            yml_data = yaml_io.safe_load(yml_file)
             script = yml_data['script']
             if yml_type == INTEGRATION:  # in integration the script is stored at a second level
                 script = script['script']
@@ -149,7 +149,7 @@ class Extractor:
             return 0  # no image in script type
         print("Extracting image to: {} ...".format(output_path))
         with open(self.yml_path, 'rb') as yml_file:
-            yml_data = yaml.safe_load(yml_file)
+            yml_data = yaml_io.safe_load(yml_file)
             image_b64 = yml_data['image'].split(',')[1]
         with open(output_path, 'wb') as image_file:
             image_file.write(base64.decodebytes(image_b64.encode('utf-8')))
@@ -160,7 +160,7 @@ class Extractor:
         if yml_type == SCRIPT:
             return 0  # no long description in script type
         with open(self.yml_path, 'rb') as yml_file:
-            yml_data = yaml.safe_load(yml_file)
+            yml_data = yaml_io.safe_load(yml_file)
             long_description = yml_data.get('detaileddescription')
         if long_description:
             print("Extracting long description to: {} ...".format(output_path))
@@ -11,17 +11,28 @@ for that task.
 """
 from __future__ import print_function
 
+import hashlib
+import io
+import logging
 import os
 import re
+import sys
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from functools import partial
+from multiprocessing import Pool
 
 from demisto_sdk.commands.common.hook_validations.pack_unique_files import PackUniqueFilesValidator
 from demisto_sdk.commands.common.configuration import Configuration
+from demisto_sdk.commands.common.file_classifier import FILE_TYPE_CLASSIFIER
+from demisto_sdk.commands.common.git_changes import GIT_CHANGES, MODIFIED, GitChange, get_change_records
+from demisto_sdk.commands.common.git_file_provider import LOCAL_GIT_FILE_PROVIDER
+from demisto_sdk.commands.common.docker_tags import DOCKER_TAG_RESOLVER, get_yml_image_name
 from demisto_sdk.commands.common.constants import CODE_FILES_REGEX, OLD_YML_FORMAT_FILE, SCHEMA_REGEX,\
     KNOWN_FILE_STATUSES, IGNORED_TYPES_REGEXES, INTEGRATION_REGEX, BETA_INTEGRATION_REGEX, BETA_INTEGRATION_YML_REGEX,\
     SCRIPT_REGEX, IMAGE_REGEX, TEST_PLAYBOOK_REGEX, DIR_LIST_FOR_REGULAR_ENTETIES,\
     PACKAGE_SUPPORTING_DIRECTORIES, YML_BETA_INTEGRATIONS_REGEXES, PACKAGE_SCRIPTS_REGEXES, YML_INTEGRATION_REGEXES, \
     PACKS_DIR, PACKS_DIRECTORIES, Errors, PLAYBOOKS_REGEXES_LIST, JSON_INDICATOR_AND_INCIDENT_FIELDS, PLAYBOOK_REGEX, \
-    JSON_ALL_LAYOUT_REGEXES, REPUTATION_REGEX, CHECKED_TYPES_REGEXES
+    JSON_ALL_LAYOUT_REGEXES, REPUTATION_REGEX, CHECKED_TYPES_REGEXES, SCHEMA_TO_REGEX
 from demisto_sdk.commands.common.hook_validations.conf_json import ConfJsonValidator
 from demisto_sdk.commands.common.hook_validations.description import DescriptionValidator
 from demisto_sdk.commands.common.hook_validations.id import IDSetValidator
@@ -35,9 +46,108 @@ from demisto_sdk.commands.common.hook_validations.layout import LayoutValidator
 
 from demisto_sdk.commands.common.tools import checked_type, run_command, print_error, print_warning, print_color, \
     LOG_COLORS, get_yaml, filter_packagify_changes, get_pack_name, is_file_path_in_pack, \
-    get_yml_paths_in_dir
+    get_yml_paths_in_dir, prefetch_remote_files, find_scheme_name
 from demisto_sdk.commands.unify.unifier import Unifier
 from demisto_sdk.commands.common.hook_validations.release_notes import ReleaseNotesValidator
+from demisto_sdk.commands.common.update_id_set import get_chunksize
+from demisto_sdk.commands.common.validation_cache import ValidationResultCache
+
+
+def get_scheme_name(file_path):
+    """Classifies a content file once, for its validators.
+
+    Args:
+        file_path (str): the path of the file.
+
+    Returns:
+        str. The name of the scheme of the file, None if it has no scheme.
+    """
+    file_type = FILE_TYPE_CLASSIFIER.get_file_type(file_path)
+    return file_type.value if file_type else None
+
+
+def validate_file_scheme(file_path, fast_schema=False):
+    """Validates the scheme of a content file.
+
+    Args:
+        file_path (str): the path of the file.
+        fast_schema (bool): whether to validate with the validator generated from the scheme.
+
+    Returns:
+        bool. Whether the scheme of the file is valid.
+    """
+    return StructureValidator(file_path, predefined_scheme=get_scheme_name(file_path),
+                              fast_schema=fast_schema).is_valid_scheme()
+
+
+def validate_file_scheme_in_worker(file_path, fast_schema=False):
+    """Pool worker - validates the scheme of a content file, recording what the validation prints.
+
+    Args:
+        file_path (str): the path of the file.
+        fast_schema (bool): whether to validate with the validator generated from the scheme.
+
+    Returns:
+        tuple. (is_valid, output) - whether the scheme is valid and the output to replay with OutputRecorder.replay.
+    """
+    recorder = OutputRecorder()
+    with recorder.record():
+        is_valid = validate_file_scheme(file_path, fast_schema)
+
+    return is_valid, recorder.pop()
+
+
+class RecordingStream(io.TextIOBase):
+    """A text stream that appends what is written to it to a shared list, tagged with the name of the stream."""
+
+    def __init__(self, stream_name, chunks):
+        super().__init__()
+        self.stream_name = stream_name
+        self.chunks = chunks
+
+    def write(self, text):
+        self.chunks.append((self.stream_name, text))
+        return len(text)
+
+
+class OutputRecorder:
+    """OutputRecorder records what is printed to stdout and stderr, in order, so it can be printed later.
+
+    The logging handlers of the root logger that write to stdout or stderr, like the one logging.basicConfig adds, are
+    recorded as well.
+    """
+
+    def __init__(self):
+        self.chunks = []  # type: list
+
+    @contextmanager
+    def record(self):
+        streams = {'stdout': RecordingStream('stdout', self.chunks), 'stderr': RecordingStream('stderr', self.chunks)}
+        handler_streams = []
+        for handler in logging.getLogger().handlers:
+            if isinstance(handler, logging.StreamHandler):
+                for stream_name, recording_stream in streams.items():
+                    if handler.stream is getattr(sys, stream_name):
+                        handler_streams.append((handler, handler.setStream(recording_stream)))
+
+        try:
+            with redirect_stdout(streams['stdout']), redirect_stderr(streams['stderr']):
+                yield self
+        finally:
+            for handler, stream in handler_streams:
+                handler.setStream(stream)
+
+    def pop(self):
+        """Returns the output recorded so far and starts a new recording."""
+        chunks = self.chunks[:]
+        del self.chunks[:]
+        return chunks
+
+    @staticmethod
+    def replay(chunks):
+        """Prints recorded output to the current stdout and stderr."""
+        for stream_name, text in chunks:
+            getattr(sys, stream_name).write(text)
 
 
 class FilesValidator:
@@ -55,11 +165,15 @@ class FilesValidator:
         validate_id_set (bool): Whether to validate id_set or not.
         file_path (string): If validating a specific file, golds it's path.
         configuration (Configuration): Configurations for IDSetValidator.
+        jobs (int): The number of worker processes to validate all the files with, 1 validates them serially.
+        fast_schema (bool): Whether to validate the schemes with the validators generated from the schemes.
+        validation_cache (ValidationResultCache): The results of previous validations of the modified and added
+            files, files that passed with the same content are skipped. None to validate all of them.
     """
 
     def __init__(self, is_backward_check=True, prev_ver='origin/master', use_git=False, is_circle=False,
                  print_ignored_files=False, validate_conf_json=True, validate_id_set=False, file_path=None,
-                 configuration=Configuration()):
+                 configuration=Configuration(), jobs=1, fast_schema=False, validation_cache=False):
         self.branch_name = ''
         self.use_git = use_git
         if self.use_git:
@@ -80,6 +194,10 @@ class FilesValidator:
         self.validate_conf_json = validate_conf_json
         self.validate_id_set = validate_id_set
         self.file_path = file_path
+        self.jobs = jobs
+        self.fast_schema = fast_schema
+        self.validation_cache = ValidationResultCache() if validation_cache else None
+        self._validation_options = {}  # type: dict
 
         if self.validate_conf_json:
             self.conf_json_validator = ConfJsonValidator()
@@ -88,7 +206,12 @@ class FilesValidator:
 
     def run(self):
         print_color('Starting validating files structure', LOG_COLORS.GREEN)
-        if self.is_valid_structure():
+        is_valid = self.is_valid_structure()
+        if self.validation_cache and self.validation_cache.hits + self.validation_cache.misses:
+            print('Validation cache: {} files passed before and were skipped, {} validated, {} results cached'.format(
+                self.validation_cache.hits, self.validation_cache.misses, self.validation_cache.writes))
+
+        if is_valid:
             print_color('The files are valid', LOG_COLORS.GREEN)
             return 0
         else:
@@ -102,33 +225,24 @@ class FilesValidator:
         return branch_name_reg.group(1)
 
     @staticmethod
-    def get_modified_files(files_string, tag='master', print_ignored_files=False):
-        """Get lists of the modified files in your branch according to the files string.
+    def get_modified_files(changes, tag='master', print_ignored_files=False):
+        """Get lists of the modified files in your branch according to the changes.
 
         Args:
-            files_string (string): String that was calculated by git using `git diff` command.
+            changes (iterable): GitChange records of the changed files, or the output of `git diff --name-status`.
             tag (string): String of git tag used to update modified files.
             print_ignored_files (bool): should print ignored files.
 
         Returns:
             (modified_files_list, added_files_list, deleted_files). Tuple of sets.
         """
-        all_files = files_string.split('\n')
         deleted_files = set([])
         added_files_list = set([])
         modified_files_list = set([])
         old_format_files = set([])
-        for f in all_files:
-            file_data = f.split()
-            if not file_data:
-                continue
-
-            file_status = file_data[0]
-            file_path = file_data[1]
-
-            if file_status.lower().startswith('r'):
-                file_status = 'r'
-                file_path = file_data[2]
+        for change in get_change_records(changes):
+            file_status = change.status
+            file_path = change.path
 
             if checked_type(file_path, CODE_FILES_REGEX) and file_status.lower() != 'd' \
                     and not file_path.endswith('_test.py'):
@@ -146,12 +260,12 @@ class FilesValidator:
                 added_files_list.add(file_path)
             elif file_status.lower() == 'd' and checked_type(file_path) and not file_path.startswith('.'):
                 deleted_files.add(file_path)
-            elif file_status.lower().startswith('r') and checked_type(file_path):
+            elif file_status.lower() == 'r' and checked_type(file_path):
                 # if a code file changed, take the associated yml file.
-                if checked_type(file_data[2], CODE_FILES_REGEX):
+                if checked_type(change.path, CODE_FILES_REGEX):
                     modified_files_list.add(file_path)
                 else:
-                    modified_files_list.add((file_data[1], file_data[2]))
+                    modified_files_list.add((change.old_path, change.path))
 
             elif checked_type(file_path, [SCHEMA_REGEX]):
                 modified_files_list.add(file_path)
@@ -163,6 +277,12 @@ class FilesValidator:
             elif print_ignored_files and not checked_type(file_path, IGNORED_TYPES_REGEXES):
                 print_warning('Ignoring file path: {}'.format(file_path))
 
+        # the old versions of the modified files and of the removed packages are downloaded together, rather than one
+        # at a time by the validators
+        prefetch_remote_files([file_path[0] if isinstance(file_path, tuple) else file_path
+                               for file_path in modified_files_list] +
+                              [file_path for file_path in deleted_files
+                               if file_path.split('/')[0] in PACKAGE_SUPPORTING_DIRECTORIES], tag)
         modified_files_list, added_files_list, deleted_files = filter_packagify_changes(
             modified_files_list,
             added_files_list,
@@ -183,28 +303,26 @@ class FilesValidator:
         # Two dots is the default in git diff, it will compare with the last known commit as the base
         # Three dots will compare with the last known shared commit as the base
         compare_type = '.' if 'master' in tag else ''
-        all_changed_files_string = run_command(
-            'git diff --name-status {tag}..{compare_type}refs/heads/{branch}'.format(tag=tag,
-                                                                                     branch=self.branch_name,
-                                                                                     compare_type=compare_type))
+        all_changed_files = GIT_CHANGES.get_changes('{tag}..{compare_type}refs/heads/{branch}'.format(
+            tag=tag, branch=self.branch_name, compare_type=compare_type))
 
         modified_files, added_files, _, old_format_files = self.get_modified_files(
-            all_changed_files_string,
+            all_changed_files,
             tag=tag,
             print_ignored_files=self.print_ignored_files)
 
         if not self.is_circle:
-            files_string = run_command('git diff --name-status --no-merges HEAD')
+            # the staged and the unstaged changes
+            uncommitted_files = GIT_CHANGES.get_changes('HEAD')
             nc_modified_files, nc_added_files, nc_deleted_files, nc_old_format_files = self.get_modified_files(
-                files_string, print_ignored_files=self.print_ignored_files)
+                uncommitted_files, print_ignored_files=self.print_ignored_files)
 
-            all_changed_files_string = run_command('git diff --name-status {}'.format(tag))
             modified_files_from_tag, added_files_from_tag, _, _ = \
-                self.get_modified_files(all_changed_files_string,
+                self.get_modified_files(GIT_CHANGES.get_changes(tag),
                                         print_ignored_files=self.print_ignored_files)
 
             if self.file_path:
-                if F'M\t{self.file_path}' in files_string:
+                if GitChange(MODIFIED, self.file_path) in uncommitted_files:
                     modified_files = {self.file_path}
                     added_files = set()
                 else:
@@ -244,13 +362,67 @@ class FilesValidator:
         if not release_notes_validator.is_file_valid():
             self._is_valid = False
 
-    def validate_modified_files(self, modified_files):  # noqa: C901
+    def get_validation_options(self, kind):
+        """Returns the kind and options of a validation of a file, a part of its key in the validation cache."""
+        if kind not in self._validation_options:
+            options = [kind, 'backward' if self.is_backward_check else 'no-backward']
+            if self.validate_id_set:
+                # the files are validated against the id_set, so it is a part of the key
+                try:
+                    with open(IDSetValidator.ID_SET_PATH, 'rb') as id_set_file:
+                        options.append('id-set-' + hashlib.sha1(id_set_file.read()).hexdigest())
+                except OSError:
+                    options.append('id-set-missing')
+
+            self._validation_options[kind] = ':'.join(options)
+
+        return self._validation_options[kind]
+
+    def validate_with_cache(self, validate_function, file_path, kind, old_file_path=None, tag=None):
+        """Validates a file, or skips it if it passed the same validation before.
+
+        The output of the validation is recorded and printed when it ends, and cached with its result.
+
+        Args:
+            validate_function (function): the validation of the file, sets self._is_valid to False if it fails.
+            file_path (str): the path of the file.
+            kind (str): the kind of the validation, 'modified' or 'added'.
+            old_file_path (str): the path of the file in the compared branch, if it was renamed.
+            tag (str): the branch the file is compared to, None if it is a new file.
+        """
+        # release notes are validated with a git diff, which isn't a part of the key
+        if self.validation_cache is None or 'CHANGELOG' in file_path:
+            validate_function()
+            return
+
+        key = self.validation_cache.get_key(file_path, self.get_validation_options(kind), old_file_path, tag)
+        result = self.validation_cache.get(key) if key else None
+        if result is not None and result[0]:
+            OutputRecorder.replay(result[1])
+            return
+
+        was_valid = self._is_valid
+        self._is_valid = True
+        recorder = OutputRecorder()
+        try:
+            with recorder.record():
+                validate_function()
+        finally:
+            output = recorder.pop()
+            OutputRecorder.replay(output)
+
+        if key:
+            self.validation_cache.set(key, self._is_valid, output)
+        self._is_valid = was_valid and self._is_valid
+
+    def validate_modified_files(self, modified_files, tag='origin/master'):
         """Validate the modified files from your branch.
 
         In case we encounter an invalid file we set the self._is_valid param to False.
 
         Args:
             modified_files (set): A set of the modified files in the current branch.
+            tag (str): The branch the files were modified from, the old files are taken from it.
         """
         for file_path in modified_files:
             old_file_path = None
@@ -258,110 +430,123 @@ class FilesValidator:
                 old_file_path, file_path = file_path
 
             print('Validating {}'.format(file_path))
-            if not checked_type(file_path):
-                print_warning('- Skipping validation of non-content entity file.')
-                continue
+            self.validate_with_cache(partial(self.validate_modified_file, file_path, old_file_path, tag), file_path,
+                                     'modified', old_file_path, tag)
 
-            if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                continue
+    def validate_modified_file(self, file_path, old_file_path=None, tag='origin/master'):  # noqa: C901
+        """Validate a modified file from your branch.
 
-            structure_validator = StructureValidator(file_path, old_file_path=old_file_path)
-            if not structure_validator.is_valid_file():
+        Args:
+            file_path (str): The path of the file.
+            old_file_path (str): The path of the file in the compared branch, if it was renamed.
+            tag (str): The branch the file was modified from, the old file is taken from it.
+        """
+        if not checked_type(file_path):
+            print_warning('- Skipping validation of non-content entity file.')
+            return
+
+        if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
+            return
+
+        structure_validator = StructureValidator(file_path, old_file_path=old_file_path,
+                                                 predefined_scheme=get_scheme_name(file_path),
+                                                 fast_schema=self.fast_schema, prev_ver=tag)
+        if not structure_validator.is_valid_file():
+            self._is_valid = False
+
+        if self.validate_id_set:
+            if not self.id_set_validator.is_file_valid_in_set(file_path):
                 self._is_valid = False
 
-            if self.validate_id_set:
-                if not self.id_set_validator.is_file_valid_in_set(file_path):
-                    self._is_valid = False
-
-            elif checked_type(file_path, YML_INTEGRATION_REGEXES):
-                image_validator = ImageValidator(file_path)
-                if not image_validator.is_valid():
-                    self._is_valid = False
-
-                description_validator = DescriptionValidator(file_path)
-                if not description_validator.is_valid():
-                    self._is_valid = False
-
-                integration_validator = IntegrationValidator(structure_validator)
-                if self.is_backward_check and not integration_validator.is_backward_compatible():
-                    self._is_valid = False
-
-                if not integration_validator.is_valid_file():
-                    self._is_valid = False
-
-            elif checked_type(file_path, YML_BETA_INTEGRATIONS_REGEXES):
-                image_validator = ImageValidator(file_path)
-                if not image_validator.is_valid():
-                    self._is_valid = False
-
-                description_validator = DescriptionValidator(file_path)
-                if not description_validator.is_valid_beta_description():
-                    self._is_valid = False
-
-                integration_validator = IntegrationValidator(structure_validator)
-                if not integration_validator.is_valid_beta_integration():
-                    self._is_valid = False
-
-            elif checked_type(file_path, [SCRIPT_REGEX]):
-                script_validator = ScriptValidator(structure_validator)
-                if self.is_backward_check and not script_validator.is_backward_compatible():
-                    self._is_valid = False
-                if not script_validator.is_valid_file():
-                    self._is_valid = False
-
-            elif checked_type(file_path, PLAYBOOKS_REGEXES_LIST):
-                playbook_validator = PlaybookValidator(structure_validator)
-                if not playbook_validator.is_valid_playbook(is_new_playbook=False):
-                    self._is_valid = False
-
-            elif checked_type(file_path, PACKAGE_SCRIPTS_REGEXES):
-                unifier = Unifier(os.path.dirname(file_path))
-                yml_path, _ = unifier.get_script_package_data()
-                # Set file path to the yml file
-                structure_validator.file_path = yml_path
-                script_validator = ScriptValidator(structure_validator)
-                if self.is_backward_check and not script_validator.is_backward_compatible():
-                    self._is_valid = False
-
-                if not script_validator.is_valid_file():
-                    self._is_valid = False
-
-            elif re.match(IMAGE_REGEX, file_path, re.IGNORECASE):
-                image_validator = ImageValidator(file_path)
-                if not image_validator.is_valid():
-                    self._is_valid = False
-
-            # incident fields and indicator fields are using the same scheme.
-            elif checked_type(file_path, JSON_INDICATOR_AND_INCIDENT_FIELDS):
-                incident_field_validator = IncidentFieldValidator(structure_validator)
-                if not incident_field_validator.is_valid_file():
-                    self._is_valid = False
-                if self.is_backward_check and not incident_field_validator.is_backward_compatible():
-                    self._is_valid = False
-
-            elif checked_type(file_path, JSON_ALL_LAYOUT_REGEXES):
-                layout_validator = LayoutValidator(structure_validator)
-                if not layout_validator.is_valid_layout():
-                    self._is_valid = False
-
-            elif 'CHANGELOG' in file_path:
-                self.is_valid_release_notes(file_path)
-
-            elif checked_type(file_path, [REPUTATION_REGEX]):
-                print_color(
-                    F'Skipping validation for file {file_path} since no validation is currently defined.',
-                    LOG_COLORS.YELLOW)
-
-            elif checked_type(file_path, CHECKED_TYPES_REGEXES):
-                pass
+        elif checked_type(file_path, YML_INTEGRATION_REGEXES):
+            image_validator = ImageValidator(file_path)
+            if not image_validator.is_valid():
+                self._is_valid = False
 
-            else:
-                print_error("The file type of {} is not supported in validate command".format(file_path))
-                print_error("'validate' command supports: Integrations, Scripts, Playbooks, "
-                            "Incident fields, Indicator fields, Images, Release notes, Layouts and Descriptions")
+            description_validator = DescriptionValidator(file_path)
+            if not description_validator.is_valid():
+                self._is_valid = False
+
+            integration_validator = IntegrationValidator(structure_validator)
+            if self.is_backward_check and not integration_validator.is_backward_compatible():
+                self._is_valid = False
+
+            if not integration_validator.is_valid_file():
+                self._is_valid = False
+
+        elif checked_type(file_path, YML_BETA_INTEGRATIONS_REGEXES):
+            image_validator = ImageValidator(file_path)
+            if not image_validator.is_valid():
+                self._is_valid = False
+
+            description_validator = DescriptionValidator(file_path)
+            if not description_validator.is_valid_beta_description():
+                self._is_valid = False
+
+            integration_validator = IntegrationValidator(structure_validator)
+            if not integration_validator.is_valid_beta_integration():
+                self._is_valid = False
+
+        elif checked_type(file_path, [SCRIPT_REGEX]):
+            script_validator = ScriptValidator(structure_validator)
+            if self.is_backward_check and not script_validator.is_backward_compatible():
+                self._is_valid = False
+            if not script_validator.is_valid_file():
+                self._is_valid = False
+
+        elif checked_type(file_path, PLAYBOOKS_REGEXES_LIST):
+            playbook_validator = PlaybookValidator(structure_validator)
+            if not playbook_validator.is_valid_playbook(is_new_playbook=False):
+                self._is_valid = False
+
+        elif checked_type(file_path, PACKAGE_SCRIPTS_REGEXES):
+            unifier = Unifier(os.path.dirname(file_path))
+            yml_path, _ = unifier.get_script_package_data()
+            # Set file path to the yml file
+            structure_validator.file_path = yml_path
+            script_validator = ScriptValidator(structure_validator)
+            if self.is_backward_check and not script_validator.is_backward_compatible():
+                self._is_valid = False
+
+            if not script_validator.is_valid_file():
+                self._is_valid = False
+
+        elif re.match(IMAGE_REGEX, file_path, re.IGNORECASE):
+            image_validator = ImageValidator(file_path)
+            if not image_validator.is_valid():
+                self._is_valid = False
+
+        # incident fields and indicator fields are using the same scheme.
+        elif checked_type(file_path, JSON_INDICATOR_AND_INCIDENT_FIELDS):
+            incident_field_validator = IncidentFieldValidator(structure_validator)
+            if not incident_field_validator.is_valid_file():
+                self._is_valid = False
+            if self.is_backward_check and not incident_field_validator.is_backward_compatible():
                 self._is_valid = False
 
-    def validate_added_files(self, added_files):  # noqa: C901
+        elif checked_type(file_path, JSON_ALL_LAYOUT_REGEXES):
+            layout_validator = LayoutValidator(structure_validator)
+            if not layout_validator.is_valid_layout():
+                self._is_valid = False
+
+        elif 'CHANGELOG' in file_path:
+            self.is_valid_release_notes(file_path)
+
+        elif checked_type(file_path, [REPUTATION_REGEX]):
+            print_color(
+                F'Skipping validation for file {file_path} since no validation is currently defined.',
+                LOG_COLORS.YELLOW)
+
+        elif checked_type(file_path, CHECKED_TYPES_REGEXES):
+            pass
+
+        else:
+            print_error("The file type of {} is not supported in validate command".format(file_path))
+            print_error("'validate' command supports: Integrations, Scripts, Playbooks, "
+                        "Incident fields, Indicator fields, Images, Release notes, Layouts and Descriptions")
+            self._is_valid = False
+
+    def validate_added_files(self, added_files):
         """Validate the added files from your branch.
 
         In case we encounter an invalid file we set the self._is_valid param to False.
@@ -371,92 +556,101 @@ class FilesValidator:
         """
         for file_path in added_files:
             print('Validating {}'.format(file_path))
+            self.validate_with_cache(partial(self.validate_added_file, file_path), file_path, 'added')
 
-            if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                continue
+    def validate_added_file(self, file_path):  # noqa: C901
+        """Validate an added file from your branch.
+
+        Args:
+            file_path (str): The path of the file.
+        """
+        if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
+            return
 
-            structure_validator = StructureValidator(file_path, is_new_file=True)
-            if not structure_validator.is_valid_file():
+        structure_validator = StructureValidator(file_path, is_new_file=True,
+                                                 predefined_scheme=get_scheme_name(file_path),
+                                                 fast_schema=self.fast_schema)
+        if not structure_validator.is_valid_file():
+            self._is_valid = False
+
+        if self.validate_id_set:
+            if not self.id_set_validator.is_file_valid_in_set(file_path):
                 self._is_valid = False
 
-            if self.validate_id_set:
-                if not self.id_set_validator.is_file_valid_in_set(file_path):
-                    self._is_valid = False
-
-                if self.id_set_validator.is_file_has_used_id(file_path):
-                    self._is_valid = False
-
-            elif re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                playbook_validator = PlaybookValidator(structure_validator)
-                if not playbook_validator.is_valid_playbook():
-                    self._is_valid = False
-
-            elif checked_type(file_path, YML_INTEGRATION_REGEXES):
-                image_validator = ImageValidator(file_path)
-                if not image_validator.is_valid():
-                    self._is_valid = False
-
-                description_validator = DescriptionValidator(file_path)
-                if not description_validator.is_valid():
-                    self._is_valid = False
-
-                integration_validator = IntegrationValidator(structure_validator)
-                if not integration_validator.is_valid_file(validate_rn=False):
-                    self._is_valid = False
-
-            elif checked_type(file_path, PACKAGE_SCRIPTS_REGEXES):
-                unifier = Unifier(os.path.dirname(file_path))
-                yml_path, _ = unifier.get_script_package_data()
-                # Set file path to the yml file
-                structure_validator.file_path = yml_path
-                script_validator = ScriptValidator(structure_validator)
-
-                if not script_validator.is_valid_file(validate_rn=False):
-                    self._is_valid = False
-
-            elif re.match(BETA_INTEGRATION_REGEX, file_path, re.IGNORECASE) or \
-                    re.match(BETA_INTEGRATION_YML_REGEX, file_path, re.IGNORECASE):
-                description_validator = DescriptionValidator(file_path)
-                if not description_validator.is_valid_beta_description():
-                    self._is_valid = False
-
-                integration_validator = IntegrationValidator(structure_validator)
-                if not integration_validator.is_valid_beta_integration():
-                    self._is_valid = False
-
-            elif re.match(IMAGE_REGEX, file_path, re.IGNORECASE):
-                image_validator = ImageValidator(file_path)
-                if not image_validator.is_valid():
-                    self._is_valid = False
-
-            # incident fields and indicator fields are using the same scheme.
-            elif checked_type(file_path, JSON_INDICATOR_AND_INCIDENT_FIELDS):
-                incident_field_validator = IncidentFieldValidator(structure_validator)
-                if not incident_field_validator.is_valid_file():
-                    self._is_valid = False
-
-            elif checked_type(file_path, JSON_ALL_LAYOUT_REGEXES):
-                layout_validator = LayoutValidator(structure_validator)
-                if not layout_validator.is_valid_layout():
-                    self._is_valid = False
-
-            elif 'CHANGELOG' in file_path:
-                self.is_valid_release_notes(file_path)
-
-            elif checked_type(file_path, [REPUTATION_REGEX]):
-                print_color(
-                    F'Skipping validation for file {file_path} since no validation is currently defined.',
-                    LOG_COLORS.YELLOW)
-
-            elif checked_type(file_path, CHECKED_TYPES_REGEXES):
-                pass
+            if self.id_set_validator.is_file_has_used_id(file_path):
+                self._is_valid = False
 
-            else:
-                print_error("The file type of {} is not supported in validate command".format(file_path))
-                print_error("validate command supports: Integrations, Scripts, Playbooks, "
-                            "Incident fields, Indicator fields, Images, Release notes, Layouts and Descriptions")
+        elif re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE):
+            playbook_validator = PlaybookValidator(structure_validator)
+            if not playbook_validator.is_valid_playbook():
+                self._is_valid = False
+
+        elif checked_type(file_path, YML_INTEGRATION_REGEXES):
+            image_validator = ImageValidator(file_path)
+            if not image_validator.is_valid():
+                self._is_valid = False
+
+            description_validator = DescriptionValidator(file_path)
+            if not description_validator.is_valid():
+                self._is_valid = False
+
+            integration_validator = IntegrationValidator(structure_validator)
+            if not integration_validator.is_valid_file(validate_rn=False):
+                self._is_valid = False
+
+        elif checked_type(file_path, PACKAGE_SCRIPTS_REGEXES):
+            unifier = Unifier(os.path.dirname(file_path))
+            yml_path, _ = unifier.get_script_package_data()
+            # Set file path to the yml file
+            structure_validator.file_path = yml_path
+            script_validator = ScriptValidator(structure_validator)
+
+            if not script_validator.is_valid_file(validate_rn=False):
+                self._is_valid = False
+
+        elif re.match(BETA_INTEGRATION_REGEX, file_path, re.IGNORECASE) or \
+                re.match(BETA_INTEGRATION_YML_REGEX, file_path, re.IGNORECASE):
+            description_validator = DescriptionValidator(file_path)
+            if not description_validator.is_valid_beta_description():
                 self._is_valid = False
 
+            integration_validator = IntegrationValidator(structure_validator)
+            if not integration_validator.is_valid_beta_integration():
+                self._is_valid = False
+
+        elif re.match(IMAGE_REGEX, file_path, re.IGNORECASE):
+            image_validator = ImageValidator(file_path)
+            if not image_validator.is_valid():
+                self._is_valid = False
+
+        # incident fields and indicator fields are using the same scheme.
+        elif checked_type(file_path, JSON_INDICATOR_AND_INCIDENT_FIELDS):
+            incident_field_validator = IncidentFieldValidator(structure_validator)
+            if not incident_field_validator.is_valid_file():
+                self._is_valid = False
+
+        elif checked_type(file_path, JSON_ALL_LAYOUT_REGEXES):
+            layout_validator = LayoutValidator(structure_validator)
+            if not layout_validator.is_valid_layout():
+                self._is_valid = False
+
+        elif 'CHANGELOG' in file_path:
+            self.is_valid_release_notes(file_path)
+
+        elif checked_type(file_path, [REPUTATION_REGEX]):
+            print_color(
+                F'Skipping validation for file {file_path} since no validation is currently defined.',
+                LOG_COLORS.YELLOW)
+
+        elif checked_type(file_path, CHECKED_TYPES_REGEXES):
+            pass
+
+        else:
+            print_error("The file type of {} is not supported in validate command".format(file_path))
+            print_error("validate command supports: Integrations, Scripts, Playbooks, "
+                        "Incident fields, Indicator fields, Images, Release notes, Layouts and Descriptions")
+            self._is_valid = False
+
     def validate_no_old_format(self, old_format_files):
         """ Validate there are no files in the old format(unified yml file for the code and configuration).
 
@@ -474,24 +668,132 @@ class FilesValidator:
                         'The files are:\n{}'.format('\n'.join(list(invalid_files))))
             self._is_valid = False
 
+    @staticmethod
+    def get_changed_schemes(modified_files):
+        """Finds the schemes of the changed schema files.
+
+        Args:
+            modified_files (set): the modified files, with the changed schema files.
+
+        Returns:
+            set. The names of the changed schemes, None if a changed schema isn't the scheme of a file type in
+            SCHEMA_TO_REGEX.
+        """
+        changed_schemes = set()
+        for file_path in modified_files:
+            if isinstance(file_path, tuple):
+                _, file_path = file_path
+            if checked_type(file_path, [SCHEMA_REGEX]):
+                scheme_name = os.path.splitext(os.path.basename(file_path))[0]
+                if scheme_name not in SCHEMA_TO_REGEX:
+                    return None
+
+                changed_schemes.add(scheme_name)
+
+        return changed_schemes
+
+    @staticmethod
+    def get_files_of_schemes(scheme_names):
+        """Finds the content files of the given schemes, the files whose type the schemes govern.
+
+        Args:
+            scheme_names (set): the names of the schemes, keys of SCHEMA_TO_REGEX.
+
+        Returns:
+            iterator. (file_path, display_name) of the files, sorted by their paths.
+        """
+        regexes = [regex for scheme_name in scheme_names for regex in SCHEMA_TO_REGEX[scheme_name]]
+        file_paths = []
+        for root, dirs, files in os.walk('.'):
+            dirs[:] = sorted(dir_name for dir_name in dirs if not dir_name.startswith('.'))
+            for file_name in files:
+                file_path = os.path.relpath(os.path.join(root, file_name))
+                # a file may match the regexes of a scheme and be validated by an earlier one
+                if checked_type(file_path, regexes) and find_scheme_name(file_path) in scheme_names:
+                    file_paths.append(file_path)
+
+        for file_path in sorted(file_paths):
+            yield file_path, file_path
+
+    @staticmethod
+    def prefetch_docker_image_tags(files):
+        """Resolves the latest tags of the docker images of the integrations and scripts concurrently, before their
+        validators check them one at a time.
+
+        Args:
+            files (set): the paths of the files, and (old path, path) tuples of renamed files.
+        """
+        # renamed files are (old path, path) tuples
+        image_names = {get_yml_image_name(file_path[1] if isinstance(file_path, tuple) else file_path)
+                       for file_path in files}
+        image_names.discard(None)
+        DOCKER_TAG_RESOLVER.prefetch(image_names)
+
     def validate_committed_files(self):
         """Validate that all the committed files in your branch are valid"""
         modified_files, added_files, old_format_files, packs = self.get_modified_and_added_files()
-        schema_changed = False
-        for f in modified_files:
-            if isinstance(f, tuple):
-                _, f = f
-            if checked_type(f, [SCHEMA_REGEX]):
-                schema_changed = True
+        changed_schemes = self.get_changed_schemes(modified_files)
         # Ensure schema change did not break BC
-        if schema_changed:
+        if changed_schemes is None:
             print("Schema changed, validating all files")
             self.validate_all_files()
         else:
+            self.prefetch_docker_image_tags(modified_files | added_files)
             self.validate_modified_files(modified_files)
             self.validate_added_files(added_files)
             self.validate_no_old_format(old_format_files)
             self.validate_pack_unique_files(packs)
+            if changed_schemes:
+                print('Schemas changed, validating the {} files'.format(', '.join(sorted(changed_schemes))))
+                self.validate_files_schemes(self.get_files_of_schemes(changed_schemes))
+
+    def validate_changed_files(self, files, packs=(), changed_schemes=()):
+        """Validates files that changed since the last validation, e.g. while validate watches them.
+
+        With git, a file that is in the compared branch is validated as a modified file, against its version in it,
+        and as an added file otherwise. Without it, only the schemes of the files are validated.
+
+        Args:
+            files (set): the paths of the files.
+            packs (set): the names of the packs whose unique files to validate.
+            changed_schemes (set): the names of the schemes whose files to validate.
+
+        Returns:
+            bool. Whether the files are valid.
+        """
+        self._is_valid = True
+        if not self.use_git:
+            self.validate_files_schemes((file_path, file_path) for file_path in sorted(files))
+        else:
+            modified_files = set()
+            added_files = set()
+            old_format_files = set()
+            for file_path in files:
+                if checked_type(file_path, OLD_YML_FORMAT_FILE) and self._is_py_script_or_integration(file_path):
+                    old_format_files.add(file_path)
+                elif LOCAL_GIT_FILE_PROVIDER.get_file_content(file_path, self.prev_ver) is not None:
+                    modified_files.add(file_path)
+                else:
+                    added_files.add(file_path)
+
+            self.prefetch_docker_image_tags(modified_files | added_files)
+            self.validate_modified_files(sorted(modified_files), self.prev_ver)
+            self.validate_added_files(sorted(added_files))
+            self.validate_no_old_format(old_format_files)
+            self.validate_pack_unique_files(sorted(set(packs) | self.get_packs(modified_files, added_files)))
+
+        if changed_schemes:
+            print('Schemas changed, validating the {} files'.format(', '.join(sorted(changed_schemes))))
+            self.validate_files_schemes(self.get_files_of_schemes(changed_schemes))
+
+        return self._is_valid
+
+    def reload_id_set(self):
+        """Loads the id_set again after it changed, the files are validated against it and it is a part of their
+        validation cache keys."""
+        self._validation_options = {}
+        if self.validate_id_set:
+            self.id_set_validator = IDSetValidator(is_circle=self.is_circle, configuration=self.configuration)
 
     def validate_pack_unique_files(self, packs):
         for pack in packs:
@@ -501,8 +803,15 @@ class FilesValidator:
                 print_error(pack_errors)
                 self._is_valid = False
 
-    def validate_all_files(self):
-        """Validate all files in the repo are in the right format."""
+    @staticmethod
+    def get_all_files_to_validate():
+        """Finds the content files validate_all_files validates, in the order they are validated.
+
+        Directory headers and missing yml errors are printed while iterating, before the files they precede.
+
+        Returns:
+            iterator. (file_path, display_name) of the files, display_name is printed before the file is validated.
+        """
         # go over packs
         for root, dirs, _ in os.walk(PACKS_DIR):
             for dir_in_dirs in dirs:
@@ -516,10 +825,7 @@ class FilesValidator:
                             _, file_path = get_yml_paths_in_dir(os.path.normpath(project_dir),
                                                                 Errors.no_yml_file(project_dir))
                             if file_path:
-                                print("Validating {}".format(file_path))
-                                structure_validator = StructureValidator(file_path)
-                                if not structure_validator.is_valid_scheme():
-                                    self._is_valid = False
+                                yield file_path, file_path
 
         # go over regular content entities
         for directory in DIR_LIST_FOR_REGULAR_ENTETIES:
@@ -531,10 +837,7 @@ class FilesValidator:
                     if not file_name.endswith('.yml'):
                         continue
 
-                    print('Validating ' + file_name)
-                    structure_validator = StructureValidator(file_path)
-                    if not structure_validator.is_valid_scheme():
-                        self._is_valid = False
+                    yield file_path, file_name
 
         # go over regular PACKAGE_SUPPORTING_DIRECTORIES entities
         for directory in PACKAGE_SUPPORTING_DIRECTORIES:
@@ -546,10 +849,64 @@ class FilesValidator:
                     project_dir = os.path.join(root, inner_dir)
                     _, file_path = get_yml_paths_in_dir(project_dir, Errors.no_yml_file(project_dir))
                     if file_path:
-                        print('Validating ' + file_path)
-                        structure_validator = StructureValidator(file_path)
-                        if not structure_validator.is_valid_scheme():
-                            self._is_valid = False
+                        yield file_path, file_path
+
+    def validate_all_files(self):
+        """Validate all files in the repo are in the right format."""
+        self.validate_files_schemes(self.get_all_files_to_validate())
+
+    def validate_files_schemes(self, files):
+        """Validate the schemes of files, in a pool of worker processes if self.jobs is more than 1.
+
+        Args:
+            files (iterator): (file_path, display_name) of the files, display_name is printed before the file is
+                validated.
+        """
+        if self.jobs > 1:
+            self.validate_files_schemes_in_pool(files)
+            return
+
+        for file_path, display_name in files:
+            print('Validating ' + display_name)
+            if not validate_file_scheme(file_path, self.fast_schema):
+                self._is_valid = False
+
+    def validate_files_schemes_in_pool(self, files):
+        """Validate the schemes of files in a pool of self.jobs worker processes.
+
+        The files are found first, then validated in the pool. The output of every file is recorded by its worker and
+        printed in the order of the files, so it is the same as the output of the serial validation.
+
+        Args:
+            files (iterator): (file_path, display_name) of the files, display_name is printed before the file is
+                validated.
+        """
+        recorder = OutputRecorder()
+        files_to_validate = []
+        with recorder.record():
+            for file_path, display_name in files:
+                # the output printed while finding a file is printed before it is validated
+                files_to_validate.append((recorder.pop(), file_path, display_name))
+        trailing_output = recorder.pop()
+
+        if files_to_validate:
+            workers = min(self.jobs, len(files_to_validate))
+            pool = Pool(processes=workers)
+            try:
+                file_paths = [file_path for _, file_path, _ in files_to_validate]
+                results = pool.imap(partial(validate_file_scheme_in_worker, fast_schema=self.fast_schema), file_paths,
+                                    chunksize=get_chunksize(len(file_paths), workers))
+                for (found_output, _, display_name), (is_valid, output) in zip(files_to_validate, results):
+                    OutputRecorder.replay(found_output)
+                    print('Validating ' + display_name)
+                    OutputRecorder.replay(output)
+                    if not is_valid:
+                        self._is_valid = False
+            finally:
+                pool.close()
+                pool.join()
+
+        OutputRecorder.replay(trailing_output)
 
     def is_valid_structure(self):
         """Check if the structure is valid for the case we are in, master - all files, branch - changed files.
@@ -589,8 +946,9 @@ class FilesValidator:
         if self.prev_ver and self.prev_ver != 'master':
             print_color('Starting validation against {}'.format(self.prev_ver), LOG_COLORS.GREEN)
             modified_files, _, _, _ = self.get_modified_and_added_files(self.prev_ver)
+            self.prefetch_docker_image_tags(modified_files)
             prev_self_valid = self._is_valid
-            self.validate_modified_files(modified_files)
+            self.validate_modified_files(modified_files, self.prev_ver)
             if no_error:
                 self._is_valid = prev_self_valid
 
@@ -601,7 +959,8 @@ class FilesValidator:
 
     @staticmethod
     def _is_py_script_or_integration(file_path):
-        file_yml = get_yaml(file_path)
+        # files with a structure issue are loaded as an empty list
+        file_yml = get_yaml(file_path) or {}
         if re.match(INTEGRATION_REGEX, file_path, re.IGNORECASE):
             if file_yml.get('script', {}).get('type', 'javascript') != 'python':
                 return False
@@ -0,0 +1,189 @@
+import logging
+import os
+import sys
+from shutil import copyfile
+
+from demisto_sdk.commands.validate.file_validator import FilesValidator, OutputRecorder
+from demisto_sdk.commands.validate import file_validator
+from demisto_sdk.tests.constants_test import INVALID_PLAYBOOK_PATH, INVALID_SCRIPT_PATH, VALID_PLAYBOOK_ID_PATH, \
+    VALID_SCRIPT_PATH, VALID_WIDGET_PATH, INVALID_WIDGET_PATH, VALID_DASHBOARD_PATH
+
+
+def create_content_repo(repo_path):
+    """Creates a content repo with valid and invalid files in packs, entity directories and package directories."""
+    files = {
+        'Packs/First/Scripts/Invalid/Invalid.yml': INVALID_SCRIPT_PATH,
+        'Playbooks/playbook-Valid.yml': VALID_PLAYBOOK_ID_PATH,
+        'Playbooks/playbook-Invalid.yml': INVALID_PLAYBOOK_PATH,
+        'Scripts/Valid/Valid.yml': VALID_SCRIPT_PATH,
+        'Scripts/Other/Other.yml': INVALID_SCRIPT_PATH,
+    }
+    for file_path, source_path in files.items():
+        os.makedirs(os.path.dirname(os.path.join(repo_path, file_path)), exist_ok=True)
+        copyfile(source_path, os.path.join(repo_path, file_path))
+
+    # a package without a yml
+    os.makedirs(os.path.join(repo_path, 'Integrations', 'Empty'))
+
+
+def validate_all_files(jobs):
+    validator = FilesValidator(validate_conf_json=False, jobs=jobs)
+    validator.validate_all_files()
+    return validator._is_valid
+
+
+def test_get_all_files_to_validate(tmp_path, monkeypatch):
+    """
+    Given
+        - A content repo with files in packs, entity directories and package directories.
+    When
+        - Finding the files to validate.
+    Then
+        - The files are found in the order they are validated, packs first.
+    """
+    create_content_repo(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+
+    files = [file_path for file_path, _ in FilesValidator.get_all_files_to_validate()]
+
+    assert files[0] == 'Packs/First/Scripts/Invalid/Invalid.yml'
+    assert sorted(files[1:3]) == ['Playbooks/playbook-Invalid.yml', 'Playbooks/playbook-Valid.yml']
+    assert sorted(files[3:]) == ['Scripts/Other/Other.yml', 'Scripts/Valid/Valid.yml']
+
+
+def test_validate_all_files_in_pool_prints_like_serial(tmp_path, monkeypatch, capsys, mocker):
+    """
+    Given
+        - A content repo with valid and invalid files and a package without a yml.
+    When
+        - Validating all the files serially and in a pool of worker processes.
+    Then
+        - Both find the files invalid and print the same output, in the same order.
+    """
+    create_content_repo(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    # the worker processes are forked after the mock, so they use it too
+    mocker.patch('demisto_sdk.commands.common.hook_validations.structure.get_remote_file', return_value={})
+
+    assert validate_all_files(jobs=1) is False
+    serial_output = capsys.readouterr()
+    assert validate_all_files(jobs=3) is False
+    pool_output = capsys.readouterr()
+
+    assert pool_output == serial_output
+    assert sorted(line for line in serial_output.out.splitlines() if line.startswith('Validating ')) == [
+        'Validating Packs/First/Scripts/Invalid/Invalid.yml', 'Validating Scripts/Other/Other.yml',
+        'Validating Scripts/Valid/Valid.yml', 'Validating playbook-Invalid.yml', 'Validating playbook-Valid.yml']
+    assert 'Integrations/Empty' in serial_output.out
+    assert 'Failed: Playbooks/playbook-Invalid.yml failed.' in serial_output.out
+
+
+def test_output_recorder_replays_in_order(capsys):
+    """
+    Given
+        - Output printed to stdout, stderr and a logging handler of stderr.
+    When
+        - Recording it and replaying it.
+    Then
+        - Nothing is printed while recording, and the replay prints everything to the original streams.
+    """
+    handler = logging.StreamHandler(sys.stderr)
+    logger = logging.getLogger()
+    logger.addHandler(handler)
+    recorder = OutputRecorder()
+    try:
+        with recorder.record():
+            print('first')
+            logger.error('logged')
+            sys.stderr.write('second\n')
+    finally:
+        logger.removeHandler(handler)
+
+    assert capsys.readouterr() == ('', '')
+    chunks = recorder.pop()
+    assert [stream_name for stream_name, _ in chunks] == ['stdout', 'stdout', 'stderr', 'stderr']
+    assert recorder.pop() == []
+
+    OutputRecorder.replay(chunks)
+    assert capsys.readouterr() == ('first\n', 'logged\nsecond\n')
+
+
+def test_validation_cache_skips_files_that_passed(tmp_path, monkeypatch, capsys, mocker):
+    """
+    Given
+        - A valid and an invalid added file, validated with the validation cache.
+    When
+        - Validating them again, then changing the valid file and validating again.
+    Then
+        - The valid file is skipped while it is unchanged and its output is printed again, the invalid file and the
+          changed file are validated.
+    """
+    for file_path, source_path in (('Scripts/script-Valid.yml', VALID_SCRIPT_PATH),
+                                   ('Playbooks/playbook-Invalid.yml', INVALID_PLAYBOOK_PATH)):
+        os.makedirs(os.path.dirname(str(tmp_path / file_path)), exist_ok=True)
+        copyfile(source_path, str(tmp_path / file_path))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('DEMISTO_SDK_VALIDATION_CACHE_DIR', str(tmp_path / 'cache'))
+    validate_added_file = mocker.spy(FilesValidator, 'validate_added_file')
+
+    def validate():
+        validator = FilesValidator(validate_conf_json=False, validation_cache=True)
+        validator.validate_added_files(['Scripts/script-Valid.yml', 'Playbooks/playbook-Invalid.yml'])
+        validated_files = [call[0][1] for call in validate_added_file.call_args_list]
+        validate_added_file.reset_mock()
+        return validator._is_valid, validated_files, capsys.readouterr().out
+
+    is_valid, validated_files, first_output = validate()
+    assert is_valid is False
+    assert validated_files == ['Scripts/script-Valid.yml', 'Playbooks/playbook-Invalid.yml']
+
+    assert validate() == (False, ['Playbooks/playbook-Invalid.yml'], first_output)
+
+    with open('Scripts/script-Valid.yml', 'a') as script_file:
+        script_file.write('\n')
+    assert validate()[:2] == (False, ['Scripts/script-Valid.yml', 'Playbooks/playbook-Invalid.yml'])
+
+
+def test_changed_schema_validates_the_files_of_its_type(tmp_path, monkeypatch, capsys, mocker):
+    """
+    Given
+        - A content repo with widgets in an entity directory and a pack, a dashboard and playbooks.
+    When
+        - Validating the committed files, when the widget schema was modified.
+    Then
+        - Only the widgets are validated by their schema, and the invalid one fails the validation.
+    """
+    create_content_repo(str(tmp_path))
+    for file_path, source_path in (('Widgets/widget-Valid.json', VALID_WIDGET_PATH),
+                                   ('Packs/First/Widgets/widget-Invalid.json', INVALID_WIDGET_PATH),
+                                   ('Dashboards/dashboard-Valid.json', VALID_DASHBOARD_PATH)):
+        os.makedirs(os.path.dirname(str(tmp_path / file_path)), exist_ok=True)
+        copyfile(source_path, str(tmp_path / file_path))
+    monkeypatch.chdir(tmp_path)
+    mocker.patch.object(FilesValidator, 'get_modified_and_added_files',
+                        return_value=({'Tests/schemas/widget.yml'}, set(), set(), set()))
+    validate_file_scheme = mocker.patch.object(file_validator, 'validate_file_scheme',
+                                               wraps=file_validator.validate_file_scheme)
+
+    validator = FilesValidator(validate_conf_json=False)
+    validator.validate_committed_files()
+
+    assert [call[0][0] for call in validate_file_scheme.call_args_list] == [
+        os.path.join('Packs', 'First', 'Widgets', 'widget-Invalid.json'), os.path.join('Widgets', 'widget-Valid.json')]
+    assert validator._is_valid is False
+    assert 'Schemas changed, validating the widget files' in capsys.readouterr().out
+
+
+def test_get_changed_schemes():
+    """
+    Given
+        - Modified files with changed schemas.
+    When
+        - Getting the changed schemes.
+    Then
+        - The schemes of file types are returned, and None if a schema isn't the scheme of a file type.
+    """
+    assert FilesValidator.get_changed_schemes({'Playbooks/playbook-Test.yml'}) == set()
+    assert FilesValidator.get_changed_schemes({'Tests/schemas/widget.yml', 'Tests/schemas/dashboard.yml',
+                                               'Playbooks/playbook-Test.yml'}) == {'widget', 'dashboard'}
+    assert FilesValidator.get_changed_schemes({'Tests/schemas/widget.yml', 'Tests/schemas/common.yml'}) is None
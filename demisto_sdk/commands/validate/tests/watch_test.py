@@ -0,0 +1,108 @@
+import os
+from shutil import copyfile
+
+from demisto_sdk.commands.validate import file_validator
+from demisto_sdk.commands.validate.file_validator import FilesValidator
+from demisto_sdk.commands.validate.tests.file_validator_test import create_content_repo
+from demisto_sdk.commands.validate.watch import ValidationWatcher, get_changed_files
+from demisto_sdk.tests.constants_test import VALID_PLAYBOOK_ID_PATH, VALID_SCRIPT_PATH
+
+
+class ScriptedWatcher:
+    """A file watcher that reports the given changes, one set per wait."""
+
+    def __init__(self, changes):
+        self.changes = list(changes)
+        self.closed = False
+
+    def wait(self, timeout=None):
+        return self.changes.pop(0) if self.changes else set()
+
+    def close(self):
+        self.closed = True
+
+
+def test_get_changed_files(tmp_path, monkeypatch):
+    """
+    Given
+        - Changed code files of packages, a playbook, a schema, the id_set and files that aren't validated.
+    When
+        - Finding the files to validate.
+    Then
+        - The ymls of the packages are validated instead of their code, with the playbook and the pack of the changed
+          file, the files of the scheme are validated, and the other files are ignored.
+    """
+    for file_path in ('Integrations/Zoom/Zoom.yml', 'Integrations/Zoom/Zoom.py', 'Packs/Hi/Scripts/Hi/Hi.yml',
+                      'Packs/Hi/Scripts/Hi/Hi.py', 'Playbooks/playbook-Zoom.yml', 'README.md'):
+        (tmp_path / file_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / file_path).write_text('')
+    monkeypatch.chdir(tmp_path)
+
+    changed_files = get_changed_files([
+        'Integrations/Zoom/Zoom.py', 'Packs/Hi/Scripts/Hi/Hi.py', 'Playbooks/playbook-Zoom.yml',
+        'Playbooks/playbook-Zoom.yml~', 'Playbooks/playbook-Deleted.yml', 'README.md', 'Tests/schemas/widget.yml',
+        'Tests/id_set.json'])
+
+    assert changed_files.files == {'Integrations/Zoom/Zoom.yml', 'Packs/Hi/Scripts/Hi/Hi.yml',
+                                   'Playbooks/playbook-Zoom.yml'}
+    assert changed_files.packs == {'Hi'}
+    assert changed_files.schemes == {'widget'}
+    assert changed_files.is_id_set_changed
+
+
+def test_validate_changed_files_with_git(tmp_path, monkeypatch, mocker):
+    """
+    Given
+        - A changed playbook that is in the compared branch, and a changed script that isn't.
+    When
+        - Validating the changed files with git.
+    Then
+        - The playbook is validated as a modified file against the compared branch, and the script as an added file.
+    """
+    for file_path, source_path in (('Playbooks/playbook-Valid.yml', VALID_PLAYBOOK_ID_PATH),
+                                   ('Scripts/Valid/Valid.yml', VALID_SCRIPT_PATH)):
+        os.makedirs(os.path.dirname(str(tmp_path / file_path)), exist_ok=True)
+        copyfile(source_path, str(tmp_path / file_path))
+    monkeypatch.chdir(tmp_path)
+    mocker.patch.object(file_validator.LOCAL_GIT_FILE_PROVIDER, 'get_file_content',
+                        side_effect=lambda file_path, tag: b'' if file_path == 'Playbooks/playbook-Valid.yml' else None)
+    mocker.patch.object(file_validator, 'DOCKER_TAG_RESOLVER')
+    validate_modified_file = mocker.patch.object(FilesValidator, 'validate_modified_file')
+    validate_added_file = mocker.patch.object(FilesValidator, 'validate_added_file')
+
+    validator = FilesValidator(validate_conf_json=False, prev_ver='origin/feature')
+    validator.use_git = True
+    assert validator.validate_changed_files({'Playbooks/playbook-Valid.yml', 'Scripts/Valid/Valid.yml'})
+
+    validate_modified_file.assert_called_once_with('Playbooks/playbook-Valid.yml', None, 'origin/feature')
+    validate_added_file.assert_called_once_with('Scripts/Valid/Valid.yml')
+
+
+def test_watch_validates_the_changed_files(tmp_path, monkeypatch, mocker, capsys):
+    """
+    Given
+        - A content repo with valid and invalid files, validated without git.
+    When
+        - Watching it while an invalid playbook, then the code of a valid script and a README change.
+    Then
+        - After validating all the files, only the schemes of the changed files are validated, with the yml of the
+          changed code, and the exit code is of the last validation.
+    """
+    create_content_repo(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    file_watcher = ScriptedWatcher([{'Playbooks/playbook-Invalid.yml'}, {'README.md'}, set(),
+                                    {'Scripts/Valid/Valid.py'}])
+    validator = FilesValidator(validate_conf_json=False)
+    run = mocker.spy(validator, 'run')
+    validate_file_scheme = mocker.patch.object(file_validator, 'validate_file_scheme',
+                                               wraps=file_validator.validate_file_scheme)
+
+    assert ValidationWatcher(validator, file_watcher).run(max_validations=2) == 0
+
+    assert run.call_count == 1
+    assert [call[0][0] for call in validate_file_scheme.call_args_list[-2:]] == [
+        'Playbooks/playbook-Invalid.yml', 'Scripts/Valid/Valid.yml']
+    assert file_watcher.closed
+    output = capsys.readouterr().out
+    assert 'The files were found as invalid' in output.split('Watching for changes')[1]
+    assert 'The files are valid' in output.split('Watching for changes')[1]
@@ -0,0 +1,186 @@
+"""Watch mode of validate.
+
+Validating again after every save paid for everything again - listing the changes with git, compiling the schemas,
+loading the id_set and resolving the docker image tags. `validate --watch` validates once, then keeps the process, and
+every cache in it, alive: the parsed files, the compiled schemas, the file types, the resolved docker tags, the git
+cat-file process of the old files and the id_set. When files change, ValidationWatcher validates only them and the
+files whose validation reads them:
+- the yml of a package, when its code, image, description or other files change,
+- the files of a scheme, when its schema in Tests/schemas changes,
+- the pack unique files of a pack, when any of its files change,
+- the files validated since the watch started, when the id_set changes and they are validated against it.
+
+The files are validated by FilesValidator.validate_changed_files.
+"""
+import os
+import time
+
+from demisto_sdk.commands.common.constants import CODE_FILES_REGEX, SCHEMA_REGEX, PACKAGE_SUPPORTING_DIRECTORIES, \
+    SCHEMA_TO_REGEX
+from demisto_sdk.commands.common.hook_validations.id import IDSetValidator
+from demisto_sdk.commands.common.tools import checked_type, print_color, print_error, LOG_COLORS, get_pack_name, \
+    is_file_path_in_pack, get_yml_paths_in_dir
+
+# the seconds without further changes that end a burst of changes, editors write a file in several steps
+SETTLE_TIME = 0.05
+
+
+class ChangedFiles:
+    """ChangedFiles are the files to validate after files changed.
+
+    Attributes:
+        files (set): the paths of the changed content files and of the files that depend on the changed files.
+        schemes (set): the names of the schemes whose schemas changed.
+        packs (set): the names of the packs with changed files.
+        is_id_set_changed (bool): whether the id_set changed.
+    """
+
+    def __init__(self):
+        self.files = set()  # type: set
+        self.schemes = set()  # type: set
+        self.packs = set()  # type: set
+        self.is_id_set_changed = False
+
+
+def get_package_yml(file_path):
+    """Returns the path of the yml of the package a file is in, None if it isn't in a package or it has no yml."""
+    package_dir = os.path.dirname(file_path)
+    if os.path.basename(os.path.dirname(package_dir)) not in PACKAGE_SUPPORTING_DIRECTORIES:
+        return None
+
+    _, yml_path = get_yml_paths_in_dir(package_dir, error_msg='')
+    return yml_path.replace(os.sep, '/') or None
+
+
+def get_changed_files(changed_paths):
+    """Finds the files to validate after files changed, the changed files and their dependents.
+
+    Args:
+        changed_paths (iterable): the paths of the created, changed and deleted files, relative to the content repo.
+
+    Returns:
+        ChangedFiles. The files to validate.
+    """
+    changed_files = ChangedFiles()
+    for file_path in changed_paths:
+        file_name = os.path.basename(file_path)
+        # editors write backups and swap files next to the files
+        if file_name.endswith('~') or file_name.startswith('.#'):
+            continue
+
+        if os.path.normpath(file_path) == os.path.normpath(IDSetValidator.ID_SET_PATH):
+            changed_files.is_id_set_changed = True
+            continue
+
+        if checked_type(file_path, [SCHEMA_REGEX]):
+            scheme_name = os.path.splitext(file_name)[0]
+            if scheme_name in SCHEMA_TO_REGEX:
+                changed_files.schemes.add(scheme_name)
+            continue
+
+        pack = get_pack_name(file_path)
+        if pack and is_file_path_in_pack(file_path):
+            changed_files.packs.add(pack)
+
+        # the yml of a package is validated with its code, image and description
+        package_yml = get_package_yml(file_path)
+        if package_yml:
+            changed_files.files.add(package_yml)
+
+        if os.path.isfile(file_path) and checked_type(file_path) and not checked_type(file_path, CODE_FILES_REGEX):
+            changed_files.files.add(file_path)
+
+    return changed_files
+
+
+class ValidationWatcher:
+    """ValidationWatcher validates the files that change while it watches them, in a single long lived process.
+
+    Attributes:
+        files_validator (FilesValidator): the validator, it keeps its state and caches between the validations.
+        file_watcher (InotifyWatcher|PollingWatcher): the watcher of the content repo.
+        validated_files (set): the files validated since the watch started.
+    """
+
+    def __init__(self, files_validator, file_watcher):
+        self.files_validator = files_validator
+        self.file_watcher = file_watcher
+        self.validated_files = set()  # type: set
+
+    def validate_changes(self, changed_paths):
+        """Validates the changed files and their dependents.
+
+        Args:
+            changed_paths (iterable): the paths of the created, changed and deleted files.
+
+        Returns:
+            bool. Whether the files are valid, None if none of the changed files is validated.
+        """
+        changed_files = get_changed_files(changed_paths)
+        files = set(changed_files.files)
+        if changed_files.is_id_set_changed:
+            self.files_validator.reload_id_set()
+            if self.files_validator.validate_id_set:
+                files.update(file_path for file_path in self.validated_files if os.path.isfile(file_path))
+
+        if not (files or changed_files.packs or changed_files.schemes):
+            return None
+
+        self.validated_files.update(files)
+        return self.files_validator.validate_changed_files(files, changed_files.packs, changed_files.schemes)
+
+    def wait_for_changes(self):
+        """Waits for files to change, and for the burst of changes they are a part of to end.
+
+        Returns:
+            set. The paths of the changed files.
+        """
+        changed_paths = self.file_watcher.wait()
+        while True:
+            more_paths = self.file_watcher.wait(SETTLE_TIME)
+            if not more_paths:
+                return changed_paths
+
+            changed_paths |= more_paths
+
+    def run(self, max_validations=None):
+        """Validates the files, then validates the files that change until interrupted.
+
+        Args:
+            max_validations (int): the number of validations of changed files to stop after, None to watch until
+                interrupted.
+
+        Returns:
+            int. The exit code of the last validation, 0 if the files are valid and 1 if they aren't.
+        """
+        exit_code = self.files_validator.run()
+        validations = 0
+        print_color('Watching for changes, press Ctrl+C to stop', LOG_COLORS.GREEN)
+        try:
+            while max_validations is None or validations < max_validations:
+                changed_paths = self.wait_for_changes()
+                start = time.time()
+                try:
+                    is_valid = self.validate_changes(changed_paths)
+                except Exception as error:
+                    # a file saved in the middle of an edit can fail a validator, the next save validates it again
+                    print_error('Failed to validate the changed files: {}'.format(error))
+                    is_valid = False
+
+                if is_valid is None:
+                    continue
+
+                validations += 1
+                exit_code = 0 if is_valid else 1
+                if is_valid:
+                    print_color('The files are valid ({:.0f} ms)'.format((time.time() - start) * 1000),
+                                LOG_COLORS.GREEN)
+                else:
+                    print_color('The files were found as invalid, the exact error message can be located above '
+                                '({:.0f} ms)'.format((time.time() - start) * 1000), LOG_COLORS.RED)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.file_watcher.close()
+
+        return exit_code